@@ -0,0 +1,47 @@
+"""Benchmarks for the command-line interface."""
+
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+from src.pygames import _application
+from src.pygames import _plugins
+
+_ROOT = pathlib.Path(__file__).parents[1]
+
+
+def bench_init():
+    return _application.Application
+
+
+def bench_parse_arguments():
+    app = _application.Application()
+    return lambda: app._parse_arguments(('hangman', '-e', '-l', '5'))
+
+
+def bench_cold_startup():
+    command = (sys.executable, str(_ROOT / '__main__.py'), '--version')
+    return lambda: subprocess.run(command, stdout=subprocess.DEVNULL,
+                                  check=True)
+
+
+def bench_discover_plugins():
+    # reading a current index costs the same no matter how many
+    # distributions are installed; only the number of plugins matters
+    path = pathlib.Path(tempfile.mkdtemp()) / 'plugins.json'
+    path.write_text(json.dumps({
+        'version': _plugins._INDEX_VERSION,
+        'key': _plugins._get_environment_key(),
+        'plugins': [
+            {'name': f'game-{n}', 'module': f'game_{n}', 'summary': "A game"}
+            for n in range(100)
+        ],
+    }))
+
+    return lambda: _plugins.discover(path)
+
+
+def bench_scan_plugins():
+    return _plugins._scan
@@ -0,0 +1,111 @@
+"""Benchmarks for the hot paths of the hangman game."""
+
+import atexit
+import pathlib
+import random
+import string
+import tempfile
+
+from src.pygames import _wordlist
+from src.pygames import hangman
+
+_WORD = 'application'
+
+# A stand-in for the downloaded wordlist, with about as many words
+_WORDLIST = '\n'.join(
+    ''.join(random.Random(n).choices(string.ascii_lowercase, k=n % 14 + 1))
+    for n in range(10000)
+)
+
+
+def bench_guess_letter():
+    secret_word = hangman._SecretWord(_WORD)
+    return lambda: secret_word.guess_letter('p')
+
+
+def bench_try_guess():
+    def play():
+        game_state = hangman._GameState(_WORD, 8)
+
+        for guess in ('a', 'x', 'p', 'a', 'foobar', 'l', 'i', 'c'):
+            game_state.try_guess(guess)
+
+    return play
+
+
+def bench_summarize():
+    game_state = hangman._GameState(_WORD, 8)
+
+    for guess in ('a', 'x', 'p', 'z'):
+        game_state.try_guess(guess)
+
+    return game_state.summarize
+
+
+def bench_build_word_index():
+    words = _WORDLIST.split()
+    return lambda: _wordlist.WordIndex.build(words)
+
+
+def bench_get_random_word():
+    index = _wordlist.WordIndex.build(_WORDLIST.split())
+    _wordlist._indexes[hangman._get_wordlist_url()] = index
+    rng = random.Random(0)
+
+    return lambda: hangman._get_random_word(rng, 'hard')
+
+
+def _load_word_index(compression: str = ''):
+    """Prepares the loading of a cached index, and the pick of a word.
+
+    Args:
+        compression (str): The compression of the cached index, if any.
+
+    Returns:
+        Callable: A function that loads the index, then picks a word.
+    """
+
+    index = _wordlist.WordIndex.build(_WORDLIST.split())
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    path = pathlib.Path(directory.name) / 'words.idx'
+    index.save(path, compression)
+
+    if not compression:
+        return lambda: _wordlist.WordIndex.load(path).pick()
+
+    def load():
+        loaded = _wordlist.CompressedWordIndex.load(path)
+        loaded.pick()
+        loaded.close()
+
+    return load
+
+
+# How long a new process takes to get an index ready: either by loading its
+# own copy from the cache (compressed or not), or by attaching to an index
+# shared by another process (see `stress --shared-wordlist` for the memory it
+# saves)
+def bench_load_word_index():
+    return _load_word_index()
+
+
+def bench_load_word_index_gzip():
+    return _load_word_index('gzip')
+
+
+def bench_load_word_index_lzma():
+    return _load_word_index('lzma')
+
+
+def bench_attach_shared_word_index():
+    index = _wordlist.WordIndex.build(_WORDLIST.split())
+    shared = _wordlist.SharedWordIndex.publish(index, 'bench')
+    atexit.register(shared.close)
+
+    def attach():
+        attached = _wordlist.SharedWordIndex.attach(shared.path, 'bench')
+        attached.pick()
+        attached.close()
+
+    return attach
@@ -0,0 +1,108 @@
+"""Benchmarks for a room of the multiplayer hangman game.
+
+Each benchmark applies 10,000 guesses from 100 players; divide 10,000 by the
+time taken to get the number of guesses per second a room can sustain.
+"""
+
+import asyncio
+import random
+import string
+
+from src.pygames import hangman_race
+
+_PLAYERS = 100
+_GUESSES = 10000
+
+# Guesses that never solve the word (it has an 'n'), so that a single round
+# lasts for the whole benchmark
+_LETTERS = string.ascii_lowercase.replace('n', '')
+
+
+class _Writer:
+    """A stand-in for a player's connection, that discards its messages."""
+
+    def __init__(self):
+        self.transport = self
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+    def is_closing(self) -> bool:
+        return False
+
+    def write(self, data: bytes):
+        pass
+
+    def close(self):
+        pass
+
+
+def _make_guesses() -> list:
+    rng = random.Random(0)
+    return [''.join(rng.choices(_LETTERS, k=rng.choice((1, 1, 1, 2))))
+            for _ in range(_GUESSES)]
+
+
+async def _wait_until_applied(room: hangman_race._Room, task: asyncio.Task):
+    while room.guesses_applied < _GUESSES:
+        await asyncio.sleep(0)
+
+    task.cancel()
+
+
+def bench_room():
+    guesses = _make_guesses()
+
+    async def play():
+        room = hangman_race._Room(lambda: 'application', lives=_GUESSES)
+
+        for n in range(_PLAYERS):
+            room.join(f'player{n}', _Writer())
+
+        task = asyncio.create_task(room.run())
+        await asyncio.sleep(0.01) # let the first round start
+
+        # every player guesses at once, then the room catches up
+        for start in range(0, _GUESSES, _PLAYERS):
+            for n, guess in enumerate(guesses[start:start + _PLAYERS]):
+                room.submit(f'player{n}', guess)
+
+            await asyncio.sleep(0)
+
+        await _wait_until_applied(room, task)
+
+    hangman_race._BROADCAST_INTERVAL = 0
+    return lambda: asyncio.run(play())
+
+
+def bench_room_tcp():
+    guesses = _make_guesses()
+    per_player = _GUESSES // _PLAYERS
+
+    async def play():
+        room = hangman_race._Room(lambda: 'application', lives=_GUESSES)
+        server = await hangman_race._serve(room, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        task = asyncio.create_task(room.run())
+        connections = []
+
+        for n in range(_PLAYERS):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            chunk = guesses[n * per_player:(n + 1) * per_player]
+            writer.write(f'player{n}\n'.encode())
+            writer.write(''.join(f'{guess}\n' for guess in chunk).encode())
+            connections.append((reader, writer))
+
+        await _wait_until_applied(room, task)
+
+        for _, writer in connections:
+            writer.close()
+
+        # let every player's connection close before the loop shuts down
+        while room._players:
+            await asyncio.sleep(0)
+
+        server.close()
+
+    hangman_race._BROADCAST_INTERVAL = 0.05
+    return lambda: asyncio.run(play())
@@ -0,0 +1,59 @@
+"""Benchmarks of the parallel search of tic-tac-toe on a larger grid.
+
+Each benchmark searches the same position of a 7x7 grid with four in a row
+to win, to a fixed depth and from an empty transposition table, with one to
+eight processes sharing the table (see `_search.ParallelSearcher`); the
+time to reach that depth should shrink as processes are added, as long as
+there are as many cores to run them. The helper processes are started once,
+outside of the time measured.
+"""
+
+import atexit
+
+from src.pygames import _search
+from src.pygames import tic_tac_toe
+
+_X, _O = tic_tac_toe._Mark.Cross, tic_tac_toe._Mark.Nought
+
+# The spaces marked so far, with the value of each mark
+_MARKS = [(25, _X.value), (24, _O.value), (18, _X.value), (32, _O.value)]
+
+_DEPTH = 5
+
+
+def _search_to_depth(processes: int):
+    """Prepares the search of the position with a number of processes.
+
+    Args:
+        processes (int): The number of processes to search with.
+
+    Returns:
+        Callable: A function that searches the position.
+    """
+
+    searcher = _search.ParallelSearcher(processes, 16)
+    atexit.register(searcher.close)
+
+    def search():
+        searcher.table.clear()
+        result = searcher.search(tic_tac_toe._create_position,
+                                 (7, 4, _MARKS, _X.value), 60000, _DEPTH)
+        assert result.depth >= _DEPTH
+
+    return search
+
+
+def bench_lazy_smp_1_process():
+    return _search_to_depth(1)
+
+
+def bench_lazy_smp_2_processes():
+    return _search_to_depth(2)
+
+
+def bench_lazy_smp_4_processes():
+    return _search_to_depth(4)
+
+
+def bench_lazy_smp_8_processes():
+    return _search_to_depth(8)
@@ -0,0 +1,33 @@
+"""Benchmarks of the self-play training of the tic-tac-toe player.
+
+A game learning into a table in shared memory (as every process of a
+parallel training does) should take no longer than one learning into a
+private table, as values are updated in place, without copies.
+"""
+
+import atexit
+import random
+
+from src.pygames import _learning
+
+
+def bench_training_game():
+    table = _learning.ValueTable()
+    rng = random.Random(0)
+
+    return lambda: _learning.play_training_game(table, rng, 0.2, 0.1)
+
+
+def bench_training_game_shared():
+    table = _learning.ValueTable(shared=True)
+    atexit.register(table.close)
+    rng = random.Random(0)
+
+    return lambda: _learning.play_training_game(table, rng, 0.2, 0.1)
+
+
+def bench_random_game():
+    table = _learning.ValueTable()
+    rng = random.Random(0)
+
+    return lambda: _learning.play_random_game(table, 2, rng)
@@ -0,0 +1,49 @@
+"""Benchmarks for snapshots of in-progress games.
+
+Each benchmark encodes or restores 100,000 games, half of them hangman and
+half of them tic-tac-toe, in runs of 10 games each.
+"""
+
+import random
+import string
+
+from src.pygames import _snapshot
+from src.pygames import hangman
+from src.pygames import tic_tac_toe
+
+_GAMES = 100000
+_RUN_LENGTH = 10
+
+
+def _create_game_states() -> list:
+    rng = random.Random(0)
+    game_states = []
+
+    for n in range(_GAMES):
+        if n // _RUN_LENGTH % 2:
+            game_state = tic_tac_toe._GameState()
+            spaces = rng.sample(range(1, 10), 4)
+            marks = (tic_tac_toe._Mark.Cross, tic_tac_toe._Mark.Nought)
+
+            for space, mark in zip(spaces, marks * 2):
+                game_state.add_mark(space, mark)
+        else:
+            word = ''.join(rng.choices(string.ascii_lowercase, k=8))
+            game_state = hangman._GameState(word, 8)
+
+            for letter in rng.sample(string.ascii_lowercase, 4):
+                game_state.try_guess(letter)
+
+        game_states.append(game_state)
+
+    return game_states
+
+
+def bench_dump():
+    game_states = _create_game_states()
+    return lambda: _snapshot.dump(game_states)
+
+
+def bench_load():
+    data = _snapshot.dump(_create_game_states())
+    return lambda: _snapshot.load(data)
@@ -0,0 +1,76 @@
+"""Benchmarks of the spectators of a game of tic-tac-toe.
+
+Each benchmark publishes a frame of a 3x3 grid to a number of spectators
+connected over TCP (see `_spectators.Broadcaster`), and waits until every
+one of them has received it in full: the time measured is the broadcast
+latency of the slowest spectator. The spectators connect once, outside of
+the time measured, and are read from a single thread, as fast as it can.
+"""
+
+import atexit
+import selectors
+import socket
+import time
+
+from src.pygames import _spectators
+from src.pygames import tic_tac_toe
+
+_X = tic_tac_toe._Mark.Cross
+
+
+def _broadcast(spectators: int):
+    """Prepares the broadcast of a frame to a number of spectators.
+
+    Args:
+        spectators (int): The number of spectators to connect.
+
+    Returns:
+        Callable: A function that broadcasts a frame, and waits for it to
+            reach every spectator.
+    """
+
+    broadcaster = _spectators.Broadcaster()
+    broadcaster.__enter__()
+    selector = selectors.DefaultSelector()
+
+    for _ in range(spectators):
+        connection = socket.create_connection(broadcaster.address)
+        connection.setblocking(False)
+        selector.register(connection, selectors.EVENT_READ)
+
+    while broadcaster.spectators < spectators:
+        time.sleep(0.001)
+
+    atexit.register(broadcaster.__exit__, None, None, None)
+
+    game_state = tic_tac_toe._GameState()
+    game_state.add_mark(5, _X)
+    lines = [*game_state.get_grid().split('\n'), '', "X marked space 5"]
+    size = len(_spectators._CLEAR_SCREEN) + sum(len(line) + 1
+                                                for line in lines)
+
+    def broadcast():
+        received = dict.fromkeys(selector.get_map(), 0)
+        waiting = spectators
+        broadcaster.publish(lines)
+
+        while waiting:
+            for key, _ in selector.select():
+                received[key.fd] += len(key.fileobj.recv(size))
+
+                if received[key.fd] == size:
+                    waiting -= 1
+
+    return broadcast
+
+
+def bench_broadcast_1_spectator():
+    return _broadcast(1)
+
+
+def bench_broadcast_100_spectators():
+    return _broadcast(100)
+
+
+def bench_broadcast_1000_spectators():
+    return _broadcast(1000)
@@ -0,0 +1,42 @@
+"""Benchmarks of the tic-tac-toe tablebase, on the classic 3x3 grid.
+
+Generating the tablebase of a 4x4 grid takes about 40 s in a single process
+(`pygames tablebase`), which is too long to benchmark here; the classic
+grid's is generated the same way, layer by layer and chunk by chunk.
+"""
+
+import atexit
+import pathlib
+import tempfile
+
+from src.pygames import _tablebase
+
+
+def _create_path() -> pathlib.Path:
+    """Creates a temporary directory for a tablebase, removed at exit."""
+
+    directory = tempfile.TemporaryDirectory(prefix='pygames-bench-')
+    atexit.register(directory.cleanup)
+
+    return pathlib.Path(directory.name) / 'classic.tbl'
+
+
+def bench_generate_classic():
+    path = _create_path()
+
+    def generate():
+        path.unlink(missing_ok=True)
+
+        with _tablebase.Tablebase(path, 3, 3) as tablebase:
+            tablebase.generate()
+
+    return generate
+
+
+def bench_choose_move_classic():
+    tablebase = _tablebase.Tablebase(_create_path(), 3, 3)
+    tablebase.generate()
+    atexit.register(tablebase.close)
+    spaces = [2, 0, 0, 0, 1, 0, 0, 0, 0]
+
+    return lambda: tablebase.choose_move(spaces, 2)
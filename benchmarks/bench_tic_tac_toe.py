@@ -0,0 +1,70 @@
+"""Benchmarks for the hot paths of the tic-tac-toe game."""
+
+from src.pygames import _search
+from src.pygames import tic_tac_toe
+
+_X, _O = tic_tac_toe._Mark.Cross, tic_tac_toe._Mark.Nought
+
+
+def bench_add_mark():
+    def play():
+        game_state = tic_tac_toe._GameState()
+
+        for index, mark in zip((5, 1, 9, 3, 2, 8, 7, 4, 6), (_X, _O) * 5):
+            game_state.add_mark(index, mark)
+
+    return play
+
+
+def bench_check_for_win():
+    game_state = tic_tac_toe._GameState()
+
+    for index, mark in zip((5, 1, 9, 3), (_X, _O) * 2):
+        game_state.add_mark(index, mark)
+
+    return game_state.check_for_win
+
+
+def bench_choose_move():
+    game_state = tic_tac_toe._GameState()
+    game_state.add_mark(5, _X)
+
+    return lambda: tic_tac_toe._choose_move(game_state, _O)
+
+
+def _create_large_game_state() -> tic_tac_toe._GameState:
+    game_state = tic_tac_toe._GameState(7, 4)
+
+    for index, mark in zip((25, 24, 18, 32), (_X, _O) * 2):
+        game_state.add_mark(index, mark)
+
+    return game_state
+
+
+def bench_add_mark_undo_large():
+    game_state = _create_large_game_state()
+
+    def play():
+        for index in range(1, 50):
+            if not game_state.add_mark(index, _X):
+                game_state.undo()
+
+    return play
+
+
+def bench_search_depth_4_large():
+    game_state = _create_large_game_state()
+    position = tic_tac_toe._Position(game_state, _X)
+
+    return lambda: _search.Searcher(position).search(10**6, max_depth=4)
+
+
+def bench_search_depth_4_large_table():
+    game_state = _create_large_game_state()
+    position = tic_tac_toe._Position(game_state, _X)
+
+    def search():
+        table = _search.TranspositionTable(1)
+        _search.Searcher(position, table).search(10**6, max_depth=4)
+
+    return search
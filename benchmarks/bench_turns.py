@@ -0,0 +1,63 @@
+"""Benchmarks of timed turns, waited for on a single loop.
+
+Each benchmark starts a turn with a 5 ms time limit on a number of sessions
+(see `_turns.TurnLoop`), none of which ever answer, and waits until every
+turn has timed out: anything measured beyond the 5 ms is the time the loop
+takes to notice the deadlines, i.e. how late the last turn ends. The
+sessions' inputs are pipes, created once, outside of the time measured.
+"""
+
+import atexit
+import os
+
+from src.pygames import _turns
+
+# The time limit on each turn, in seconds
+_TIMEOUT = 0.005
+
+
+def _time_out(sessions: int):
+    """Prepares turns that time out for a number of idle sessions.
+
+    Args:
+        sessions (int): The number of sessions sharing the loop.
+
+    Returns:
+        Callable: A function that starts a turn for every session, and waits
+            for all of them to time out.
+    """
+
+    pipes = [os.pipe() for _ in range(sessions)]
+    loop = _turns.TurnLoop()
+
+    def close():
+        loop.close()
+
+        for fds in pipes:
+            for fd in fds:
+                os.close(fd)
+
+    atexit.register(close)
+
+    def time_out():
+        for read_fd, _ in pipes:
+            loop.start_turn(read_fd, _TIMEOUT)
+
+        ended = 0
+
+        while ended < sessions:
+            ended += len(loop.wait())
+
+    return time_out
+
+
+def bench_time_out_1_session():
+    return _time_out(1)
+
+
+def bench_time_out_100_sessions():
+    return _time_out(100)
+
+
+def bench_time_out_1000_sessions():
+    return _time_out(1000)
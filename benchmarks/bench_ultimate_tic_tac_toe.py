@@ -0,0 +1,49 @@
+"""Benchmarks for the ultimate tic-tac-toe game and its computer player.
+
+The search benchmarks should take as long as their time budget, and no
+longer; divide the number of positions reported by the game by the budget to
+compare the search speed instead.
+"""
+
+import random
+
+from src.pygames import ultimate_tic_tac_toe
+
+# An opening where both players fight over the center board
+_MOVES = (40, 36, 4, 44, 76, 42, 58, 41)
+
+
+def _create_game_state() -> ultimate_tic_tac_toe._GameState:
+    game_state = ultimate_tic_tac_toe._GameState()
+
+    for move in _MOVES:
+        game_state.play(move)
+
+    return game_state
+
+
+def bench_play_undo():
+    game_state = _create_game_state()
+
+    def play():
+        for move in game_state.get_moves():
+            game_state.play(move)
+            game_state.undo()
+
+    return play
+
+
+def bench_evaluate():
+    return _create_game_state().evaluate
+
+
+def bench_search_10ms():
+    game_state = _create_game_state()
+    rng = random.Random(0)
+    return lambda: ultimate_tic_tac_toe._choose_move(game_state, 10, rng)
+
+
+def bench_search_100ms():
+    game_state = _create_game_state()
+    rng = random.Random(0)
+    return lambda: ultimate_tic_tac_toe._choose_move(game_state, 100, rng)
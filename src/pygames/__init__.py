@@ -1,5 +1,11 @@
 # PYTHON_ARGCOMPLETE_OK
 
+from . import _profiling
+
+# started before anything else is imported, so that the profile (if any)
+# includes the time spent importing the rest of the package
+_profiling.start_from_environment()
+
 from ._application import Application, BadArgumentError
 
 
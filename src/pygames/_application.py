@@ -1,18 +1,58 @@
-import argcomplete
 import argparse
+import functools
+import importlib
 import inspect
+import os
 import pathlib
+import typing
 from dataclasses import dataclass
-from types import FunctionType, ModuleType
+from types import FunctionType, ModuleType, NoneType, UnionType
+
+from . import _bundle
+from . import _metrics
+from . import _plugins
+from . import _profiling
+
+# The built-in commands, and the summary of each (the first line of their
+# `main()` function's docstring); like plugins, their modules are only
+# imported once their command is run, so that each command only pays for
+# importing its own module
+_COMMANDS = {
+    'hangman': "Play a game of hangman.",
+    'hangman-race': "Host a game of hangman that many players race to solve.",
+    'magic-8-ball': "Ask the magic 8 ball a question.",
+    'tic-tac-toe': "Play a game of tic-tac-toe.",
+    'ultimate-tic-tac-toe': "Play a game of ultimate tic-tac-toe.",
+    'replay': "Replay the games in a journal.",
+    'stats': "Show the statistics for each player.",
+    'bench': "Run the benchmark suite.",
+    'stress': "Drive the games with scripted or random input, and measure "
+              "them.",
+    'train': "Train the tic-tac-toe computer player by self-play.",
+    'tablebase': "Generate a tablebase for the tic-tac-toe computer player.",
+    'build': "Build PyGames into a single-file zipapp.",
+}
+
+
+def _import_command(name: str) -> ModuleType:
+    """Imports the module of a built-in command.
+
+    Args:
+        name (str): The name of the command.
+
+    Returns:
+        ModuleType: The command's module.
+    """
+
+    return importlib.import_module(f'.{name.replace("-", "_")}', __package__)
 
-from . import hangman
-from . import magic_8_ball
 
 def _get_module_version():
     """Retrieves the version number of this application.
 
     Finds and returns the version number of the 'pygames' application, AKA:
-    this application right here. When running from the PyGames source code,
+    this application right here. When running from a zipapp build, reads the
+    version number bundled with it. When running from the PyGames source code,
     retrieves the version number from the pyproject TOML file. Otherwise, reads
     the version number from the package's metadata.
 
@@ -25,6 +65,13 @@ def _get_module_version():
     # application. This cannot be adequately replicated through unit tests (at
     # least as far as I know).
 
+    bundled_version = _bundle.read_data('VERSION')
+
+    # checked first, as the pyproject file of an unrelated project could be
+    # found next to the zipapp
+    if bundled_version is not None:
+        return bundled_version.decode()
+
     pyproject_file = pathlib.Path(__file__).parents[2] / "pyproject.toml"
 
     if pyproject_file.exists():
@@ -64,8 +111,60 @@ class Application:
     """The PyGames application itself, wrapped into a single class."""
 
     _OPTION_HELP = {
+        'address': "address to listen on (default: %(default)s)",
+        'agent': "checkpoint of a trained computer player to play against",
+        'archive': "path to write the zipapp to (default: %(default)s)",
+        'baseline': "results of a previous run to compare against",
+        'batch': "answer each line of a file ('-' for stdin) in bulk",
+        'by': "rank players by: wins, win-rate, guesses or streak",
+        'checkpoint': "file to save the trained player to (and resume from)",
+        'computer': "play against the computer",
+        'deck': "file of (weighted) answers to draw from",
+        'difficulty': "difficulty of the words: easy, medium or hard",
         'endless': "automatically start a new game after the previous",
+        'episodes': "number of games to train with (default: %(default)s)",
+        'exploration': "chance of a random move while training (default: "
+                       "%(default)s)",
+        'file': "journal file to replay ('-' for stdin)",
+        'game': "game to show the leaderboard of (default: %(default)s)",
+        'games': "comma-separated games to play (default: %(default)s)",
+        'interpreter': "interpreter for the zipapp's shebang line "
+                       "(default: %(default)s)",
+        'journal': "file to append a replayable log of each game to",
+        'learning_rate': "share of each error corrected while training "
+                         "(default: %(default)s)",
+        'length': "marks in a row it takes to win (default: %(default)s)",
         'lives': "number of lives to start with (default: %(default)s)",
+        'match': "only run benchmarks whose name contains this string",
+        'output': "file to save the results to, as JSON",
+        'output_format': "output format for batch answers: tsv or jsonl",
+        'player': "name of the player to record (or show) statistics for",
+        'port': "port to listen on (default: %(default)s)",
+        'processes': "number of processes to work with (default: one per "
+                     "CPU)",
+        'samples': "number of random positions to check against search "
+                   "(default: %(default)s)",
+        'script': "file of input lines to enter in every session",
+        'seed': "seed for the random number generator",
+        'sessions': "number of sessions to run (default: %(default)s)",
+        'shared_wordlist': "index the wordlist once, for every session to "
+                           "share",
+        'size': "spaces on each side of the grid (default: %(default)s)",
+        'spectate': "HOST:PORT to let spectators watch the games at",
+        'suite': "directory of the benchmark suite to run",
+        'table_mb': "size of the computer's transposition table, in MB "
+                    "(default: %(default)s)",
+        'think_ms': "time the computer may think per move, in ms (default: "
+                    "%(default)s)",
+        'threads': "number of processes the computer searches with "
+                   "(default: %(default)s)",
+        'threshold': "allowed slowdown against the baseline, as a fraction "
+                     "(default: %(default)s)",
+        'top': "number of players to show (default: %(default)s)",
+        'tty': "run the games in a pseudo-terminal instead of pipes",
+        'turn_timeout': "seconds each turn may take before it is forfeited",
+        'turns': "maximum lines of input per session (default: %(default)s)",
+        'workers': "number of sessions to run at once (default: one per CPU)",
     }
 
     def __init__(self):
@@ -83,15 +182,48 @@ class Application:
             version=f'%(prog)s {__version__}',
         )
 
+        self._parser.add_argument(
+            '--profile',
+            metavar='PATH',
+            help="profile the command, and save the profile to PATH (as "
+                 ".pstats) and a summary to PATH.txt",
+        )
+
+        self._parser.add_argument(
+            '--metrics',
+            metavar='TARGET',
+            help="record latency metrics, and save them to the file TARGET "
+                 "(in Prometheus format), or serve them at TARGET while "
+                 "running if it is an http:// address",
+        )
+
         subparsers = self._parser.add_subparsers(
             prog=self._parser.prog,
             required=True,
         )
 
-        for module in (hangman, magic_8_ball):
-            self._add_subcommand(subparsers, module)
-
-        argcomplete.autocomplete(self._parser)
+        # argcomplete sets this variable when completing a command; otherwise,
+        # importing it (and every command's module, to complete their
+        # options) would only slow down startup
+        completing = '_ARGCOMPLETE' in os.environ
+
+        for name, summary in _COMMANDS.items():
+            if completing:
+                self._add_subcommand(subparsers, _import_command(name))
+            else:
+                self._add_lazy_subcommand(subparsers, name, summary,
+                                          command=name)
+
+        # plugins are only imported once their command is run, so that they
+        # cannot slow down (or break) the rest of the application
+        for plugin in _plugins.discover():
+            if plugin.name not in subparsers.choices:
+                self._add_lazy_subcommand(subparsers, plugin.name,
+                                          plugin.summary, plugin=plugin)
+
+        if completing:
+            import argcomplete
+            argcomplete.autocomplete(self._parser)
 
     def run(self, *argv): # HACK: optimize!
         """Runs PyGames with the provided arguments.
@@ -138,6 +270,22 @@ class Application:
             description=short_summary,
         )
 
+        cls._add_arguments(subparser, main_function)
+
+    @classmethod
+    def _add_arguments(
+        cls,
+        parser: argparse.ArgumentParser,
+        main_function: FunctionType,
+    ):
+        """Adds an argument to a parser for each parameter of a function.
+
+        Args:
+            parser (argparse.ArgumentParser): The parser of the function's
+                command.
+            main_function (FunctionType): The function run by the command.
+        """
+
         # used to keep track of all the 1-letter flags used by the arguments
         # registered for this subcommand, so that no two arguments share the
         # same short flag
@@ -145,9 +293,41 @@ class Application:
 
         for parameter in inspect.signature(main_function).parameters.values():
             flags, config = cls._create_argument_data(short_flags, parameter)
-            subparser.add_argument(*flags, **config)
+            parser.add_argument(*flags, **config)
 
-        subparser.set_defaults(function=main_function)
+        parser.set_defaults(function=main_function)
+
+    @staticmethod
+    def _add_lazy_subcommand(
+        subparsers: argparse._SubParsersAction,
+        name: str,
+        summary: str,
+        **defaults,
+    ):
+        """Registers a command, without importing its module.
+
+        The command's arguments are left for `_parse_command_arguments()` to
+        parse, once its module is imported.
+
+        Args:
+            subparsers (argparse._SubParsersAction): The subcommands of the
+                application.
+            name (str): The name of the command.
+            summary (str): A one-line description of the command.
+            **defaults: The values that identify the command once parsed:
+                either its name (as 'command') for a built-in command, or
+                its plugin (as 'plugin'); see `_parse_arguments()`.
+        """
+
+        subparser = subparsers.add_parser(
+            name,
+            usage="%(prog)s [options]",
+            help=summary.lower(),
+            description=summary,
+            add_help=False,
+        )
+
+        subparser.set_defaults(**defaults)
 
     @classmethod
     def _create_argument_data(
@@ -184,6 +364,11 @@ class Application:
         if has_annotation: config['type'] = parameter.annotation
         if has_default: config['default'] = parameter.default
 
+        # optional values (e.g. `int | None`) are parsed as their non-None type
+        if isinstance(parameter.annotation, UnionType):
+            types = set(typing.get_args(parameter.annotation)) - {NoneType}
+            config['type'] = types.pop()
+
         return (flags, config)
 
     @staticmethod
@@ -246,12 +431,80 @@ class Application:
 
         Returns:
             FunctionType: The primary function/action called by the
-                subcommand (if applicable).
+                subcommand (if applicable); wrapped to record metrics and/or
+                in a profiler if the ``--metrics`` and/or ``--profile``
+                options were specified.
             dict: Contains any and all options specified by the provided
                 ``argv`` arguments.
         """
 
-        args = vars(self._parser.parse_args(argv))
+        namespace, extra_argv = self._parser.parse_known_args(argv)
+        args = vars(namespace)
+        command = args.pop('command', None)
+        plugin = args.pop('plugin', None)
+
+        if command is not None:
+            args.update(self._parse_command_arguments(
+                command, _COMMANDS[command], _import_command(command),
+                extra_argv,
+            ))
+        elif plugin is not None:
+            try:
+                module = _plugins.load(plugin)
+            except ValueError as e:
+                raise BadArgumentError(str(e))
+
+            args.update(self._parse_command_arguments(
+                plugin.name, plugin.summary, module, extra_argv,
+            ))
+        elif extra_argv:
+            self._parser.error(
+                f"unrecognized arguments: {' '.join(extra_argv)}"
+            )
+
         action = args.pop('function')
+        metrics = args.pop('metrics')
+        profile = args.pop('profile')
+
+        if metrics:
+            action = functools.partial(_metrics.export_call, action, metrics)
+
+        if profile:
+            action = functools.partial(
+                _profiling.profile_call, action, profile,
+            )
 
         return (action, args)
+
+    def _parse_command_arguments(
+        self,
+        name: str,
+        summary: str,
+        module: ModuleType,
+        argv: list,
+    ) -> dict:
+        """Parses the arguments of a command, once its module is imported.
+
+        Args:
+            name (str): The name of the command.
+            summary (str): A one-line description of the command.
+            module (ModuleType): The command's module.
+            argv (list): The argument tokens that follow the command.
+
+        Returns:
+            dict: The module's `main()` function (as 'function'), and the
+                options specified for it.
+
+        Raises:
+            BadArgumentError: One or more arguments are invalid.
+        """
+
+        parser = _ArgumentParser(
+            prog=f'{self._parser.prog} {name}',
+            usage="%(prog)s [options]",
+            description=summary,
+        )
+
+        self._add_arguments(parser, module.main)
+
+        return vars(parser.parse_args(argv))
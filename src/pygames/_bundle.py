@@ -0,0 +1,24 @@
+import os
+
+# The directory of the data files bundled with a zipapp build of PyGames (see
+# the `build` command); it does not exist in the source tree or other installs
+DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), '_data')
+
+
+def read_data(name: str) -> bytes | None:
+    """Reads a data file bundled with a zipapp build.
+
+    The file is read through the package's loader, so that it can be read
+    straight from the archive, without extracting it.
+
+    Args:
+        name (str): The name of the file.
+
+    Returns:
+        bytes | None: The file's contents, or None if it was not bundled.
+    """
+
+    try:
+        return __loader__.get_data(os.path.join(DATA_DIRECTORY, name))
+    except OSError:
+        return None
@@ -0,0 +1,159 @@
+import itertools
+import json
+import random
+import sys
+from typing import Iterator
+
+
+class Journal:
+    """An append-only log of the events in a series of games.
+
+    Each event is written as a single, compact line of JSON (i.e. JSONL), and
+    flushed right away, so that a journal stays readable even if the program
+    exits unexpectedly. Every game begins with a 'start' event, holding
+    everything needed to replay it (e.g. the seed and the game's settings),
+    and ends with an 'end' event, holding its outcome.
+
+    A journal without a path is disabled, and silently ignores all events.
+    """
+
+    def __init__(self, path: str = ''):
+        self._file = open(path, 'a', encoding='utf-8') if path else None
+
+    def __enter__(self) -> 'Journal':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record(self, event: str, **fields):
+        """Appends an event to the journal.
+
+        Args:
+            event (str): The type of event (e.g. 'start', 'guess', 'end').
+            fields: Any data associated with the event; must be serializable
+                as JSON.
+        """
+
+        if self._file is None:
+            return None
+
+        line = json.dumps({'event': event, **fields}, separators=(',', ':'))
+        self._file.write(line + '\n')
+        self._file.flush()
+
+    def close(self):
+        """Closes the journal's file, if it has one."""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def make_rng(seed: int | None) -> (int, random.Random):
+    """Creates a random number generator that can be reproduced later.
+
+    Args:
+        seed (int | None): The seed to use, or None to pick one at random.
+
+    Returns:
+        int: The seed used, which can be recorded to replay the game later.
+        random.Random: The new random number generator.
+    """
+
+    if seed is None:
+        seed = random.randrange(1 << 64)
+
+    return (seed, random.Random(seed))
+
+
+class CorruptedJournalError(ValueError):
+    """Error from reading a line of a journal that is not a valid event."""
+
+
+def read_events(path: str) -> Iterator[dict]:
+    """Reads the events from a journal file, one at a time.
+
+    The journal file is read as a stream, so that even large journals can be
+    read without loading them into memory. The standard input is left open
+    once read.
+
+    Args:
+        path (str): The path to the journal file, or '-' for the standard
+            input.
+
+    Yields:
+        dict: The next event in the journal.
+
+    Raises:
+        ValueError: The journal cannot be read.
+        CorruptedJournalError: A line of the journal is not a valid event.
+    """
+
+    if path == '-':
+        yield from _parse_events(sys.stdin)
+        return None
+
+    try:
+        f = open(path, encoding='utf-8')
+    except OSError as e:
+        raise ValueError(f"cannot read journal '{path}': {e.strerror}")
+
+    with f:
+        yield from _parse_events(f)
+
+
+def _parse_events(lines: Iterator[str]) -> Iterator[dict]:
+    """Parses the lines of a journal into events; see `read_events()`.
+
+    Args:
+        lines (Iterator[str]): The lines of the journal.
+
+    Yields:
+        dict: The next event in the journal.
+
+    Raises:
+        CorruptedJournalError: A line is not a valid event.
+    """
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            raise CorruptedJournalError(f"corrupted journal on line {number}")
+
+        if not isinstance(event, dict) or 'event' not in event:
+            raise CorruptedJournalError(f"corrupted journal on line {number}")
+
+        yield event
+
+
+def group_games(events: Iterator[dict]) -> Iterator[tuple]:
+    """Groups a stream of journal events by the game they belong to.
+
+    Args:
+        events (Iterator[dict]): The events of a journal, in order.
+
+    Yields:
+        dict: The 'start' event of the next game.
+        Iterator[dict]: The rest of the game's events, including its 'end'
+            event (if it has one). These are read lazily from ``events``, and
+            are skipped over if not consumed before moving on to the next
+            game.
+    """
+
+    game_number = 0
+
+    # number each game in order, so that all events of a game share the same
+    # key; any events before the first 'start' event are given the key 0
+    def key(event: dict) -> int:
+        nonlocal game_number
+        game_number += event['event'] == 'start'
+        return game_number
+
+    for number, game in itertools.groupby(events, key=key):
+        if number:
+            yield (next(game), game)
@@ -0,0 +1,489 @@
+import os
+import pathlib
+import random
+import signal
+import struct
+import time
+from array import array
+
+from . import tic_tac_toe
+
+# The number of codes of the classic grid: each of its nine spaces is empty,
+# a nought or a cross (see `get_code()`)
+_STATES = 3 ** 9
+
+# The weight of each space in the code of a grid
+_POWERS = tuple(3 ** n for n in range(9))
+
+# The lines through each space of the classic grid
+_LINES_THROUGH = tuple(
+    tuple(line for line in tic_tac_toe._LINES if n in line) for n in range(9)
+)
+
+_CROSS = tic_tac_toe._Mark.Cross.value
+_NOUGHT = tic_tac_toe._Mark.Nought.value
+
+# Header of a checkpoint: magic bytes, the number of values that follow it
+# (as 32-bit floats), and the number of games the values were trained with
+_CHECKPOINT_HEADER = struct.Struct('<4sIQ')
+_CHECKPOINT_MAGIC = b'PGVT'
+
+# The value table of a worker process of a training, set once the process
+# starts (see `_start_worker()`)
+_worker_table = None
+
+
+def get_code(spaces) -> int:
+    """Numbers a position of the classic grid, from 0 to 3**9 - 1.
+
+    Args:
+        spaces: The value of each mark on the grid, or 0 for an empty space,
+            left to right and top to bottom (see `tic_tac_toe._get_spaces()`).
+
+    Returns:
+        int: The code of the position, which reads the spaces as the digits
+            of a number in base 3, the first space being the lowest digit.
+    """
+
+    return sum(value * power for value, power in zip(spaces, _POWERS))
+
+
+def _is_win(spaces: list, n: int) -> bool:
+    """Checks whether the mark just made on a space completed a line."""
+
+    mark = spaces[n]
+
+    for a, b, c in _LINES_THROUGH[n]:
+        if spaces[a] == spaces[b] == spaces[c] == mark:
+            return True
+
+    return False
+
+
+class ValueTable:
+    """The learned value of every position of tic-tac-toe on the classic grid.
+
+    Each position is valued from the point of view of the player who just
+    marked the grid, from -1 (a sure loss) to 1 (a sure win), and stored at
+    its code (see `get_code()`); the player to move picks the move that
+    leads to the most valuable position. Who just moved is told by the
+    number of marks on the grid, so a code alone is enough.
+
+    The values can be held in shared memory, so that the processes of a
+    training (see `Trainer`) all learn into the same table, each writing
+    single values in place without locks or copies.
+    """
+
+    def __init__(self, shared: bool = False):
+        """Allocates a table of zeros (i.e. every position is a draw).
+
+        Args:
+            shared (bool): Whether or not to allocate the table in shared
+                memory, for other processes to attach to (default: False).
+        """
+
+        size = _STATES * struct.calcsize('d')
+
+        if shared:
+            # only imported for parallel trainings
+            from multiprocessing import shared_memory
+
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+            self.values = self._memory.buf.cast('d')
+        else:
+            self._memory = None
+            self.values = memoryview(bytearray(size)).cast('d')
+
+        self._owner = shared
+        self.games = 0
+
+    @classmethod
+    def attach(cls, name: str) -> 'ValueTable':
+        """Attaches to a table allocated in shared memory by another process.
+
+        Args:
+            name (str): The name of the table's shared memory block; see
+                `name`.
+
+        Returns:
+            ValueTable: The table.
+        """
+
+        from multiprocessing import shared_memory
+
+        table = cls.__new__(cls)
+        table._memory = shared_memory.SharedMemory(name)
+        table.values = table._memory.buf.cast('d')
+        table._owner = False
+        table.games = 0
+
+        return table
+
+    @property
+    def name(self) -> str | None:
+        """str | None: The name of the table's shared memory block, if any.
+        """
+
+        return self._memory.name if self._memory is not None else None
+
+    def close(self):
+        """Releases the table's shared memory, freeing it if it allocated it.
+        """
+
+        if self._memory is None:
+            return None
+
+        self.values.release()
+        self._memory.close()
+
+        if self._owner:
+            self._memory.unlink()
+
+        self._memory = None
+
+    def load(self, path: str):
+        """Replaces the values of the table with those of a checkpoint.
+
+        Args:
+            path (str): The path to the checkpoint; see `save()`.
+
+        Raises:
+            ValueError: The checkpoint cannot be read, or is invalid.
+        """
+
+        try:
+            data = pathlib.Path(path).read_bytes()
+        except OSError as e:
+            raise ValueError(f"cannot read checkpoint '{path}': {e.strerror}")
+
+        try:
+            magic, count, games = _CHECKPOINT_HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError(f"corrupted checkpoint '{path}'")
+
+        values = struct.Struct(f'<{_STATES}f')
+
+        if (magic != _CHECKPOINT_MAGIC or count != _STATES
+                or len(data) != _CHECKPOINT_HEADER.size + values.size):
+            raise ValueError(f"corrupted checkpoint '{path}'")
+
+        self.values[:] = array('d', values.unpack_from(
+            data, _CHECKPOINT_HEADER.size,
+        ))
+        self.games = games
+
+    def save(self, path: str):
+        """Saves the values of the table as a compact checkpoint.
+
+        The values are saved as 32-bit floats (about 77 KB), after a header;
+        the checkpoint is replaced at once, so that an interrupted save never
+        leaves it half written.
+
+        Args:
+            path (str): The path to save the checkpoint to.
+
+        Raises:
+            ValueError: The checkpoint cannot be written.
+        """
+
+        path = pathlib.Path(path)
+        # unique to this process, so that processes saving the same
+        # checkpoint at once cannot write over (or move) each other's
+        # temporary file
+        temporary_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+        try:
+            with open(temporary_path, 'wb') as f:
+                f.write(_CHECKPOINT_HEADER.pack(_CHECKPOINT_MAGIC, _STATES,
+                                                self.games))
+                f.write(struct.pack(f'<{_STATES}f', *self.values))
+
+            os.replace(temporary_path, path)
+        except OSError as e:
+            raise ValueError(f"cannot save checkpoint '{path}': {e.strerror}")
+
+    def choose_move(
+        self,
+        spaces: list,
+        turn: int,
+        rng: random.Random = random,
+        exploration: float = 0.0,
+    ) -> (int, bool):
+        """Picks the move that leads to the most valuable position.
+
+        Args:
+            spaces (list): The value of each mark on the grid, or 0 for an
+                empty space; see `get_code()`.
+            turn (int): The value of the mark of the player to move.
+            rng (random.Random): The random number generator used to explore
+                and to pick between equally valuable moves (default: the
+                `random` module's global generator).
+            exploration (float): The chance of picking a move at random
+                instead (default: 0.0).
+
+        Returns:
+            int: The number of the space to mark, from 0 to 8.
+            bool: Whether or not the move was picked at random.
+        """
+
+        moves = [n for n in range(9) if not spaces[n]]
+
+        if exploration and rng.random() < exploration:
+            return (rng.choice(moves), True)
+
+        # each value is read once, as other processes may be updating it
+        values = self.values
+        code = get_code(spaces)
+        scores = [values[code + turn * _POWERS[n]] for n in moves]
+        best = max(scores)
+        moves = [n for n, score in zip(moves, scores) if score == best]
+
+        return (rng.choice(moves), False)
+
+
+def play_training_game(
+    table: ValueTable,
+    rng: random.Random,
+    learning_rate: float,
+    exploration: float,
+) -> int:
+    """Plays a game against itself, and learns from each of its moves.
+
+    Each position is valued for the player who just moved into it. After
+    each move, the value of the position the opponent left (one move
+    earlier) is brought closer to the opposite of the value of the position
+    the move left, in the style of temporal-difference learning; moves
+    picked at random to explore teach nothing about the moves before them.
+    Positions that end the game are brought closer to 1 (a win) or 0 (a
+    draw).
+
+    Args:
+        table (ValueTable): The values to learn.
+        rng (random.Random): The random number generator used to explore.
+        learning_rate (float): The share of each error to correct, from 0
+            to 1.
+        exploration (float): The chance of each move being picked at random.
+
+    Returns:
+        int: The value of the winner's mark, or 0 for a draw.
+    """
+
+    values = table.values
+    spaces = [0] * 9
+    turn = _CROSS
+    code = previous = 0
+
+    for ply in range(9):
+        n, explored = table.choose_move(spaces, turn, rng, exploration)
+        spaces[n] = turn
+        code += turn * _POWERS[n]
+        won = _is_win(spaces, n)
+
+        if won or ply == 8:
+            values[code] += learning_rate * (won - values[code])
+
+        if ply and not explored:
+            values[previous] += learning_rate * (-values[code]
+                                                 - values[previous])
+
+        if won:
+            return turn
+
+        previous = code
+        turn = _CROSS + _NOUGHT - turn
+
+    return 0
+
+
+def play_random_game(table: ValueTable, mark: int,
+                     rng: random.Random) -> int:
+    """Plays a game against an opponent that picks its moves at random.
+
+    Args:
+        table (ValueTable): The values that pick the agent's moves.
+        mark (int): The value of the agent's mark; crosses move first.
+        rng (random.Random): The random number generator used by both
+            players.
+
+    Returns:
+        int: The value of the winner's mark, or 0 for a draw.
+    """
+
+    spaces = [0] * 9
+    turn = _CROSS
+
+    for _ in range(9):
+        if turn == mark:
+            n, _ = table.choose_move(spaces, turn, rng)
+        else:
+            n = rng.choice([n for n in range(9) if not spaces[n]])
+
+        spaces[n] = turn
+
+        if _is_win(spaces, n):
+            return turn
+
+        turn = _CROSS + _NOUGHT - turn
+
+    return 0
+
+
+class Trainer:
+    """Trains a value table by self-play, with several processes.
+
+    Every process plays its own games against itself, and learns into the
+    same table held in shared memory; updates are not locked, so that a
+    process may rarely overwrite the update another process just made to the
+    same value, which only costs a little learning. With a single process,
+    the games are played in the calling process alone.
+
+    Attributes:
+        table (ValueTable): The value table.
+    """
+
+    def __init__(self, processes: int, learning_rate: float,
+                 exploration: float):
+        """Starts the worker processes, and allocates their shared table.
+
+        Args:
+            processes (int): The number of processes to train with.
+            learning_rate (float): The share of each error to correct; see
+                `play_training_game()`.
+            exploration (float): The chance of each move being picked at
+                random.
+
+        Raises:
+            ValueError: ``processes`` is less than 1, or ``learning_rate`` or
+                ``exploration`` is out of range.
+        """
+
+        if processes < 1:
+            raise ValueError("the training needs at least 1 process")
+
+        if not 0 < learning_rate <= 1 or not 0 <= exploration <= 1:
+            raise ValueError("the learning rate must be from 0 (excluded) to "
+                             "1, and the exploration from 0 to 1")
+
+        self.table = ValueTable(shared=processes > 1)
+        self._processes = processes
+        self._learning_rate = learning_rate
+        self._exploration = exploration
+        self._pool = None
+
+        if processes > 1:
+            # only imported for parallel trainings
+            import multiprocessing
+
+            self._pool = multiprocessing.Pool(processes, _start_worker,
+                                              (self.table.name,))
+
+    def __enter__(self) -> 'Trainer':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stops the worker processes, and frees the table."""
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+        self.table.close()
+
+    def train(self, games: int, rng: random.Random) -> float:
+        """Plays games against itself, and learns from them.
+
+        Args:
+            games (int): The number of games to play, split evenly between the
+                processes.
+            rng (random.Random): The random number generator used to seed
+                each process's games.
+
+        Returns:
+            float: The number of seconds the games took.
+        """
+
+        start = time.perf_counter()
+        jobs = [
+            (games // self._processes + (n < games % self._processes),
+             rng.randrange(1 << 64), self._learning_rate, self._exploration)
+            for n in range(self._processes)
+        ]
+
+        if self._pool is None:
+            _train(self.table, *jobs[0])
+        else:
+            self._pool.starmap(_train_worker, jobs)
+
+        self.table.games += games
+
+        return time.perf_counter() - start
+
+    def evaluate(self, games: int, rng: random.Random) -> (int, int, int):
+        """Plays the table against an opponent that moves at random.
+
+        Args:
+            games (int): The number of games to play, half of them as
+                crosses (who move first) and half as noughts.
+            rng (random.Random): The random number generator used by both
+                players.
+
+        Returns:
+            int: The number of games won by the table.
+            int: The number of games drawn.
+            int: The number of games lost.
+        """
+
+        wins = draws = 0
+
+        for n in range(games):
+            mark = (_CROSS, _NOUGHT)[n % 2]
+            winner = play_random_game(self.table, mark, rng)
+            wins += winner == mark
+            draws += not winner
+
+        return (wins, draws, games - wins - draws)
+
+
+def _train(table: ValueTable, games: int, seed: int, learning_rate: float,
+           exploration: float):
+    """Plays games against itself, and learns from them into a table.
+
+    Args:
+        table (ValueTable): The value table.
+        games (int): The number of games to play.
+        seed (int): The seed of the games.
+        learning_rate (float): The share of each error to correct.
+        exploration (float): The chance of each move being picked at random.
+    """
+
+    rng = random.Random(seed)
+
+    for _ in range(games):
+        play_training_game(table, rng, learning_rate, exploration)
+
+
+def _start_worker(name: str):
+    """Prepares a worker process of a training, as it starts.
+
+    Args:
+        name (str): The name of the shared value table.
+    """
+
+    global _worker_table
+
+    # interrupting the program only interrupts the main process, which then
+    # stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _worker_table = ValueTable.attach(name)
+
+
+def _train_worker(games: int, seed: int, learning_rate: float,
+                  exploration: float):
+    """Plays games in a worker process of a training; see `_train()`."""
+
+    _train(_worker_table, games, seed, learning_rate, exploration)
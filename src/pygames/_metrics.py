@@ -0,0 +1,409 @@
+import functools
+import os
+import sys
+import threading
+import time
+from types import FunctionType
+
+# Each power of two is split into 2 ** _SUB_BUCKET_BITS linear sub-buckets,
+# which bounds the error of any recorded latency to 1/16th of its value, no
+# matter how large it is (the same layout as an HDR histogram)
+_SUB_BUCKET_BITS = 4
+
+# The port that metrics are served on, if the address does not specify one
+_DEFAULT_PORT = 9464
+
+_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# The description of each metric, included in the exported text
+_DESCRIPTIONS = {
+    'pygames_computer_move_seconds': "Time taken by the computer to move",
+    'pygames_games_total': "Games finished, by outcome",
+    'pygames_input_wait_seconds': "Time spent waiting for the user's input",
+    'pygames_render_seconds': "Time taken to draw a frame",
+    'pygames_turn_seconds': "Time taken to process the user's input",
+    'pygames_word_fetch_seconds': "Time taken to fetch a secret word",
+}
+
+# The registry that measurements are recorded to, or None while disabled; it
+# is read once per measurement, so that disabled measurements cost next to
+# nothing
+_registry = None
+
+
+class Histogram:
+    """A histogram of latencies, with a bounded relative error.
+
+    Latencies are recorded in nanoseconds, into buckets whose width grows with
+    the values they hold: values below 32 are counted exactly, and every
+    power of two above that is split into 16 buckets of equal width. This
+    covers anything from nanoseconds to hours in a few hundred buckets, each
+    within 6.25% of the values it holds.
+
+    Attributes:
+        count (int): The number of values recorded.
+        sum (int): The sum of all values recorded.
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self.count = 0
+        self.sum = 0
+
+    @staticmethod
+    def _get_index(value: int) -> int:
+        """Finds the index of the bucket that holds a value."""
+
+        shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+
+        if shift <= 0:
+            return value
+
+        return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+    @staticmethod
+    def _get_upper_bound(index: int) -> int:
+        """Finds the (exclusive) upper bound of the values in a bucket."""
+
+        shift = (index >> _SUB_BUCKET_BITS) - 1
+
+        if shift <= 0:
+            return index + 1
+
+        return (index - (shift << _SUB_BUCKET_BITS) + 1) << shift
+
+    def record(self, value: int):
+        """Records a value.
+
+        Args:
+            value (int): The value to record; must not be negative.
+        """
+
+        index = self._get_index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+
+    def get_buckets(self) -> list:
+        """Lists the upper bound and cumulative count of each bucket.
+
+        Returns:
+            list: A tuple for each non-empty bucket, in order, with the
+                (exclusive) upper bound of its values, and the number of
+                values recorded in it or any bucket before it.
+        """
+
+        buckets = []
+        total = 0
+
+        for index in sorted(self._counts):
+            total += self._counts[index]
+            buckets.append((self._get_upper_bound(index), total))
+
+        return buckets
+
+    def get_quantile(self, quantile: float) -> int:
+        """Estimates a quantile of the recorded values (e.g. 0.99 for p99).
+
+        Args:
+            quantile (float): The quantile to estimate, from 0 to 1.
+
+        Returns:
+            int: The upper bound of the bucket holding the quantile, or 0 if
+                no values were recorded.
+        """
+
+        target = max(1, round(quantile * self.count))
+
+        for upper_bound, total in self.get_buckets():
+            if total >= target:
+                return upper_bound
+
+        return 0
+
+
+class Registry:
+    """A set of counters and histograms, exportable in Prometheus format.
+
+    Each metric is identified by its name and a sorted tuple of its labels, as
+    pairs of strings. Measurements may be recorded and exported from
+    different threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def increment(self, key: tuple, amount: int = 1):
+        """Increments a counter.
+
+        Args:
+            key (tuple): The name and labels of the counter.
+            amount (int): The amount to increment it by (default: 1).
+        """
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, key: tuple, nanoseconds: int):
+        """Records a latency to a histogram.
+
+        Args:
+            key (tuple): The name and labels of the histogram.
+            nanoseconds (int): The latency to record.
+        """
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+
+            histogram.record(nanoseconds)
+
+    def get_histogram(self, name: str, **labels) -> Histogram | None:
+        """Finds a histogram by its name and labels, if it has any values."""
+
+        return self._histograms.get((name, tuple(sorted(labels.items()))))
+
+    def export(self) -> str:
+        """Exports every metric in the Prometheus text format.
+
+        Latencies are exported in seconds; only the non-empty buckets of each
+        histogram are listed.
+
+        Returns:
+            str: The exported metrics.
+        """
+
+        lines = []
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                (key, histogram.get_buckets(), histogram.sum, histogram.count)
+                for key, histogram in self._histograms.items()
+            )
+
+        previous_name = None
+
+        # metrics are sorted by name, so each one's header is only added
+        # before its first set of labels
+        for (name, labels), value in counters:
+            if name != previous_name:
+                _add_header(lines, name, 'counter')
+                previous_name = name
+
+            lines.append(f'{name}{_format_labels(labels)} {value}')
+
+        for (name, labels), buckets, total, count in histograms:
+            if name != previous_name:
+                _add_header(lines, name, 'histogram')
+                previous_name = name
+
+            for upper_bound, cumulative in buckets:
+                bucket_labels = (*labels, ('le', repr(upper_bound / 1e9)))
+                lines.append(
+                    f'{name}_bucket{_format_labels(bucket_labels)} '
+                    f'{cumulative}'
+                )
+
+            bucket_labels = (*labels, ('le', '+Inf'))
+            lines.append(
+                f'{name}_bucket{_format_labels(bucket_labels)} {count}'
+            )
+            lines.append(f'{name}_sum{_format_labels(labels)} {total / 1e9!r}')
+            lines.append(f'{name}_count{_format_labels(labels)} {count}')
+
+        return ''.join(f'{line}\n' for line in lines)
+
+
+def _add_header(lines: list, name: str, metric_type: str):
+    """Adds the HELP and TYPE lines of a metric to the exported lines."""
+
+    if name in _DESCRIPTIONS:
+        lines.append(f'# HELP {name} {_DESCRIPTIONS[name]}')
+
+    lines.append(f'# TYPE {name} {metric_type}')
+
+
+def _format_labels(labels: tuple) -> str:
+    """Formats the labels of a metric, escaping their values as needed."""
+
+    if not labels:
+        return ''
+
+    pairs = ','.join(
+        '{}="{}"'.format(name, value.replace('\\', '\\\\')
+                                    .replace('"', '\\"')
+                                    .replace('\n', '\\n'))
+        for name, value in labels
+    )
+
+    return f'{{{pairs}}}'
+
+
+def timed(name: str, **labels) -> FunctionType:
+    """Creates a decorator that records how long each call of a function takes.
+
+    While metrics are disabled, the decorated function is called directly,
+    after a single check.
+
+    Args:
+        name (str): The name of the histogram to record to.
+        labels: The labels of the histogram, as strings.
+
+    Returns:
+        FunctionType: The decorator.
+    """
+
+    key = (name, tuple(sorted(labels.items())))
+
+    def decorator(function: FunctionType) -> FunctionType:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            registry = _registry
+
+            if registry is None:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter_ns()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                registry.observe(key, time.perf_counter_ns() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, **labels):
+    """Increments a counter by one, if metrics are enabled.
+
+    Args:
+        name (str): The name of the counter.
+        labels: The labels of the counter, as strings.
+    """
+
+    registry = _registry
+
+    if registry is not None:
+        registry.increment((name, tuple(sorted(labels.items()))))
+
+
+def enable() -> Registry:
+    """Starts recording metrics to a new registry, and returns it."""
+
+    global _registry
+
+    _registry = Registry()
+    return _registry
+
+
+def disable():
+    """Stops recording metrics."""
+
+    global _registry
+
+    _registry = None
+
+
+def _write(registry: Registry, path: str):
+    """Writes the exported metrics to a file, replacing it atomically.
+
+    Args:
+        registry (Registry): The metrics to write.
+        path (str): The path to write them to.
+    """
+
+    temporary_path = f'{path}.tmp'
+
+    with open(temporary_path, 'w', encoding='utf-8') as f:
+        f.write(registry.export())
+
+    os.replace(temporary_path, path)
+    sys.stderr.write(f"metrics saved to '{path}'\n")
+
+
+def _serve(registry: Registry, address: str):
+    """Serves the exported metrics over HTTP from a background thread.
+
+    Args:
+        registry (Registry): The metrics to serve.
+        address (str): The address to serve them at, as an 'http://' URL;
+            the port defaults to 9464 if not given.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The server, already started.
+    """
+
+    # only imported when serving metrics, to keep startup fast otherwise
+    import http.server
+    import urllib.parse
+
+    url = urllib.parse.urlsplit(address)
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path not in ('/', '/metrics'):
+                self.send_error(404)
+                return None
+
+            body = registry.export().encode()
+
+            self.send_response(200)
+            self.send_header('Content-Type', _CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass # keep the game's output clean
+
+    server = http.server.ThreadingHTTPServer(
+        (url.hostname or '127.0.0.1', url.port or _DEFAULT_PORT),
+        MetricsHandler,
+    )
+    server.daemon_threads = True
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    host, port = server.server_address[:2]
+    sys.stderr.write(f"serving metrics at 'http://{host}:{port}/metrics'\n")
+
+    return server
+
+
+def export_call(function: FunctionType, target: str, **kwargs):
+    """Calls a function while recording metrics, then exports them.
+
+    Args:
+        function (FunctionType): The function to call.
+        target (str): Either the path of a file to write the metrics to once
+            the function returns (even if it raises an exception), or an
+            'http://' address to serve them at while the function runs.
+        kwargs: The keyword arguments to call the function with.
+
+    Returns:
+        The value returned by the function.
+    """
+
+    registry = enable()
+    server = None
+
+    if target.startswith('http://'):
+        server = _serve(registry, target)
+
+    try:
+        return function(**kwargs)
+    finally:
+        disable()
+
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        else:
+            _write(registry, target)
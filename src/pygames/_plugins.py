@@ -0,0 +1,186 @@
+"""Finds the third-party games installed alongside PyGames.
+
+A distribution adds a game by registering its module under the
+`ENTRY_POINT_GROUP` entry-point group; the game's module only needs a
+`main()` function, like the built-in games. Reading every distribution's
+metadata is slow, so the plugins found are cached in an index, which is
+only rebuilt when the installed distributions may have changed (see
+`discover()`), and a plugin's module is only imported once its command is
+run (see `load()`).
+"""
+
+import importlib
+import json
+import os
+import pathlib
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+
+# The entry-point group that third-party games register themselves under;
+# each entry point names a module with a `main()` function, like the
+# built-in games, e.g. ``snake = "pygames_snake"``
+ENTRY_POINT_GROUP = 'pygames.games'
+
+# The version of the index's format; indexes of other versions are rebuilt
+_INDEX_VERSION = 1
+
+
+@dataclass
+class Plugin:
+    """A third-party game, found through its entry point.
+
+    Attributes:
+        name (str): The name of the game's command.
+        module (str): The name of the game's module.
+        summary (str): A one-line description of the game, from the metadata
+            of the distribution that installed it.
+    """
+
+    name: str
+    module: str
+    summary: str = ''
+
+
+def get_index_path() -> pathlib.Path:
+    """Finds the path to the cached index of installed plugins.
+
+    The index is cached in 'pygames' in the user's cache directory
+    (``$XDG_CACHE_HOME``, or '~/.cache').
+
+    Returns:
+        pathlib.Path: The path to the index.
+    """
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or '~/.cache'
+    return pathlib.Path(cache_home).expanduser() / 'pygames' / 'plugins.json'
+
+
+def _get_environment_key() -> list:
+    """Describes the environment that plugins are installed in.
+
+    Installing or removing a distribution adds or removes its metadata
+    directory in one of the directories on ``sys.path``, which changes the
+    modification time of that directory; so the key changes whenever the
+    installed plugins may have changed, at the cost of a single `os.stat()`
+    call per directory.
+
+    Returns:
+        list: The Python version, and the modification time of each entry
+            of ``sys.path`` (or None if it does not exist).
+    """
+
+    key = [sys.version]
+
+    for entry in sys.path:
+        try:
+            key.append([entry, os.stat(entry or '.').st_mtime_ns])
+        except OSError:
+            key.append([entry, None])
+
+    return key
+
+
+def _scan() -> list:
+    """Finds the installed plugins, by reading every distribution's metadata.
+
+    Plugins whose name is taken by an earlier plugin are left out.
+
+    Returns:
+        list: The plugins, sorted by name.
+    """
+
+    # only imported when the index is out of date, as it is slow to import
+    # (and even slower to use)
+    from importlib import metadata
+
+    plugins = {}
+
+    for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in plugins:
+            continue
+
+        distribution = entry_point.dist
+        summary = distribution.metadata['Summary'] if distribution else None
+
+        plugins[entry_point.name] = Plugin(
+            entry_point.name, entry_point.value.strip(), summary or '',
+        )
+
+    return sorted(plugins.values(), key=lambda plugin: plugin.name)
+
+
+def discover(path: pathlib.Path | None = None) -> list:
+    """Finds the installed plugins, using the cached index if it is current.
+
+    The index is rebuilt whenever the environment changes (see
+    `_get_environment_key()`), so that reading it takes the same time no
+    matter how many distributions are installed. Failing to save the index
+    is not an error, as it can be rebuilt.
+
+    Args:
+        path (pathlib.Path | None): The path to the index (default: see
+            `get_index_path()`).
+
+    Returns:
+        list: The plugins, sorted by name; see `Plugin`.
+    """
+
+    path = path or get_index_path()
+    key = _get_environment_key()
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            index = json.load(f)
+
+        if index['version'] == _INDEX_VERSION and index['key'] == key:
+            return [Plugin(**plugin) for plugin in index['plugins']]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    plugins = _scan()
+    # unique to this process, so that processes rebuilding the index at once
+    # cannot write over (or move) each other's temporary file
+    temporary_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': _INDEX_VERSION,
+                'key': key,
+                'plugins': [vars(plugin) for plugin in plugins],
+            }, f)
+
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+    return plugins
+
+
+def load(plugin: Plugin) -> ModuleType:
+    """Imports the module of a plugin.
+
+    Args:
+        plugin (Plugin): The plugin to import.
+
+    Returns:
+        ModuleType: The plugin's module.
+
+    Raises:
+        ValueError: The module cannot be imported, or has no `main()`
+            function.
+    """
+
+    try:
+        module = importlib.import_module(plugin.module)
+    except ImportError as e:
+        raise ValueError(f"cannot load plugin '{plugin.name}': {e}")
+
+    if not callable(getattr(module, 'main', None)):
+        raise ValueError(f"cannot load plugin '{plugin.name}': "
+                         f"'{plugin.module}' has no main() function")
+
+    return module
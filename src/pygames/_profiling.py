@@ -0,0 +1,101 @@
+import os
+import sys
+from types import FunctionType
+
+# The number of functions listed in the text summary of a profile
+_SUMMARY_LENGTH = 30
+
+# The profiler started by `start_from_environment()`, if any; only one
+# profiler can be active at a time
+_active_profiler = None
+
+
+def _save_profile(profiler, path: str):
+    """Saves a profile as a '.pstats' file, and a text summary next to it.
+
+    The summary lists the functions with the highest cumulative time, and is
+    saved to the same path with a '.txt' suffix added.
+
+    Args:
+        profiler (cProfile.Profile): The profiler to save the profile of.
+        path (str): The path to save the profile to.
+    """
+
+    import pstats
+
+    profiler.dump_stats(path)
+
+    with open(f'{path}.txt', 'w', encoding='utf-8') as f:
+        stats = pstats.Stats(profiler, stream=f)
+        stats.sort_stats('cumulative').print_stats(_SUMMARY_LENGTH)
+
+    sys.stderr.write(f"profile saved to '{path}' (summary: '{path}.txt')\n")
+
+
+def start_from_environment():
+    """Starts profiling right away, if requested by an environment variable.
+
+    If the ``PYGAMES_PROFILE`` environment variable is set to a path, starts
+    profiling the whole process (including the time spent importing the
+    rest of PyGames) and saves the profile to that path when the process
+    exits. This is meant to be called as early as possible.
+    """
+
+    global _active_profiler
+
+    path = os.environ.get('PYGAMES_PROFILE')
+
+    if not path or _active_profiler is not None:
+        return None
+
+    # only imported when actually profiling, to keep startup fast otherwise
+    import atexit
+    import cProfile
+
+    _active_profiler = cProfile.Profile()
+    _active_profiler.enable()
+
+    atexit.register(_stop_and_save, _active_profiler, path)
+
+
+def _stop_and_save(profiler, path: str):
+    """Stops a profiler, then saves its profile; see `_save_profile()`."""
+
+    profiler.disable()
+    _save_profile(profiler, path)
+
+
+def profile_call(function: FunctionType, path: str, **kwargs):
+    """Calls a function while profiling it, then saves the profile.
+
+    The profile is saved even if the function raises an exception. If the
+    whole process is already being profiled (see `start_from_environment()`),
+    only one profiler can be active at a time, so the profile of the whole
+    process so far is saved to the path instead, and the process's profiler
+    carries on afterwards.
+
+    Args:
+        function (FunctionType): The function to call.
+        path (str): The path to save the profile to; see `_save_profile()`.
+        kwargs: The keyword arguments to call the function with.
+
+    Returns:
+        The value returned by the function.
+    """
+
+    if _active_profiler is not None:
+        try:
+            return function(**kwargs)
+        finally:
+            # saving the profile stops the profiler, until enabled again
+            _save_profile(_active_profiler, path)
+            _active_profiler.enable()
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+
+    try:
+        return profiler.runcall(function, **kwargs)
+    finally:
+        _save_profile(profiler, path)
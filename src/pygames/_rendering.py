@@ -0,0 +1,257 @@
+import os
+import sys
+
+from . import _metrics
+
+# ANSI escape sequences used when redrawing frames in a terminal
+_CLEAR_TO_EOL = '\x1b[K'
+_CLEAR_BELOW = '\x1b[J'
+
+
+class Renderer:
+    """Draws the games' output in the terminal, one frame at a time.
+
+    Each frame is a list of lines composed in full by the caller, then written
+    to the output stream with a single `write()` call (and a single flush).
+    When the output stream is a terminal, only the lines that differ from the
+    previous frame are redrawn, using ANSI escape sequences to move the cursor
+    over the lines that stayed the same. Otherwise, frames are written
+    sequentially, skipping any leading lines already written as part of the
+    previous frame; this keeps the output readable when it is piped to a file
+    or another program.
+
+    Attributes:
+        bytes_written (int): The total number of bytes written to the output
+            stream so far.
+        writes (int): The total number of `write()` calls made on the output
+            stream so far; one per frame that needed to be (re)drawn.
+    """
+
+    def __init__(self, stream=None, ansi: bool | None = None):
+        self._stream = stream if stream is not None else sys.stdout
+
+        if ansi is None:
+            isatty = getattr(self._stream, 'isatty', None)
+            ansi = bool(isatty and isatty())
+
+        self._ansi = ansi
+
+        # The lines of the previous frame, as they currently appear on screen,
+        # and the row of the cursor relative to the first of those lines. The
+        # cursor sits at the end of the last line after a frame is drawn, or
+        # at the start of the row below it after the user enters some input.
+        self._lines = []
+        self._row = 0
+
+        # the loop that reads the user's input once turns are timed, instead
+        # of `input()`
+        self._turns = None
+
+        self.bytes_written = 0
+        self.writes = 0
+
+    @property
+    def lines(self) -> list:
+        """list: The lines of the current frame, including any user input."""
+
+        return list(self._lines)
+
+    @_metrics.timed('pygames_render_seconds')
+    def draw(self, lines: list, final: bool = False):
+        """Draws a new frame, replacing the previous one.
+
+        Args:
+            lines (list): The lines of text making up the frame; none of them
+                may contain a newline character.
+            final (bool): Whether or not this is the last frame of a sequence
+                (e.g. the end of a game). The frame is terminated with a
+                newline, and the next frame will be drawn below it instead of
+                over it (default: False).
+        """
+
+        lines = list(lines)
+
+        if self._ansi:
+            buffer = self._compose_redraw(lines)
+        else:
+            buffer = self._compose_append(lines)
+
+        if final:
+            buffer += '\n'
+            self._lines = []
+            self._row = 0
+        else:
+            self._lines = lines
+            self._row = len(lines) - 1
+
+        self._write(buffer)
+
+    def input(self, lines: list, timeout: float | None = None) -> str:
+        """Draws a new frame, then reads a line of input from the user.
+
+        The last line of the frame acts as the prompt, and the user's input is
+        entered right after it.
+
+        Args:
+            lines (list): The lines of text making up the frame, the last of
+                which is used as the prompt.
+            timeout (float | None): The most seconds to wait for the input,
+                or None to wait for as long as it takes (default: None).
+
+        Returns:
+            str: The line of input entered by the user.
+
+        Raises:
+            EOFError: The user hit CTRL+D / EOF instead of entering a line. The
+                frame is kept as-is, so that it can be continued by the next
+                call to `draw()`.
+            TimeoutError: The user did not enter a line in time. Whatever
+                they typed so far is discarded, and the frame is kept as-is.
+        """
+
+        self.draw(lines)
+
+        if timeout is None and self._turns is None:
+            text = input()
+        else:
+            text = self._read_line(timeout)
+
+        # the typed text is echoed right after the prompt, and the cursor is
+        # moved to the start of the next row once the user presses enter
+        self._lines[-1] += text
+        self._row = len(self._lines)
+
+        return text
+
+    def _read_line(self, timeout: float | None) -> str:
+        """Reads a line of input from the user, within a time limit.
+
+        Once a line has been read this way, every following line is too, as
+        input may have been read ahead of it.
+
+        Args:
+            timeout (float | None): The most seconds to wait for the line, or
+                None to wait for as long as it takes.
+
+        Returns:
+            str: The line of input entered by the user.
+
+        Raises:
+            EOFError: The user hit CTRL+D / EOF instead of entering a line.
+            TimeoutError: The user did not enter a line in time.
+        """
+
+        if self._turns is None:
+            # only imported when turns are timed
+            from ._turns import TurnLoop
+
+            self._turns = TurnLoop()
+
+        fd = sys.stdin.fileno()
+
+        try:
+            return self._turns.read_line(fd, timeout)
+        except TimeoutError:
+            # drop the part of a line typed in a terminal, which would
+            # otherwise be prepended to the next line entered
+            if os.isatty(fd):
+                import termios
+
+                termios.tcflush(fd, termios.TCIFLUSH)
+
+            raise
+
+    def _compose_append(self, lines: list) -> str:
+        """Composes a frame by appending it below the previous one.
+
+        Args:
+            lines (list): The lines of the new frame.
+
+        Returns:
+            str: The text to write to the output stream.
+        """
+
+        start = 0
+
+        # skip the lines that have already been written, as long as the new
+        # frame only extends the previous one
+        if lines[:len(self._lines)] == self._lines:
+            start = len(self._lines)
+
+        # nothing new to write, unless the user has entered some (empty) input
+        # since, in which case the frame is drawn again below it
+        if start == len(lines):
+            if self._row < len(self._lines):
+                return ''
+
+            start = 0
+
+        buffer = '\n'.join(lines[start:])
+
+        # start on a new row, unless the cursor has already moved to one
+        if self._lines and self._row < len(self._lines):
+            buffer = '\n' + buffer
+
+        return buffer
+
+    def _compose_redraw(self, lines: list) -> str:
+        """Composes a frame by redrawing the changed lines of the previous one.
+
+        Args:
+            lines (list): The lines of the new frame.
+
+        Returns:
+            str: The text to write to the output stream, including the escape
+                sequences needed to move the cursor and clear stale text.
+        """
+
+        old = self._lines
+
+        if lines == old and self._row == len(old) - 1:
+            return ''
+
+        # find the first row that differs from the previous frame; the last
+        # row is always redrawn, so that the cursor ends up at the end of it
+        first = 0
+
+        while first < min(len(lines), len(old)) and lines[first] == old[first]:
+            first += 1
+
+        first = min(first, len(lines) - 1)
+        parts = []
+
+        if self._row > first:
+            parts.append(f'\x1b[{self._row - first}A')
+
+        parts.append('\r')
+        parts.append('\n' * (first - self._row))
+
+        for row in range(first, len(lines)):
+            if row > first:
+                parts.append('\n')
+
+            is_last = row == len(lines) - 1
+
+            if is_last or row >= len(old) or lines[row] != old[row]:
+                parts.append(lines[row] + _CLEAR_TO_EOL)
+
+        if len(old) > len(lines):
+            parts.append(_CLEAR_BELOW)
+
+        return ''.join(parts)
+
+    def _write(self, buffer: str):
+        """Writes the provided text to the output stream in a single call.
+
+        Args:
+            buffer (str): The text to write.
+        """
+
+        if not buffer:
+            return None
+
+        self._stream.write(buffer)
+        self._stream.flush()
+
+        self.bytes_written += len(buffer.encode())
+        self.writes += 1
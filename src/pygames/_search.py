@@ -0,0 +1,761 @@
+import random
+import signal
+import struct
+import time
+from dataclasses import dataclass
+
+# The score of a won position, minus the number of moves it takes to win;
+# every heuristic score must stay well below it
+WIN_SCORE = 1_000_000
+
+# Scores this close to `WIN_SCORE` mean that the game is decided
+_DECIDED_SCORE = WIN_SCORE - 1000
+
+# The deepest search ever started, no matter how much time is left
+_MAX_DEPTH = 64
+
+# An entry of a transposition table: the key of the position XORed with the
+# entry's data, and the data itself (see `_unpack_entry()`); an entry of zeros
+# is empty. Processes sharing a table write entries without locks, so an
+# entry may mix the halves of two writes; its key then fails to match
+_ENTRY = struct.Struct('<QQ')
+
+# A bucket of a transposition table: an entry only replaced by a deeper (or
+# newer) search, followed by an entry replaced by every other search
+_BUCKET = struct.Struct('<QQQQ')
+
+# The kinds of bound a score stored in a transposition table can be: the
+# exact score, or a lower or upper bound of it (the search failed high or low)
+_EXACT, _LOWER, _UPPER = 1, 2, 3
+
+# The transposition table and stop event of a helper process of a parallel
+# search, set once the process starts (see `_start_helper()`)
+_helper_table = None
+_helper_stop = None
+
+
+class _Timeout(Exception):
+    """Raised deep in the search once its time budget is spent."""
+
+
+@dataclass
+class SearchResult:
+    """The outcome of a search for the best move.
+
+    Attributes:
+        move: The best move found.
+        score (int): The score of the move, for the player making it.
+        depth (int): The depth of the deepest search that was completed (or
+            partly completed, if it already found a better move), in moves.
+        nodes (int): The number of positions visited.
+        seconds (float): The time spent searching.
+        hit_rate (float): The fraction of transposition table lookups that
+            found the position (0.0 if no table was used).
+    """
+
+    move: object
+    score: int
+    depth: int
+    nodes: int
+    seconds: float
+    hit_rate: float = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        """float: The number of positions visited per second."""
+
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+class TranspositionTable:
+    """A fixed-size table of the positions already searched, by their key.
+
+    Positions reached through different orders of moves (transpositions) are
+    only searched once, and the best move of a shallower search is searched
+    first by the next. The table is a single buffer of two-entry buckets, so
+    its memory never grows past its size however long it is searched: the
+    first entry of a bucket keeps the deepest search of the current move
+    (which saves the most work), and the second entry takes every position
+    the first does not.
+
+    The buffer can be held in shared memory, for the processes of a parallel
+    search to share (see `ParallelSearcher`); entries are then read and
+    written without locks, but verified against their key.
+
+    Attributes:
+        generation (int): The generation of the entries being stored, from 1
+            to 63; see `new_search()`.
+        lookups (int): The number of positions looked up.
+        hits (int): The number of lookups that found the position.
+    """
+
+    def __init__(self, size_mb: int, shared: bool = False):
+        """Allocates the table.
+
+        Args:
+            size_mb (int): The size of the table, in megabytes (MiB).
+            shared (bool): Whether or not to allocate the table in shared
+                memory, for other processes to attach to (default: False).
+
+        Raises:
+            ValueError: ``size_mb`` is less than 1.
+        """
+
+        if size_mb < 1:
+            raise ValueError("the transposition table needs at least 1 MB")
+
+        size = size_mb * 2**20 // _BUCKET.size * _BUCKET.size
+
+        if shared:
+            # only imported for parallel searches
+            from multiprocessing import shared_memory
+
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+            self._buffer = self._memory.buf
+        else:
+            self._memory = None
+            self._buffer = bytearray(size)
+
+        self._owner = shared
+
+        self._buckets = size // _BUCKET.size
+        self.generation = 1
+        self.lookups = 0
+        self.hits = 0
+
+    @classmethod
+    def attach(cls, name: str) -> 'TranspositionTable':
+        """Attaches to a table allocated in shared memory by another process.
+
+        Args:
+            name (str): The name of the table's shared memory block; see
+                `name`.
+
+        Returns:
+            TranspositionTable: The table.
+        """
+
+        from multiprocessing import shared_memory
+
+        # the block is tracked again, but by the resource tracker of the
+        # process that allocated it (which its child processes share), so it
+        # is still only freed once
+        table = cls.__new__(cls)
+        table._memory = shared_memory.SharedMemory(name)
+        table._buffer = table._memory.buf
+        table._owner = False
+        table._buckets = len(table._buffer) // _BUCKET.size
+        table.generation = 1
+        table.lookups = 0
+        table.hits = 0
+
+        return table
+
+    @property
+    def name(self) -> str | None:
+        """str | None: The name of the table's shared memory block, if any.
+        """
+
+        return self._memory.name if self._memory is not None else None
+
+    @property
+    def hit_rate(self) -> float:
+        """float: The fraction of lookups that found the position."""
+
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def close(self):
+        """Releases the table's shared memory, freeing it if it allocated it.
+        """
+
+        if self._memory is None:
+            return None
+
+        self._buffer = bytearray()
+        self._memory.close()
+
+        if self._owner:
+            self._memory.unlink()
+
+        self._memory = None
+
+    def clear(self):
+        """Empties the table."""
+
+        self._buffer[:] = bytes(len(self._buffer))
+
+    def new_search(self):
+        """Starts a new generation of entries, for the search of a new move.
+
+        Entries of older searches are still found, but are replaced by any
+        new entry, however shallow.
+        """
+
+        self.generation = self.generation % 63 + 1
+
+    def lookup(self, key: int) -> tuple | None:
+        """Looks up a position.
+
+        Args:
+            key (int): The 64-bit key of the position.
+
+        Returns:
+            tuple | None: The score of the position, its best move (or -1),
+                the depth it was searched to, and the kind of bound the score
+                is; or None if the position is not in the table.
+        """
+
+        self.lookups += 1
+        offset = key % self._buckets * _BUCKET.size
+        entries = _BUCKET.unpack_from(self._buffer, offset)
+
+        for n in (0, 2):
+            data = entries[n + 1]
+
+            if entries[n] ^ data == key and data:
+                self.hits += 1
+                return _unpack_entry(data)
+
+        return None
+
+    def store(self, key: int, score: int, move: int, depth: int,
+              bound: int):
+        """Stores the result of a search of a position.
+
+        Args:
+            key (int): The 64-bit key of the position.
+            score (int): The score of the position.
+            move (int): The best move, or -1 if none was found.
+            depth (int): The depth that the position was searched to.
+            bound (int): The kind of bound the score is.
+        """
+
+        offset = key % self._buckets * _BUCKET.size
+        old_key, old_data = _ENTRY.unpack_from(self._buffer, offset)
+        data = (score + 2**31 << 32 | (move + 1) << 16 | depth << 8
+                | self.generation << 2 | bound)
+
+        if not (old_key ^ old_data == key or depth >= old_data >> 8 & 0xff
+                or old_data >> 2 & 0x3f != self.generation):
+            offset += _ENTRY.size
+
+        _ENTRY.pack_into(self._buffer, offset, key ^ data, data)
+
+
+def _unpack_entry(data: int) -> tuple:
+    """Unpacks the data of a transposition table's entry.
+
+    The data packs the score of the position (offset by 2**31, in the upper
+    32 bits), its best move plus one (in the next 16), the depth it was
+    searched to (in the next 8), the generation of the search that stored
+    it (in the next 6) and the kind of bound the score is (in the lowest 2).
+
+    Args:
+        data (int): The data.
+
+    Returns:
+        tuple: The score, move, depth and kind of bound; see
+            `TranspositionTable.lookup()`.
+    """
+
+    return ((data >> 32) - 2**31, (data >> 16 & 0xffff) - 1, data >> 8 & 0xff,
+            data & 3)
+
+
+class Searcher:
+    """Searches for the best move with iterative deepening.
+
+    Searches the position to a depth of one move, then two, and so on, until
+    the time budget is spent; the best move of the deepest search is
+    returned. Each search starts with the moves that were best in the one
+    before it, all along its principal variation, which makes alpha-beta
+    pruning cut off far more of the tree than the extra searches cost.
+
+    The position is searched in place, and must provide:
+
+    - ``get_moves()``: the legal moves, in a list (empty once the game ends);
+    - ``play(move)`` and ``undo()``: make a move, or take back the last one;
+    - ``winner``: the winner of the game, if any (which can only be the
+      player who made the last move);
+    - ``evaluate()``: a heuristic score of a position whose game is still in
+      progress, for the player whose turn it is;
+    - ``key``: a 64-bit hash of the position, including whose turn it is
+      (only if searched with a transposition table, whose moves must then be
+      integers from 0 to 32767).
+    """
+
+    def __init__(self, position, table: TranspositionTable | None = None,
+                 stop=None):
+        """Prepares the search of a position.
+
+        Args:
+            position: The position to search.
+            table (TranspositionTable | None): The transposition table to
+                share the results of the search through, which can be reused
+                by the searches of later moves; its generation must be moved
+                on before each new move (see `TranspositionTable.new_search()`)
+                (default: None).
+            stop (multiprocessing.Event | None): An event that stops the
+                search as if its time budget was spent when set, and that the
+                search sets when it ends before its budget is spent; for the
+                searches of a parallel search to stop each other (default:
+                None).
+        """
+
+        self._position = position
+        self._table = table
+        self._stop = stop
+        self._deadline = 0.0
+        self._previous_pv = []
+        self._pv = []
+        self.nodes = 0
+
+    def search(
+        self,
+        think_ms: float,
+        max_depth: int = _MAX_DEPTH,
+        rng: random.Random | None = None,
+        first_depth: int = 1,
+    ) -> SearchResult:
+        """Finds the best move, within a time budget.
+
+        The time budget is a hard limit: the search is abandoned as soon as
+        it is spent, however deep it is, and the best move found so far is
+        returned.
+
+        Args:
+            think_ms (float): The time budget, in milliseconds.
+            max_depth (int): The deepest search to start, in moves (default:
+                64).
+            rng (random.Random | None): The random number generator used to
+                shuffle the moves before the first search, so that equally
+                good moves are picked at random (default: None, i.e. moves are
+                searched in the order listed by the position).
+            first_depth (int): The depth of the first search, in moves; the
+                searches of a parallel search start at different depths, so
+                that they do not all search the same positions (default: 1).
+
+        Returns:
+            SearchResult: The best move found.
+
+        Raises:
+            ValueError: The game has already ended.
+        """
+
+        start = time.perf_counter()
+        moves = self._position.get_moves()
+
+        if not moves:
+            raise ValueError("the game has already ended")
+
+        if rng is not None:
+            rng.shuffle(moves)
+
+        self._deadline = start + think_ms / 1000
+        self._previous_pv = []
+        self.nodes = 0
+
+        if self._table is not None:
+            lookups, hits = self._table.lookups, self._table.hits
+
+        result = SearchResult(moves[0], 0, 0, 0, 0.0)
+        finished = True
+
+        for depth in range(first_depth, max_depth + 1):
+            try:
+                move, score, moves = self._search_root(depth, moves, result)
+            except _Timeout:
+                finished = False
+                break
+
+            result.move, result.score, result.depth = move, score, depth
+            self._previous_pv = self._pv[0]
+
+            # deeper searches cannot change the outcome of a decided game
+            if abs(score) >= _DECIDED_SCORE:
+                break
+
+        # the other searches have nothing left to find
+        if self._stop is not None and finished and result.depth:
+            self._stop.set()
+
+        result.nodes = self.nodes
+        result.seconds = time.perf_counter() - start
+
+        if self._table is not None and self._table.lookups > lookups:
+            result.hit_rate = ((self._table.hits - hits)
+                               / (self._table.lookups - lookups))
+
+        return result
+
+    def _search_root(self, depth: int, moves: list,
+                     result: SearchResult) -> (object, int, list):
+        """Searches every move of the root position to a given depth.
+
+        The best move of the previous search is searched first; as soon as
+        it is searched, any move found to be better is the new best move,
+        even if the search runs out of time before the other moves.
+
+        Args:
+            depth (int): The depth to search to, in moves.
+            moves (list): The legal moves, in the order to search them.
+            result (SearchResult): The result to update with a better move
+                as soon as one is found, in case the search runs out of time.
+
+        Returns:
+            object: The best move.
+            int: The score of the best move.
+            list: The moves, ordered from best to worst, for the next search.
+
+        Raises:
+            _Timeout: The time budget was spent.
+        """
+
+        position = self._position
+        self._pv = [[] for _ in range(depth + 1)]
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        scores = {}
+        best_move = None
+
+        for n, move in enumerate(moves):
+            position.play(move)
+
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, 1, n == 0)
+            finally:
+                position.undo()
+
+            scores[move] = score
+
+            if score > alpha:
+                alpha, best_move = score, move
+                self._pv[0] = [move, *self._pv[1]]
+
+                if depth > 1:
+                    result.move, result.score = move, score
+                    result.depth = depth
+
+        # moves that could not beat the best move only have an upper bound
+        # for a score, but it is still a good guess of their order
+        ordered = sorted(moves, key=lambda move: -scores[move])
+
+        return (best_move, alpha, ordered)
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int,
+                 on_pv: bool) -> int:
+        """Scores a position with alpha-beta pruning, in negamax form.
+
+        Args:
+            depth (int): The remaining depth to search, in moves.
+            alpha (int): The lowest score the player to move is assured of.
+            beta (int): The highest score the opponent lets them have.
+            ply (int): The number of moves made since the root position.
+            on_pv (bool): Whether or not the moves made since the root follow
+                the principal variation of the previous search.
+
+        Returns:
+            int: The score of the position, for the player whose turn it is.
+
+        Raises:
+            _Timeout: The time budget was spent.
+        """
+
+        self.nodes += 1
+
+        if time.perf_counter() >= self._deadline:
+            raise _Timeout()
+
+        # checked less often, as it takes a system call
+        if (self._stop is not None and not self.nodes & 0xff
+                and self._stop.is_set()):
+            raise _Timeout()
+
+        position = self._position
+        pv = self._pv
+        pv[ply] = []
+
+        # only the player who just moved can have won
+        if position.winner:
+            return -(WIN_SCORE - ply)
+
+        moves = position.get_moves()
+
+        if not moves:
+            return 0
+
+        if depth == 0:
+            return position.evaluate()
+
+        table = self._table
+        table_move = -1
+
+        if table is not None:
+            key = position.key
+            entry = table.lookup(key)
+
+            if entry is not None:
+                score, table_move, table_depth, bound = entry
+                score = _from_table(score, ply)
+
+                # the principal variation is searched again, to extend it
+                if table_depth >= depth and not on_pv and (
+                    bound == _EXACT
+                    or bound == _LOWER and score >= beta
+                    or bound == _UPPER and score <= alpha
+                ):
+                    return score
+
+        previous_pv = self._previous_pv
+        pv_move = None
+
+        if on_pv and ply < len(previous_pv) and previous_pv[ply] in moves:
+            pv_move = previous_pv[ply]
+
+        # the best move of the previous search of the position, if any, is
+        # the most likely to cause a cutoff
+        first_move = table_move if pv_move is None else pv_move
+
+        if first_move in moves:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+
+        original_alpha = alpha
+        best_move = table_move
+
+        for move in moves:
+            position.play(move)
+
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1,
+                                       move == pv_move)
+            finally:
+                position.undo()
+
+            if score > alpha:
+                alpha, best_move = score, move
+                pv[ply] = [move, *pv[ply + 1]]
+
+                if alpha >= beta:
+                    break
+
+        if table is not None:
+            if alpha <= original_alpha:
+                bound = _UPPER
+            elif alpha >= beta:
+                bound = _LOWER
+            else:
+                bound = _EXACT
+
+            table.store(key, _to_table(alpha, ply), best_move, depth, bound)
+
+        return alpha
+
+
+class ParallelSearcher:
+    """Searches for the best move with several processes, in the style of
+    Lazy SMP.
+
+    Every process searches the same position at once, with its own
+    `Searcher`, sharing a transposition table held in shared memory; as the
+    helper processes start at different depths and order their moves
+    differently, each of them fills the table with positions the others then
+    skip, and the first to finish stops the others. The result of the
+    deepest search is returned (that of the main process, if none is
+    deeper).
+
+    The helper processes are started once, and reused for every move; with a
+    single process, the search runs in the calling process alone.
+
+    Attributes:
+        table (TranspositionTable): The transposition table.
+    """
+
+    def __init__(self, processes: int, size_mb: int):
+        """Starts the helper processes, and allocates their shared table.
+
+        Args:
+            processes (int): The number of processes to search with,
+                including the calling process.
+            size_mb (int): The size of the transposition table, in megabytes.
+
+        Raises:
+            ValueError: ``processes`` or ``size_mb`` is less than 1.
+        """
+
+        if processes < 1:
+            raise ValueError("the search needs at least 1 process")
+
+        self.table = TranspositionTable(size_mb, shared=processes > 1)
+        self._processes = processes
+        self._pool = None
+        self._stop = None
+
+        if processes > 1:
+            # only imported for parallel searches
+            import multiprocessing
+
+            self._stop = multiprocessing.Event()
+            self._pool = multiprocessing.Pool(
+                processes - 1, _start_helper, (self.table.name, self._stop),
+            )
+
+    def __enter__(self) -> 'ParallelSearcher':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stops the helper processes, and frees the table."""
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+        self.table.close()
+
+    def search(
+        self,
+        create_position,
+        args: tuple,
+        think_ms: float,
+        max_depth: int = _MAX_DEPTH,
+        rng: random.Random | None = None,
+    ) -> SearchResult:
+        """Finds the best move, within a time budget; see `Searcher.search()`.
+
+        Args:
+            create_position (Callable): A function that creates the position
+                to search, which every process calls to get its own copy; it
+                must be importable (i.e. defined at the top level of a
+                module).
+            args (tuple): The arguments to call ``create_position`` with.
+            think_ms (float): The time budget, in milliseconds.
+            max_depth (int): The deepest search to start, in moves (default:
+                64).
+            rng (random.Random | None): The random number generator used to
+                shuffle the moves of the main process (default: None).
+
+        Returns:
+            SearchResult: The best move found, with the positions visited by
+                every process.
+
+        Raises:
+            ValueError: The game has already ended.
+        """
+
+        start = time.perf_counter()
+        self.table.new_search()
+        position = create_position(*args)
+
+        if self._pool is None:
+            return Searcher(position, self.table).search(think_ms, max_depth,
+                                                         rng)
+
+        self._stop.clear()
+        helpers = [
+            self._pool.apply_async(_search_helper, (
+                create_position, args, think_ms, max_depth,
+                self.table.generation, n,
+            ))
+            for n in range(1, self._processes)
+        ]
+
+        try:
+            result = Searcher(position, self.table, self._stop).search(
+                think_ms, max_depth, rng,
+            )
+        finally:
+            self._stop.set()
+            results = [helper.get() for helper in helpers]
+
+        nodes = result.nodes + sum(other.nodes for other in results)
+
+        for other in results:
+            if other.depth > result.depth:
+                result = other
+
+        result.nodes = nodes
+        result.seconds = time.perf_counter() - start
+
+        return result
+
+
+def _start_helper(name: str, stop):
+    """Prepares a helper process of a parallel search, as it starts.
+
+    Args:
+        name (str): The name of the shared transposition table.
+        stop (multiprocessing.Event): The event that stops the search.
+    """
+
+    global _helper_table, _helper_stop
+
+    # interrupting the program only interrupts the main process, which then
+    # stops the helpers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _helper_table = TranspositionTable.attach(name)
+    _helper_stop = stop
+
+
+def _search_helper(create_position, args: tuple, think_ms: float,
+                   max_depth: int, generation: int, n: int) -> SearchResult:
+    """Searches a position in a helper process of a parallel search.
+
+    Args:
+        create_position (Callable): A function that creates the position.
+        args (tuple): The arguments to call ``create_position`` with.
+        think_ms (float): The time budget, in milliseconds.
+        max_depth (int): The deepest search to start, in moves.
+        generation (int): The generation of the table's entries.
+        n (int): The number of the helper, from 1; odd helpers start one move
+            deeper than the main process, and each helper orders its moves in
+            its own random order.
+
+    Returns:
+        SearchResult: The best move found by the helper.
+    """
+
+    _helper_table.generation = generation
+    searcher = Searcher(create_position(*args), _helper_table, _helper_stop)
+
+    return searcher.search(think_ms, max_depth, random.Random(n),
+                           first_depth=1 + n % 2)
+
+
+def _to_table(score: int, ply: int) -> int:
+    """Converts a score to be stored in a transposition table.
+
+    Scores of decided games count the moves from the root position, but the
+    same position can be reached at any ply; so they are stored counting the
+    moves from the position itself instead.
+
+    Args:
+        score (int): The score, counting from the root position.
+        ply (int): The number of moves made since the root position.
+
+    Returns:
+        int: The score to store.
+    """
+
+    if score >= _DECIDED_SCORE:
+        return score + ply
+
+    if score <= -_DECIDED_SCORE:
+        return score - ply
+
+    return score
+
+
+def _from_table(score: int, ply: int) -> int:
+    """Converts a score stored in a transposition table; see `_to_table()`."""
+
+    if score >= _DECIDED_SCORE:
+        return score - ply
+
+    if score <= -_DECIDED_SCORE:
+        return score + ply
+
+    return score
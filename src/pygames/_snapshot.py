@@ -0,0 +1,115 @@
+import itertools
+import struct
+
+from . import hangman, tic_tac_toe
+
+# Header of a set of snapshots: magic bytes, and the number of runs that
+# follow it
+_HEADER = struct.Struct('<4sI')
+_MAGIC = b'PGSS'
+
+# Header of a run of snapshots of the same game: the game's tag, and the
+# number of snapshots in the run; followed by the snapshots themselves
+_RUN_HEADER = struct.Struct('<2sI')
+
+# The game state type and snapshot format of each tag
+_FORMATS = {
+    b'HM': (hangman._GameState, hangman._SNAPSHOT),
+    b'TT': (tic_tac_toe._GameState, tic_tac_toe._SNAPSHOT),
+}
+_TAGS = {state_type: tag for tag, (state_type, _) in _FORMATS.items()}
+
+
+def dump(states) -> bytes:
+    """Encodes the snapshots of several in-progress games at once.
+
+    Consecutive states of the same game are stored as a single run, so that
+    they can be restored in bulk; see `load()`.
+
+    Args:
+        states: The game states to encode, of any supported game, in any
+            order.
+
+    Returns:
+        bytes: The encoded snapshots.
+
+    Raises:
+        ValueError: A game state cannot be encoded.
+    """
+
+    chunks = [b'']
+    run_count = 0
+
+    for state_type, run in itertools.groupby(states, type):
+        if state_type not in _TAGS:
+            raise ValueError(f"cannot snapshot a '{state_type.__name__}'")
+
+        tag = _TAGS[state_type]
+        snapshot = _FORMATS[tag][1]
+        header_position = len(chunks)
+        chunks.append(b'')
+        count = 0
+
+        try:
+            for state in run:
+                chunks.append(snapshot.pack(*state._get_snapshot()))
+                count += 1
+        except struct.error:
+            raise ValueError("cannot snapshot a game state")
+
+        chunks[header_position] = _RUN_HEADER.pack(tag, count)
+        run_count += 1
+
+    chunks[0] = _HEADER.pack(_MAGIC, run_count)
+    return b''.join(chunks)
+
+
+def load(data: bytes) -> list:
+    """Restores the game states encoded by `dump()`.
+
+    Args:
+        data (bytes): The encoded snapshots.
+
+    Returns:
+        list: The game states, in the order they were encoded in.
+
+    Raises:
+        ValueError: The snapshots are invalid.
+    """
+
+    view = memoryview(data)
+
+    try:
+        magic, run_count = _HEADER.unpack_from(view)
+    except struct.error:
+        raise ValueError("corrupted snapshot")
+
+    if magic != _MAGIC:
+        raise ValueError("corrupted snapshot")
+
+    states = []
+    position = _HEADER.size
+
+    for _ in range(run_count):
+        try:
+            tag, count = _RUN_HEADER.unpack_from(view, position)
+            state_type, snapshot = _FORMATS[tag]
+        except (struct.error, KeyError):
+            raise ValueError("corrupted snapshot")
+
+        start = position + _RUN_HEADER.size
+        position = start + count * snapshot.size
+
+        if position > len(view):
+            raise ValueError("corrupted snapshot")
+
+        # each run is unpacked in a single pass over its snapshots
+        from_snapshot = state_type._from_snapshot
+        states.extend(itertools.starmap(
+            from_snapshot, snapshot.iter_unpack(view[start:position])
+        ))
+
+    if position != len(view):
+        raise ValueError("corrupted snapshot")
+
+    return states
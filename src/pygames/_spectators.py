@@ -0,0 +1,216 @@
+"""Lets spectators watch a game live, over TCP.
+
+Spectators connect with any TCP client (e.g. `nc`), and are sent every frame
+of the game as it is played, each one clearing the screen before it is drawn.
+Each frame is encoded once, and the same bytes are queued for every
+spectator; a spectator whose connection cannot keep up skips to the latest
+frame instead of falling behind, so that no spectator can hold back the game
+(or the other spectators).
+
+The games themselves block on the player's input, so the spectators are
+served by an event loop of their own, running in a background thread.
+"""
+
+import asyncio
+import threading
+
+# Clears the screen and moves the cursor to its top left corner, in front of
+# each frame
+_CLEAR_SCREEN = b'\x1b[H\x1b[2J'
+
+# The number of bytes a spectator's connection may buffer before its frames
+# are queued instead of written
+_MAX_BACKLOG = 1 << 12
+
+
+def parse_address(address: str) -> tuple:
+    """Splits an address to serve spectators at into its host and port.
+
+    Args:
+        address (str): The address, as 'HOST:PORT' or just 'PORT' (in which
+            case only this machine may connect).
+
+    Returns:
+        tuple: The host and the port.
+
+    Raises:
+        ValueError: The port is not a number from 0 to 65535.
+    """
+
+    host, _, port = address.rpartition(':')
+
+    if not port.isdigit() or int(port) > 65535:
+        raise ValueError(f"invalid address to serve spectators at "
+                         f"'{address}'")
+
+    return (host or '127.0.0.1', int(port))
+
+
+class Broadcaster:
+    """Serves the frames of a game to every connected spectator.
+
+    Used as a context manager: spectators may connect from the moment it is
+    entered, and are disconnected when it is exited. Entering it raises a
+    `ValueError` if its address cannot be listened on.
+
+    Attributes:
+        frames (int): The number of frames published so far.
+        dropped (int): The number of frames that were never sent to a
+            spectator, because newer ones replaced them.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self._host = host
+        self._port = port
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+        # the frame waiting to be sent to each spectator (in a queue of a
+        # single frame), by their stream, and the latest frame, sent to
+        # spectators as soon as they connect
+        self._queues = {}
+        self._frame = None
+
+        self.frames = 0
+        self.dropped = 0
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+        if self._error is not None:
+            self._thread.join()
+            raise ValueError(f"cannot listen on {self._host}:{self._port}: "
+                             f"{self._error.strerror}")
+
+        return self
+
+    def __exit__(self, *exc_info):
+        self._loop.call_soon_threadsafe(self._close)
+        self._thread.join()
+
+    @property
+    def address(self) -> tuple:
+        """tuple: The host and port spectators may connect to."""
+
+        return self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def spectators(self) -> int:
+        """int: The number of spectators currently connected."""
+
+        return len(self._queues)
+
+    def publish(self, lines: list):
+        """Sends a new frame to every spectator.
+
+        The frame is encoded once, then handed over to the spectators' event
+        loop without waiting for it to be sent.
+
+        Args:
+            lines (list): The lines of text making up the frame.
+        """
+
+        data = _CLEAR_SCREEN + ''.join(f'{line}\n' for line in lines).encode()
+        self._loop.call_soon_threadsafe(self._fan_out, data)
+
+    def _run(self):
+        """Runs the spectators' event loop, until the server is closed."""
+
+        try:
+            asyncio.run(self._serve())
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+
+    async def _serve(self):
+        """Accepts spectators, until the server is closed.
+
+        Raises:
+            OSError: The server cannot listen on its address.
+        """
+
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(
+            self._handle_spectator, self._host, self._port,
+        )
+        self._ready.set()
+        await self._server.wait_closed()
+
+        # let every spectator's task end before the event loop stops
+        while self._queues:
+            await asyncio.sleep(0)
+
+    def _close(self):
+        """Disconnects every spectator, and stops accepting new ones."""
+
+        for writer, queue in self._queues.items():
+            # without waiting for slow spectators to receive their backlog
+            writer.transport.abort()
+            self._put_latest(queue, None)
+
+        self._server.close()
+
+    def _put_latest(self, queue: asyncio.Queue, data: bytes | None):
+        """Queues a frame for a spectator, replacing the one waiting, if any.
+
+        Args:
+            queue (asyncio.Queue): The spectator's queue, of a single frame.
+            data (bytes | None): The encoded frame, or None to disconnect
+                the spectator.
+        """
+
+        if queue.full():
+            # skip to the latest frame, rather than catching up on stale
+            # frames one at a time
+            if queue.get_nowait() is not None:
+                self.dropped += 1
+
+        queue.put_nowait(data)
+
+    def _fan_out(self, data: bytes):
+        """Queues a frame for every spectator, from the event loop's thread.
+
+        Args:
+            data (bytes): The encoded frame.
+        """
+
+        self._frame = data
+        self.frames += 1
+
+        for queue in self._queues.values():
+            self._put_latest(queue, data)
+
+    async def _handle_spectator(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        """Sends the frames queued for a spectator, until they disconnect.
+
+        Args:
+            reader (asyncio.StreamReader): The spectator's incoming stream,
+                which is never read from.
+            writer (asyncio.StreamWriter): The spectator's outgoing stream.
+        """
+
+        queue = asyncio.Queue(maxsize=1)
+        writer.transport.set_write_buffer_limits(high=_MAX_BACKLOG)
+        self._queues[writer] = queue
+
+        if self._frame is not None:
+            queue.put_nowait(self._frame)
+
+        try:
+            while (data := await queue.get()) is not None:
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass # the spectator disconnected
+        finally:
+            del self._queues[writer]
+            writer.close()
@@ -0,0 +1,280 @@
+import os
+import pathlib
+import queue
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    game TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    guesses INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS players (
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    played INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    PRIMARY KEY (game, player)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS players_by_player
+    ON players (player);
+CREATE INDEX IF NOT EXISTS players_by_wins
+    ON players (game, wins DESC);
+CREATE INDEX IF NOT EXISTS players_by_win_rate
+    ON players (game, CAST(wins AS REAL) / played DESC);
+CREATE INDEX IF NOT EXISTS players_by_guesses
+    ON players (game, CAST(guesses AS REAL) / played);
+CREATE INDEX IF NOT EXISTS players_by_streak
+    ON players (game, best_streak DESC);
+"""
+
+# Adds the outcome of a single game to a player's totals. The parameters are,
+# in order: the game, the player, then whether the game was a win, a loss or
+# a draw (as 1 or 0), and the number of guesses made.
+_UPDATE_TOTALS = """
+INSERT INTO players VALUES (?1, ?2, 1, ?3, ?4, ?5, ?6, ?3, ?3)
+ON CONFLICT (game, player) DO UPDATE SET
+    played = played + 1,
+    wins = wins + excluded.wins,
+    losses = losses + excluded.losses,
+    draws = draws + excluded.draws,
+    guesses = guesses + excluded.guesses,
+    streak = CASE WHEN excluded.wins THEN streak + 1 ELSE 0 END,
+    best_streak = MAX(best_streak, CASE WHEN excluded.wins THEN streak + 1
+                                   ELSE 0 END)
+"""
+
+# The expression that each leaderboard is sorted by; each one matches the
+# expression of an index on the 'players' table, so that the top players can
+# be read straight from the index
+LEADERBOARDS = {
+    'wins': 'wins DESC',
+    'win-rate': 'CAST(wins AS REAL) / played DESC',
+    'guesses': 'CAST(guesses AS REAL) / played',
+    'streak': 'best_streak DESC',
+}
+
+
+def get_database_path() -> pathlib.Path:
+    """Finds the path to the statistics database.
+
+    Uses the path in the ``PYGAMES_STATS_DB`` environment variable if it is
+    set; otherwise, uses 'pygames/stats.sqlite3' in the user's data directory
+    (``$XDG_DATA_HOME``, or '~/.local/share').
+
+    Returns:
+        pathlib.Path: The path to the statistics database.
+    """
+
+    if os.environ.get('PYGAMES_STATS_DB'):
+        return pathlib.Path(os.environ['PYGAMES_STATS_DB'])
+
+    data_home = os.environ.get('XDG_DATA_HOME') or '~/.local/share'
+    return pathlib.Path(data_home).expanduser() / 'pygames' / 'stats.sqlite3'
+
+
+def connect(path: pathlib.Path | None = None) -> 'sqlite3.Connection':
+    """Opens the statistics database, creating it if needed.
+
+    The database is opened in WAL mode, so that the statistics can be read
+    while a game is writing to them.
+
+    Args:
+        path (pathlib.Path | None): The path to the database (default: see
+            `get_database_path()`).
+
+    Returns:
+        sqlite3.Connection: The connection to the database.
+
+    Raises:
+        ValueError: The database cannot be created or opened.
+    """
+
+    # only imported once the statistics are used, to keep startup fast
+    # otherwise
+    import sqlite3
+
+    path = path or get_database_path()
+    connection = None
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(path)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        connection.executescript(_SCHEMA)
+    except (OSError, sqlite3.Error) as e:
+        if connection is not None:
+            connection.close()
+
+        raise ValueError(f"cannot open statistics database '{path}': {e}")
+
+    return connection
+
+
+class StatsRecorder:
+    """Records the outcome of each game to the statistics database.
+
+    Outcomes are handed off to a background thread, which writes every
+    outcome waiting in its queue in a single transaction, so that a game
+    never has to wait for the disk. The thread (and its connection to the
+    database) is only started once the first outcome is recorded, and any
+    outcomes still waiting are written when the recorder is closed.
+
+    A recorder without a player name is disabled, and silently ignores all
+    outcomes.
+
+    Attributes:
+        error (Exception | None): The error that stopped the background thread
+            from writing to the database, if any. Statistics are not worth
+            interrupting a game over, so such errors are not raised.
+    """
+
+    def __init__(self, player: str = '', path: pathlib.Path | None = None):
+        self._player = player
+        self._path = path
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self.error = None
+
+    def __enter__(self) -> 'StatsRecorder':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record(self, game: str, outcome: str, guesses: int = 0):
+        """Records the outcome of a game.
+
+        Args:
+            game (str): The name of the game (e.g. 'hangman').
+            outcome (str): Either 'win', 'lose' or 'draw'.
+            guesses (int): The number of guesses made, if applicable
+                (default: 0).
+        """
+
+        if not self._player:
+            return None
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._write_outcomes)
+            self._thread.start()
+
+        self._queue.put((game, outcome, guesses, time.time()))
+
+    def close(self):
+        """Writes any outcomes still waiting, then stops the recorder."""
+
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _write_outcomes(self):
+        """Writes outcomes from the queue until the recorder is closed."""
+
+        import sqlite3
+
+        try:
+            connection = connect(self._path)
+        except ValueError as e:
+            self.error = e
+            return None
+
+        try:
+            while True:
+                batch = [self._queue.get()]
+
+                # gather everything else that is already waiting, so that the
+                # whole batch is written in a single transaction
+                while not self._queue.empty():
+                    batch.append(self._queue.get())
+
+                is_closed = batch[-1] is None
+                batch = [outcome for outcome in batch if outcome is not None]
+
+                with connection:
+                    self._write_batch(connection, batch)
+
+                if is_closed:
+                    return None
+        except sqlite3.Error as e:
+            self.error = e
+        finally:
+            connection.close()
+
+    def _write_batch(self, connection: 'sqlite3.Connection', batch: list):
+        """Writes a batch of outcomes within the current transaction.
+
+        Args:
+            connection (sqlite3.Connection): The connection to the database.
+            batch (list): The outcomes to write, each as a tuple of the game,
+                the outcome, the number of guesses, and the time it was
+                recorded at.
+        """
+
+        connection.executemany(
+            'INSERT INTO games (player, game, outcome, guesses, finished_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            ((self._player, *outcome) for outcome in batch),
+        )
+
+        connection.executemany(_UPDATE_TOTALS, (
+            (game, self._player, outcome == 'win', outcome == 'lose',
+             outcome == 'draw', guesses)
+            for game, outcome, guesses, _ in batch
+        ))
+
+
+def get_leaderboard(
+    connection: 'sqlite3.Connection',
+    game: str,
+    by: str,
+    limit: int,
+) -> list:
+    """Finds the top players of a game.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+        game (str): The name of the game.
+        by (str): The leaderboard to read; one of the keys in `LEADERBOARDS`.
+        limit (int): The maximum number of players to return.
+
+    Returns:
+        list: A row for each player, best first; see `get_player_stats()`.
+    """
+
+    return connection.execute(
+        f'SELECT * FROM players WHERE game = ? ORDER BY {LEADERBOARDS[by]} '
+        'LIMIT ?', (game, limit),
+    ).fetchall()
+
+
+def get_player_stats(connection: 'sqlite3.Connection', player: str) -> list:
+    """Finds a player's statistics for every game they have played.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+        player (str): The name of the player.
+
+    Returns:
+        list: A row for each game, with the game, the player, then the number
+            of games played, wins, losses, draws, guesses, the current winning
+            streak and the best winning streak.
+    """
+
+    return connection.execute(
+        'SELECT * FROM players WHERE player = ? ORDER BY game', (player,),
+    ).fetchall()
@@ -0,0 +1,418 @@
+import itertools
+import mmap
+import os
+import pathlib
+import random
+import signal
+import struct
+
+from . import tic_tac_toe
+
+# Header of a tablebase file: magic bytes, the size of the grid, the number
+# of marks in a row it takes to win, the number of layers solved so far
+# (from the full grid down; see `Tablebase`) and the chunks of the next layer
+# already solved, as bits; followed by the values of the positions, four to a
+# byte
+_HEADER = struct.Struct('<4sBBBxI')
+_MAGIC = b'PGTB'
+
+# The values of a position, for the player whose turn it is; positions that
+# are not solved (yet) are valued 0
+WIN, DRAW, LOSS = 1, 2, 3
+
+_CROSS = tic_tac_toe._Mark.Cross.value
+_NOUGHT = tic_tac_toe._Mark.Nought.value
+
+# The largest grid a tablebase can be generated for: 3**16 positions take
+# about 10 MB, but the next size would take 200 GB
+_MAX_SIZE = 4
+
+# The number of spaces, from the last, whose marks pick the chunk of a
+# position; each layer is solved in 3**_CHUNK_SPACES chunks, in parallel
+_CHUNK_SPACES = 3
+
+# The tablebase of a worker process of a generation, set once the process
+# starts (see `_start_worker()`)
+_worker_tablebase = None
+
+
+def get_path(size: int, length: int) -> pathlib.Path:
+    """Finds the path to the tablebase of a game.
+
+    Tablebases are kept in 'pygames' in the user's cache directory
+    (``$XDG_CACHE_HOME``, or '~/.cache').
+
+    Args:
+        size (int): The number of spaces on each side of the grid.
+        length (int): The number of marks in a row it takes to win.
+
+    Returns:
+        pathlib.Path: The path to the tablebase.
+    """
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or '~/.cache'
+    return (pathlib.Path(cache_home).expanduser() / 'pygames'
+            / f'tic-tac-toe-{size}x{size}-{length}.tbl')
+
+
+class Tablebase:
+    """The value of every position of tic-tac-toe on a small grid, on disk.
+
+    Each position is stored at its code, which reads the marks on the grid as
+    the digits of a number in base 3 (see `_learning.get_code()`), as a 2-bit
+    value; crosses always move first, so the player whose turn it is can be
+    told from the marks alone. The file is memory-mapped, so that looking up
+    a position only reads the page it is on.
+
+    The positions are solved backward from the end of the game, one layer
+    (number of marks on the grid) at a time, starting from the full grid: the
+    value of a position only depends on the values of the positions of the
+    next layer, which are all solved by then. Each layer is split into chunks,
+    by the marks on the last few spaces of the grid, and the chunks are
+    solved in parallel by a pool of processes that share the mapped file; the
+    chunks are laid out so that no two of them share a byte, and a chunk
+    is only recorded as solved in the header once it is written to disk, so
+    that an interrupted generation resumes where it stopped.
+
+    Attributes:
+        path (pathlib.Path): The path to the tablebase.
+        size (int): The number of spaces on each side of the grid.
+        length (int): The number of marks in a row it takes to win.
+    """
+
+    def __init__(self, path: pathlib.Path, size: int, length: int):
+        """Opens a tablebase, creating an empty one if it does not exist.
+
+        Args:
+            path (pathlib.Path): The path to the tablebase.
+            size (int): The number of spaces on each side of the grid, from 3
+                to 4.
+            length (int): The number of marks in a row it takes to win, from
+                3 to the size of the grid.
+
+        Raises:
+            ValueError: The grid or line is out of range, or the tablebase
+                cannot be opened, or is not a valid tablebase of this game.
+        """
+
+        if not 3 <= size <= _MAX_SIZE or not 3 <= length <= size:
+            raise ValueError(f"tablebases can only be generated for grids of "
+                             f"3 to {_MAX_SIZE} spaces wide")
+
+        self.size = size
+        self.length = length
+        self._spaces = size * size
+        self._powers = tuple(3 ** n for n in range(self._spaces))
+
+        # every chunk is padded to a whole number of bytes
+        self._chunk_codes = 3 ** (self._spaces - _CHUNK_SPACES)
+        self._chunk_stride = -(-self._chunk_codes // 4) * 4
+        file_size = (_HEADER.size
+                     + 3 ** _CHUNK_SPACES * self._chunk_stride // 4)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            raise ValueError(f"cannot open tablebase '{path}': {e.strerror}")
+
+        try:
+            if not os.fstat(fd).st_size:
+                os.ftruncate(fd, file_size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, size, length, 0, 0), 0)
+            elif os.fstat(fd).st_size != file_size:
+                raise ValueError(f"corrupted tablebase '{path}'")
+
+            self._map = mmap.mmap(fd, file_size)
+        finally:
+            os.close(fd)
+
+        magic, file_grid, file_length, *_ = _HEADER.unpack_from(self._map)
+
+        if (magic, file_grid, file_length) != (_MAGIC, size, length):
+            self._map.close()
+            raise ValueError(f"corrupted tablebase '{path}'")
+
+        self.path = path
+        self._values = memoryview(self._map)[_HEADER.size:]
+        lines, _ = tic_tac_toe._get_lines(size, length)
+        self._line_masks = tuple(sum(1 << n for n in line) for line in lines)
+
+    @classmethod
+    def load(cls, size: int, length: int) -> 'Tablebase | None':
+        """Opens the tablebase of a game, if it has been generated.
+
+        Args:
+            size (int): The number of spaces on each side of the grid.
+            length (int): The number of marks in a row it takes to win.
+
+        Returns:
+            Tablebase | None: The tablebase, or None if it does not exist,
+                is not fully generated, or cannot be read.
+        """
+
+        path = get_path(size, length)
+
+        if not path.is_file():
+            return None
+
+        try:
+            tablebase = cls(path, size, length)
+        except ValueError:
+            return None
+
+        if not tablebase.complete:
+            tablebase.close()
+            return None
+
+        return tablebase
+
+    def __enter__(self) -> 'Tablebase':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Unmaps the tablebase."""
+
+        if self._map.closed:
+            return None
+
+        self._values.release()
+        self._map.close()
+
+    @property
+    def layers(self) -> int:
+        """int: The number of layers of the tablebase; see `Tablebase`."""
+
+        return self._spaces + 1
+
+    @property
+    def complete(self) -> bool:
+        """bool: Whether or not every position has been solved."""
+
+        return _HEADER.unpack_from(self._map)[3] == self.layers
+
+    def lookup(self, spaces) -> int:
+        """Looks up the value of a position.
+
+        Args:
+            spaces: The value of each mark on the grid, or 0 for an empty
+                space, left to right and top to bottom, in a game that
+                crosses started.
+
+        Returns:
+            int: The value of the position for the player whose turn it is
+                (`WIN`, `DRAW` or `LOSS`), or 0 if it is not solved.
+        """
+
+        return self._get(sum(value * power for value, power
+                             in zip(spaces, self._powers)))
+
+    def choose_move(self, spaces: list, turn: int,
+                    rng: random.Random = random) -> int:
+        """Picks a move that keeps the best value a position has.
+
+        As the grid fills up with each move, a won position is won by any
+        move that leads to a lost position for the opponent, however long it
+        takes, and the game cannot go round in circles.
+
+        Args:
+            spaces (list): The value of each mark on the grid, or 0 for an
+                empty space; see `lookup()`.
+            turn (int): The value of the mark of the player whose turn it is.
+            rng (random.Random): The random number generator used to pick
+                between equally good moves (default: the `random` module's
+                global generator).
+
+        Returns:
+            int: The number of the space to mark, from 0.
+        """
+
+        code = sum(value * power for value, power
+                   in zip(spaces, self._powers))
+        moves = {}
+
+        # the opponent's loss is the player's win, and so on: moves are ranked
+        # from 0 (the opponent loses) to 3 (not solved)
+        for n, value in enumerate(spaces):
+            if not value:
+                moves[n] = 3 - self._get(code + turn * self._powers[n])
+
+        best = min(moves.values())
+        return rng.choice([n for n, rank in moves.items() if rank == best])
+
+    def generate(self, processes: int = 1, progress=None):
+        """Solves every position not solved yet, layer by layer.
+
+        Args:
+            processes (int): The number of processes to solve chunks with at
+                once (default: 1).
+            progress (Callable | None): A function called with the number of
+                marks of each layer as it is solved (default: None).
+        """
+
+        pool = None
+
+        if processes > 1:
+            # only imported for parallel generations
+            import multiprocessing
+
+            pool = multiprocessing.Pool(
+                processes, _start_worker, (self.path, self.size, self.length),
+            )
+
+        try:
+            while not self.complete:
+                *_, layers, chunks = _HEADER.unpack_from(self._map)
+                marks = self._spaces - layers
+                pending = [(marks, chunk)
+                           for chunk in range(3 ** _CHUNK_SPACES)
+                           if not chunks >> chunk & 1]
+
+                if pool is None:
+                    solved = (_solve_chunk(self, *job) for job in pending)
+                else:
+                    solved = pool.imap_unordered(_solve_worker, pending)
+
+                for chunk in solved:
+                    chunks |= 1 << chunk
+                    self._set_progress(layers, chunks)
+
+                self._set_progress(layers + 1, 0)
+
+                if progress is not None:
+                    progress(marks)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+    def _set_progress(self, layers: int, chunks: int):
+        """Records the layers and chunks solved, once they are on disk."""
+
+        self._map.flush()
+        _HEADER.pack_into(self._map, 0, _MAGIC, self.size, self.length,
+                          layers, chunks)
+        self._map.flush(0, mmap.PAGESIZE)
+
+    def _get(self, code: int) -> int:
+        """Reads the value of a position, by its code."""
+
+        chunk, offset = divmod(code, self._chunk_codes)
+        index = chunk * self._chunk_stride + offset
+
+        return self._values[index >> 2] >> (index & 3) * 2 & 3
+
+
+def _solve_chunk(tablebase: Tablebase, marks: int, chunk: int) -> int:
+    """Solves the positions of a layer that fall in a chunk.
+
+    Args:
+        tablebase (Tablebase): The tablebase, with the next layer solved.
+        marks (int): The number of marks of the layer.
+        chunk (int): The number of the chunk, which reads the marks on the
+            last spaces of the grid as the digits of a number in base 3.
+
+    Returns:
+        int: The number of the chunk, once its values are written to disk.
+    """
+
+    spaces = tablebase._spaces
+    powers = tablebase._powers
+    line_masks = tablebase._line_masks
+    get = tablebase._get
+    first = spaces - _CHUNK_SPACES
+
+    # crosses move first: noughts are to move after an odd number of marks,
+    # and crosses made the last move
+    crosses, noughts = (marks + 1) // 2, marks // 2
+    turn, last = (_NOUGHT, _CROSS) if marks % 2 else (_CROSS, _NOUGHT)
+
+    base_code = chunk * tablebase._chunk_codes
+    base_bits = [0, 0, 0]
+
+    for n in range(_CHUNK_SPACES):
+        value = chunk // 3 ** n % 3
+        base_bits[value] |= 1 << (first + n)
+        crosses -= value == _CROSS
+        noughts -= value == _NOUGHT
+
+    if crosses < 0 or noughts < 0:
+        return chunk
+
+    # the chunk's values are solved in a copy, then written at once
+    start = chunk * tablebase._chunk_stride // 4
+    end = start + tablebase._chunk_stride // 4
+    values = bytearray(tablebase._values[start:end])
+    empty_tops = [first + n for n in range(_CHUNK_SPACES)
+                  if not chunk // 3 ** n % 3]
+
+    for cross_spaces in itertools.combinations(range(first), crosses):
+        cross_code = base_code + sum(_CROSS * powers[n]
+                                     for n in cross_spaces)
+        cross_bits = base_bits[_CROSS] | sum(1 << n for n in cross_spaces)
+        others = [n for n in range(first) if not cross_bits >> n & 1]
+
+        for nought_spaces in itertools.combinations(others, noughts):
+            code = cross_code + sum(_NOUGHT * powers[n]
+                                    for n in nought_spaces)
+            nought_bits = base_bits[_NOUGHT] | sum(1 << n
+                                                   for n in nought_spaces)
+            last_bits = cross_bits if last == _CROSS else nought_bits
+
+            if any(mask & last_bits == mask for mask in line_masks):
+                value = LOSS
+            elif marks == spaces:
+                value = DRAW
+            else:
+                value = LOSS
+                taken = cross_bits | nought_bits
+
+                for n in itertools.chain(others, empty_tops):
+                    if taken >> n & 1:
+                        continue
+
+                    result = get(code + turn * powers[n])
+
+                    if result == LOSS:
+                        value = WIN
+                        break
+                    elif result == DRAW:
+                        value = DRAW
+
+            index = code - base_code
+            shift = (index & 3) * 2
+            values[index >> 2] = (values[index >> 2] & ~(3 << shift)
+                                  | value << shift)
+
+    tablebase._values[start:end] = values
+    tablebase._map.flush()
+
+    return chunk
+
+
+def _start_worker(path: pathlib.Path, size: int, length: int):
+    """Prepares a worker process of a generation, as it starts.
+
+    Args:
+        path (pathlib.Path): The path to the tablebase.
+        size (int): The number of spaces on each side of the grid.
+        length (int): The number of marks in a row it takes to win.
+    """
+
+    global _worker_tablebase
+
+    # interrupting the program only interrupts the main process, which then
+    # stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _worker_tablebase = Tablebase(path, size, length)
+
+
+def _solve_worker(job: tuple) -> int:
+    """Solves a chunk in a worker process of a generation; see
+    `_solve_chunk()`."""
+
+    return _solve_chunk(_worker_tablebase, *job)
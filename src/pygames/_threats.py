@@ -0,0 +1,277 @@
+import time
+
+# The most threats in a row searched for before the winning move, by default
+_MAX_DEPTH = 8
+
+
+class _Timeout(Exception):
+    """Raised deep in the search once its time budget is spent."""
+
+
+class ThreatSearcher:
+    """Searches for a forced win, made of threats the opponent must answer.
+
+    On large grids, alpha-beta search cannot see far enough ahead to find
+    the long sequences of threats that win k-in-a-row games; but a forcing
+    sequence only has a handful of moves worth searching at each step, which
+    makes it cheap to search deep, in the style of threat-space search:
+
+    - a *four* is a line one mark short of winning, with no opposing mark;
+      the opponent must block its only empty space;
+    - a *three* is two marks short, and threatens a four with two empty
+      spaces the opponent cannot both block; the opponent must block one of
+      the spaces of the threatened fours (or make a four of their own).
+
+    The attacker tries each move that makes a four or a three, and wins if
+    every answer of the opponent still leaves a forced win. Answers that do
+    not block the threat or make a four are assumed not to help, so a win
+    found this way may, rarely, be refuted by an unexpected move; no win is
+    missed for that reason, though, within the depth searched.
+
+    The threats are found from the lines that only one player has marks on,
+    which the game state keeps up to date with each mark (see
+    `tic_tac_toe._GameState.get_open_lines()`), rather than by scanning the
+    grid.
+    """
+
+    def __init__(self, game_state, attacker, defender):
+        """Prepares the search of a position.
+
+        Args:
+            game_state (tic_tac_toe._GameState): The game in progress, which
+                is searched in place.
+            attacker (tic_tac_toe._Mark): The mark of the player to move, who
+                looks for a forced win.
+            defender (tic_tac_toe._Mark): The mark of their opponent.
+        """
+
+        self._game_state = game_state
+        self._attacker = attacker
+        self._defender = defender
+        self._deadline = 0.0
+
+        # the deepest search that found no win from each position (with the
+        # attacker to move), by its key: independent threats can be made in
+        # any order, so the same positions are reached over and over
+        self._refuted = {}
+        self.nodes = 0
+
+    def find_win(self, think_ms: float,
+                 max_depth: int = _MAX_DEPTH) -> list | None:
+        """Finds the shortest forced win, within a time budget.
+
+        Args:
+            think_ms (float): The time budget, in milliseconds; the search
+                is abandoned as soon as it is spent.
+            max_depth (int): The most threats the attacker may make before
+                the winning move (default: 8).
+
+        Returns:
+            list | None: The moves of the winning sequence, of both players
+                in turn, starting with the attacker's (for the first answer
+                of the defender to each threat); or None if no forced win was
+                found.
+        """
+
+        self._deadline = time.perf_counter() + think_ms / 1000
+        self._refuted = {}
+        self.nodes = 0
+
+        try:
+            for depth in range(max_depth + 1):
+                line = self._attack(depth)
+
+                if line is not None:
+                    return line
+        except _Timeout:
+            pass
+
+        return None
+
+    def _get_winning_spaces(self, mark) -> set:
+        """Finds the spaces that would complete a line of a player's marks.
+
+        Args:
+            mark (tic_tac_toe._Mark): The player's mark.
+
+        Returns:
+            set: The numbers of the spaces, from 1.
+        """
+
+        game_state = self._game_state
+        spaces = set()
+
+        for line in game_state.get_open_lines(mark, game_state.length - 1):
+            spaces.update(game_state.get_empty_spaces(line))
+
+        return spaces
+
+    def _get_threat_moves(self, mark, count: int) -> list:
+        """Lists the moves that add a mark to a player's open lines.
+
+        Args:
+            mark (tic_tac_toe._Mark): The player's mark.
+            count (int): The number of the player's marks on the lines.
+
+        Returns:
+            list: The numbers of the spaces, from 1, without duplicates.
+        """
+
+        game_state = self._game_state
+
+        if count < 1:
+            return []
+
+        moves = {}
+
+        for line in sorted(game_state.get_open_lines(mark, count)):
+            for space in game_state.get_empty_spaces(line):
+                moves[space] = None
+
+        return list(moves)
+
+    def _get_three_defences(self) -> set:
+        """Finds the answers to the attacker's threes, if any.
+
+        Returns:
+            set: The spaces where the attacker would make two fours at once,
+                with the other spaces of those fours; empty if there are no
+                such spaces (i.e. the attacker made no threat).
+        """
+
+        game_state = self._game_state
+        length = game_state.length
+        fours = {}
+
+        # the other empty space of each line that a space would make a four
+        for line in game_state.get_open_lines(self._attacker, length - 2):
+            spaces = game_state.get_empty_spaces(line)
+
+            for space in spaces:
+                fours.setdefault(space, set()).update(
+                    other for other in spaces if other != space
+                )
+
+        defences = set()
+
+        for space, wins in fours.items():
+            if len(wins) >= 2:
+                defences.add(space)
+                defences.update(wins)
+
+        return defences
+
+    def _visit(self):
+        """Counts a position as visited, unless the time budget is spent.
+
+        Raises:
+            _Timeout: The time budget was spent.
+        """
+
+        self.nodes += 1
+
+        if time.perf_counter() >= self._deadline:
+            raise _Timeout()
+
+    def _attack(self, depth: int) -> list | None:
+        """Searches the attacker's threats, with the attacker to move.
+
+        Args:
+            depth (int): The most threats the attacker may still make.
+
+        Returns:
+            list | None: The winning sequence, or None if none was found.
+
+        Raises:
+            _Timeout: The time budget was spent.
+        """
+
+        self._visit()
+        game_state = self._game_state
+        wins = self._get_winning_spaces(self._attacker)
+
+        if wins:
+            return [min(wins)]
+
+        losses = self._get_winning_spaces(self._defender)
+
+        # the defender's four must be blocked, and two cannot both be
+        if len(losses) > 1 or depth == 0:
+            return None
+
+        key = game_state.key
+
+        if self._refuted.get(key, 0) >= depth:
+            return None
+
+        if losses:
+            moves = list(losses)
+        else:
+            length = game_state.length
+            moves = [*self._get_threat_moves(self._attacker, length - 2),
+                     *self._get_threat_moves(self._attacker, length - 3)]
+
+        for move in dict.fromkeys(moves):
+            game_state.add_mark(move, self._attacker)
+
+            try:
+                line = self._defend(depth - 1)
+            finally:
+                game_state.undo()
+
+            if line is not None:
+                return [move, *line]
+
+        self._refuted[key] = depth
+        return None
+
+    def _defend(self, depth: int) -> list | None:
+        """Searches every answer to the attacker's threat.
+
+        Args:
+            depth (int): The most threats the attacker may still make.
+
+        Returns:
+            list | None: The winning sequence for the first answer, or None
+                if any answer escapes the attacker (or there is no threat).
+
+        Raises:
+            _Timeout: The time budget was spent.
+        """
+
+        self._visit()
+        game_state = self._game_state
+
+        if self._get_winning_spaces(self._defender):
+            return None
+
+        answers = self._get_winning_spaces(self._attacker)
+
+        # answering a four with anything but a block loses right away, but a
+        # three can also be answered with a four, which must be blocked
+        if not answers:
+            answers = self._get_three_defences()
+
+            if not answers:
+                return None
+
+            answers.update(self._get_threat_moves(
+                self._defender, game_state.length - 2,
+            ))
+
+        first_line = None
+
+        for answer in sorted(answers):
+            game_state.add_mark(answer, self._defender)
+
+            try:
+                line = self._attack(depth)
+            finally:
+                game_state.undo()
+
+            if line is None:
+                return None
+
+            first_line = first_line or [answer, *line]
+
+        return first_line
@@ -0,0 +1,291 @@
+import time
+
+# The number of seconds to wait for a server to connect or respond
+_TIMEOUT = 10
+
+# The number of times a failed request is retried, and the delay before the
+# first retry (in seconds), doubled after each one
+_RETRIES = 2
+_RETRY_DELAY = 0.25
+
+_MAX_REDIRECTS = 5
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class FileTransport:
+    """Reads files from the local filesystem, given as 'file:' URLs or paths.
+
+    Useful for playing (or testing) without network access.
+    """
+
+    def fetch(self, url: str) -> bytes:
+        """Reads a file.
+
+        Args:
+            url (str): The 'file:' URL or path of the file.
+
+        Returns:
+            bytes: The file's contents.
+
+        Raises:
+            ValueError: The file cannot be read.
+        """
+
+        path = url
+
+        if url.startswith('file:'):
+            import urllib.parse
+            import urllib.request
+
+            path = urllib.request.url2pathname(urllib.parse.urlsplit(url).path)
+
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            raise ValueError(f"cannot fetch '{url}': {e.strerror}")
+
+    def close(self):
+        """Does nothing, as no files are kept open."""
+
+
+class HTTPTransport:
+    """Fetches resources over HTTP(S), reusing connections between requests.
+
+    One connection is kept open per server, so that fetching from the same
+    server again (e.g. a new word for each game) skips the TCP and TLS
+    handshakes. Requests that fail, or that the server fails to handle, are
+    retried a few times with a growing delay; a connection that the server
+    closed while idle is replaced right away.
+
+    The standard library's HTTP client (and its TLS support) is only imported
+    once the first request is made.
+    """
+
+    def __init__(self, timeout: float = _TIMEOUT, retries: int = _RETRIES):
+        self._timeout = timeout
+        self._retries = retries
+        self._connections = {}
+
+    def fetch(self, url: str) -> bytes:
+        """Fetches a resource, following any redirects.
+
+        Args:
+            url (str): The 'http:' or 'https:' URL of the resource.
+
+        Returns:
+            bytes: The body of the response, decompressed if needed.
+
+        Raises:
+            ValueError: The resource cannot be fetched.
+        """
+
+        import urllib.parse
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, location, body = self._request(url)
+
+            if status in _REDIRECT_STATUSES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+
+            if status != 200:
+                raise ValueError(f"cannot fetch '{url}': HTTP {status}")
+
+            return body
+
+        raise ValueError(f"cannot fetch '{url}': too many redirects")
+
+    def close(self):
+        """Closes every open connection."""
+
+        for connection in self._connections.values():
+            connection.close()
+
+        self._connections.clear()
+
+    def _request(self, url: str) -> (int, str | None, bytes):
+        """Makes a single GET request, retrying it if it fails.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            int: The status code of the response.
+            str | None: The response's 'Location' header, if any.
+            bytes: The body of the response, decompressed if needed.
+
+        Raises:
+            ValueError: The URL is not supported, or the request still failed
+                after every retry.
+        """
+
+        import http.client
+        import urllib.parse
+
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        query = f'?{parts.query}' if parts.query else ''
+        target = (parts.path or '/') + query
+        attempt = 0
+
+        while True:
+            connection = self._connections.get(key)
+            is_reused = connection is not None
+
+            if not is_reused:
+                connection = self._connections[key] = self._connect(parts)
+
+            try:
+                connection.request('GET', target, headers={
+                    'Accept-Encoding': 'gzip',
+                })
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._connections.pop(key).close()
+
+                # the server closed the connection while it was idle
+                if is_reused:
+                    continue
+
+                if attempt == self._retries:
+                    raise ValueError(f"cannot fetch '{url}': {e}")
+            else:
+                if response.will_close:
+                    self._connections.pop(key).close()
+
+                if response.status < 500 or attempt == self._retries:
+                    if response.getheader('Content-Encoding') == 'gzip':
+                        body = _decompress(url, body)
+
+                    return (response.status, response.getheader('Location'),
+                            body)
+
+            time.sleep(_RETRY_DELAY * 2 ** attempt)
+            attempt += 1
+
+    def _connect(self, parts):
+        """Opens a connection to the server of a URL.
+
+        Args:
+            parts (urllib.parse.SplitResult): The parts of the URL.
+
+        Returns:
+            http.client.HTTPConnection: The (not yet connected) connection.
+
+        Raises:
+            ValueError: The URL's scheme is not supported.
+        """
+
+        import http.client
+
+        if parts.scheme == 'https':
+            connection_type = http.client.HTTPSConnection
+        elif parts.scheme == 'http':
+            connection_type = http.client.HTTPConnection
+        else:
+            raise ValueError(f"unsupported URL scheme '{parts.scheme}'")
+
+        return connection_type(parts.hostname, parts.port,
+                               timeout=self._timeout)
+
+
+# The type of transport used for each URL scheme; paths without a scheme are
+# read as files
+_TRANSPORT_TYPES = {
+    'file': FileTransport,
+    'http': HTTPTransport,
+    'https': HTTPTransport,
+}
+
+# The transport used for each URL scheme, created when first needed
+_transports = {}
+
+
+def _decompress(url: str, body: bytes) -> bytes:
+    """Decompresses a gzip-encoded response body.
+
+    Args:
+        url (str): The URL the body was fetched from.
+        body (bytes): The compressed body.
+
+    Returns:
+        bytes: The decompressed body.
+
+    Raises:
+        ValueError: The body is not valid gzip data.
+    """
+
+    # only imported for compressed responses
+    import gzip
+    import zlib
+
+    try:
+        return gzip.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise ValueError(f"cannot fetch '{url}': corrupted response ({e})")
+
+
+def _get_scheme(url: str) -> str:
+    """Finds the scheme of a URL, or 'file' if it is a path."""
+
+    scheme, separator, _ = url.partition(':')
+    return scheme.lower() if separator and len(scheme) > 1 else 'file'
+
+
+def get_transport(url: str):
+    """Finds the transport used to fetch a URL, creating it if needed.
+
+    Args:
+        url (str): The URL (or path) to fetch.
+
+    Returns:
+        FileTransport | HTTPTransport: The transport for the URL's scheme.
+
+    Raises:
+        ValueError: The URL's scheme is not supported.
+    """
+
+    scheme = _get_scheme(url)
+
+    if scheme not in _transports:
+        if scheme not in _TRANSPORT_TYPES:
+            raise ValueError(f"unsupported URL scheme '{scheme}'")
+
+        _transports[scheme] = _TRANSPORT_TYPES[scheme]()
+
+    return _transports[scheme]
+
+
+def set_transport(scheme: str, transport):
+    """Replaces the transport used for a URL scheme (e.g. in tests).
+
+    Args:
+        scheme (str): The URL scheme (e.g. 'https').
+        transport: The new transport; any object with `fetch()` and `close()`
+            methods like those of `HTTPTransport`.
+    """
+
+    previous = _transports.pop(scheme, None)
+
+    if previous is not None and previous is not transport:
+        previous.close()
+
+    _transports[scheme] = transport
+
+
+def fetch_text(url: str) -> str:
+    """Fetches a text resource.
+
+    Args:
+        url (str): The URL (or path) of the resource.
+
+    Returns:
+        str: The resource's contents, decoded as UTF-8.
+
+    Raises:
+        ValueError: The resource cannot be fetched.
+    """
+
+    return get_transport(url).fetch(url).decode('utf-8', errors='replace')
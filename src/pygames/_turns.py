@@ -0,0 +1,199 @@
+"""Reads the players' input with a time limit on each turn.
+
+Reading a line with `input()` blocks until the line is entered, so a turn
+could only be timed by waiting for it from another thread. Instead, the
+input is read straight from its file descriptor, once a selector reports it
+ready, and the deadlines of the turns are kept in a heap: a single call to
+`select()` waits for whichever comes first, a line of input or the nearest
+deadline. Any number of sessions, each with its own input, can share the
+same loop, and every turn still ends within a few milliseconds of its
+deadline.
+"""
+
+import heapq
+import os
+import selectors
+import sys
+import time
+
+# The most bytes read from an input at once
+_READ_SIZE = 1 << 16
+
+# The selector used to wait for input: unlike `epoll`, `poll` also accepts
+# regular files (which are always ready), for input redirected from a file
+_Selector = getattr(selectors, 'PollSelector', selectors.SelectSelector)
+
+
+class TurnLoop:
+    """Waits for lines of input from many sources, each until a deadline.
+
+    A turn is started on a source (a file descriptor) with `start_turn()`,
+    and ends once a whole line has been read from it, once it reaches its
+    end, or once its deadline passes; `wait()` returns the turns as they end.
+    Input read beyond the end of a line is kept for the source's next turn.
+    """
+
+    def __init__(self):
+        self._selector = _Selector()
+
+        # the input read from each source but not returned yet, the sources
+        # that reached their end, and the deadline of each turn in progress
+        # (by source), along with a heap of those deadlines
+        self._buffers = {}
+        self._ended = set()
+        self._deadlines = {}
+        self._heap = []
+
+        # the turns that ended, but were not returned by `wait()` yet
+        self._results = []
+        self._encoding = getattr(sys.stdin, 'encoding', None) or 'utf-8'
+
+    def start_turn(self, fd: int, timeout: float | None = None):
+        """Starts waiting for a line of input from a source.
+
+        Args:
+            fd (int): The file descriptor to read the line from; it must not
+                have a turn in progress already.
+            timeout (float | None): The most seconds to wait for, or None to
+                wait for as long as it takes (default: None).
+        """
+
+        self._buffers.setdefault(fd, bytearray())
+
+        if self._end_turn(fd):
+            return None
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        self._deadlines[fd] = deadline
+        self._selector.register(fd, selectors.EVENT_READ)
+
+        if deadline is not None:
+            heapq.heappush(self._heap, (deadline, fd))
+
+    def wait(self) -> list:
+        """Waits until at least one turn ends.
+
+        Returns:
+            list: The file descriptor of each turn that ended, and either the
+                line read (without its newline character), an `EOFError` if
+                the source reached its end first, or a `TimeoutError` if the
+                deadline passed first.
+
+        Raises:
+            ValueError: No turn is in progress.
+        """
+
+        while not self._results:
+            if not self._deadlines:
+                raise ValueError("no turn is in progress")
+
+            now = time.monotonic()
+
+            # drop the deadlines of the turns that already ended
+            while self._heap and (
+                self._deadlines.get(self._heap[0][1]) != self._heap[0][0]
+            ):
+                heapq.heappop(self._heap)
+
+            if self._heap and self._heap[0][0] <= now:
+                _, fd = heapq.heappop(self._heap)
+                self._selector.unregister(fd)
+                self._finish(fd, TimeoutError())
+                continue
+
+            timeout = self._heap[0][0] - now if self._heap else None
+
+            for key, _ in self._selector.select(timeout):
+                self._read(key.fd)
+
+        results = self._results
+        self._results = []
+        return results
+
+    def read_line(self, fd: int, timeout: float | None = None) -> str:
+        """Reads a line of input from a single source, like `input()`.
+
+        Only meant for a loop that serves a single session, with no other
+        turn in progress.
+
+        Args:
+            fd (int): The file descriptor to read the line from.
+            timeout (float | None): The most seconds to wait for, or None to
+                wait for as long as it takes (default: None).
+
+        Returns:
+            str: The line read, without its newline character.
+
+        Raises:
+            EOFError: The source reached its end before a line was read.
+            TimeoutError: The line was not read in time.
+        """
+
+        self.start_turn(fd, timeout)
+        (_, result), = self.wait()
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def close(self):
+        """Stops waiting for any turn; the loop cannot be used once closed."""
+
+        self._selector.close()
+
+    def _read(self, fd: int):
+        """Reads the input available from a source, ending its turn if need be.
+
+        Args:
+            fd (int): The file descriptor of the source.
+        """
+
+        data = os.read(fd, _READ_SIZE)
+
+        if data:
+            self._buffers[fd] += data
+        else:
+            self._ended.add(fd)
+
+        if self._end_turn(fd):
+            self._selector.unregister(fd)
+
+    def _end_turn(self, fd: int) -> bool:
+        """Ends a source's turn, if it has a line ready or reached its end.
+
+        Args:
+            fd (int): The file descriptor of the source.
+
+        Returns:
+            bool: Whether or not the turn ended.
+        """
+
+        buffer = self._buffers[fd]
+        end = buffer.find(b'\n')
+
+        if end < 0 and fd not in self._ended:
+            return False
+
+        if end < 0 and not buffer:
+            self._finish(fd, EOFError())
+            return True
+
+        # the last line may not end with a newline character
+        end = len(buffer) if end < 0 else end
+        line = buffer[:end].decode(self._encoding, errors='replace')
+        del buffer[:end + 1]
+
+        self._finish(fd, line)
+        return True
+
+    def _finish(self, fd: int, result):
+        """Records the end of a source's turn.
+
+        Args:
+            fd (int): The file descriptor of the source.
+            result (str | Exception): The line read, or why none was.
+        """
+
+        self._deadlines.pop(fd, None)
+        self._results.append((fd, result))
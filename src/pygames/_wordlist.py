@@ -0,0 +1,825 @@
+import collections
+import hashlib
+import importlib
+import math
+import mmap
+import os
+import pathlib
+import random
+import struct
+import tempfile
+import time
+from array import array
+
+from . import _bundle
+from . import _transport
+
+# The difficulty bands that words can be picked from; each one holds an equal
+# share of the words, from the easiest to the hardest
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# The formats the cached index can be compressed with, each named after the
+# standard module that compresses it
+COMPRESSIONS = ('gzip', 'lzma')
+
+# How much each part of a word's difficulty contributes to its score: the
+# number of wrong guesses made by the solver (see `_count_solver_misses()`),
+# the rarity of its letters, and how few unique letters it has
+_SCORE_WEIGHTS = (0.5, 0.3, 0.2)
+
+# The minimum and maximum length of the words picked for a game
+_MIN_LENGTH = 5
+_MAX_LENGTH = 12
+
+# How long a cached index is used for before the wordlist is fetched again,
+# in seconds
+_MAX_AGE = 24 * 60 * 60
+
+# Header of a cached index: magic bytes, number of words, and the time the
+# index was built at; followed by the scores, then the words
+_INDEX_HEADER = struct.Struct('<4sQd')
+_INDEX_MAGIC = b'PGWI'
+
+# Header of a compressed index: magic bytes, number of words, the time the
+# index was built at, the number of words per block, and the compression;
+# followed by the offset of each block (and of the end of the last one) from
+# the start of the file, then the blocks, each compressed on its own and
+# holding the scores of its words, then the words
+_COMPRESSED_HEADER = struct.Struct('<4sQdI4s')
+_COMPRESSED_MAGIC = b'PGWZ'
+
+# The number of words in each block of a compressed index: reading a single
+# word means reading and decompressing its whole block
+_BLOCK_SIZE = 512
+
+# The environment variable holding the compression of the cached index, if it
+# is compressed (see `CompressedWordIndex`)
+_COMPRESSION_VARIABLE = 'PYGAMES_WORDLIST_COMPRESSION'
+
+# Header of a shared index: magic bytes, number of words, the time the index
+# was built at, and the name of the index (see `get_index_name()`); followed
+# by the scores, then the words, each padded to `_MAX_LENGTH` bytes
+_SHARED_HEADER = struct.Struct('<4sQd20s')
+_SHARED_MAGIC = b'PGWS'
+
+# The environment variable holding the path of a shared index, for processes
+# to use instead of loading their own (see `SharedWordIndex`)
+_SHARED_VARIABLE = 'PYGAMES_WORDLIST_SHARED'
+
+# Where shared indexes are published, if it exists: a file system kept in
+# memory, so that publishing an index never writes to a disk
+_SHARED_DIRECTORY = '/dev/shm'
+
+# The indexes already loaded by this process, by the URL of their wordlist
+_indexes = {}
+
+
+class WordIndex:
+    """The words of a wordlist, sorted by how hard they are to guess.
+
+    Each word is scored once, when the index is built; picking a word of a
+    given difficulty is then a matter of picking a random position within
+    that difficulty's band of the sorted words.
+
+    Attributes:
+        created (float): The time the index was built at (as a timestamp).
+    """
+
+    def __init__(self, words: tuple, scores: array, created: float):
+        self._words = words
+        self._scores = scores
+        self.created = created
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @classmethod
+    def build(cls, words) -> 'WordIndex':
+        """Builds an index from the words of a wordlist.
+
+        Only the words of 5 to 12 (ASCII) letters are kept, in lowercase.
+
+        Args:
+            words: The words of the wordlist, in any order.
+
+        Returns:
+            WordIndex: The new index.
+
+        Raises:
+            ValueError: The wordlist has no suitable words.
+        """
+
+        words = sorted({
+            word.lower() for word in words
+            if _MIN_LENGTH <= len(word) <= _MAX_LENGTH
+            and word.isascii() and word.isalpha()
+        })
+
+        if not words:
+            raise ValueError("wordlist has no words of 5 to 12 letters")
+
+        scores = _score_words(words)
+        order = sorted(range(len(words)), key=lambda n: (scores[n], words[n]))
+
+        return cls(tuple(words[n] for n in order),
+                   array('f', (scores[n] for n in order)), time.time())
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> 'WordIndex | None':
+        """Loads an index saved by `save()`.
+
+        Args:
+            path (pathlib.Path): The path to the saved index.
+
+        Returns:
+            WordIndex | None: The index, or None if it cannot be read or is
+                invalid.
+        """
+
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        return cls.from_bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'WordIndex | None':
+        """Decodes an index encoded by `to_bytes()`.
+
+        Args:
+            data (bytes): The encoded index.
+
+        Returns:
+            WordIndex | None: The index, or None if it is invalid.
+        """
+
+        try:
+            magic, count, created = _INDEX_HEADER.unpack_from(data)
+        except struct.error:
+            return None
+
+        start = _INDEX_HEADER.size
+        end = start + count * array('f').itemsize
+
+        if magic != _INDEX_MAGIC or len(data) < end:
+            return None
+
+        scores = array('f', data[start:end])
+        words = tuple(data[end:].decode('ascii', errors='replace').split())
+
+        if len(words) != count:
+            return None
+
+        return cls(words, scores, created)
+
+    def to_bytes(self) -> bytes:
+        """Encodes the index, so that it can be decoded by `from_bytes()`."""
+
+        return b''.join((
+            _INDEX_HEADER.pack(_INDEX_MAGIC, len(self._words), self.created),
+            self._scores.tobytes(),
+            '\n'.join(self._words).encode('ascii'),
+        ))
+
+    def save(self, path: pathlib.Path, compression: str = ''):
+        """Saves the index, so that it can be loaded by another process.
+
+        Failing to save the index is not an error, as it can be rebuilt.
+
+        Args:
+            path (pathlib.Path): The path to save the index to.
+            compression (str): One of `COMPRESSIONS`, to save the index for
+                `CompressedWordIndex.load()`, or an empty string to save it
+                for `load()` (default: '').
+
+        Raises:
+            ValueError: The compression is unknown.
+        """
+
+        if compression:
+            data = CompressedWordIndex.compress(self, compression)
+        else:
+            data = self.to_bytes()
+
+        # unique to this process, so that processes building the same index
+        # at once cannot write over (or move) each other's temporary file
+        temporary_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(temporary_path, 'wb') as f:
+                f.write(data)
+
+            os.replace(temporary_path, path)
+        except OSError:
+            pass
+
+    def get_band(self, difficulty: str = '') -> (int, int):
+        """Finds the positions of the words of a given difficulty.
+
+        Args:
+            difficulty (str): One of `DIFFICULTIES`, or an empty string for
+                every word.
+
+        Returns:
+            int: The position of the first word of the band.
+            int: The position after the last word of the band.
+
+        Raises:
+            ValueError: The difficulty is unknown.
+        """
+
+        if not difficulty:
+            return (0, len(self._words))
+
+        if difficulty not in DIFFICULTIES:
+            raise ValueError(f"unknown difficulty '{difficulty}'")
+
+        band = DIFFICULTIES.index(difficulty)
+        count = len(self._words)
+
+        return (count * band // len(DIFFICULTIES),
+                max(count * (band + 1) // len(DIFFICULTIES), 1))
+
+    def pick(self, rng: random.Random = random, difficulty: str = '') -> str:
+        """Picks a random word of a given difficulty.
+
+        Args:
+            rng (random.Random): The random number generator to pick the word
+                with (default: the `random` module's global generator).
+            difficulty (str): One of `DIFFICULTIES`, or an empty string to
+                pick from every word (default: '').
+
+        Returns:
+            str: The word.
+
+        Raises:
+            ValueError: The difficulty is unknown.
+        """
+
+        start, stop = self.get_band(difficulty)
+        return self._words[rng.randrange(start, stop)]
+
+
+class _CompressedWords:
+    """The words of a compressed index, read from its file as needed.
+
+    Behaves like the tuple of words of a `WordIndex`, as far as picking words
+    goes, reading and decompressing only the block of the word asked for
+    (and keeping the last block read, in case the next word is in it too).
+    """
+
+    def __init__(self, file, offsets: array, count: int, block_size: int,
+                 codec):
+        self._file = file
+        self._offsets = offsets
+        self._count = count
+        self._block_size = block_size
+        self._codec = codec
+        self._block = (None, None, None)
+        self.bytes_read = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, n: int) -> str:
+        if not 0 <= n < self._count:
+            raise IndexError("word index out of range")
+
+        return self.read_block(n // self._block_size)[1][n % self._block_size]
+
+    def read_block(self, block: int) -> tuple:
+        """Reads and decompresses a block of the index.
+
+        Args:
+            block (int): The number of the block, from 0.
+
+        Returns:
+            tuple: The scores of the block's words (as an `array`), and the
+                words (as a `list`).
+
+        Raises:
+            ValueError: The block is not valid, i.e. the file was changed
+                since the index was loaded.
+        """
+
+        number, scores, words = self._block
+
+        if number == block:
+            return (scores, words)
+
+        start, end = self._offsets[block], self._offsets[block + 1]
+        self._file.seek(start)
+        data = self._file.read(end - start)
+        self.bytes_read += len(data)
+
+        try:
+            data = self._codec.decompress(data)
+        except Exception as e:
+            raise ValueError(f"invalid block of a compressed index: {e}")
+
+        count = min(self._block_size, self._count - block * self._block_size)
+        split = count * array('f').itemsize
+        scores = array('f', data[:split])
+        words = data[split:].decode('ascii', errors='replace').split()
+
+        if len(scores) != count or len(words) != count:
+            raise ValueError("invalid block of a compressed index")
+
+        self._block = (block, scores, words)
+        return (scores, words)
+
+
+class CompressedWordIndex(WordIndex):
+    """A word index cached compressed, and only read a block at a time.
+
+    The words are split into blocks of `_BLOCK_SIZE` words, which are
+    compressed on their own, behind a table of where each block starts in the
+    file; so picking a word only reads and decompresses the block holding
+    that word, rather than the whole index.
+    """
+
+    def __init__(self, words: _CompressedWords, created: float, header: int):
+        super().__init__(words, None, created)
+        self._header_size = header
+
+    @property
+    def bytes_read(self) -> int:
+        """int: The number of bytes read from the index's file so far."""
+
+        return self._header_size + self._words.bytes_read
+
+    @staticmethod
+    def compress(index: WordIndex, compression: str) -> bytes:
+        """Encodes an index, so that it can be loaded by `load()`.
+
+        Args:
+            index (WordIndex): The index to encode.
+            compression (str): One of `COMPRESSIONS`.
+
+        Returns:
+            bytes: The encoded index.
+
+        Raises:
+            ValueError: The compression is unknown.
+        """
+
+        codec = _get_codec(compression)
+        count = len(index)
+        blocks = []
+
+        for start in range(0, count, _BLOCK_SIZE):
+            stop = min(start + _BLOCK_SIZE, count)
+            blocks.append(codec.compress(b''.join((
+                index._scores[start:stop].tobytes(),
+                '\n'.join(index._words[n] for n in range(start, stop))
+                .encode('ascii'),
+            ))))
+
+        offsets = array('Q', [_COMPRESSED_HEADER.size
+                              + (len(blocks) + 1) * array('Q').itemsize])
+
+        for block in blocks:
+            offsets.append(offsets[-1] + len(block))
+
+        return b''.join((
+            _COMPRESSED_HEADER.pack(_COMPRESSED_MAGIC, count, index.created,
+                                    _BLOCK_SIZE, compression.encode()),
+            offsets.tobytes(),
+            *blocks,
+        ))
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> 'CompressedWordIndex | None':
+        """Loads an index saved by `WordIndex.save()`, compressed.
+
+        Only the header and the table of blocks are read; the file is kept
+        open, so that the blocks can be read as they are needed.
+
+        Args:
+            path (pathlib.Path): The path to the saved index.
+
+        Returns:
+            CompressedWordIndex | None: The index, or None if it cannot be
+                read or is invalid.
+        """
+
+        try:
+            file = open(path, 'rb')
+        except OSError:
+            return None
+
+        try:
+            header = file.read(_COMPRESSED_HEADER.size)
+            magic, count, created, block_size, compression = (
+                _COMPRESSED_HEADER.unpack(header)
+            )
+            codec = _get_codec(compression.decode('ascii'))
+
+            if magic != _COMPRESSED_MAGIC or block_size < 1:
+                raise ValueError("invalid header")
+
+            blocks = -(-count // block_size)
+            offsets = array('Q')
+            offsets.frombytes(file.read((blocks + 1) * offsets.itemsize))
+        except (OSError, struct.error, UnicodeDecodeError, ValueError):
+            file.close()
+            return None
+
+        if (len(offsets) != blocks + 1
+                or offsets[-1] != os.fstat(file.fileno()).st_size):
+            file.close()
+            return None
+
+        words = _CompressedWords(file, offsets, count, block_size, codec)
+        return cls(words, created, len(header) + len(offsets.tobytes()))
+
+    def to_bytes(self) -> bytes:
+        """Encodes the index, so that it can be decoded by `from_bytes()`.
+
+        Every block is read and decompressed to do so.
+        """
+
+        scores = array('f')
+        words = []
+
+        for block in range(-(-len(self) // self._words._block_size)):
+            block_scores, block_words = self._words.read_block(block)
+            scores.extend(block_scores)
+            words.extend(block_words)
+
+        return WordIndex(tuple(words), scores, self.created).to_bytes()
+
+    def close(self):
+        """Closes the index's file; the index cannot be used once closed."""
+
+        self._words._file.close()
+
+
+class _PackedWords:
+    """The words of a shared index, read from its mapping as needed.
+
+    Behaves like the tuple of words of a `WordIndex`, as far as picking words
+    goes, without ever holding more than the word asked for as a string.
+    """
+
+    def __init__(self, mapping: mmap.mmap, offset: int, count: int):
+        self._mapping = mapping
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, n: int) -> str:
+        if not 0 <= n < self._count:
+            raise IndexError("word index out of range")
+
+        start = self._offset + n * _MAX_LENGTH
+        return self._mapping[start:start + _MAX_LENGTH].rstrip(b'\0').decode()
+
+
+class SharedWordIndex(WordIndex):
+    """A word index published once, for many processes to pick words from.
+
+    The words are packed into a file, each padded to the same length so that
+    any of them can be read by its position, and every process maps that
+    file into memory instead of reading it: its pages are shared by all the
+    processes, and no process holds a copy of the words as Python strings.
+
+    The index is published by one process, with `publish()`, and attached to
+    by the others with `attach()`, given the path of its file; processes
+    started with that path in the ``PYGAMES_WORDLIST_SHARED`` environment
+    variable attach to it on their own, instead of loading the index (see
+    `load_index()`). The file is removed once the publishing process closes
+    the index, which the processes already attached to it do not notice.
+
+    Attributes:
+        path (str): The path of the index's file.
+    """
+
+    def __init__(self, path: str, mapping: mmap.mmap, count: int,
+                 created: float, owner: bool = False):
+        start = _SHARED_HEADER.size
+        end = start + count * array('f').itemsize
+
+        super().__init__(_PackedWords(mapping, end, count),
+                         memoryview(mapping)[start:end].cast('f'), created)
+
+        self._mapping = mapping
+        self._owner = owner
+        self.path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @classmethod
+    def publish(cls, index: WordIndex, url: str) -> 'SharedWordIndex':
+        """Publishes an index, for other processes to attach to.
+
+        Args:
+            index (WordIndex): The index to publish.
+            url (str): The URL of the index's wordlist.
+
+        Returns:
+            SharedWordIndex: The published index, which removes its file when
+                closed.
+
+        Raises:
+            OSError: The index's file cannot be written.
+        """
+
+        directory = (_SHARED_DIRECTORY if os.path.isdir(_SHARED_DIRECTORY)
+                     else None)
+        fd, path = tempfile.mkstemp(prefix='pygames-', suffix='.idx',
+                                    dir=directory)
+
+        try:
+            with open(fd, 'wb') as f:
+                f.write(_SHARED_HEADER.pack(
+                    _SHARED_MAGIC, len(index), index.created,
+                    get_index_name(url).encode(),
+                ))
+                f.write(index._scores.tobytes())
+                f.write(b''.join(word.encode().ljust(_MAX_LENGTH, b'\0')
+                                 for word in index._words))
+
+            shared = cls.attach(path, url)
+        except BaseException:
+            os.unlink(path)
+            raise
+
+        shared._owner = True
+        return shared
+
+    @classmethod
+    def attach(cls, path: str, url: str) -> 'SharedWordIndex | None':
+        """Attaches to an index published by `publish()`.
+
+        Args:
+            path (str): The path of the index's file.
+            url (str): The URL of the wordlist the index should be of.
+
+        Returns:
+            SharedWordIndex | None: The index, or None if it cannot be read,
+                is invalid, or is of another wordlist.
+        """
+
+        try:
+            with open(path, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, count, created, name = _SHARED_HEADER.unpack_from(mapping)
+        except struct.error:
+            magic = count = created = name = None
+
+        if (magic != _SHARED_MAGIC
+                or name != get_index_name(url).encode()
+                or len(mapping) != _SHARED_HEADER.size
+                + count * (array('f').itemsize + _MAX_LENGTH)):
+            mapping.close()
+            return None
+
+        return cls(path, mapping, count, created)
+
+    def close(self):
+        """Detaches from the index, and removes it if it was published here.
+
+        The index cannot be used once closed.
+        """
+
+        self._scores.release()
+        self._mapping.close()
+
+        if self._owner:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+            self._owner = False
+
+
+def _get_codec(compression: str):
+    """Finds the module that compresses the blocks of a compressed index.
+
+    Args:
+        compression (str): One of `COMPRESSIONS`.
+
+    Returns:
+        module: The module, with `compress()` and `decompress()` functions.
+
+    Raises:
+        ValueError: The compression is unknown.
+    """
+
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"unknown wordlist compression '{compression}'")
+
+    # only imported when the cached index is compressed
+    return importlib.import_module(compression)
+
+
+def _count_solver_misses(words: list) -> dict:
+    """Counts the wrong guesses a simple solver makes for each word.
+
+    The solver knows the wordlist and the length of the word, and always
+    guesses the letter found in the most words that are still possible,
+    given its previous guesses. Words that share the same guesses and
+    answers so far are solved together, so the whole wordlist is solved in
+    a single pass down the solver's decision tree.
+
+    Args:
+        words (list): The words to solve, without duplicates.
+
+    Returns:
+        dict: The number of wrong guesses made for each word.
+    """
+
+    misses = {}
+    by_length = collections.defaultdict(list)
+
+    for word in words:
+        by_length[len(word)].append(word)
+
+    stack = [(group, frozenset(), 0) for group in by_length.values()]
+
+    while stack:
+        candidates, guessed, missed = stack.pop()
+        counts = collections.Counter()
+
+        if len(candidates) > 1:
+            for word in candidates:
+                counts.update(set(word) - guessed)
+
+        # the solver knows the word once only one candidate is left
+        if not counts:
+            misses.update(dict.fromkeys(candidates, missed))
+            continue
+
+        letter = min(counts, key=lambda letter: (-counts[letter], letter))
+        partitions = collections.defaultdict(list)
+
+        for word in candidates:
+            positions = tuple(n for n, c in enumerate(word) if c == letter)
+            partitions[positions].append(word)
+
+        for positions, group in partitions.items():
+            stack.append((group, guessed | {letter}, missed + (not positions)))
+
+    return misses
+
+
+def _score_words(words: list) -> list:
+    """Scores how hard each word is to guess, from 0 (easiest) to 1.
+
+    See `_SCORE_WEIGHTS` for what the score is made of; each part is scaled
+    relative to the hardest word of the wordlist for that part.
+
+    Args:
+        words (list): The words to score, without duplicates.
+
+    Returns:
+        list: The score of each word, in the same order.
+    """
+
+    letter_counts = collections.Counter(''.join(words))
+    total = sum(letter_counts.values())
+    rarity = {letter: -math.log2(count / total)
+              for letter, count in letter_counts.items()}
+
+    misses = _count_solver_misses(words)
+    parts = [
+        (misses[word],
+         sum(rarity[letter] for letter in set(word)) / len(set(word)),
+         -len(set(word)))
+        for word in words
+    ]
+
+    # scale every part to the range from 0 to 1
+    lows = [min(part[n] for part in parts) for n in range(3)]
+    highs = [max(part[n] for part in parts) for n in range(3)]
+
+    return [
+        sum(weight * (value - low) / ((high - low) or 1)
+            for weight, value, low, high
+            in zip(_SCORE_WEIGHTS, part, lows, highs))
+        for part in parts
+    ]
+
+
+def get_index_name(url: str) -> str:
+    """Names the index of a wordlist, as it is cached or bundled.
+
+    Args:
+        url (str): The URL of the wordlist.
+
+    Returns:
+        str: The file name of the index.
+    """
+
+    return f'{hashlib.sha256(url.encode()).hexdigest()[:16]}.idx'
+
+
+def get_cache_path(url: str, compression: str = '') -> pathlib.Path:
+    """Finds the path to the cached index of a wordlist.
+
+    Indexes are cached in 'pygames' in the user's cache directory
+    (``$XDG_CACHE_HOME``, or '~/.cache').
+
+    Args:
+        url (str): The URL of the wordlist.
+        compression (str): The compression of the cached index, if any
+            (default: '').
+
+    Returns:
+        pathlib.Path: The path to the cached index.
+    """
+
+    name = get_index_name(url)
+
+    if compression:
+        name = f'{name}.{compression}'
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or '~/.cache'
+    return pathlib.Path(cache_home).expanduser() / 'pygames' / name
+
+
+def load_index(url: str) -> WordIndex:
+    """Loads the index of a wordlist, building it if needed.
+
+    The index is built the first time a wordlist is used, then cached on
+    disk and reused for a day, so that games never wait for the wordlist to
+    be downloaded and scored. If the wordlist cannot be fetched once the
+    cached index is out of date, the old index is used instead.
+
+    An index bundled with a zipapp build is always used as is, so that the
+    zipapp can be played offline; and so is an index shared by another
+    process, through the ``PYGAMES_WORDLIST_SHARED`` environment variable
+    (see `SharedWordIndex`).
+
+    The cached index is compressed if the ``PYGAMES_WORDLIST_COMPRESSION``
+    environment variable names one of `COMPRESSIONS`, in which case only the
+    blocks of the words picked are read from it (see `CompressedWordIndex`).
+
+    Args:
+        url (str): The URL (or path) of the wordlist.
+
+    Returns:
+        WordIndex: The index.
+
+    Raises:
+        ValueError: The wordlist cannot be fetched (and is not cached), has
+            no suitable words, or its compression is unknown.
+    """
+
+    if url in _indexes:
+        return _indexes[url]
+
+    if shared_path := os.environ.get(_SHARED_VARIABLE):
+        index = SharedWordIndex.attach(shared_path, url)
+
+        if index is not None:
+            _indexes[url] = index
+            return index
+
+    data = _bundle.read_data(get_index_name(url))
+
+    index = WordIndex.from_bytes(data) if data is not None else None
+
+    if index is not None:
+        _indexes[url] = index
+        return index
+
+    compression = os.environ.get(_COMPRESSION_VARIABLE, '')
+    path = get_cache_path(url, compression)
+
+    if compression:
+        _get_codec(compression)
+        index = CompressedWordIndex.load(path)
+    else:
+        index = WordIndex.load(path)
+
+    if index is None or time.time() - index.created > _MAX_AGE:
+        try:
+            fresh_index = WordIndex.build(_transport.fetch_text(url).split())
+        except ValueError:
+            if index is None:
+                raise
+        else:
+            if isinstance(index, CompressedWordIndex):
+                index.close()
+
+            index = fresh_index
+            index.save(path, compression)
+
+    _indexes[url] = index
+    return index
@@ -0,0 +1,229 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Runs the benchmark suite, and compares the results against a baseline.
+
+The benchmark suite lives in the 'benchmarks' directory of the PyGames source
+code. Each module in it whose name starts with ``bench_`` may define any
+number of benchmarks, as functions whose names also start with ``bench_``.
+A benchmark function does any setup it needs, then returns the function to
+be timed (which takes no arguments).
+"""
+
+import importlib.util
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import timeit
+from types import FunctionType
+
+# The number of times each benchmark is timed; the best time is used to
+# compare results, as it is the least affected by other processes
+_REPEAT = 5
+
+
+def _find_suite(path: str) -> pathlib.Path:
+    """Finds the directory holding the benchmark suite.
+
+    Args:
+        path (str): The path to the benchmark suite, or an empty string for
+            the 'benchmarks' directory of the PyGames source code.
+
+    Returns:
+        pathlib.Path: The path to the benchmark suite.
+
+    Raises:
+        ValueError: The benchmark suite cannot be found.
+    """
+
+    default = pathlib.Path(__file__).parents[2] / 'benchmarks'
+    suite = pathlib.Path(path) if path else default
+
+    if not suite.is_dir():
+        raise ValueError(f"cannot find benchmark suite '{suite}'")
+
+    return suite
+
+
+def _load_benchmarks(suite: pathlib.Path, match: str) -> dict:
+    """Loads every benchmark in the benchmark suite.
+
+    Args:
+        suite (pathlib.Path): The path to the benchmark suite.
+        match (str): Only benchmarks whose name contains this string are
+            loaded.
+
+    Returns:
+        dict: Maps the name of each benchmark (e.g. 'hangman.guess_letter')
+            to its function.
+    """
+
+    # the benchmarks import PyGames from the source code, i.e. 'src.pygames'
+    sys.path.insert(0, str(suite.parent))
+    benchmarks = {}
+
+    for path in sorted(suite.glob('bench_*.py')):
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        for attribute, function in vars(module).items():
+            name = f"{path.stem[6:]}.{attribute[6:]}"
+
+            if attribute.startswith('bench_') and match in name:
+                benchmarks[name] = function
+
+    return benchmarks
+
+
+def _run_benchmark(benchmark: FunctionType) -> dict:
+    """Times a single benchmark.
+
+    Args:
+        benchmark (FunctionType): The benchmark function, which returns the
+            function to time.
+
+    Returns:
+        dict: The best and median time per call (in seconds), and the number
+            of calls timed in each repetition.
+    """
+
+    timer = timeit.Timer(benchmark())
+    loops, _ = timer.autorange()
+    times = [total / loops for total in timer.repeat(_REPEAT, loops)]
+
+    return {
+        'best': min(times),
+        'median': statistics.median(times),
+        'loops': loops,
+    }
+
+
+def _compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Finds the benchmarks that got slower than their baseline.
+
+    Args:
+        results (dict): The new results, by benchmark name.
+        baseline (dict): The baseline results, by benchmark name.
+        threshold (float): How much slower a benchmark may get before it is
+            considered a regression, as a fraction of its baseline time.
+
+    Returns:
+        list: A message for each regression.
+    """
+
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = result['best'] / baseline[name]['best']
+
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    """Formats a duration with a suitable unit.
+
+    Args:
+        seconds (float): The duration, in seconds.
+
+    Returns:
+        str: The formatted duration (e.g. '1.23 µs').
+    """
+
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def main(
+    output: str = '',
+    baseline: str = '',
+    threshold: float = 0.25,
+    match: str = '',
+    suite: str = '',
+):
+    """Run the benchmark suite.
+
+    Times every benchmark in the benchmark suite, prints the results, and
+    optionally saves them as JSON and compares them against a baseline saved
+    by a previous run.
+
+    Args:
+        output (str): The path to save the results to, as JSON (default:
+            none).
+        baseline (str): The path to the results of a previous run, to compare
+            the new results against (default: none).
+        threshold (float): How much slower a benchmark may get before it is
+            considered a regression, as a fraction of its baseline time
+            (default: 0.25, i.e. 25% slower).
+        match (str): Only run the benchmarks whose name contains this string
+            (default: none, i.e. run every benchmark).
+        suite (str): The path to the benchmark suite (default: the
+            'benchmarks' directory of the PyGames source code).
+
+    Raises:
+        ValueError: The benchmark suite or the baseline cannot be read.
+        SystemExit: One or more benchmarks regressed against the baseline.
+    """
+
+    benchmarks = _load_benchmarks(_find_suite(suite), match)
+
+    if baseline:
+        try:
+            with open(baseline, encoding='utf-8') as f:
+                baseline_results = json.load(f)['benchmarks']
+        except (OSError, ValueError, KeyError):
+            raise ValueError(f"cannot read baseline '{baseline}'")
+
+    results = {}
+
+    for name, benchmark in benchmarks.items():
+        results[name] = _run_benchmark(benchmark)
+        print(f"{name:<40} {_format_time(results[name]['best']):>10}")
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'benchmarks': results,
+            }, f, indent=2)
+
+    if not baseline:
+        return None
+
+    regressions = _compare(results, baseline_results, threshold)
+
+    for regression in regressions:
+        print(regression)
+
+    if regressions:
+        raise SystemExit(f"{len(regressions)} benchmarks regressed")
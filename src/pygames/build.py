@@ -0,0 +1,184 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Builds PyGames into a single-file, self-contained zipapp.
+
+The zipapp holds the package's modules, both as sources and as precompiled
+bytecode, along with the few dependencies that are needed at runtime, and
+data files that are otherwise fetched or computed on first use: the hangman
+wordlist (already indexed by difficulty) and the tic-tac-toe solution
+table. It only needs a Python interpreter to run, and never needs network
+access.
+"""
+
+import pathlib
+
+from . import _bundle
+from . import _wordlist
+from . import hangman
+from . import tic_tac_toe
+
+# The packages vendored into the zipapp, each with the subpackages that are
+# left out, as they are not needed at runtime
+_VENDORED = {
+    'argcomplete': ('scripts',),
+}
+
+# The entry point of the zipapp; the marker comment lets argcomplete know
+# that the zipapp supports completion
+_MAIN = """\
+# PYTHON_ARGCOMPLETE_OK
+
+import pygames
+
+pygames.run_cli()
+"""
+
+
+def _copy_sources(source: pathlib.Path, target: pathlib.Path,
+                  excluded: tuple = ()):
+    """Copies the Python sources of a package, including its subpackages.
+
+    Args:
+        source (pathlib.Path): The directory of the package.
+        target (pathlib.Path): The directory to copy the sources to.
+        excluded (tuple): The names of the subpackages to leave out
+            (default: none).
+    """
+
+    import shutil
+
+    for path in source.rglob('*.py'):
+        relative_path = path.relative_to(source)
+
+        if relative_path.parts[0] in excluded:
+            continue
+
+        (target / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, target / relative_path)
+
+
+def _write_data(directory: pathlib.Path, version: str) -> int:
+    """Writes the data files bundled with the zipapp; see `_bundle`.
+
+    Args:
+        directory (pathlib.Path): The directory to write the files to.
+        version (str): The version number of PyGames.
+
+    Returns:
+        int: The number of words in the bundled wordlist.
+
+    Raises:
+        ValueError: The wordlist cannot be fetched, or has no suitable words.
+    """
+
+    url = hangman._get_wordlist_url()
+    index = _wordlist.load_index(url)
+
+    directory.mkdir()
+    (directory / 'VERSION').write_text(version)
+    (directory / _wordlist.get_index_name(url)).write_bytes(index.to_bytes())
+    (directory / tic_tac_toe.SOLUTION_TABLE_NAME).write_bytes(
+        tic_tac_toe.build_solution_table()
+    )
+
+    return len(index)
+
+
+def _compile_sources(root: pathlib.Path):
+    """Compiles every Python source, next to it, into unchecked bytecode.
+
+    The bytecode is loaded straight from the zipapp, without comparing it to
+    its source. Python versions that cannot load it fall back to the source.
+
+    Args:
+        root (pathlib.Path): The root directory of the zipapp.
+    """
+
+    import py_compile
+
+    for path in root.rglob('*.py'):
+        py_compile.compile(
+            str(path),
+            cfile=str(path.with_suffix('.pyc')),
+            dfile=path.relative_to(root).as_posix(),
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+
+
+def main(
+    archive: str = 'pygames.pyz',
+    interpreter: str = '/usr/bin/env python3',
+):
+    """Build PyGames into a single-file zipapp.
+
+    Bundles PyGames, its runtime dependencies and the data it needs into a
+    single executable file, which starts faster than an installed package
+    and runs fully offline. The wordlist is fetched (or read from the cache)
+    while building, from the same URL hangman uses.
+
+    Args:
+        archive (str): The path to write the zipapp to (default:
+            'pygames.pyz').
+        interpreter (str): The interpreter to run the zipapp with, written to
+            its shebang line (default: '/usr/bin/env python3').
+
+    Raises:
+        ValueError: A runtime dependency is not installed, or the wordlist
+            cannot be fetched.
+    """
+
+    # only imported when building, to keep startup fast otherwise
+    import importlib.util
+    import tempfile
+    import zipapp
+
+    from ._application import __version__
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = pathlib.Path(directory)
+        package = pathlib.Path(__file__).parent
+
+        _copy_sources(package, root / 'pygames')
+
+        for name, excluded in _VENDORED.items():
+            spec = importlib.util.find_spec(name)
+
+            if spec is None or not spec.submodule_search_locations:
+                raise ValueError(f"cannot vendor '{name}': not installed")
+
+            _copy_sources(pathlib.Path(spec.submodule_search_locations[0]),
+                          root / name, excluded)
+
+        (root / '__main__.py').write_text(_MAIN)
+
+        word_count = _write_data(
+            root / 'pygames' / pathlib.Path(_bundle.DATA_DIRECTORY).name,
+            __version__,
+        )
+        _compile_sources(root)
+
+        zipapp.create_archive(root, archive, interpreter=interpreter)
+
+    size = pathlib.Path(archive).stat().st_size
+    print(f"built '{archive}' (PyGames {__version__}, {word_count} words, "
+          f"{size / 1024:.0f} KiB)")
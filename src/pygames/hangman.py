@@ -33,11 +33,28 @@ also convert this file into an executable via `chmod +x hangman.py`, then
 run the file directly.
 """
 
+import os
 import random
-import requests
+import struct
+from typing import Iterator
+
+from . import _metrics
+from . import _wordlist
+from ._journal import Journal, make_rng
+from ._rendering import Renderer
+from ._stats import StatsRecorder
 
 _WORDLIST_URL = 'https://raw.githubusercontent.com/first20hours/google-10000-english/master/google-10000-english-no-swears.txt'
 
+# Snapshot of a game state: the secret word (see `_pack_word()`), the letters
+# guessed (a bit per letter, from A to Z, and `_SOLVED_BIT` if the word was
+# guessed), the number of lives left, and the number of guesses made
+_SNAPSHOT = struct.Struct('<QIHH')
+_SOLVED_BIT = 1 << 31
+
+# The longest word that fits in a snapshot, at 5 bits per letter
+_MAX_PACKED_LENGTH = 12
+
 
 class _SecretLetter:
     """A hidden letter, only to be revealed with a correct guess.
@@ -155,6 +172,9 @@ class _GameState:
         self.lives = lives
         self.guesses = set()
 
+        # Number of valid guesses made so far, including a correct word guess
+        self.guess_count = 0
+
         # String representation of all the wrong (letter) guesses made so far
         self._wrong_guesses = ''
 
@@ -177,6 +197,7 @@ class _GameState:
 
         return summary
 
+    @_metrics.timed('pygames_turn_seconds', game='hangman')
     def try_guess(self, guess: str) -> str:
         """Modifies the game state according to the provided guess.
 
@@ -200,7 +221,9 @@ class _GameState:
         """
 
         # return early if the guess matches the secret word
-        if self.secret_word.guess_word(guess): return ""
+        if self.secret_word.guess_word(guess):
+            self.guess_count += 1
+            return ""
 
         if not (guess and guess.isascii() and guess.isalpha()):
             return "Please input a letter or word!"
@@ -209,6 +232,7 @@ class _GameState:
             return "You already made this guess!"
 
         self.guesses.add(guess)
+        self.guess_count += 1
 
         if len(guess) != 1:
             self.lives -= 1
@@ -223,6 +247,119 @@ class _GameState:
 
         return self._generate_count_message(count, guess)
 
+    def forfeit_turn(self) -> str:
+        """Takes a life away for a turn the player ran out of time on.
+
+        Returns:
+            str: A message explaining that a life was lost.
+        """
+
+        self.lives -= 1
+        return "Time's up! You lost a life"
+
+    def to_bytes(self) -> bytes:
+        """Encodes the game state as a compact, 16-byte snapshot.
+
+        Only the letters guessed are kept, not the order they were guessed in
+        (wrong letters are listed alphabetically once restored) nor the wrong
+        word guesses, which can then be guessed again.
+
+        Returns:
+            bytes: The snapshot; see `from_bytes()`.
+
+        Raises:
+            ValueError: The game state cannot be encoded; the secret word is
+                not made of up to 12 lowercase letters (A to Z), or there are
+                more than 65535 lives or guesses.
+        """
+
+        try:
+            return _SNAPSHOT.pack(*self._get_snapshot())
+        except struct.error:
+            raise ValueError("too many lives or guesses for a snapshot")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> '_GameState':
+        """Restores a game state from a snapshot made by `to_bytes()`.
+
+        Args:
+            data (bytes): The snapshot.
+
+        Returns:
+            _GameState: The restored game state.
+
+        Raises:
+            ValueError: The snapshot is invalid.
+        """
+
+        try:
+            return cls._from_snapshot(*_SNAPSHOT.unpack(data))
+        except struct.error:
+            raise ValueError("corrupted snapshot")
+
+    def _get_snapshot(self) -> tuple:
+        """Lists the fields of the game state's snapshot; see `_SNAPSHOT`."""
+
+        guessed = 0 if self.secret_word.hidden else _SOLVED_BIT
+
+        for guess in self.guesses:
+            if len(guess) == 1:
+                guessed |= 1 << (ord(guess) - ord('a'))
+
+        return (_pack_word(self.secret_word._word), guessed, self.lives,
+                self.guess_count)
+
+    @classmethod
+    def _from_snapshot(
+        cls,
+        word: int,
+        guessed: int,
+        lives: int,
+        guess_count: int,
+    ) -> '_GameState':
+        """Restores a game state from the fields of its snapshot.
+
+        Args:
+            word (int): The packed secret word; see `_pack_word()`.
+            guessed (int): The letters guessed, as a bitmask.
+            lives (int): The number of lives left.
+            guess_count (int): The number of guesses made.
+
+        Returns:
+            _GameState: The restored game state.
+
+        Raises:
+            ValueError: The packed secret word is invalid.
+        """
+
+        secret_word = _unpack_word(word)
+        game_state = cls(secret_word, lives)
+        game_state.guess_count = guess_count
+        guesses = game_state.guesses
+        wrong_guesses = []
+        letters = guessed & ~_SOLVED_BIT
+
+        # only visit the bits that are set, from the lowest (A) up
+        while letters:
+            bit = letters & -letters
+            letter = chr(ord('a') + bit.bit_length() - 1)
+            guesses.add(letter)
+
+            if letter not in secret_word:
+                wrong_guesses.append(letter.upper())
+
+            letters ^= bit
+
+        for slot in game_state.secret_word._slots:
+            slot._hidden = slot._letter not in guesses
+
+        game_state.secret_word.hidden = not (
+            guessed & _SOLVED_BIT or guesses.issuperset(secret_word)
+        )
+        game_state._wrong_guesses = ' '.join(wrong_guesses)
+
+        return game_state
+
     @staticmethod
     def _generate_count_message(count: int, letter: str) -> str:
         """Creates a string stating the number of matches for the given guess.
@@ -252,6 +389,64 @@ class _GameState:
         return f"There {copula} {count} letter {letter.upper()}{num_marker}"
 
 
+def _pack_word(word: str) -> int:
+    """Packs a word into an integer, with 5 bits per letter.
+
+    Each letter is stored as its position in the alphabet (from 1 to 26),
+    starting from the lowest bits; the word ends at the first zero.
+
+    Args:
+        word (str): The word to pack; up to 12 lowercase letters (A to Z).
+
+    Returns:
+        int: The packed word, which fits in 64 bits.
+
+    Raises:
+        ValueError: The word cannot be packed.
+    """
+
+    if not (word.isascii() and word.isalpha() and word.islower()
+            and len(word) <= _MAX_PACKED_LENGTH):
+        raise ValueError(f"cannot pack the word '{word}'")
+
+    value = 0
+
+    for letter in reversed(word):
+        value = value << 5 | (ord(letter) - ord('a') + 1)
+
+    return value
+
+
+def _unpack_word(value: int) -> str:
+    """Unpacks a word packed by `_pack_word()`.
+
+    Args:
+        value (int): The packed word.
+
+    Returns:
+        str: The word.
+
+    Raises:
+        ValueError: The packed word is invalid.
+    """
+
+    letters = []
+
+    while value:
+        code = value & 31
+
+        if not 1 <= code <= 26:
+            raise ValueError("corrupted snapshot")
+
+        letters.append(chr(ord('a') + code - 1))
+        value >>= 5
+
+    if not letters:
+        raise ValueError("corrupted snapshot")
+
+    return ''.join(letters)
+
+
 def _check_validity_lives(lives: int):
     """TODO
 
@@ -265,55 +460,134 @@ def _check_validity_lives(lives: int):
         raise ValueError("cannot start game with less than 1 life")
 
 
-def _get_random_word() -> str:
-    """TODO
+def _get_wordlist_url() -> str:
+    """Finds the URL of the wordlist to pick secret words from.
+
+    Uses the URL in the ``PYGAMES_WORDLIST_URL`` environment variable if it is
+    set (e.g. to a local server, or a local file for playing offline; see
+    `_transport.fetch_text()`); otherwise, uses the default wordlist.
 
     Returns:
-        str: A random word between 5 and 12 letters in length.
+        str: The URL of the wordlist.
     """
 
     global _WORDLIST_URL
 
-    all_words = requests.get(_WORDLIST_URL).text.rstrip().split()
-    valid_words = tuple(filter(lambda x: 5 <= len(x) <= 12, all_words))
-    return random.choice(valid_words)
+    return os.environ.get('PYGAMES_WORDLIST_URL') or _WORDLIST_URL
 
 
-def _prompt_guess(game_state: _GameState) -> bool:
-    """TODO
+@_metrics.timed('pygames_word_fetch_seconds')
+def _get_random_word(
+    rng: random.Random = random,
+    difficulty: str = '',
+) -> str:
+    """Picks a random word from the wordlist.
+
+    The wordlist is only downloaded and indexed by difficulty once in a
+    while; see `_wordlist.load_index()`.
 
     Args:
-        game_state (_GameState): TODO
+        rng (random.Random): The random number generator to pick the word
+            with (default: the `random` module's global generator).
+        difficulty (str): How hard the word should be to guess: 'easy',
+            'medium' or 'hard', or an empty string for any word (default:
+            '').
 
     Returns:
-        bool: Whether or not the user requested to exit the program; if an EOF
-            ('end-of-file') was added to the standard input stream (i.e. with
-            the CTRL + D shortcut).
+        str: A random word between 5 and 12 letters in length.
+
+    Raises:
+        ValueError: The wordlist cannot be fetched, or the difficulty is
+            unknown.
     """
 
-    # NOTE: This function might have gotten a bit too long. May need to break
-    # it into smaller functions later
+    return _wordlist.load_index(_get_wordlist_url()).pick(rng, difficulty)
+
+
+@_metrics.timed('pygames_input_wait_seconds', game='hangman')
+def _prompt_guess(
+    renderer: Renderer,
+    game_state: _GameState,
+    header: list,
+    timeout: float | None = None,
+) -> str | None:
+    """Draws the current turn's frame and prompts the user for a guess.
 
-    print(game_state.summarize())
+    Args:
+        renderer (Renderer): The renderer used to draw the game.
+        game_state (_GameState): The state of the game in progress.
+        header (list): Lines to draw above the game summary, typically the
+            result of the previous guess.
+        timeout (float | None): The most seconds the user may take to guess,
+            or None for no limit (default: None).
+
+    Returns:
+        str | None: The user's guess (in lowercase), or None if the user
+            requested to exit the program; if an EOF ('end-of-file') was added
+            to the standard input stream (i.e. with the CTRL + D shortcut).
+
+    Raises:
+        TimeoutError: The user did not guess in time.
+    """
+
+    lines = [*header, game_state.summarize(), "your guess: "]
 
     try:
-        guess = input("your guess: ")
+        guess = renderer.input(lines, timeout)
     except EOFError: # return early if user hits CTRL+D / EOF
-        print('\nGoodbye!')
-        return True
+        renderer.draw([*lines, "Goodbye!"], final=True)
+        return None
 
-    guess = guess.lower() # make input case insensitive
+    return guess.lower() # make input case insensitive
+
+
+def _replay(start: dict, events: Iterator[dict]) -> str | None:
+    """Replays a game of hangman from its journal, without any user input.
+
+    Args:
+        start (dict): The game's 'start' event.
+        events (Iterator[dict]): The rest of the game's events.
+
+    Returns:
+        str | None: A description of how the replayed game differs from the
+            journal, or None if the outcome is the same.
+    """
 
-    result_message = game_state.try_guess(guess)
+    game_state = _GameState(start['word'], start['config']['lives'])
+    end = None
 
-    if result_message:
-        print(result_message)
+    for event in events:
+        if event['event'] == 'guess':
+            game_state.try_guess(event['guess'])
+        elif event['event'] == 'timeout':
+            game_state.forfeit_turn()
+        elif event['event'] == 'end':
+            end = event
 
-    print() # newline
-    return False
+    expected = (end or {}).get('outcome', 'quit')
 
+    if expected == 'quit':
+        is_over = not (game_state.lives and game_state.secret_word.hidden)
+        return "game ended before it was quit" if is_over else None
 
-def main(endless: bool = False, lives: int = 8):
+    outcome = 'win' if game_state.lives else 'lose'
+
+    if (outcome, game_state.lives) != (expected, end.get('lives')):
+        return (f"expected a {expected} with {end.get('lives')} lives, "
+                f"got a {outcome} with {game_state.lives} lives")
+
+    return None
+
+
+def main(
+    endless: bool = False,
+    lives: int = 8,
+    difficulty: str = '',
+    seed: int | None = None,
+    journal: str = '',
+    player: str = '',
+    turn_timeout: float = 0,
+):
     """Play a game of hangman.
 
     Starts a game of Hangman with a randomly selected word as the secret
@@ -323,29 +597,83 @@ def main(endless: bool = False, lives: int = 8):
         endless (bool): Whether or not to automatically start a new game after
             the previous one ends (default: False).
         lives (int): The number of lives to start off with (default: 8).
+        difficulty (str): How hard the secret words should be to guess:
+            'easy', 'medium' or 'hard' (default: any difficulty).
+        seed (int | None): The seed for picking the secret words; picked at
+            random if not given (default: None).
+        journal (str): The path to a file to append a replayable log of each
+            game to; see `pygames replay` (default: none).
+        player (str): The name to record the outcome of each game under; see
+            `pygames stats` (default: none, i.e. nothing is recorded).
+        turn_timeout (float): The most seconds each guess may take; running
+            out of time costs a life (default: 0, i.e. no limit).
 
     Raises:
         TypeError: ``lives`` must be an integer (`int`).
         ValueError: ``lives`` cannot be less than 1; cannot start with less
-            than 1 life.
+            than 1 life. Also raised if ``difficulty`` is unknown, if
+            ``turn_timeout`` is negative, or if the wordlist cannot be
+            fetched.
     """
 
     _check_validity_lives(lives)
 
-    while True:
-        game_state = _GameState(_get_random_word(), lives)
+    if turn_timeout < 0:
+        raise ValueError("the turn timeout cannot be negative")
+
+    if difficulty and difficulty not in _wordlist.DIFFICULTIES:
+        raise ValueError(f"unknown difficulty '{difficulty}'")
+
+    seed, rng = make_rng(seed)
+    renderer = Renderer()
+
+    with Journal(journal) as log, StatsRecorder(player) as stats:
+        while True:
+            secret_word = _get_random_word(rng, difficulty)
+            game_state = _GameState(secret_word, lives)
+            header = []
+
+            log.record('start', game='hangman', seed=seed,
+                       config={'lives': lives, 'difficulty': difficulty},
+                       word=secret_word)
+
+            while game_state.lives and game_state.secret_word.hidden:
+                try:
+                    guess = _prompt_guess(renderer, game_state, header,
+                                          turn_timeout or None)
+                except TimeoutError:
+                    log.record('timeout')
+                    header = [game_state.forfeit_turn(), '']
+                    continue
+
+                if guess is None: # if user asked to exit the program
+                    log.record('end', outcome='quit')
+                    return None # exit function early
+
+                log.record('guess', guess=guess)
+
+                result_message = game_state.try_guess(guess)
+                header = [result_message, ''] if result_message else ['']
+
+            outcome = 'win' if game_state.lives else 'lose'
+            log.record('end', outcome=outcome, lives=game_state.lives)
+            stats.record('hangman', outcome, game_state.guess_count)
+            _metrics.count('pygames_games_total', game='hangman',
+                           outcome=outcome)
 
-        while game_state.lives and game_state.secret_word.hidden:
-            if _prompt_guess(game_state): # if user asked to exit the program
-                return None # exit function early
+            # make the entire secret word visible when parsed into a string
+            game_state.secret_word.hidden = False
 
-        # make the entire secret word visible when parsed into a string
-        game_state.secret_word.hidden = False
+            lines = [
+                *header,
+                "You win!" if game_state.lives else "Game over!",
+                f"The secret word was \"{game_state.secret_word}\"",
+            ]
 
-        print("You win!" if game_state.lives else "Game over!")
-        print(f"The secret word was \"{game_state.secret_word}\"")
+            if endless:
+                lines.append('') # newline
 
-        if not endless:
-            return None
+            renderer.draw(lines, final=True)
 
-        print() # newline
+            if not endless:
+                return None
@@ -0,0 +1,340 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""A game of hangman that many players race to solve over the network.
+
+Players connect over TCP (e.g. with `nc`, or from a chat bridge), send their
+name, then send one guess per line. Everyone shares the same secret word and
+the same lives, and whoever guesses the word (or its last letter) wins the
+round; a new word is picked as soon as a round ends.
+
+Every guess goes through a single queue, and is applied by a single task
+that owns the game's state, so guesses are applied one at a time, in the
+order they arrived. The results are broadcast in batches: guesses that
+arrive within the same short interval are applied together, then sent to
+every player as a single message.
+"""
+
+import time
+
+from . import hangman
+from ._journal import make_rng
+from ._wordlist import DIFFICULTIES
+
+# The minimum time between two broadcasts, in seconds; guesses arriving in
+# between are applied and broadcast together
+_BROADCAST_INTERVAL = 0.05
+
+# The maximum number of bytes waiting to be sent to a player; players that
+# fall further behind are disconnected, so that they cannot slow down the room
+_MAX_BACKLOG = 1 << 20
+
+# The maximum length of a single line sent by a player
+_MAX_LINE_LENGTH = 1024
+
+
+class _Room:
+    """A game of hangman shared by every connected player.
+
+    The game's state is only ever changed by `run()`, which applies the
+    guesses submitted by the players in order.
+
+    Attributes:
+        game_state (hangman._GameState | None): The state of the current
+            round, if one has started.
+        guesses_applied (int): The number of guesses applied so far.
+        broadcasts (int): The number of batches broadcast so far.
+    """
+
+    def __init__(self, get_word, lives: int = 8):
+        # only imported to host a room, as it is slow to import
+        import asyncio
+
+        self._get_word = get_word
+        self._lives = lives
+        self._queue = asyncio.Queue()
+        self._players = {}
+        self.game_state = None
+        self.guesses_applied = 0
+        self.broadcasts = 0
+
+    def join(self, name: str, writer: 'asyncio.StreamWriter'):
+        """Adds a player to the room, and sends them the current round.
+
+        Args:
+            name (str): The player's name.
+            writer (asyncio.StreamWriter): The stream to send the player's
+                messages to.
+        """
+
+        self._players[writer] = name
+
+        if self.game_state is not None:
+            writer.write(f"{self.game_state.summarize()}\n".encode())
+
+        count = len(self._players)
+        self._broadcast([
+            f"{name} joined ({count} player{'' if count == 1 else 's'})",
+        ])
+
+    def leave(self, writer: 'asyncio.StreamWriter'):
+        """Removes a player from the room.
+
+        Args:
+            writer (asyncio.StreamWriter): The player's stream.
+        """
+
+        self._players.pop(writer, None)
+
+    def submit(self, name: str, guess: str):
+        """Queues a player's guess, to be applied in order by `run()`.
+
+        Args:
+            name (str): The name of the player making the guess.
+            guess (str): The guess.
+        """
+
+        self._queue.put_nowait((name, guess))
+
+    async def run(self):
+        """Plays round after round, applying the submitted guesses in order.
+
+        Runs until cancelled.
+        """
+
+        import asyncio
+
+        last_broadcast = 0
+
+        while True:
+            word = await asyncio.to_thread(self._get_word)
+            self.game_state = hangman._GameState(word, self._lives)
+
+            # the guesses still queued (whether left over from the previous
+            # round, or submitted while the new word was fetched) were made
+            # for the previous word
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+            self._broadcast(["New word!", self.game_state.summarize()])
+
+            while self._is_playing():
+                batch = [await self._queue.get()]
+
+                # wait out the rest of the interval, so that every guess made
+                # in the meantime is part of the same batch
+                delay = last_broadcast + _BROADCAST_INTERVAL - time.monotonic()
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                lines = self._apply(batch)
+
+                if self._is_playing():
+                    lines.append(self.game_state.summarize())
+
+                self._broadcast(lines)
+                last_broadcast = time.monotonic()
+
+            self.game_state.secret_word.hidden = False
+            self._broadcast([
+                "You win!" if self.game_state.lives else "Game over!",
+                f"The secret word was \"{self.game_state.secret_word}\"",
+                '',
+            ])
+
+    def _is_playing(self) -> bool:
+        """Checks whether or not the current round is still in progress."""
+
+        game_state = self.game_state
+        return bool(game_state.lives and game_state.secret_word.hidden)
+
+    def _apply(self, batch: list) -> list:
+        """Applies a batch of guesses, in order, until the round ends.
+
+        Guesses left over once the round has ended are dropped, as they were
+        made for the previous word.
+
+        Args:
+            batch (list): The name of the player and the guess, for each
+                guess.
+
+        Returns:
+            list: The lines to broadcast about the guesses.
+        """
+
+        lines = []
+
+        for name, guess in batch:
+            if not self._is_playing():
+                break
+
+            message = self.game_state.try_guess(guess)
+            self.guesses_applied += 1
+
+            if not self.game_state.secret_word.hidden:
+                lines.append(f"{name} solved it with \"{guess}\"!")
+            elif message:
+                lines.append(f"{name}: {guess} · {message}")
+
+        return lines
+
+    def _broadcast(self, lines: list):
+        """Sends the same message to every player, in a single write each.
+
+        Args:
+            lines (list): The lines of the message.
+        """
+
+        if not lines:
+            return None
+
+        data = ''.join(f'{line}\n' for line in lines).encode()
+        self.broadcasts += 1
+
+        for writer in list(self._players):
+            if writer.is_closing():
+                self.leave(writer)
+            elif writer.transport.get_write_buffer_size() > _MAX_BACKLOG:
+                self.leave(writer)
+                writer.close()
+            else:
+                writer.write(data)
+
+
+async def _handle_player(
+    room: _Room,
+    reader: 'asyncio.StreamReader',
+    writer: 'asyncio.StreamWriter',
+):
+    """Reads a player's name, then their guesses until they disconnect.
+
+    Args:
+        room (_Room): The room to join.
+        reader (asyncio.StreamReader): The player's incoming stream.
+        writer (asyncio.StreamWriter): The player's outgoing stream.
+    """
+
+    try:
+        writer.write(b"Your name: ")
+        name = (await reader.readline()).decode(errors='replace').strip()
+
+        if not name:
+            return None
+
+        room.join(name, writer)
+
+        while line := await reader.readline():
+            room.submit(name, line.decode(errors='replace').strip().lower())
+    except (ConnectionError, ValueError):
+        pass # the player disconnected, or sent an overly long line
+    finally:
+        room.leave(writer)
+        writer.close()
+
+
+async def _serve(room: _Room, address: str, port: int) -> 'asyncio.Server':
+    """Starts accepting players into a room.
+
+    Args:
+        room (_Room): The room to host.
+        address (str): The address to listen on.
+        port (int): The port to listen on, or 0 for any free port.
+
+    Returns:
+        asyncio.Server: The server, already accepting connections.
+    """
+
+    import asyncio
+
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_player(room, reader, writer),
+        address, port, limit=_MAX_LINE_LENGTH,
+    )
+
+
+async def _host(room: _Room, address: str, port: int):
+    """Hosts a room until cancelled.
+
+    Args:
+        room (_Room): The room to host.
+        address (str): The address to listen on.
+        port (int): The port to listen on, or 0 for any free port.
+    """
+
+    server = await _serve(room, address, port)
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Hosting hangman at {host}:{port} (CTRL+C to stop)")
+
+    async with server:
+        await room.run()
+
+
+def main(
+    address: str = '127.0.0.1',
+    port: int = 8023,
+    lives: int = 8,
+    difficulty: str = '',
+    seed: int | None = None,
+):
+    """Host a game of hangman that many players race to solve.
+
+    Players connect over TCP (e.g. with `nc ADDRESS PORT`), enter their name,
+    then enter one guess per line. Everyone shares the same secret word and
+    lives, and a new word is picked as soon as a round ends.
+
+    Args:
+        address (str): The address to listen on (default: '127.0.0.1', i.e.
+            only this machine).
+        port (int): The port to listen on (default: 8023).
+        lives (int): The number of lives each round starts with (default:
+            8).
+        difficulty (str): How hard the secret words should be to guess:
+            'easy', 'medium' or 'hard' (default: any difficulty).
+        seed (int | None): The seed for picking the secret words; picked at
+            random if not given (default: None).
+
+    Raises:
+        TypeError: ``lives`` must be an integer (`int`).
+        ValueError: ``lives`` cannot be less than 1, or ``difficulty`` is
+            unknown.
+    """
+
+    # only imported to host a room, as it is slow to import
+    import asyncio
+
+    hangman._check_validity_lives(lives)
+
+    if difficulty and difficulty not in DIFFICULTIES:
+        raise ValueError(f"unknown difficulty '{difficulty}'")
+
+    _, rng = make_rng(seed)
+    room = _Room(lambda: hangman._get_random_word(rng, difficulty), lives)
+
+    try:
+        asyncio.run(_host(room, address, port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        raise ValueError(f"cannot listen on {address}:{port}: {e.strerror}")
@@ -20,7 +20,20 @@
 
 """TODO"""
 
+import itertools
+import json
+import math
+import os
 import random
+import re
+import struct
+import sys
+from array import array
+from types import FunctionType
+from typing import Iterator
+
+from ._journal import Journal, make_rng
+from ._rendering import Renderer
 
 _ANSWERS = (
     "It is certain",
@@ -45,8 +58,465 @@ _ANSWERS = (
     "Very doubtful",
 )
 
+# Size of the chunks that questions are read in when answering in bulk
+_BATCH_CHUNK_SIZE = 1 << 20
+
+_OUTPUT_FORMATS = ('tsv', 'jsonl')
+
+# Matches any byte (other than a newline) that would need to be escaped in a
+# JSON string
+_JSON_SPECIAL_BYTES = re.compile(rb'[\x00-\x09\x0b-\x1f"\\\x7f-\xff]')
+
+# Header of a cached alias table: a magic number, followed by the number of
+# entries in the table, and the size and modification time (in nanoseconds)
+# of the deck file that the table was built from
+_ALIAS_HEADER = struct.Struct('<4sQQq')
+_ALIAS_MAGIC = b'P8BA'
+
+
+class _AliasTable:
+    """A lookup table for drawing weighted random indexes in constant time.
+
+    An implementation of Walker's alias method (using Vose's algorithm to
+    build the table). Each entry in the table holds the probability of keeping
+    its own index, and an "alias" index to use otherwise, so that a weighted
+    random index can be drawn with a single random number, regardless of how
+    many entries there are or how skewed their weights are.
+    """
+
+    def __init__(self, probabilities: array, aliases: array):
+        self._probabilities = probabilities
+        self._aliases = aliases
+
+    def __len__(self):
+        return len(self._probabilities)
+
+    @classmethod
+    def from_weights(cls, weights: list) -> '_AliasTable':
+        """Builds a new alias table from a sequence of weights.
+
+        Args:
+            weights (list): The weight of each index; all weights must be
+                positive and finite.
+
+        Returns:
+            _AliasTable: The new alias table.
+
+        Raises:
+            ValueError: The weights are empty, not positive, or not finite.
+        """
+
+        count = len(weights)
+        total = sum(weights)
+
+        # a NaN or infinite weight makes the total NaN or infinite too
+        if not count or not total < math.inf or min(weights) <= 0:
+            raise ValueError("weights must be positive and finite")
+
+        scaled = [weight * count / total for weight in weights]
+        probabilities = array('d', bytes(8 * count))
+        aliases = array('I', bytes(4 * count))
+
+        small = [n for n, weight in enumerate(scaled) if weight < 1]
+        large = [n for n, weight in enumerate(scaled) if weight >= 1]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+
+            # move the excess probability of the larger entry over to the
+            # smaller one, then re-file the larger entry accordingly
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+
+        # whatever is left over is (within rounding error) exactly 1
+        for n in small + large:
+            probabilities[n] = 1.0
+            aliases[n] = n
+
+        return cls(probabilities, aliases)
+
+    @classmethod
+    def load(cls, path: str, stat: os.stat_result) -> '_AliasTable | None':
+        """Loads a cached alias table, if it is still up to date.
+
+        Args:
+            path (str): The path to the cached alias table.
+            stat (os.stat_result): The status of the deck file that the table
+                is expected to have been built from.
+
+        Returns:
+            _AliasTable | None: The cached alias table, or None if the cache
+                is missing, unreadable, corrupt, or out of date.
+        """
+
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(_ALIAS_HEADER.size)
+                magic, count, size, mtime = _ALIAS_HEADER.unpack(header)
+
+                if (magic, size, mtime) != (_ALIAS_MAGIC, stat.st_size,
+                                            stat.st_mtime_ns):
+                    return None
+
+                probabilities, aliases = array('d'), array('I')
+                probabilities.fromfile(f, count)
+                aliases.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return None
+
+        # tables built from invalid weights (e.g. NaN) by earlier versions
+        if not all(0 <= probability <= 1 for probability in probabilities):
+            return None
+
+        return cls(probabilities, aliases)
+
+    def save(self, path: str, stat: os.stat_result):
+        """Caches the alias table in a file, replacing any previous cache.
+
+        Failing to write the cache is not an error; the table will simply be
+        rebuilt the next time it is needed.
+
+        Args:
+            path (str): The path to cache the alias table in.
+            stat (os.stat_result): The status of the deck file that the table
+                was built from.
+        """
+
+        header = _ALIAS_HEADER.pack(
+            _ALIAS_MAGIC, len(self), stat.st_size, stat.st_mtime_ns,
+        )
+
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+
+        try:
+            with open(temporary_path, 'wb') as f:
+                f.write(header)
+                self._probabilities.tofile(f)
+                self._aliases.tofile(f)
+
+            os.replace(temporary_path, path)
+        except OSError:
+            pass
+
+    def sample(self, rng: random.Random = random) -> int:
+        """Draws a random index from the table.
+
+        Args:
+            rng (random.Random): The random number generator to draw with
+                (default: the `random` module's global generator).
+
+        Returns:
+            int: The drawn index.
+        """
+
+        position = rng.random() * len(self._probabilities)
+        index = int(position)
+
+        if position - index < self._probabilities[index]:
+            return index
+
+        return self._aliases[index]
+
+    def sample_many(self, count: int, rng: random.Random = random) -> list:
+        """Draws several random indexes from the table at once.
+
+        Args:
+            count (int): The number of indexes to draw.
+            rng (random.Random): The random number generator to draw with
+                (default: the `random` module's global generator).
+
+        Returns:
+            list: The drawn indexes.
+        """
+
+        size = len(self._probabilities)
+        probabilities, aliases = self._probabilities, self._aliases
+        uniform = rng.random
+
+        positions = [uniform() * size for _ in itertools.repeat(None, count)]
+
+        return [
+            index if position - index < probability else aliases[index]
+            for position in positions
+            for index in (int(position),)
+            for probability in (probabilities[index],)
+        ]
+
+
+def _split_deck_line(line: str) -> (str | None, str):
+    """Splits a line from a deck file into its weight and its answer.
+
+    Args:
+        line (str): A line from a deck file.
+
+    Returns:
+        str | None: The weight of the answer, or None if none is given.
+        str: The answer itself.
+    """
+
+    weight, tab, answer = line.partition('\t')
+    return (weight, answer) if tab else (None, line)
+
+
+def _load_deck(path: str) -> (tuple, _AliasTable):
+    """Loads a custom set of answers from a deck file.
+
+    Each line of a deck file holds a single answer, optionally preceded by its
+    weight and a tab character (e.g. ``3\tAsk again later``); answers without
+    a weight have a weight of 1, and weights must be positive and finite.
+    Blank lines are ignored. The alias table used to draw from the deck is
+    cached next to the deck file (with an ``.alias`` suffix), and is only
+    rebuilt when the deck file changes.
+
+    Args:
+        path (str): The path to the deck file.
+
+    Returns:
+        tuple: The answers in the deck.
+        _AliasTable: The alias table used to draw an answer's index.
+
+    Raises:
+        ValueError: The deck file cannot be read, or is invalid.
+    """
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            stat = os.fstat(f.fileno())
+            lines = [line for line in f.read().splitlines() if line.strip()]
+    except OSError as e:
+        raise ValueError(f"cannot read deck '{path}': {e.strerror}")
+
+    cache_path = f'{path}.alias'
+    table = _AliasTable.load(cache_path, stat)
+
+    if table is not None and len(table) == len(lines):
+        return (tuple(_split_deck_line(line)[1] for line in lines), table)
+
+    answers, weights = [], []
+
+    for number, line in enumerate(lines, start=1):
+        weight, answer = _split_deck_line(line)
+
+        try:
+            weight = 1.0 if weight is None else float(weight)
+        except ValueError:
+            weight = math.nan
+
+        # also rejects 'nan' and 'inf', which `float()` accepts
+        if not 0 < weight < math.inf:
+            raise ValueError(f"invalid weight on line {number} of '{path}'")
+
+        weights.append(weight)
+        answers.append(answer)
 
-def main(endless: bool = False):
+    table = _AliasTable.from_weights(weights)
+    table.save(cache_path, stat)
+
+    return (tuple(answers), table)
+
+
+def _encode_batch_answers(answers: tuple, output_format: str) -> list:
+    """Pre-encodes each answer as it will appear in the batch output.
+
+    Args:
+        answers (tuple): The answers to encode.
+        output_format (str): Either 'tsv' or 'jsonl'.
+
+    Returns:
+        list: The encoded answers, as bytes; each one is the tail of a line of
+            output, right after the (escaped) question.
+    """
+
+    if output_format == 'tsv':
+        return [b'\t' + _escape_tsv(answer.encode()) for answer in answers]
+
+    return [
+        f'", "answer": {json.dumps(answer)}}}'.encode() for answer in answers
+    ]
+
+
+def _escape_tsv(field: bytes) -> bytes:
+    """Escapes the backslashes and tabs in a TSV field.
+
+    Args:
+        field (bytes): The field to escape.
+
+    Returns:
+        bytes: The escaped field.
+    """
+
+    return field.replace(b'\\', b'\\\\').replace(b'\t', b'\\t')
+
+
+def _answer_batch(
+    source,
+    output,
+    answers: tuple,
+    table: _AliasTable | None,
+    rng: random.Random,
+    output_format: str,
+):
+    """Answers every line of a binary stream as a separate question.
+
+    Questions are read in large chunks, and each chunk of answers is drawn at
+    once and written with a single `write()` call. Every line of input gets
+    exactly one line of output, in the same order.
+
+    Args:
+        source: A binary stream to read questions from.
+        output: A binary stream to write the questions and answers to.
+        answers (tuple): The answers to draw from.
+        table (_AliasTable | None): The alias table used to draw an answer's
+            index, or None to draw with equal weights.
+        rng (random.Random): The random number generator to draw with.
+        output_format (str): Either 'tsv' (question, tab, answer) or 'jsonl'
+            (an object with a "question" and an "answer").
+    """
+
+    encoded = _encode_batch_answers(answers, output_format)
+    prefix = b'' if output_format == 'tsv' else b'{"question": "'
+    remainder = b''
+
+    while True:
+        chunk = source.read(_BATCH_CHUNK_SIZE)
+        data = remainder + chunk
+
+        # the last line of a chunk may be incomplete, so it is carried over
+        # to the next chunk (unless the end of the stream has been reached)
+        questions = data.split(b'\n')
+        remainder = questions.pop() if chunk else b''
+
+        if not chunk and not questions[-1]:
+            questions.pop()
+
+        if not questions: # i.e. the chunk did not complete any lines
+            if chunk:
+                continue
+
+            return None
+
+        if table is None:
+            drawn = rng.choices(encoded, k=len(questions))
+        else:
+            indexes = table.sample_many(len(questions), rng)
+            drawn = [encoded[n] for n in indexes]
+
+        if output_format == 'tsv':
+            if b'\t' in data or b'\\' in data:
+                questions = [_escape_tsv(question) for question in questions]
+        elif _JSON_SPECIAL_BYTES.search(data):
+            questions = [
+                json.dumps(question.decode(errors='replace'))[1:-1].encode()
+                for question in questions
+            ]
+
+        lines = map(b''.join, zip(questions, drawn))
+        output.write(prefix + (b'\n' + prefix).join(lines) + b'\n')
+
+        if not chunk:
+            return None
+
+
+def _run_batch(
+    path: str,
+    answers: tuple,
+    table: _AliasTable | None,
+    rng: random.Random,
+    output_format: str,
+):
+    """Answers every line of a file (or the standard input) in bulk.
+
+    Args:
+        path (str): The path to the file, or '-' for the standard input.
+        answers (tuple): The answers to draw from.
+        table (_AliasTable | None): The alias table used to draw an answer's
+            index, or None to draw with equal weights.
+        rng (random.Random): The random number generator to draw with.
+        output_format (str): Either 'tsv' or 'jsonl'.
+
+    Raises:
+        ValueError: The file cannot be read.
+    """
+
+    output = sys.stdout.buffer
+
+    if path == '-':
+        _answer_batch(sys.stdin.buffer, output, answers, table, rng,
+                      output_format)
+    else:
+        try:
+            with open(path, 'rb') as source:
+                _answer_batch(source, output, answers, table, rng,
+                              output_format)
+        except OSError as e:
+            raise ValueError(f"cannot read questions '{path}': {e.strerror}")
+
+    output.flush()
+
+
+def _make_draw(
+    answers: tuple,
+    table: _AliasTable | None,
+    rng: random.Random,
+) -> FunctionType:
+    """Creates a function that draws a single answer at a time.
+
+    Args:
+        answers (tuple): The answers to draw from.
+        table (_AliasTable | None): The alias table used to draw an answer's
+            index, or None to draw with equal weights.
+        rng (random.Random): The random number generator to draw with.
+
+    Returns:
+        FunctionType: A function that takes no arguments, and returns the
+            next answer drawn.
+    """
+
+    if table is None:
+        return lambda: rng.choice(answers)
+
+    return lambda: answers[table.sample(rng)]
+
+
+def _replay(start: dict, events: Iterator[dict]) -> str | None:
+    """Replays a session with the magic 8 ball from its journal.
+
+    Args:
+        start (dict): The session's 'start' event.
+        events (Iterator[dict]): The rest of the session's events.
+
+    Returns:
+        str | None: A description of how the replayed answers differ from the
+            journal, or None if they are the same.
+    """
+
+    deck = start['config']['deck']
+
+    try:
+        answers, table = _load_deck(deck) if deck else (_ANSWERS, None)
+    except ValueError as e:
+        return str(e)
+
+    draw = _make_draw(answers, table, random.Random(start['seed']))
+
+    for number, event in enumerate(events, start=1):
+        if event['event'] == 'answer' and event['answer'] != draw():
+            return f"answer #{number} differs"
+
+    return None
+
+
+def main(
+    endless: bool = False,
+    deck: str = '',
+    batch: str = '',
+    output_format: str = 'tsv',
+    seed: int | None = None,
+    journal: str = '',
+):
     """Ask the magic 8 ball a question.
 
     Prompts the user to give a question to the Magic 8 Ball, then prints the
@@ -56,20 +526,65 @@ def main(endless: bool = False):
         endless (bool): Whether or not to automatically prompt the user for a
             new question after the Magic 8 Ball answers the previous one
             (default: False).
+        deck (str): The path to a file with a custom set of answers to draw
+            from, each with an optional weight; see `_load_deck()` (default:
+            the classic twenty answers, with equal weights).
+        batch (str): The path to a file ('-' for the standard input) to read
+            questions from, one per line, instead of prompting the user. All
+            the questions are answered in bulk, and written to the standard
+            output as ``output_format`` (default: none).
+        output_format (str): The format to write answers in when in batch
+            mode; either 'tsv' or 'jsonl' (default: 'tsv').
+        seed (int | None): The seed for the random number generator; picked
+            at random if not given (default: None).
+        journal (str): The path to a file to append a replayable log of the
+            answers to; see `pygames replay`. Not used in batch mode, which
+            is already reproducible from its input and seed (default: none).
+
+    Raises:
+        ValueError: ``deck`` cannot be read, or is invalid; or
+            ``output_format`` is unknown.
     """
 
     global _ANSWERS
 
-    while True:
-        try:
-            input("Your question: ") # NOTE: answer not *actually* needed
-        except EOFError:
-            print("\nGoodbye!")
-            return None # exit function early
+    if output_format not in _OUTPUT_FORMATS:
+        raise ValueError(f"unknown output format '{output_format}'")
 
-        print("The magic 8-ball says:", random.choice(_ANSWERS))
+    seed, rng = make_rng(seed)
+    answers, table = _load_deck(deck) if deck else (_ANSWERS, None)
 
-        if not endless:
-            return None
+    if batch:
+        _run_batch(batch, answers, table, rng, output_format)
+        return None
+
+    draw = _make_draw(answers, table, rng)
+    renderer = Renderer()
+
+    with Journal(journal) as log:
+        log.record('start', game='magic-8-ball', seed=seed,
+                   config={'deck': os.path.abspath(deck) if deck else ''})
+
+        while True:
+            lines = ["Your question: "]
+
+            try:
+                renderer.input(lines) # NOTE: answer not *actually* needed
+            except EOFError:
+                renderer.draw([*lines, "Goodbye!"], final=True)
+                log.record('end', outcome='quit')
+                return None # exit function early
+
+            answer = draw()
+            log.record('answer', answer=answer)
+
+            lines = [*renderer.lines, f"The magic 8-ball says: {answer}"]
+
+            if endless:
+                lines.append('') # newline
+
+            renderer.draw(lines, final=True)
 
-        print() # newline
+            if not endless:
+                log.record('end', outcome='done')
+                return None
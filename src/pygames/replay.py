@@ -0,0 +1,113 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Replays journals of past games, to verify their outcomes.
+
+Games started with the ``--journal`` option append a log of their events to a
+journal file. This module re-executes the games in a journal without any user
+input or rendering, and checks that each one reaches the same outcome.
+"""
+
+from . import hangman
+from . import magic_8_ball
+from . import tic_tac_toe
+from . import ultimate_tic_tac_toe
+from ._journal import CorruptedJournalError, group_games, read_events
+
+_REPLAYERS = {
+    'hangman': hangman._replay,
+    'magic-8-ball': magic_8_ball._replay,
+    'tic-tac-toe': tic_tac_toe._replay,
+    'ultimate-tic-tac-toe': ultimate_tic_tac_toe._replay,
+}
+
+
+def _replay_journal(path: str) -> (int, list):
+    """Replays every game in a journal.
+
+    Args:
+        path (str): The path to the journal file, or '-' for the standard
+            input.
+
+    Returns:
+        int: The number of games replayed.
+        list: A message for each game whose outcome did not match the
+            journal.
+
+    Raises:
+        ValueError: The journal cannot be read, or is corrupted.
+    """
+
+    count = 0
+    mismatches = []
+
+    for count, (start, events) in enumerate(
+        group_games(read_events(path)), start=1,
+    ):
+        replayer = _REPLAYERS.get(start.get('game'))
+
+        if replayer is None:
+            game = start.get('game')
+            mismatches.append(f"game {count}: unknown game '{game}'")
+            continue
+
+        try:
+            mismatch = replayer(start, events)
+        except CorruptedJournalError:
+            raise # a line that is not an event, rather than a bad game
+        except (KeyError, TypeError, ValueError):
+            mismatch = "corrupted journal events"
+
+        if mismatch:
+            mismatches.append(f"game {count} ({start['game']}): {mismatch}")
+
+    return (count, mismatches)
+
+
+def main(file: str):
+    """Replay the games in a journal.
+
+    Re-executes every game recorded in a journal file, as fast as possible and
+    without any user input, then reports whether or not each game reached the
+    same outcome as the one recorded. The journal is read as a stream, so
+    even large journals can be replayed.
+
+    Args:
+        file (str): The path to the journal file, or '-' for the standard
+            input.
+
+    Raises:
+        ValueError: The journal cannot be read, or is corrupted.
+        SystemExit: One or more games did not replay to the same outcome.
+    """
+
+    count, mismatches = _replay_journal(file)
+
+    for mismatch in mismatches:
+        print(mismatch)
+
+    if mismatches:
+        raise SystemExit(
+            f"{len(mismatches)} of {count} games did not replay to the same "
+            "outcome"
+        )
+
+    print(f"Replayed {count} games: all outcomes match")
@@ -0,0 +1,126 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Shows the statistics recorded for each player.
+
+Games started with the ``--player`` option record their outcomes to a local
+statistics database (see the `_stats` module). This module reads those
+statistics back, either as a leaderboard for a single game, or as a summary
+of a single player's games.
+"""
+
+from . import _stats
+
+_HEADINGS = ('player', 'played', 'wins', 'losses', 'draws', 'win rate',
+             'avg guesses', 'streak', 'best streak')
+
+
+def _format_table(rows: list) -> str:
+    """Formats a list of rows as a table with aligned columns.
+
+    Args:
+        rows (list): The rows of the table, the first of which is used as the
+            headings; each row must have the same number of values.
+
+    Returns:
+        str: The formatted table.
+    """
+
+    widths = [
+        max(len(str(value)) for value in column) for column in zip(*rows)
+    ]
+
+    return '\n'.join(
+        '  '.join(str(value).ljust(width) for value, width in zip(row, widths))
+        .rstrip()
+        for row in rows
+    )
+
+
+def _format_row(first: str, row: tuple) -> tuple:
+    """Formats a row from the 'players' table for display.
+
+    Args:
+        first (str): The value of the first column.
+        row (tuple): The row, as returned by `_stats.get_player_stats()`.
+
+    Returns:
+        tuple: The values to display, matching `_HEADINGS`.
+    """
+
+    _, _, played, wins, losses, draws, guesses, streak, best_streak = row
+
+    return (first, played, wins, losses, draws, f'{wins / played:.0%}',
+            f'{guesses / played:.1f}', streak, best_streak)
+
+
+def main(
+    game: str = 'hangman',
+    top: int = 10,
+    by: str = 'wins',
+    player: str = '',
+):
+    """Show the statistics for each player.
+
+    Prints a leaderboard of the top players of a game, or the statistics of a
+    single player across every game.
+
+    Args:
+        game (str): The name of the game to show the leaderboard of (default:
+            'hangman').
+        top (int): The number of players to show on the leaderboard (default:
+            10).
+        by (str): What to rank the players by: 'wins', 'win-rate', 'guesses'
+            (the fewest guesses per game) or 'streak' (the best winning
+            streak) (default: 'wins').
+        player (str): The name of a player to show the statistics of, instead
+            of showing a leaderboard (default: none).
+
+    Raises:
+        ValueError: ``by`` is unknown, or ``top`` is less than 1.
+    """
+
+    if by not in _stats.LEADERBOARDS:
+        raise ValueError(f"unknown leaderboard '{by}'")
+
+    if top < 1:
+        raise ValueError("cannot show less than 1 player")
+
+    connection = _stats.connect()
+
+    with connection:
+        if player:
+            rows = _stats.get_player_stats(connection, player)
+            headings = ('game', *_HEADINGS[1:])
+            rows = [_format_row(row[0], row) for row in rows]
+        else:
+            rows = _stats.get_leaderboard(connection, game, by, top)
+            headings = ('#', *_HEADINGS)
+            rows = [(n, *_format_row(row[1], row))
+                    for n, row in enumerate(rows, start=1)]
+
+    connection.close()
+
+    if not rows:
+        print("No games recorded yet")
+        return None
+
+    print(_format_table([headings, *rows]))
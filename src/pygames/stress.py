@@ -0,0 +1,539 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Drives the games with scripted or random input, and measures their latency.
+
+Each session runs one of the games in its own process, started the same way
+as the `pygames` command, and talks to it through pipes (or a
+pseudo-terminal): it waits for the game's prompt, enters a line of input,
+then times how long the game takes to prompt again. Every session ends with
+an EOF, as if the user hit CTRL+D, and many sessions are run in parallel.
+Hangman fetches its words from a local stand-in server, so that no network
+access is needed.
+"""
+
+import concurrent.futures
+import itertools
+import json
+import os
+import pathlib
+import platform
+import random
+import select
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import _transport
+from . import _wordlist
+from ._journal import make_rng
+from ._metrics import Histogram
+from .bench import _format_time
+
+# The number of seconds to wait for a game's output before giving up on it
+_TIMEOUT = 30
+
+# The chance of ending a session with random input early, after any turn
+_EOF_CHANCE = 0.02
+
+# The number of words served by the stand-in wordlist server
+_WORDLIST_SIZE = 10000
+
+# Invalid input, mixed in with the random input of every game
+_JUNK = ('', ' ', '0', '10', '?!', 'é', 'a b', '\t')
+
+# The code run in each session's process: it starts PyGames from the same
+# copy of the package as this module, the same way as the `pygames` command
+_CHILD_CODE = (
+    "import sys; sys.path.insert(0, {root!r}); "
+    "from {package} import run_cli; run_cli()"
+)
+
+
+def _random_guess(rng: random.Random) -> str:
+    """Generates a hangman guess: mostly letters, with some words and junk."""
+
+    roll = rng.random()
+
+    if roll < 0.8:
+        return rng.choice(string.ascii_lowercase)
+    elif roll < 0.9:
+        length = rng.randint(5, 12)
+        return ''.join(rng.choices(string.ascii_lowercase, k=length))
+
+    return rng.choice(_JUNK)
+
+
+def _random_move(rng: random.Random) -> str:
+    """Generates a tic-tac-toe move: mostly spaces, with some junk."""
+
+    return str(rng.randint(1, 9)) if rng.random() < 0.9 else rng.choice(_JUNK)
+
+
+def _random_question(rng: random.Random) -> str:
+    """Generates a question for the magic 8-ball."""
+
+    words = (''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+             for _ in range(rng.randint(1, 8)))
+
+    return ' '.join(words) + '?'
+
+
+# The prompt that each game waits for input with, and the function used to
+# generate random input for it
+_GAMES = {
+    'hangman': (b"your guess: ", _random_guess),
+    'magic-8-ball': (b"Your question: ", _random_question),
+    'tic-tac-toe': (b"'s move (1-9): ", _random_move),
+}
+
+
+class _Session:
+    """The results of a single session.
+
+    Attributes:
+        game (str): The name of the game played.
+        seed (int): The seed used for the game, and for its random input.
+        startup (int): The time until the game's first prompt, in
+            nanoseconds.
+        rss (int): The resident memory of the game's process at its first
+            prompt, in bytes, or 0 if unknown.
+        latencies (list): The time taken by each turn, in nanoseconds.
+        error (str): What went wrong with the session, if anything.
+    """
+
+    def __init__(self, game: str, seed: int):
+        self.game = game
+        self.seed = seed
+        self.startup = 0
+        self.rss = 0
+        self.latencies = []
+        self.error = ''
+
+
+def _serve_wordlist(seed: int):
+    """Serves a wordlist of random words over HTTP from a background thread.
+
+    Args:
+        seed (int): The seed used to generate the words.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The server, already started; it
+            serves the wordlist at every path.
+    """
+
+    import http.server
+    import threading
+
+    rng = random.Random(seed)
+    body = '\n'.join(
+        ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 14)))
+        for _ in range(_WORDLIST_SIZE)
+    ).encode()
+
+    class WordlistHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), WordlistHandler)
+    server.daemon_threads = True
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def _get_rss(pid: int) -> int:
+    """Measures the resident memory of a process, where supported.
+
+    Args:
+        pid (int): The process's ID.
+
+    Returns:
+        int: The process's resident memory, in bytes, or 0 if it cannot be
+            measured (i.e. outside of Linux).
+    """
+
+    try:
+        with open(f'/proc/{pid}/statm', encoding='ascii') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+
+    return pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _share_wordlist(url: str) -> _wordlist.SharedWordIndex:
+    """Indexes a wordlist once, for every session to share.
+
+    Args:
+        url (str): The URL of the wordlist.
+
+    Returns:
+        _wordlist.SharedWordIndex: The published index.
+    """
+
+    index = _wordlist.WordIndex.build(_transport.fetch_text(url).split())
+    return _wordlist.SharedWordIndex.publish(index, url)
+
+
+def _get_command(game: str, seed: int) -> tuple:
+    """Creates the command that starts an endless session of a game."""
+
+    package = __package__ or 'pygames'
+    root = pathlib.Path(__file__).parents[package.count('.') + 1]
+    code = _CHILD_CODE.format(root=str(root), package=package)
+
+    return (sys.executable, '-c', code, game, '--endless', '--seed', str(seed))
+
+
+def _wait_for_prompt(fd: int, prompt: bytes) -> bool:
+    """Reads a game's output until it prompts for input, or exits.
+
+    Args:
+        fd (int): The file descriptor to read the game's output from.
+        prompt (bytes): The game's prompt.
+
+    Returns:
+        bool: True if the game prompted for input, or False if it exited.
+
+    Raises:
+        TimeoutError: The game did neither within the timeout.
+    """
+
+    buffer = b''
+
+    while prompt not in buffer:
+        if not select.select([fd], [], [], _TIMEOUT)[0]:
+            raise TimeoutError("timed out waiting for the game")
+
+        try:
+            chunk = os.read(fd, 65536)
+        except OSError: # a pseudo-terminal raises EIO once the game exits
+            chunk = b''
+
+        if not chunk:
+            return False
+
+        buffer += chunk
+
+    return True
+
+
+def _run_session(
+    game: str,
+    seed: int,
+    turns: int,
+    script: tuple,
+    tty: bool,
+    env: dict,
+) -> _Session:
+    """Runs a session of a game, timing each turn.
+
+    Args:
+        game (str): The name of the game to play.
+        seed (int): The seed for the game, and for its random input.
+        turns (int): The maximum number of lines of input to enter.
+        script (tuple): The lines of input to enter, in order; random input
+            is generated if empty.
+        tty (bool): Whether or not to run the game in a pseudo-terminal,
+            instead of through pipes.
+        env (dict): The environment variables of the game's process.
+
+    Returns:
+        _Session: The results of the session.
+    """
+
+    prompt, generate = _GAMES[game]
+    rng = random.Random(seed)
+    session = _Session(game, seed)
+
+    if script:
+        lines = itertools.islice(script, turns)
+    else:
+        lines = (generate(rng) for _ in range(turns))
+
+    if tty:
+        import pty
+
+        fd, child_fd = pty.openpty()
+        stdin = stdout = child_fd
+    else:
+        stdin = stdout = subprocess.PIPE
+
+    process = subprocess.Popen(_get_command(game, seed), stdin=stdin,
+                               stdout=stdout, stderr=subprocess.PIPE, env=env)
+
+    if tty:
+        os.close(child_fd)
+        read_fd = write_fd = fd
+    else:
+        read_fd = process.stdout.fileno()
+        write_fd = process.stdin.fileno()
+
+    try:
+        start = time.perf_counter_ns()
+
+        if not _wait_for_prompt(read_fd, prompt):
+            raise EOFError("game exited before prompting for input")
+
+        session.startup = time.perf_counter_ns() - start
+        session.rss = _get_rss(process.pid)
+
+        for line in lines:
+            start = time.perf_counter_ns()
+            os.write(write_fd, f"{line}\n".encode())
+
+            if not _wait_for_prompt(read_fd, prompt):
+                raise EOFError(f"game exited after the input {line!r}")
+
+            session.latencies.append(time.perf_counter_ns() - start)
+
+            if not script and rng.random() < _EOF_CHANCE:
+                break
+
+        # end the session like a user hitting CTRL+D
+        if tty:
+            os.write(write_fd, b'\x04')
+        else:
+            process.stdin.close()
+
+        if _wait_for_prompt(read_fd, prompt):
+            raise EOFError("game prompted for input after an EOF")
+
+        process.wait(_TIMEOUT)
+    except (EOFError, OSError, TimeoutError,
+            subprocess.TimeoutExpired) as e:
+        process.kill()
+        process.wait()
+        session.error = str(e) or type(e).__name__
+    finally:
+        if tty:
+            os.close(fd)
+        else:
+            process.stdin.close()
+            process.stdout.close()
+
+    errors = process.stderr.read().decode(errors='replace').strip()
+    process.stderr.close()
+
+    if errors and not session.error:
+        session.error = errors.splitlines()[-1]
+    elif process.returncode and not session.error:
+        session.error = f"game exited with status {process.returncode}"
+
+    return session
+
+
+def _summarize(sessions: list, elapsed: float) -> dict:
+    """Summarizes the results of the sessions of a single game.
+
+    Args:
+        sessions (list): The results of each session (see `_Session`).
+        elapsed (float): The time taken to run every session, in seconds.
+
+    Returns:
+        dict: The number of sessions, failed sessions and turns, the turns
+            per second, the quantiles of the turn and startup latencies (in
+            seconds), and the median resident memory of the sessions' games
+            (in bytes, or 0 if unknown).
+    """
+
+    latencies = Histogram()
+    startups = Histogram()
+
+    for session in sessions:
+        for latency in session.latencies:
+            latencies.record(latency)
+
+        if session.startup:
+            startups.record(session.startup)
+
+    return {
+        'sessions': len(sessions),
+        'failed': sum(bool(session.error) for session in sessions),
+        'turns': latencies.count,
+        'turns_per_second': latencies.count / elapsed,
+        'latency': {
+            name: latencies.get_quantile(quantile) / 1e9
+            for name, quantile in (
+                ('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1),
+            )
+        },
+        'startup': {
+            name: startups.get_quantile(quantile) / 1e9
+            for name, quantile in (('p50', 0.5), ('p99', 0.99))
+        },
+        'rss': int(statistics.median(
+            [session.rss for session in sessions if session.rss] or [0],
+        )),
+    }
+
+
+def main(
+    games: str = 'hangman',
+    sessions: int = 100,
+    workers: int = 0,
+    turns: int = 50,
+    script: str = '',
+    tty: bool = False,
+    seed: int | None = None,
+    output: str = '',
+    shared_wordlist: bool = False,
+):
+    """Drive the games with scripted or random input, and measure them.
+
+    Runs sessions of the given games in parallel, each in its own process,
+    entering a line of input whenever the game prompts for one, and ending
+    each session with an EOF. Prints the number of turns per second and the
+    latency of the turns of each game, from entering a line of input to the
+    next prompt.
+
+    Args:
+        games (str): The games to play, separated by commas; sessions are
+            split evenly between them (default: 'hangman').
+        sessions (int): The total number of sessions to run (default: 100).
+        workers (int): The number of sessions to run at the same time
+            (default: 0, i.e. one per CPU).
+        turns (int): The maximum number of lines of input to enter in each
+            session (default: 50).
+        script (str): The path to a file of input lines, entered in order in
+            every session (default: none, i.e. generate random input, and end
+            some sessions early).
+        tty (bool): Whether or not to run the games in a pseudo-terminal,
+            instead of through pipes (default: False).
+        seed (int | None): The seed used to generate the sessions' seeds and
+            the wordlist; picked at random if not given (default: None).
+        output (str): The path to save the results to, as JSON (default:
+            none).
+        shared_wordlist (bool): Whether or not to index Hangman's wordlist
+            once, for every session to share, instead of having each session
+            load the index on its own (default: False).
+
+    Raises:
+        ValueError: A game is unknown, the script cannot be read, or
+            ``sessions``, ``turns`` or ``workers`` are out of range.
+        SystemExit: One or more sessions failed.
+    """
+
+    names = games.split(',')
+
+    for name in names:
+        if name not in _GAMES:
+            raise ValueError(f"unknown game '{name}'")
+
+    if sessions < 1 or turns < 1 or workers < 0:
+        raise ValueError("sessions and turns must be at least 1, and workers "
+                         "cannot be negative")
+
+    lines = ()
+
+    if script:
+        try:
+            with open(script, encoding='utf-8') as f:
+                lines = tuple(f.read().splitlines())
+        except OSError as e:
+            raise ValueError(f"cannot read script '{script}': {e.strerror}")
+
+    seed, rng = make_rng(seed)
+    jobs = [(names[n % len(names)], rng.randrange(1 << 64))
+            for n in range(sessions)]
+
+    server = _serve_wordlist(seed)
+    host, port = server.server_address[:2]
+
+    # the games cache the stand-in wordlist's index in a temporary directory,
+    # rather than next to the user's own
+    with tempfile.TemporaryDirectory(prefix='pygames-stress-') as cache_home:
+        env = {
+            **os.environ,
+            'PYGAMES_WORDLIST_URL': f'http://{host}:{port}/',
+            'XDG_CACHE_HOME': cache_home,
+        }
+
+        shared = None
+
+        if shared_wordlist and 'hangman' in names:
+            shared = _share_wordlist(env['PYGAMES_WORDLIST_URL'])
+            env[_wordlist._SHARED_VARIABLE] = shared.path
+
+        pool_size = workers or os.cpu_count()
+        start = time.perf_counter()
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(pool_size) as executor:
+                results = list(executor.map(
+                    lambda job: _run_session(*job, turns, lines, tty, env),
+                    jobs,
+                ))
+        finally:
+            if shared is not None:
+                shared.close()
+
+        elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    server.server_close()
+
+    summaries = {
+        name: _summarize([r for r in results if r.game == name], elapsed)
+        for name in dict.fromkeys(names)
+    }
+
+    print(f"{'game':<14} {'sessions':>8} {'failed':>6} {'turns':>7} "
+          f"{'turns/s':>8} {'p50':>10} {'p99':>10} {'startup':>10} "
+          f"{'rss':>9}")
+
+    for name, summary in summaries.items():
+        print(f"{name:<14} {summary['sessions']:>8} {summary['failed']:>6} "
+              f"{summary['turns']:>7} {summary['turns_per_second']:>8.0f} "
+              f"{_format_time(summary['latency']['p50']):>10} "
+              f"{_format_time(summary['latency']['p99']):>10} "
+              f"{_format_time(summary['startup']['p50']):>10} "
+              f"{summary['rss'] / 1e6:>6.1f} MB")
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': seed,
+                'elapsed': elapsed,
+                'games': summaries,
+            }, f, indent=2)
+
+    failures = [r for r in results if r.error]
+
+    for result in failures:
+        print(f"{result.game} (seed {result.seed}): {result.error}")
+
+    if failures:
+        raise SystemExit(f"{len(failures)} of {sessions} sessions failed")
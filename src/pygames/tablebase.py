@@ -0,0 +1,171 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Generates the tablebase of tic-tac-toe on a 4x4 grid, for perfect play.
+
+The tablebase holds the value (win, draw or loss) of every position of the
+game, solved backward from the full grid (see `_tablebase`), so that the
+computer plays those games perfectly by looking up each move instead of
+searching. Once generated, it is checked against the computer's search on
+random positions near the end of the game, which search can solve exactly.
+"""
+
+import os
+import random
+import time
+
+from . import _search
+from . import _tablebase
+from . import tic_tac_toe
+from ._journal import make_rng
+
+# The most empty spaces left on the grid of the positions checked against
+# search, which takes under 50 ms to solve them
+_MAX_VERIFY_EMPTY = 8
+
+
+def _create_sample(size: int, length: int, rng: random.Random) -> tuple:
+    """Plays random moves, up to a position that search can solve exactly.
+
+    Args:
+        size (int): The number of spaces on each side of the grid.
+        length (int): The number of marks in a row it takes to win.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        tic_tac_toe._Position: The position, with crosses having moved
+            first, which the game has not ended in.
+        list: The value of each mark on the grid, or 0 for an empty space.
+    """
+
+    while True:
+        game_state = tic_tac_toe._GameState(size, length)
+        marks = size * size - rng.randint(1, min(_MAX_VERIFY_EMPTY,
+                                                 size * size))
+        moves = rng.sample(range(1, size * size + 1), marks)
+        turn = tic_tac_toe._Mark.Cross
+
+        for move in moves:
+            game_state.add_mark(move, turn)
+            turn = tic_tac_toe._Position._OTHER[turn]
+
+            if game_state.winner:
+                break
+        else:
+            spaces = list(tic_tac_toe._get_spaces(game_state))
+            return (tic_tac_toe._Position(game_state, turn), spaces)
+
+
+def _verify(tablebase: _tablebase.Tablebase, samples: int,
+            rng: random.Random) -> int:
+    """Checks random positions of a tablebase against search.
+
+    Args:
+        tablebase (_tablebase.Tablebase): The tablebase.
+        samples (int): The number of positions to check.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        int: The number of positions whose value differs from search.
+    """
+
+    table = _search.TranspositionTable(4)
+    mismatches = 0
+
+    for _ in range(samples):
+        position, spaces = _create_sample(tablebase.size, tablebase.length,
+                                          rng)
+        empty = spaces.count(0)
+
+        # searching every empty space reaches the end of every game, where
+        # only won or lost games are scored as decided
+        table.new_search()
+        score = _search.Searcher(position, table).search(
+            float('inf'), max_depth=empty,
+        ).score
+
+        if score > _search._DECIDED_SCORE:
+            expected = _tablebase.WIN
+        elif score < -_search._DECIDED_SCORE:
+            expected = _tablebase.LOSS
+        else:
+            expected = _tablebase.DRAW
+
+        mismatches += tablebase.lookup(spaces) != expected
+
+    return mismatches
+
+
+def main(
+    size: int = 4,
+    length: int = 3,
+    processes: int = 0,
+    samples: int = 100,
+    seed: int | None = None,
+):
+    """Generate a tablebase for the tic-tac-toe computer player.
+
+    Solves every position of tic-tac-toe on a small grid, and saves their
+    values to the user's cache directory, where `pygames tic-tac-toe
+    --computer` finds them and plays those games perfectly. An interrupted
+    generation resumes where it stopped. The tablebase is then checked
+    against search on random positions.
+
+    Args:
+        size (int): The number of spaces on each side of the grid, from 3 to
+            4 (default: 4).
+        length (int): The number of marks in a row it takes to win, from 3 to
+            the size of the grid (default: 3).
+        processes (int): The number of processes to solve positions with at
+            once (default: 0, i.e. one per CPU).
+        samples (int): The number of random positions to check against
+            search (default: 100).
+        seed (int | None): The seed used to pick the positions to check;
+            picked at random if not given (default: None).
+
+    Raises:
+        ValueError: The grid or line is out of range, the tablebase cannot
+            be opened, or ``processes`` or ``samples`` is negative.
+        SystemExit: The tablebase differs from search.
+    """
+
+    if processes < 0 or samples < 0:
+        raise ValueError("processes and samples cannot be negative")
+
+    _, rng = make_rng(seed)
+    path = _tablebase.get_path(size, length)
+
+    with _tablebase.Tablebase(path, size, length) as tablebase:
+        start = time.perf_counter()
+
+        def report(marks: int):
+            print(f"solved the positions with {marks} marks "
+                  f"({time.perf_counter() - start:.1f}s)")
+
+        tablebase.generate(processes or os.cpu_count(), report)
+        print(f"{path}: {os.path.getsize(path):,} bytes")
+
+        mismatches = _verify(tablebase, samples, rng)
+        print(f"checked {samples} random positions against search")
+
+    if mismatches:
+        raise SystemExit(f"{mismatches} of {samples} positions differ from "
+                         "search")
@@ -20,8 +20,24 @@
 
 """TODO"""
 
+import contextlib
+import functools
 import itertools
+import random
+import struct
+import time
 from enum import Enum
+from typing import Iterator
+
+from . import _bundle
+from . import _metrics
+from ._journal import Journal, make_rng
+from ._rendering import Renderer
+from ._search import (
+    _DECIDED_SCORE, WIN_SCORE, ParallelSearcher, SearchResult,
+)
+from ._stats import StatsRecorder
+from ._threats import ThreatSearcher
 
 
 class _Mark(Enum):
@@ -32,94 +48,1207 @@ class _Mark(Enum):
         return ('O' if self == _Mark.Nought else 'X')
 
 
+# Every line of three spaces on the grid, with the spaces numbered from 0 to 8
+# (left to right, top to bottom)
+_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# The eight symmetries of the grid (rotations and reflections), each as the
+# new order of the spaces
+_SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8), (6, 3, 0, 7, 4, 1, 8, 5, 2),
+    (8, 7, 6, 5, 4, 3, 2, 1, 0), (2, 5, 8, 1, 4, 7, 0, 3, 6),
+    (2, 1, 0, 5, 4, 3, 8, 7, 6), (0, 3, 6, 1, 4, 7, 2, 5, 8),
+    (6, 7, 8, 3, 4, 5, 0, 1, 2), (8, 5, 2, 7, 4, 1, 6, 3, 0),
+)
+
+# Snapshot of a game state: a bitboard of the crosses (bits 0 to 8) and the
+# noughts (bits 9 to 17), with the spaces numbered as in `_LINES`
+_SNAPSHOT = struct.Struct('<I')
+
+# An entry of the solution table bundled with a zipapp build: the spaces of a
+# canonical position (see `_get_spaces()`), the turn, and the position's score
+_SOLUTION = struct.Struct('<9sBb')
+SOLUTION_TABLE_NAME = 'tic_tac_toe.tbl'
+
+# The score of every canonical position evaluated so far, by its spaces and
+# turn (see `_evaluate()`); seeded from the bundled solution table, if any
+_scores = {}
+
+# The largest grid that can be played on, as on a go board
+_MAX_SIZE = 19
+
+# The key XORed into the key of a position (see `_GameState.key`) when it is
+# noughts' turn, so that the computer player tells both turns apart
+_NOUGHT_TURN_KEY = 0x9e3779b97f4a7c15
+
+# The heuristic value of a line that only one player has marks on, by the
+# number of marks, for the computer player on grids larger than 3x3
+_LINE_VALUES = tuple(4 ** (count - 1) if count else 0 for count in range(20))
+
+# The highest heuristic score of a position, which must stay clear of the
+# scores of won games (see `_search.WIN_SCORE`)
+_MAX_HEURISTIC_SCORE = WIN_SCORE // 10
+
+# The share of the computer's time budget it may spend looking for a forced
+# win made of threats, before searching every move (see `_search_move()`)
+_THREAT_SEARCH_SHARE = 0.25
+
+# The share of the rest of the computer's time budget it may spend checking
+# a forced win found by the threat search (see `_search_move()`)
+_THREAT_CHECK_SHARE = 0.5
+
+
+@functools.cache
+def _get_lines(size: int, length: int) -> (tuple, tuple):
+    """Lists every line of a given length on a grid of a given size.
+
+    Lines are horizontal, vertical or diagonal, and overlap: a row of five
+    spaces holds three lines of three.
+
+    Args:
+        size (int): The number of spaces on each side of the grid.
+        length (int): The number of marks in a row it takes to win.
+
+    Returns:
+        tuple: The lines, each as the numbers of its spaces, numbered from 0
+            (left to right, top to bottom).
+        tuple: The indexes of the lines through each space.
+    """
+
+    lines = []
+
+    for y, x in itertools.product(range(size), repeat=2):
+        for dy, dx in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            end_y, end_x = y + dy * (length - 1), x + dx * (length - 1)
+
+            if 0 <= end_y < size and 0 <= end_x < size:
+                lines.append(tuple((y + dy * n) * size + x + dx * n
+                                   for n in range(length)))
+
+    lines_through = tuple(
+        tuple(n for n, line in enumerate(lines) if space in line)
+        for space in range(size * size)
+    )
+
+    return (tuple(lines), lines_through)
+
+
+@functools.cache
+def _get_zobrist_keys(size: int) -> tuple:
+    """Draws the keys of each mark in each space, for Zobrist hashing.
+
+    The keys are drawn from a generator seeded with the size of the grid, so
+    that positions hash the same way in every process.
+
+    Args:
+        size (int): The number of spaces on each side of the grid.
+
+    Returns:
+        tuple: A random 64-bit key for each space and mark, at the index
+            ``space * 3 + mark.value``.
+    """
+
+    rng = random.Random(size)
+    return tuple(rng.getrandbits(64) for _ in range(size * size * 3))
+
+
+@functools.cache
+def _get_neighbours(size: int) -> tuple:
+    """Lists the spaces around each space of a grid, numbered from 0."""
+
+    return tuple(
+        tuple(
+            (y + dy) * size + x + dx
+            for dy, dx in itertools.product((-1, 0, 1), repeat=2)
+            if (dy or dx) and 0 <= y + dy < size and 0 <= x + dx < size
+        )
+        for y, x in itertools.product(range(size), repeat=2)
+    )
+
+
 class _GameState:
-    def __init__(self):
-        self._grid = [[None for _ in range(3)] for _ in range(3)]
+    def __init__(self, size: int = 3, length: int = 3):
+        """Creates an empty grid.
+
+        Args:
+            size (int): The number of spaces on each side of the grid
+                (default: 3).
+            length (int): The number of marks in a row it takes to win
+                (default: 3).
+        """
+
+        self.size = size
+        self.length = length
+        self._grid = [[None for _ in range(size)] for _ in range(size)]
+        self._lines, self._lines_through = _get_lines(size, length)
+
+        # the number of each player's marks on each line, by mark value, and
+        # the lines that only one player has marks on, by mark value and then
+        # by number of marks (see `get_open_lines()`)
+        self._counts = (None, [0] * len(self._lines), [0] * len(self._lines))
+        self._open_lines = (
+            None, *([set() for _ in range(length + 1)] for _ in _Mark),
+        )
+
+        # the heuristic score of the position for crosses, summed over the
+        # lines (see `_LINE_VALUES`)
+        self._score = 0
+
+        # the space of each mark, in order, with the winner before it
+        self._history = []
+        self._keys = _get_zobrist_keys(size)
+
+        # the Zobrist hash of the marks on the grid: the XOR of the key of
+        # each mark in its space, updated with each mark added or taken back
+        self.key = 0
         self.winner: _Mark | None = None
 
     def add_mark(self, index: int, mark: _Mark) -> bool:
-        """TODO
+        """Adds a mark to an empty space on the grid.
+
+        The first player to get ``length`` marks in a row (horizontally,
+        vertically or diagonally) becomes the winner, and stays the winner
+        until the mark is taken back with `undo()`.
 
         Args:
-            index (int): TODO
-            mark (Mark): TODO
+            index (int): The number of the space, from 1 to ``size * size``
+                (left to right, top to bottom).
+            mark (_Mark): The mark to add.
 
         Returns:
-            bool: Whether or not the specified space is already taken.
+            bool: Whether or not the specified space is already taken; if it
+                is, the grid is left unchanged.
         """
 
-        y = (index-1) // 3
-        x = (index-1) % 3
+        space = index - 1
+        y, x = divmod(space, self.size)
 
         if self._grid[y][x]:
             return True
 
+        value = mark.value
         self._grid[y][x] = mark
-        self.check_for_win()
+        self._history.append((space, self.winner))
+        self.key ^= self._keys[space * 3 + value]
+
+        if self._count_mark(space, value, 1) and not self.winner:
+            self.winner = mark
 
         return False
 
-    def check_for_win(self):
-        """TODO
+    def undo(self):
+        """Takes back the last mark added to the grid.
+
+        Raises:
+            IndexError: The grid is empty.
         """
 
-        # check rows for win
-        self.winner = self.winner or self._find_three_row(self._grid)
+        space, winner = self._history.pop()
+        y, x = divmod(space, self.size)
+        value = self._grid[y][x].value
 
-        # check columns for win
-        self.winner = self.winner or self._find_three_row(zip(*self._grid))
+        self._grid[y][x] = None
+        self.key ^= self._keys[space * 3 + value]
+        self._count_mark(space, value, -1)
+        self.winner = winner
 
-        if self.winner:
-            return None
+    def _count_mark(self, space: int, value: int, change: int) -> bool:
+        """Updates the counts and scores of the lines through a space.
 
-        # check diagonals for win
-        diagonal = (
-            tuple(self._grid[x][x] for x in range(3)),
-            tuple(self._grid[x][2-x] for x in range(3)),
-        )
+        Args:
+            space (int): The number of the space, from 0.
+            value (int): The value of the mark added to, or taken back from,
+                the space.
+            change (int): 1 if the mark was added, or -1 if taken back.
+
+        Returns:
+            bool: Whether or not the mark completes a line.
+        """
+
+        own = self._counts[value]
+        other = self._counts[3 - value]
+        own_lines = self._open_lines[value]
+        other_lines = self._open_lines[3 - value]
+        values = _LINE_VALUES
+        complete = False
+        gain = 0
+
+        # a line only counts for a player as long as it is theirs alone, so
+        # it moves between their open lines as its count changes
+        if change > 0:
+            length = self.length
+
+            for line in self._lines_through[space]:
+                count = own[line]
+                own[line] = count + 1
+                opponent = other[line]
+
+                if not opponent:
+                    gain += values[count + 1] - values[count]
+                    own_lines[count].discard(line)
+                    own_lines[count + 1].add(line)
+                    complete = complete or count + 1 == length
+                elif not count:
+                    gain += values[opponent]
+                    other_lines[opponent].remove(line)
+        else:
+            for line in self._lines_through[space]:
+                count = own[line] - 1
+                own[line] = count
+                opponent = other[line]
+
+                if not opponent:
+                    gain -= values[count + 1] - values[count]
+                    own_lines[count + 1].remove(line)
+
+                    if count:
+                        own_lines[count].add(line)
+                elif not count:
+                    gain -= values[opponent]
+                    other_lines[opponent].add(line)
+
+        if value == _Mark.Cross.value:
+            self._score += gain
+        else:
+            self._score -= gain
 
-        self.winner = self._find_three_row(diagonal)
+        return complete
+
+    def get_open_lines(self, mark: _Mark, count: int) -> set:
+        """Finds the lines that only one player has marks on, and how many.
+
+        The lines are kept up to date as marks are added and taken back, so
+        finding them takes no time; the set is updated in place, so it must
+        be copied before adding or taking back a mark while iterating it.
+
+        Args:
+            mark (_Mark): The player's mark.
+            count (int): The number of the player's marks on the lines, from
+                1 to the length of a line.
+
+        Returns:
+            set: The indexes of the lines (see `_get_lines()`).
+        """
+
+        return self._open_lines[mark.value][count]
+
+    def get_empty_spaces(self, line: int) -> list:
+        """Lists the empty spaces on a line.
+
+        Args:
+            line (int): The index of the line (see `_get_lines()`).
+
+        Returns:
+            list: The numbers of the spaces, from 1 (as in `add_mark()`).
+        """
+
+        grid = self._grid
+        size = self.size
+
+        return [space + 1 for space in self._lines[line]
+                if not grid[space // size][space % size]]
+
+    def check_for_win(self):
+        """Sets the winner, if a player has ``length`` marks in a row.
+
+        An existing winner is always kept. As `add_mark()` already keeps the
+        winner up to date, this never changes it for a grid that was only
+        changed with `add_mark()` and `undo()`.
+        """
+
+        for mark in _Mark:
+            if self.length in self._counts[mark.value]:
+                self.winner = self.winner or mark
+
+    def is_full(self) -> bool:
+        """Checks whether or not every space on the grid is taken.
+
+        Returns:
+            bool: Whether or not the grid is full.
+        """
+
+        return len(self._history) == self.size * self.size
 
     def get_grid(self) -> str:
-        """TODO
+        """Draws the grid as text, one row of ``size`` spaces per line.
+
+        Returns:
+            str: The grid, with each space shown as its mark or '-' if it is
+                empty, and the spaces on each row separated by ' | '.
         """
 
         rows = (' | '.join((str(x or '-') for x in row)) for row in self._grid)
         return '\n'.join(rows)
 
-    @staticmethod # CHECK???
-    def _find_three_row(rows: list | tuple | zip) -> _Mark | None:
-        """TODO
+    def to_bytes(self) -> bytes:
+        """Encodes the game state as a compact, 4-byte snapshot.
+
+        Only games on the classic 3x3 grid, with three marks in a row to win,
+        can be encoded.
+
+        Returns:
+            bytes: The snapshot; see `from_bytes()`.
+
+        Raises:
+            ValueError: The game is not played on the classic grid.
         """
 
-        for row in rows:
-            if all(row) and len(set(row)) == 1:
-                return row[0]
+        return _SNAPSHOT.pack(*self._get_snapshot())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> '_GameState':
+        """Restores a game state from a snapshot made by `to_bytes()`.
+
+        Args:
+            data (bytes): The snapshot.
+
+        Returns:
+            _GameState: The restored game state.
+
+        Raises:
+            ValueError: The snapshot is invalid.
+        """
+
+        try:
+            return cls._from_snapshot(*_SNAPSHOT.unpack(data))
+        except struct.error:
+            raise ValueError("corrupted snapshot")
+
+    def _get_snapshot(self) -> tuple:
+        """Lists the fields of the game state's snapshot; see `_SNAPSHOT`."""
+
+        if (self.size, self.length) != (3, 3):
+            raise ValueError("only games on a 3x3 grid can be snapshotted")
+
+        board = 0
+
+        for n, mark in enumerate(itertools.chain.from_iterable(self._grid)):
+            if mark == _Mark.Cross:
+                board |= 1 << n
+            elif mark == _Mark.Nought:
+                board |= 1 << (n + 9)
+
+        return (board,)
+
+    @classmethod
+    def _from_snapshot(cls, board: int) -> '_GameState':
+        """Restores a game state from the fields of its snapshot.
+
+        Args:
+            board (int): The bitboard of the crosses and noughts.
+
+        Returns:
+            _GameState: The restored game state.
+
+        Raises:
+            ValueError: The bitboard is invalid.
+        """
+
+        if board >> 18 or board & (board >> 9) & 0x1ff:
+            raise ValueError("corrupted snapshot")
+
+        game_state = cls()
+
+        # only visit the bits that are set, from the lowest up
+        while board:
+            bit = board & -board
+            n = bit.bit_length() - 1
+            mark = _Mark.Cross if n < 9 else _Mark.Nought
+            game_state.add_mark(n % 9 + 1, mark)
+            board ^= bit
+
+        return game_state
+
+
+def _get_spaces(game_state: _GameState) -> tuple:
+    """Flattens the grid of a game into a tuple of its spaces.
 
+    Args:
+        game_state (_GameState): The state of the game.
 
-def _prompt_move(game_state: _GameState, player: _Mark) -> bool:
-    """TODO
+    Returns:
+        tuple: The value of each mark on the grid (or 0 for an empty space),
+            left to right and top to bottom.
     """
 
-    print(game_state.get_grid())
+    return tuple(mark.value if mark else 0 for row in game_state._grid
+                 for mark in row)
 
-    # TODO
 
+def _get_first_player_spaces(game_state: _GameState,
+                             player: _Mark) -> (list, int):
+    """Flattens the grid of a game as if crosses had made the first move.
 
-def main(endless: bool = False):
-    """TODO
+    Players take turns starting first in endless games, but a game that
+    noughts started is the same as one that crosses started, with every
+    mark swapped.
+
+    Args:
+        game_state (_GameState): The state of the game.
+        player (_Mark): The mark of the player whose turn it is.
+
+    Returns:
+        list: The value of each mark on the grid (or 0 for an empty space),
+            left to right and top to bottom, swapped if noughts moved first.
+        int: The value of the mark of the player whose turn it is, swapped
+            likewise.
+    """
+
+    spaces = list(_get_spaces(game_state))
+    other = 3 - player.value
+    first = spaces.count(player.value) == spaces.count(other)
+
+    if first == (player == _Mark.Cross):
+        return (spaces, player.value)
+
+    return ([3 - value if value else 0 for value in spaces], other)
+
+
+def _evaluate(spaces: tuple, turn: int) -> int:
+    """Scores a position, assuming that both players play perfectly.
+
+    Args:
+        spaces (tuple): The value of each mark on the grid (see
+            `_get_spaces()`).
+        turn (int): The value of the mark of the player whose turn it is.
+
+    Returns:
+        int: The score of the position, for the player whose turn it is;
+            positive for a win, negative for a loss, or 0 for a draw. Wins and
+            losses that take fewer moves are scored further from zero.
     """
 
+    # symmetric positions have the same score, so they share the same entry
+    # in the cache
+    canonical = min(tuple(spaces[n] for n in order) for order in _SYMMETRIES)
+    score = _scores.get((canonical, turn))
+
+    if score is None:
+        score = _scores[canonical, turn] = _evaluate_canonical(canonical, turn)
+
+    return score
+
+
+def _evaluate_canonical(spaces: tuple, turn: int) -> int:
+    """Scores a position in its canonical form; see `_evaluate()`."""
+
+    empty = spaces.count(0)
+
+    # the previous player is the only one who may have just won
+    for a, b, c in _LINES:
+        if spaces[a] and spaces[a] == spaces[b] == spaces[c]:
+            return -(empty + 1)
+
+    if not empty:
+        return 0
+
+    other = 3 - turn
+
+    return max(
+        -_evaluate(spaces[:n] + (turn,) + spaces[n+1:], other)
+        for n in range(9) if not spaces[n]
+    )
+
+
+def _load_solution_table():
+    """Seeds the scores of every position from the bundled solution table.
+
+    Does nothing if no solution table was bundled (see `_bundle`), in which
+    case positions are scored as they are first reached.
+    """
+
+    data = _bundle.read_data(SOLUTION_TABLE_NAME)
+
+    if data is None:
+        return None
+
+    for spaces, turn, score in _SOLUTION.iter_unpack(data):
+        _scores[tuple(spaces), turn] = score
+
+
+def build_solution_table() -> bytes:
+    """Scores every position reachable in a game, whoever moves first.
+
+    Returns:
+        bytes: The solution table, to be bundled with a zipapp build; see
+            `_load_solution_table()`.
+    """
+
+    for mark in _Mark:
+        _evaluate((0,) * 9, mark.value)
+
+    return b''.join(
+        _SOLUTION.pack(bytes(spaces), turn, score)
+        for (spaces, turn), score in _scores.items()
+    )
+
+
+class _Position:
+    """A game of tic-tac-toe, as searched by the computer player on grids
+    larger than the classic one (see `_search.Searcher`).
+
+    Moves are the numbers of the spaces to mark, from 1, as in
+    `_GameState.add_mark()`.
+
+    Attributes:
+        game_state (_GameState): The state of the game, searched in place.
+        turn (_Mark): The mark of the player whose turn it is.
+    """
+
+    _OTHER = {_Mark.Cross: _Mark.Nought, _Mark.Nought: _Mark.Cross}
+
+    def __init__(self, game_state: _GameState, turn: _Mark):
+        self.game_state = game_state
+        self.turn = turn
+
+    @property
+    def key(self) -> int:
+        """int: The Zobrist hash of the position, including whose turn it is.
+        """
+
+        if self.turn == _Mark.Nought:
+            return self.game_state.key ^ _NOUGHT_TURN_KEY
+
+        return self.game_state.key
+
+    @property
+    def winner(self) -> _Mark | None:
+        """_Mark | None: The winner of the game, if any."""
+
+        return self.game_state.winner
+
+    def get_moves(self) -> list:
+        """Lists the moves worth searching.
+
+        On grids of more than 4x4 spaces, only the spaces next to a mark are
+        worth searching (or the center of an empty grid), most recent marks
+        first, as a line can only be won or blocked next to other marks.
+
+        Returns:
+            list: The moves, or an empty list if the game has ended.
+        """
+
+        game_state = self.game_state
+        size = game_state.size
+
+        if game_state.winner or game_state.is_full():
+            return []
+
+        grid = game_state._grid
+
+        if size <= 4:
+            return [n + 1 for n in range(size * size)
+                    if not grid[n // size][n % size]]
+
+        if not game_state._history:
+            return [size * size // 2 + 1]
+
+        neighbours = _get_neighbours(size)
+        moves = {}
+
+        for space, _ in reversed(game_state._history):
+            for n in neighbours[space]:
+                if not grid[n // size][n % size]:
+                    moves[n + 1] = None
+
+        return list(moves)
+
+    def play(self, move: int):
+        """Marks a space for the player whose turn it is."""
+
+        self.game_state.add_mark(move, self.turn)
+        self.turn = self._OTHER[self.turn]
+
+    def undo(self):
+        """Takes back the last move."""
+
+        self.game_state.undo()
+        self.turn = self._OTHER[self.turn]
+
+    def evaluate(self) -> int:
+        """Scores the position heuristically, by the lines each player holds.
+
+        Returns:
+            int: The score, for the player whose turn it is.
+        """
+
+        score = self.game_state._score
+
+        if self.turn == _Mark.Nought:
+            score = -score
+
+        return max(-_MAX_HEURISTIC_SCORE, min(score, _MAX_HEURISTIC_SCORE))
+
+
+def _create_position(size: int, length: int, marks: list,
+                     turn: int) -> _Position:
+    """Recreates a game in progress, as searched by the computer player.
+
+    Each process of a parallel search (see `_search.ParallelSearcher`)
+    searches its own copy of the game.
+
+    Args:
+        size (int): The number of spaces on each side of the grid.
+        length (int): The number of marks in a row it takes to win.
+        marks (list): The number of each space marked (from 1) and the value
+            of its mark, in the order they were marked.
+        turn (int): The value of the mark of the player whose turn it is.
+
+    Returns:
+        _Position: The game.
+    """
+
+    game_state = _GameState(size, length)
+
+    for index, value in marks:
+        game_state.add_mark(index, _Mark(value))
+
+    return _Position(game_state, _Mark(turn))
+
+
+@_metrics.timed('pygames_computer_move_seconds', game='tic-tac-toe')
+def _search_move(
+    game_state: _GameState,
+    mark: _Mark,
+    think_ms: int,
+    searcher: ParallelSearcher,
+    rng: random.Random = random,
+) -> SearchResult:
+    """Searches for the best move for the computer player, within a budget.
+
+    Used instead of `_choose_move()` on grids larger than the classic one,
+    which are too large to solve. A forced win made of threats is looked for
+    first (see `_threats.ThreatSearcher`), as those wins are often too deep
+    for alpha-beta search to see; the rest of the time budget is spent on a
+    search of every move.
+
+    As the threat search overlooks some answers of the opponent, a win it
+    finds is checked by searching every answer to its first move, up to the
+    length of the win: the win is only scored as such once that search
+    proves it, and is given up for a search of every move once that search
+    refutes it. A win that is neither proven nor refuted in time is still
+    played, with the heuristic score of the deepest check.
+
+    Args:
+        game_state (_GameState): The state of the game in progress.
+        mark (_Mark): The computer player's mark.
+        think_ms (int): The time the computer may think for, in milliseconds.
+        searcher (ParallelSearcher): The searcher used for every move, with
+            its transposition table.
+        rng (random.Random): The random number generator used to pick between
+            equally good moves (default: the `random` module's global
+            generator).
+
+    Returns:
+        SearchResult: The best move found, and how deep it was searched.
+    """
+
+    start = time.perf_counter()
+    size = game_state.size
+    marks = [(space + 1, game_state._grid[space // size][space % size].value)
+             for space, _ in game_state._history]
+    other = _Position._OTHER[mark]
+
+    threats = ThreatSearcher(game_state, mark, other)
+    line = threats.find_win(think_ms * _THREAT_SEARCH_SHARE)
+    nodes = threats.nodes
+
+    if line is not None and len(line) == 1:
+        return SearchResult(line[0], WIN_SCORE - 1, 1, nodes,
+                            time.perf_counter() - start)
+
+    if line is not None:
+        left_ms = think_ms - (time.perf_counter() - start) * 1000
+        check = searcher.search(
+            _create_position,
+            (size, game_state.length, [*marks, (line[0], mark.value)],
+             other.value),
+            left_ms * _THREAT_CHECK_SHARE, max_depth=len(line) - 1,
+        )
+        nodes += check.nodes
+
+        # the check is scored for the opponent, one move later; it refutes
+        # the win if the opponent holds out for the length of the win
+        proven = check.score <= -_DECIDED_SCORE
+        refuted = not proven and (check.depth == len(line) - 1
+                                  or check.score >= _DECIDED_SCORE)
+
+        if not refuted:
+            score = -check.score - 1 if proven else -check.score
+            return SearchResult(line[0], score, len(line), nodes,
+                                time.perf_counter() - start)
+
+    args = (size, game_state.length, marks, mark.value)
+    left_ms = think_ms - (time.perf_counter() - start) * 1000
+    result = searcher.search(_create_position, args, left_ms, rng=rng)
+    result.nodes += nodes
+    result.seconds = time.perf_counter() - start
+
+    return result
+
+
+@_metrics.timed('pygames_computer_move_seconds', game='tic-tac-toe')
+def _choose_move(
+    game_state: _GameState,
+    mark: _Mark,
+    rng: random.Random = random,
+) -> int:
+    """Picks the best move for the computer player.
+
+    Args:
+        game_state (_GameState): The state of the game in progress.
+        mark (_Mark): The computer player's mark.
+        rng (random.Random): The random number generator used to pick between
+            equally good moves (default: the `random` module's global
+            generator).
+
+    Returns:
+        int: The number of the space to mark, from 1 to 9.
+    """
+
+    if not _scores:
+        _load_solution_table()
+
+    spaces = _get_spaces(game_state)
+    scores = {}
+
+    for n in range(9):
+        if not spaces[n]:
+            child = spaces[:n] + (mark.value,) + spaces[n+1:]
+            scores[n + 1] = -_evaluate(child, 3 - mark.value)
+
+    best = max(scores.values())
+    return rng.choice([n for n, score in scores.items() if score == best])
+
+
+def _choose_random_move(game_state: _GameState, rng: random.Random) -> int:
+    """Picks a random move, for a player who ran out of time.
+
+    Args:
+        game_state (_GameState): The state of the game in progress.
+        rng (random.Random): The random number generator to pick with.
+
+    Returns:
+        int: The number of an empty space, from 1.
+    """
+
+    spaces = _get_spaces(game_state)
+    return rng.choice([n + 1 for n, mark in enumerate(spaces) if not mark])
+
+
+@_metrics.timed('pygames_input_wait_seconds', game='tic-tac-toe')
+def _prompt_move(
+    renderer: Renderer,
+    game_state: _GameState,
+    player: _Mark,
+    header: list,
+    timeout: float | None = None,
+) -> str | None:
+    """Draws the current turn's frame and prompts the player for a move.
+
+    Args:
+        renderer (Renderer): The renderer used to draw the game.
+        game_state (_GameState): The state of the game in progress.
+        player (_Mark): The mark of the player whose turn it is.
+        header (list): Lines to draw above the grid, typically explaining why
+            the previous move was rejected.
+        timeout (float | None): The most seconds the player may take to
+            move, or None for no limit (default: None).
+
+    Returns:
+        str | None: The player's move, as entered, or None if the player
+            requested to exit the program; if an EOF ('end-of-file') was added
+            to the standard input stream (i.e. with the CTRL + D shortcut).
+
+    Raises:
+        TimeoutError: The player did not move in time.
+    """
+
+    lines = [
+        *header,
+        *game_state.get_grid().split('\n'),
+        '',
+        f"{player}'s move (1-{game_state.size ** 2}): ",
+    ]
+
+    try:
+        return renderer.input(lines, timeout).strip()
+    except EOFError: # return early if user hits CTRL+D / EOF
+        renderer.draw([*lines, "Goodbye!"], final=True)
+        return None
+
+
+@_metrics.timed('pygames_turn_seconds', game='tic-tac-toe')
+def _try_move(game_state: _GameState, move: str, player: _Mark) -> str:
+    """Marks the space chosen by a player, if it is a valid move.
+
+    Args:
+        game_state (_GameState): The state of the game in progress.
+        move (str): The number of the space to mark, as entered.
+        player (_Mark): The mark of the player making the move.
+
+    Returns:
+        str: A message explaining why the move is invalid, or an empty string
+            if the space was marked.
+    """
+
+    spaces = game_state.size ** 2
+
+    if not (move.isascii() and move.isdigit() and 1 <= int(move) <= spaces):
+        return f"Please input a number from 1 to {spaces}!"
+
+    if game_state.add_mark(int(move), player):
+        return "That space is already taken!"
+
+    return ""
+
+
+def _get_outcome(game_state: _GameState) -> str:
+    """Describes the outcome of a game, as recorded in a journal.
+
+    Args:
+        game_state (_GameState): The state of the game.
+
+    Returns:
+        str: The winner's mark ('X' or 'O'), 'draw' if the grid is full, or
+            'quit' if the game is still in progress.
+    """
+
+    if game_state.winner:
+        return str(game_state.winner)
+
+    return 'draw' if game_state.is_full() else 'quit'
+
+
+def _replay(start: dict, events: Iterator[dict]) -> str | None:
+    """Replays a game of tic-tac-toe from its journal, without any user input.
+
+    Args:
+        start (dict): The game's 'start' event.
+        events (Iterator[dict]): The rest of the game's events.
+
+    Returns:
+        str | None: A description of how the replayed game differs from the
+            journal, or None if the outcome is the same.
+    """
+
+    config = start['config']
+    game_state = _GameState(config.get('size', 3), config.get('length', 3))
+    players = itertools.cycle((_Mark.Cross, _Mark.Nought))
+    player = next(players)
+    expected = 'quit'
+
+    if start['first'] != str(player):
+        player = next(players)
+
+    for event in events:
+        if event['event'] == 'move':
+            if not _try_move(game_state, event['move'], player):
+                player = next(players)
+        elif event['event'] == 'end':
+            expected = event['outcome']
+
+    outcome = _get_outcome(game_state)
+
+    if outcome != expected:
+        return f"expected outcome '{expected}', got '{outcome}'"
+
+    return None
+
+
+def _publish(spectators, game_state: _GameState, status: list):
+    """Sends the grid to the spectators of the game, if there are any.
+
+    Args:
+        spectators (_spectators.Broadcaster | None): The spectators.
+        game_state (_GameState): The game.
+        status (list): The lines to show below the grid.
+    """
+
+    if spectators is not None:
+        spectators.publish([*game_state.get_grid().split('\n'), '', *status])
+
+
+def _play_game(
+    renderer: Renderer,
+    game_state: _GameState,
+    player_order: list,
+    computer: bool,
+    rng: random.Random,
+    log: Journal,
+    think_ms: int = 1000,
+    searcher: ParallelSearcher | None = None,
+    agent=None,
+    tablebase=None,
+    spectators=None,
+    turn_timeout: float | None = None,
+) -> bool:
+    """Plays a single game of tic-tac-toe, until it ends or the player quits.
+
+    Args:
+        renderer (Renderer): The renderer used to draw the game.
+        game_state (_GameState): The state of the new game.
+        player_order (list): The marks of the players, in order of play.
+        computer (bool): Whether or not noughts are played by the computer.
+        rng (random.Random): The random number generator used by the
+            computer player.
+        log (Journal): The journal to record each move in.
+        think_ms (int): The time the computer may think for, per move, on
+            grids larger than the classic one (default: 1000).
+        searcher (ParallelSearcher | None): The searcher used by the
+            computer on grids larger than the classic one (default: None,
+            i.e. the classic grid is played).
+        agent (_learning.ValueTable | None): The values the computer picks
+            its moves with on the classic grid, as trained by `pygames
+            train` (default: None, i.e. the computer plays perfectly).
+        tablebase (_tablebase.Tablebase | None): The tablebase the computer
+            looks its moves up in, instead of searching, as generated by
+            `pygames tablebase` (default: None).
+        spectators (_spectators.Broadcaster | None): The spectators to send
+            the grid to after each move (default: None).
+        turn_timeout (float | None): The most seconds a player may take to
+            move, after which a random move is made for them (default: None,
+            i.e. no limit).
+
+    Returns:
+        bool: Whether or not the user requested to exit the program.
+    """
+
+    players = itertools.cycle(player_order)
+    player = next(players)
+    header = []
+    _publish(spectators, game_state, [f"{player}'s turn"])
+
+    while not (game_state.winner or game_state.is_full()):
+        if computer and player == _Mark.Nought and tablebase is not None:
+            spaces, turn = _get_first_player_spaces(game_state, player)
+            move = str(tablebase.choose_move(spaces, turn, rng) + 1)
+            header = [f"{player} marked space {move} (from the tablebase)",
+                      '']
+        elif computer and player == _Mark.Nought and searcher is not None:
+            result = _search_move(game_state, player, think_ms, searcher, rng)
+            move = str(result.move)
+            header = [
+                f"{player} marked space {move} (depth {result.depth}, "
+                f"{result.nodes_per_second:,.0f} positions/s, "
+                f"{result.hit_rate:.0%} table hits)",
+                '',
+            ]
+        elif computer and player == _Mark.Nought and agent is not None:
+            spaces, turn = _get_first_player_spaces(game_state, player)
+            move = str(agent.choose_move(spaces, turn, rng)[0] + 1)
+            header = [f"{player} marked space {move}", '']
+        elif computer and player == _Mark.Nought:
+            move = str(_choose_move(game_state, player, rng))
+            header = [f"{player} marked space {move}", '']
+        else:
+            try:
+                move = _prompt_move(renderer, game_state, player, header,
+                                    turn_timeout)
+                header = []
+            except TimeoutError:
+                move = str(_choose_random_move(game_state, rng))
+                header = [f"{player} ran out of time, and marked space "
+                          f"{move} at random", '']
+
+            if move is None: # if user asked to exit the program
+                return True
+
+        log.record('move', move=move)
+        message = _try_move(game_state, move, player)
+
+        if message:
+            header = [message, '']
+        else:
+            previous, player = player, next(players)
+
+            # the end of the game is published by `main()`, with its outcome
+            if not (game_state.winner or game_state.is_full()):
+                _publish(spectators, game_state, [
+                    f"{previous} marked space {move}", f"{player}'s turn",
+                ])
+
+    return False
+
+
+def main(
+    endless: bool = False,
+    computer: bool = False,
+    seed: int | None = None,
+    journal: str = '',
+    player: str = '',
+    size: int = 3,
+    length: int = 3,
+    think_ms: int = 1000,
+    table_mb: int = 16,
+    threads: int = 1,
+    agent: str = '',
+    spectate: str = '',
+    turn_timeout: float = 0,
+):
+    """Play a game of tic-tac-toe.
+
+    Starts a game of Tic-Tac-Toe for two players sharing the same keyboard,
+    or for one player against the computer. The spaces on an NxN grid are
+    numbered from 1 to N², left to right and top to bottom (from 1 to 9 on
+    the classic 3x3 grid), and the players take turns marking a space until
+    either player gets enough marks in a row (three by default), or the grid
+    is full. Larger grids can be played on, with more marks in a row to win
+    (up to gomoku's five in a row on a 15x15 grid, and beyond); on a 4x4
+    grid, the computer plays perfectly once the grid's tablebase is
+    generated (see `pygames tablebase`).
+
+    Args:
+        endless (bool): Whether or not to automatically start a new game after
+            the previous one ends (default: False).
+        computer (bool): Whether or not to play against the computer, which
+            plays noughts (default: False).
+        seed (int | None): The seed used by the computer to pick between
+            equally good moves; picked at random if not given (default:
+            None).
+        journal (str): The path to a file to append a replayable log of each
+            game to; see `pygames replay` (default: none).
+        player (str): The name to record the outcome of each game against the
+            computer under; see `pygames stats` (default: none, i.e. nothing
+            is recorded).
+        size (int): The number of spaces on each side of the grid, from 3 to
+            19 (default: 3).
+        length (int): The number of marks in a row it takes to win, from 3 to
+            the size of the grid (default: 3).
+        think_ms (int): The time the computer may think for, per move, on
+            grids larger than 3x3, in milliseconds; it always moves within
+            that time (default: 1000).
+        table_mb (int): The size of the computer's transposition table, in
+            megabytes, on grids larger than 3x3 (default: 16).
+        threads (int): The number of processes the computer searches with at
+            once, on grids larger than 3x3, sharing its transposition table
+            (default: 1).
+        agent (str): The path to a checkpoint of `pygames train`, for the
+            computer to play with on the classic grid instead of playing
+            perfectly; requires ``computer`` (default: none).
+        spectate (str): The address to let spectators watch the games at,
+            as 'HOST:PORT' or 'PORT', e.g. with `nc HOST PORT` (default:
+            none).
+        turn_timeout (float): The most seconds each move may take, after
+            which a random move is made instead (default: 0, i.e. no limit).
+
+    Raises:
+        ValueError: The size, length, time budget, table size, number of
+            threads, agent, spectators' address or turn timeout is
+            invalid.
+    """
+
+    if not 3 <= size <= _MAX_SIZE:
+        raise ValueError(f"the grid must be from 3 to {_MAX_SIZE} spaces wide")
+
+    if not 3 <= length <= size:
+        raise ValueError("the length of a line must be from 3 to the size of "
+                         "the grid")
+
+    if think_ms < 1:
+        raise ValueError("the computer must be given at least 1 ms to think")
+
+    if threads < 1:
+        raise ValueError("the computer must search with at least 1 thread")
+
+    if turn_timeout < 0:
+        raise ValueError("the turn timeout cannot be negative")
+
+    # the classic grid is solved instead of searched (see `_choose_move()`),
+    # and so are 4x4 grids once their tablebase is generated
+    searcher = None
+    table = None
+    tablebase = None
+
+    if agent:
+        if not computer:
+            raise ValueError("--agent requires --computer")
+
+        if (size, length) != (3, 3):
+            raise ValueError("a trained agent can only play on a 3x3 grid")
+
+        # only imported to play with a trained agent
+        from . import _learning
+
+        table = _learning.ValueTable()
+        table.load(agent)
+
+    if computer and size == 4:
+        # only imported to play on 4x4 grids
+        from . import _tablebase
+
+        tablebase = _tablebase.Tablebase.load(size, length)
+
+    if computer and (size, length) != (3, 3) and tablebase is None:
+        searcher = ParallelSearcher(threads, table_mb)
+
+    spectators = None
+
+    if spectate:
+        # only imported to serve spectators
+        from . import _spectators
+
+        spectators = _spectators.Broadcaster(
+            *_spectators.parse_address(spectate),
+        )
+
+    seed, rng = make_rng(seed)
     player_order = [_Mark.Cross, _Mark.Nought]
+    renderer = Renderer()
 
-    while True:
-        game_state = _GameState
-        players = itertools.cycle(player_order)
+    with (
+        Journal(journal) as log,
+        StatsRecorder(player) as stats,
+        searcher or contextlib.nullcontext(),
+        tablebase or contextlib.nullcontext(),
+        spectators or contextlib.nullcontext(),
+    ):
+        if spectators is not None:
+            host, port = spectators.address
+            print(f"Serving spectators at {host}:{port}")
 
-        while game_state.winner:
-            if _prompt_move(game_state, next(players)):
-                return None
+        while True:
+            game_state = _GameState(size, length)
 
-        # print(f'The winner is {game_state.winner}')
+            log.record('start', game='tic-tac-toe', seed=seed,
+                       config={'computer': computer, 'size': size,
+                               'length': length},
+                       first=str(player_order[0]))
+
+            if _play_game(renderer, game_state, player_order, computer, rng,
+                          log, think_ms, searcher, table, tablebase,
+                          spectators, turn_timeout or None):
+                log.record('end', outcome='quit')
+                return None # exit function early
+
+            outcome = _get_outcome(game_state)
+            log.record('end', outcome=outcome)
+            _metrics.count('pygames_games_total', game='tic-tac-toe',
+                           outcome=outcome)
+
+            if computer:
+                stats.record('tic-tac-toe', {
+                    str(_Mark.Cross): 'win', str(_Mark.Nought): 'lose',
+                }.get(outcome, 'draw'))
+
+            lines = [
+                *game_state.get_grid().split('\n'),
+                '',
+                f"{game_state.winner} wins!" if game_state.winner else "Draw!",
+            ]
+
+            _publish(spectators, game_state, lines[-1:])
+
+            if endless:
+                lines.append('') # newline
+
+            renderer.draw(lines, final=True)
+
+            if not endless:
+                return None
 
-        player_order.reverse() # HACK: There may be a cheaper way to do this
+            player_order.reverse() # HACK: There may be a cheaper way to do it
@@ -0,0 +1,106 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Trains a computer player for tic-tac-toe, by playing against itself.
+
+The player learns the value of every position of the classic grid from the
+outcomes of its own games (see `_learning`), in rounds: each round plays a
+share of the games, with every process learning into the same table in
+shared memory, then measures how the player fares against an opponent that
+moves at random, and saves its progress to a checkpoint. Training again
+with the same checkpoint picks up where it left off.
+"""
+
+import os
+import random
+
+from . import _learning
+from ._journal import make_rng
+
+# The number of rounds the games are split into
+_ROUNDS = 10
+
+# The number of games played against the random opponent after each round
+_EVALUATION_GAMES = 1000
+
+
+def main(
+    checkpoint: str,
+    episodes: int = 100_000,
+    processes: int = 0,
+    learning_rate: float = 0.2,
+    exploration: float = 0.1,
+    seed: int | None = None,
+):
+    """Train the tic-tac-toe computer player by self-play.
+
+    Plays games of tic-tac-toe of the computer against itself, learning from
+    each of them, and saves what it learned to a checkpoint, which
+    `pygames tic-tac-toe --computer --agent` can then play with. Prints the
+    number of games played per second, and how many games the player wins,
+    draws and loses against an opponent that moves at random, as it learns.
+
+    Args:
+        checkpoint (str): The path to save the player to; if it already
+            exists, training resumes from it.
+        episodes (int): The number of games to play (default: 100000).
+        processes (int): The number of processes to play with at once
+            (default: 0, i.e. one per CPU).
+        learning_rate (float): The share of each error of the player's
+            values to correct after each move, from 0 (excluded) to 1
+            (default: 0.2).
+        exploration (float): The chance of each move being picked at random
+            instead of by the player, from 0 to 1 (default: 0.1).
+        seed (int | None): The seed of the games; picked at random if not
+            given (default: None).
+
+    Raises:
+        ValueError: The checkpoint cannot be read or saved, or ``episodes``,
+            ``processes``, ``learning_rate`` or ``exploration`` is out of
+            range.
+    """
+
+    if episodes < _ROUNDS or processes < 0:
+        raise ValueError(f"episodes must be at least {_ROUNDS}, and processes "
+                         "cannot be negative")
+
+    _, rng = make_rng(seed)
+
+    with _learning.Trainer(processes or os.cpu_count(), learning_rate,
+                           exploration) as trainer:
+        if os.path.exists(checkpoint):
+            trainer.table.load(checkpoint)
+
+        print(f"{'games':>10} {'games/s':>8} {'won':>6} {'drawn':>6} "
+              f"{'lost':>6}")
+
+        for n in range(_ROUNDS):
+            games = episodes // _ROUNDS + (n < episodes % _ROUNDS)
+            seconds = trainer.train(games, rng)
+            wins, draws, losses = trainer.evaluate(
+                _EVALUATION_GAMES, random.Random(rng.randrange(1 << 64)),
+            )
+            trainer.table.save(checkpoint)
+
+            print(f"{trainer.table.games:>10,} {games / seconds:>8,.0f} "
+                  f"{wins / _EVALUATION_GAMES:>6.1%} "
+                  f"{draws / _EVALUATION_GAMES:>6.1%} "
+                  f"{losses / _EVALUATION_GAMES:>6.1%}")
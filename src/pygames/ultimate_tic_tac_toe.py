@@ -0,0 +1,602 @@
+# Copyright (c) 2025 MellowGhostyx
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Ultimate tic-tac-toe: a game of tic-tac-toe made of nine smaller ones."""
+
+import itertools
+import random
+from typing import Iterator
+
+from . import _metrics
+from ._journal import Journal, make_rng
+from ._rendering import Renderer
+from ._search import Searcher, SearchResult
+from ._stats import StatsRecorder
+from .tic_tac_toe import _LINES, _Mark
+
+# The value of a small board that was filled without a winner
+_DRAWN = 3
+
+# The mark of each value, as stored in the grid
+_MARKS = (None, _Mark.Nought, _Mark.Cross)
+
+# The moves on each small board
+_BOARD_MOVES = tuple(tuple(range(b * 9, b * 9 + 9)) for b in range(9))
+
+# For each space of a board (or board of the grid), the pairs of other spaces
+# that complete a line through it
+_LINE_PAIRS = tuple(
+    tuple(tuple(n for n in line if n != space)
+          for line in _LINES if space in line)
+    for space in range(9)
+)
+
+# For each move, the pairs of other moves that complete a line through it on
+# the same small board
+_MOVE_LINE_PAIRS = tuple(
+    tuple((move - move % 9 + a, move - move % 9 + b)
+          for a, b in _LINE_PAIRS[move % 9])
+    for move in range(81)
+)
+
+# How much a board (or space) is worth, by the number of lines through it
+_WEIGHTS = (3, 2, 3, 2, 4, 2, 3, 2, 3)
+
+# Heuristic scores (see `_GameState.evaluate()`): an open line on a small
+# board, by its number of marks; a won small board; and an open line on the
+# grid, by its number of won boards
+_SMALL_LINE_SCORES = (0, 1, 4)
+_BOARD_SCORE = 25
+_GRID_LINE_SCORES = (0, 40, 400)
+
+# The heuristic score of each small board in progress, by the code of its
+# spaces (see `_GameState`); filled in as the boards are first reached
+_small_board_scores = {}
+
+
+class _GameState:
+    """The state of a game of ultimate tic-tac-toe.
+
+    The grid is made of nine small boards of tic-tac-toe, laid out as a board
+    of their own. Each move marks a space on a small board, and sends the
+    opponent to the board in the same position on the grid as that space;
+    if that board is finished, the opponent may play on any board instead.
+    Winning a small board claims it, and the first player to claim three
+    boards in a row wins the game.
+
+    Moves are numbered from 0 to 80: nine times the number of the board, plus
+    the number of the space, both numbered from 0 to 8 (left to right, top to
+    bottom). Moves can be made and taken back in place, so that the computer
+    player can search the game without copying it.
+
+    Attributes:
+        winner (_Mark | None): The winner of the game, if any.
+    """
+
+    def __init__(self, first: _Mark = _Mark.Cross):
+        # the value of each mark on the grid (or 0 for an empty space), the
+        # code of each small board (the sum of its values, each times 3 to
+        # the power of its space) and the number of marks on it
+        self._cells = [0] * 81
+        self._codes = [0] * 9
+        self._counts = [0] * 9
+
+        # the value of the mark that claimed each small board, `_DRAWN`, or 0
+        # while it is still in progress
+        self._boards = [0] * 9
+
+        # the board that the next move must be made on, or -1 for any
+        self._next_board = -1
+        self._turn = first.value
+        self._history = []
+        self.winner: _Mark | None = None
+
+    @property
+    def turn(self) -> _Mark:
+        """_Mark: The mark of the player whose turn it is."""
+
+        return _MARKS[self._turn]
+
+    @property
+    def next_board(self) -> int | None:
+        """int | None: The board the next move must be made on, if any."""
+
+        return self._next_board if self._next_board >= 0 else None
+
+    def get_moves(self) -> list:
+        """Lists the legal moves.
+
+        Returns:
+            list: The legal moves, in order; empty once the game has ended.
+        """
+
+        if self.winner:
+            return []
+
+        cells = self._cells
+
+        if self._next_board >= 0:
+            return [move for move in _BOARD_MOVES[self._next_board]
+                    if not cells[move]]
+
+        boards = self._boards
+
+        return [move for board in range(9) if not boards[board]
+                for move in _BOARD_MOVES[board] if not cells[move]]
+
+    def play(self, move: int):
+        """Makes a move, without checking that it is legal.
+
+        Args:
+            move (int): The move to make.
+        """
+
+        turn = self._turn
+        board, space = divmod(move, 9)
+        cells = self._cells
+        boards = self._boards
+
+        cells[move] = turn
+        self._codes[board] += turn * 3 ** space
+        self._counts[board] += 1
+        is_finished = False
+
+        for a, b in _MOVE_LINE_PAIRS[move]:
+            if cells[a] == turn and cells[b] == turn:
+                boards[board] = turn
+                is_finished = True
+
+                for c, d in _LINE_PAIRS[board]:
+                    if boards[c] == turn and boards[d] == turn:
+                        self.winner = _MARKS[turn]
+
+                break
+        else:
+            if self._counts[board] == 9:
+                boards[board] = _DRAWN
+                is_finished = True
+
+        self._history.append((move, self._next_board, is_finished))
+        self._next_board = -1 if boards[space] else space
+        self._turn = 3 - turn
+
+    def undo(self):
+        """Takes back the last move."""
+
+        move, self._next_board, is_finished = self._history.pop()
+        board, space = divmod(move, 9)
+        turn = self._cells[move]
+
+        self._cells[move] = 0
+        self._codes[board] -= turn * 3 ** space
+        self._counts[board] -= 1
+        self._turn = turn
+
+        if is_finished:
+            self._boards[board] = 0
+            self.winner = None
+
+    def evaluate(self) -> int:
+        """Scores the game in progress with a heuristic.
+
+        Rewards the boards claimed by each player and the lines of boards
+        that they could still complete, as well as their open lines on the
+        small boards still in progress; the boards and spaces that are part
+        of more lines count for more.
+
+        Returns:
+            int: The score, for the player whose turn it is.
+        """
+
+        boards = self._boards
+        codes = self._codes
+        score = 0
+
+        for board in range(9):
+            value = boards[board]
+
+            if not value:
+                score += _score_small_board(codes[board]) * _WEIGHTS[board]
+            elif value == _Mark.Cross.value:
+                score += _BOARD_SCORE * _WEIGHTS[board]
+            elif value == _Mark.Nought.value:
+                score -= _BOARD_SCORE * _WEIGHTS[board]
+
+        for a, b, c in _LINES:
+            line = (boards[a], boards[b], boards[c])
+
+            if _DRAWN in line:
+                continue
+
+            crosses = line.count(_Mark.Cross.value)
+            noughts = line.count(_Mark.Nought.value)
+
+            if not noughts:
+                score += _GRID_LINE_SCORES[crosses]
+            elif not crosses:
+                score -= _GRID_LINE_SCORES[noughts]
+
+        return score if self._turn == _Mark.Cross.value else -score
+
+    def get_grid(self) -> str:
+        """Draws the grid, with the boards separated by lines.
+
+        Claimed boards are filled with the mark of the player who claimed
+        them, and the empty spaces that can be marked by the next move are
+        drawn as '-' (and as '.' otherwise).
+
+        Returns:
+            str: The grid, as 11 lines of text.
+        """
+
+        moves = set(self.get_moves())
+        rows = []
+
+        for board_row, space_row in itertools.product(range(3), repeat=2):
+            if space_row == 0 and board_row:
+                rows.append('------+-------+------')
+
+            parts = []
+
+            for board in range(board_row * 3, board_row * 3 + 3):
+                symbols = []
+
+                for space in range(space_row * 3, space_row * 3 + 3):
+                    move = board * 9 + space
+                    value = self._boards[board]
+
+                    if value in (_Mark.Cross.value, _Mark.Nought.value):
+                        symbols.append(str(_MARKS[value]))
+                    elif self._cells[move]:
+                        symbols.append(str(_MARKS[self._cells[move]]))
+                    else:
+                        symbols.append('-' if move in moves else '.')
+
+                parts.append(' '.join(symbols))
+
+            rows.append(' | '.join(parts))
+
+        return '\n'.join(rows)
+
+
+def _score_small_board(code: int) -> int:
+    """Scores a small board in progress; see `_GameState.evaluate()`.
+
+    Args:
+        code (int): The code of the board's spaces.
+
+    Returns:
+        int: The score of the board, for crosses.
+    """
+
+    score = _small_board_scores.get(code)
+
+    if score is None:
+        spaces = [code // 3 ** space % 3 for space in range(9)]
+        score = 0
+
+        for line in _LINES:
+            values = {spaces[space] for space in line} - {0}
+
+            if len(values) == 1:
+                count = sum(1 for space in line if spaces[space])
+                sign = 1 if _Mark.Cross.value in values else -1
+                score += sign * _SMALL_LINE_SCORES[count]
+
+        _small_board_scores[code] = score
+
+    return score
+
+
+@_metrics.timed('pygames_computer_move_seconds',
+                game='ultimate-tic-tac-toe')
+def _choose_move(
+    game_state: _GameState,
+    think_ms: int,
+    rng: random.Random = random,
+) -> SearchResult:
+    """Searches for the best move for the computer player, within a budget.
+
+    Args:
+        game_state (_GameState): The state of the game in progress.
+        think_ms (int): The time the computer may think for, in milliseconds.
+        rng (random.Random): The random number generator used to pick between
+            equally good moves (default: the `random` module's global
+            generator).
+
+    Returns:
+        SearchResult: The best move found, and how deep it was searched.
+    """
+
+    return Searcher(game_state).search(think_ms, rng=rng)
+
+
+def _format_move(move: int) -> str:
+    """Formats a move as entered by a player.
+
+    E.g. '53' for board 5, space 3.
+    """
+
+    board, space = divmod(move, 9)
+    return f'{board + 1}{space + 1}'
+
+
+@_metrics.timed('pygames_input_wait_seconds', game='ultimate-tic-tac-toe')
+def _prompt_move(
+    renderer: Renderer,
+    game_state: _GameState,
+    header: list,
+) -> str | None:
+    """Draws the current turn's frame and prompts the player for a move.
+
+    Args:
+        renderer (Renderer): The renderer used to draw the game.
+        game_state (_GameState): The state of the game in progress.
+        header (list): Lines to draw above the grid, typically explaining why
+            the previous move was rejected.
+
+    Returns:
+        str | None: The player's move, as entered, or None if the player
+            requested to exit the program with an EOF (i.e. CTRL + D).
+    """
+
+    if game_state.next_board is None:
+        prompt = f"{game_state.turn}'s move (board and space, e.g. 53): "
+    else:
+        prompt = (f"{game_state.turn}'s move on board "
+                  f"{game_state.next_board + 1} (1-9): ")
+
+    lines = [*header, *game_state.get_grid().split('\n'), '', prompt]
+
+    try:
+        return renderer.input(lines).strip()
+    except EOFError: # return early if user hits CTRL+D / EOF
+        renderer.draw([*lines, "Goodbye!"], final=True)
+        return None
+
+
+@_metrics.timed('pygames_turn_seconds', game='ultimate-tic-tac-toe')
+def _try_move(game_state: _GameState, move: str) -> str:
+    """Makes the move chosen by the player whose turn it is, if it is legal.
+
+    A move is entered as the number of a board then the number of a space,
+    both from 1 to 9 (e.g. '53', or '5 3'); the board may be left out when
+    the move must be made on a given board.
+
+    Args:
+        game_state (_GameState): The state of the game in progress.
+        move (str): The move, as entered.
+
+    Returns:
+        str: A message explaining why the move is invalid, or an empty string
+            if the move was made.
+    """
+
+    digits = move.replace(' ', '')
+    next_board = game_state.next_board
+
+    if not (digits.isascii() and digits.isdigit() and '0' not in digits
+            and len(digits) in (1, 2)):
+        return "Please input a board and a space, from 1 to 9 each!"
+
+    if len(digits) == 1:
+        if next_board is None:
+            return "Please input a board as well as a space (e.g. 53)!"
+
+        digits = f'{next_board + 1}{digits}'
+
+    board, space = int(digits[0]) - 1, int(digits[1]) - 1
+
+    if next_board is not None and board != next_board:
+        return f"You must play on board {next_board + 1}!"
+
+    if game_state._boards[board]:
+        return "That board is already finished!"
+
+    if game_state._cells[board * 9 + space]:
+        return "That space is already taken!"
+
+    game_state.play(board * 9 + space)
+    return ""
+
+
+def _get_outcome(game_state: _GameState) -> str:
+    """Describes the outcome of a game, as recorded in a journal.
+
+    Args:
+        game_state (_GameState): The state of the game.
+
+    Returns:
+        str: The winner's mark ('X' or 'O'), 'draw' if no moves are left, or
+            'quit' if the game is still in progress.
+    """
+
+    if game_state.winner:
+        return str(game_state.winner)
+
+    return 'quit' if game_state.get_moves() else 'draw'
+
+
+def _replay(start: dict, events: Iterator[dict]) -> str | None:
+    """Replays a game of ultimate tic-tac-toe from its journal.
+
+    Args:
+        start (dict): The game's 'start' event.
+        events (Iterator[dict]): The rest of the game's events.
+
+    Returns:
+        str | None: A description of how the replayed game differs from the
+            journal, or None if the outcome is the same.
+    """
+
+    first = {str(mark): mark for mark in _Mark}[start['first']]
+    game_state = _GameState(first)
+    expected = 'quit'
+
+    for event in events:
+        if event['event'] == 'move':
+            _try_move(game_state, event['move'])
+        elif event['event'] == 'end':
+            expected = event['outcome']
+
+    outcome = _get_outcome(game_state)
+
+    if outcome != expected:
+        return f"expected outcome '{expected}', got '{outcome}'"
+
+    return None
+
+
+def _play_game(
+    renderer: Renderer,
+    game_state: _GameState,
+    computer: bool,
+    think_ms: int,
+    rng: random.Random,
+    log: Journal,
+) -> bool:
+    """Plays a single game, until it ends or the player quits.
+
+    Args:
+        renderer (Renderer): The renderer used to draw the game.
+        game_state (_GameState): The state of the new game.
+        computer (bool): Whether or not noughts are played by the computer.
+        think_ms (int): The time the computer may think for, per move.
+        rng (random.Random): The random number generator used by the
+            computer player.
+        log (Journal): The journal to record each move in.
+
+    Returns:
+        bool: Whether or not the user requested to exit the program.
+    """
+
+    header = []
+
+    while game_state.get_moves():
+        player = game_state.turn
+
+        if computer and player == _Mark.Nought:
+            result = _choose_move(game_state, think_ms, rng)
+            move = _format_move(result.move)
+            header = [
+                f"{player} marked board {move[0]}, space {move[1]} "
+                f"(depth {result.depth}, "
+                f"{result.nodes_per_second:,.0f} positions/s)",
+                '',
+            ]
+        else:
+            move = _prompt_move(renderer, game_state, header)
+            header = []
+
+            if move is None: # if user asked to exit the program
+                return True
+
+        log.record('move', move=move)
+        message = _try_move(game_state, move)
+
+        if message:
+            header = [message, '']
+
+    return False
+
+
+def main(
+    endless: bool = False,
+    computer: bool = False,
+    think_ms: int = 1000,
+    seed: int | None = None,
+    journal: str = '',
+    player: str = '',
+):
+    """Play a game of ultimate tic-tac-toe.
+
+    Starts a game of Ultimate Tic-Tac-Toe, played on a grid of nine small
+    tic-tac-toe boards, for two players sharing the same keyboard or for one
+    player against the computer. Each move marks a space on a small board,
+    and sends the opponent to the board in the same position on the grid;
+    winning a small board claims it, and the first player to claim three
+    boards in a row wins. Boards and spaces are numbered from 1 to 9, left to
+    right and top to bottom.
+
+    Args:
+        endless (bool): Whether or not to automatically start a new game after
+            the previous one ends (default: False).
+        computer (bool): Whether or not to play against the computer, which
+            plays noughts (default: False).
+        think_ms (int): The time the computer may think for, per move, in
+            milliseconds; it always moves within that time (default: 1000).
+        seed (int | None): The seed used by the computer to pick between
+            equally good moves; picked at random if not given (default:
+            None).
+        journal (str): The path to a file to append a replayable log of each
+            game to; see `pygames replay` (default: none).
+        player (str): The name to record the outcome of each game against the
+            computer under; see `pygames stats` (default: none, i.e. nothing
+            is recorded).
+
+    Raises:
+        ValueError: ``think_ms`` is less than 1.
+    """
+
+    if think_ms < 1:
+        raise ValueError("the computer must be given at least 1 ms to think")
+
+    seed, rng = make_rng(seed)
+    player_order = [_Mark.Cross, _Mark.Nought]
+    renderer = Renderer()
+
+    with Journal(journal) as log, StatsRecorder(player) as stats:
+        while True:
+            game_state = _GameState(player_order[0])
+
+            log.record('start', game='ultimate-tic-tac-toe', seed=seed,
+                       config={'computer': computer, 'think_ms': think_ms},
+                       first=str(player_order[0]))
+
+            if _play_game(renderer, game_state, computer, think_ms, rng, log):
+                log.record('end', outcome='quit')
+                return None # exit function early
+
+            outcome = _get_outcome(game_state)
+            log.record('end', outcome=outcome)
+            _metrics.count('pygames_games_total', game='ultimate-tic-tac-toe',
+                           outcome=outcome)
+
+            if computer:
+                stats.record('ultimate-tic-tac-toe', {
+                    str(_Mark.Cross): 'win', str(_Mark.Nought): 'lose',
+                }.get(outcome, 'draw'))
+
+            lines = [
+                *game_state.get_grid().split('\n'),
+                '',
+                f"{game_state.winner} wins!" if game_state.winner else "Draw!",
+            ]
+
+            if endless:
+                lines.append('') # newline
+
+            renderer.draw(lines, final=True)
+
+            if not endless:
+                return None
+
+            player_order.reverse()
@@ -1,11 +1,41 @@
 import argparse
 import inspect
+import pathlib
 import pytest
+import subprocess
+import sys
 from types import CodeType, FunctionType, ModuleType
 
 from src.pygames import _application
+from src.pygames import bench
+from src.pygames import build
 from src.pygames import hangman
+from src.pygames import hangman_race
 from src.pygames import magic_8_ball
+from src.pygames import replay
+from src.pygames import stats
+from src.pygames import stress
+from src.pygames import tablebase
+from src.pygames import tic_tac_toe
+from src.pygames import train
+from src.pygames import ultimate_tic_tac_toe
+
+# The keyword arguments passed to each game's `main()` function by default
+_HANGMAN_DEFAULTS = {
+    'endless': False, 'lives': 8, 'difficulty': '', 'seed': None,
+    'journal': '', 'player': '', 'turn_timeout': 0,
+}
+
+_MAGIC_8_BALL_DEFAULTS = {
+    'endless': False, 'deck': '', 'batch': '', 'output_format': 'tsv',
+    'seed': None, 'journal': '',
+}
+
+_TIC_TAC_TOE_DEFAULTS = {
+    'endless': False, 'computer': False, 'seed': None, 'journal': '',
+    'player': '', 'size': 3, 'length': 3, 'think_ms': 1000, 'table_mb': 16,
+    'threads': 1, 'agent': '', 'spectate': '', 'turn_timeout': 0,
+}
 
 
 @pytest.fixture
@@ -89,6 +119,29 @@ def parameters(main_function) -> tuple:
     ('hangman --foo', 'unrecognized arguments'),
     ('hangman -l abc', 'invalid int value'),
     ('hangman -l -1', 'invalid config'),
+    ('hangman -d impossible', 'invalid config'),
+    ('hangman -t -0.5', 'invalid config'),
+    ('hangman-race -l 0', 'invalid config'),
+    ('magic-8-ball -s abc', 'invalid int value'),
+    ('magic-8-ball -b - -o xml', 'invalid config'),
+    ('stats -b losses', 'invalid config'),
+    ('stress -g chess', 'invalid config'),
+    ('tic-tac-toe -S 20', 'invalid config'),
+    ('tic-tac-toe -S 5 -l 6', 'invalid config'),
+    ('tic-tac-toe -c -S 5 -T 0', 'invalid config'),
+    ('tic-tac-toe -c -S 5 --threads 0', 'invalid config'),
+    ('tic-tac-toe -c -a /nonexistent/agent', 'invalid config'),
+    ('tic-tac-toe -a /nonexistent/agent', 'invalid config'),
+    ('tic-tac-toe -c -S 4 -a x', 'invalid config'),
+    ('tic-tac-toe --spectate localhost:http', 'invalid config'),
+    ('tic-tac-toe --turn-timeout -1', 'invalid config'),
+    ('tablebase -s 5', 'invalid config'),
+    ('tablebase -s 4 -l 5', 'invalid config'),
+    ('tablebase -p -1', 'invalid config'),
+    ('train x -e 5', 'invalid config'),
+    ('train x -l 0', 'invalid config'),
+    ('train x -l abc', 'invalid float value'),
+    ('ultimate-tic-tac-toe -t 0', 'invalid config'),
 ))
 def test_application_run_error(fresh_app, argv: str, expected: str):
     """Tests if `Application.run()` raises the right errors for bad arguments.
@@ -110,12 +163,80 @@ def test_application_run_error(fresh_app, argv: str, expected: str):
 
 
 @pytest.mark.parametrize('argv,expected_action,expected_kwargs', (
-    ('hangman', hangman.main, {'endless': False, 'lives': 8}),
-    ('hangman -e', hangman.main, {'endless': True, 'lives': 8}),
-    ('hangman -l 73', hangman.main, {'endless': False, 'lives': 73}),
-    ('hangman -e -l 3', hangman.main, {'endless': True, 'lives': 3}),
-    ('magic-8-ball', magic_8_ball.main, {'endless': False}),
-    ('magic-8-ball -e', magic_8_ball.main, {'endless': True}),
+    ('hangman', hangman.main, {**_HANGMAN_DEFAULTS}),
+    ('hangman -e', hangman.main, {**_HANGMAN_DEFAULTS, 'endless': True}),
+    ('hangman -l 73', hangman.main, {**_HANGMAN_DEFAULTS, 'lives': 73}),
+    ('hangman -e -l 3', hangman.main, {
+        **_HANGMAN_DEFAULTS, 'endless': True, 'lives': 3,
+    }),
+    ('hangman -s 7 -j x', hangman.main, {
+        **_HANGMAN_DEFAULTS, 'seed': 7, 'journal': 'x',
+    }),
+    ('hangman -t 30', hangman.main, {
+        **_HANGMAN_DEFAULTS, 'turn_timeout': 30,
+    }),
+    ('hangman -d hard', hangman.main, {
+        **_HANGMAN_DEFAULTS, 'difficulty': 'hard',
+    }),
+    ('hangman-race -p 0 -d easy', hangman_race.main, {
+        'address': '127.0.0.1', 'port': 0, 'lives': 8, 'difficulty': 'easy',
+        'seed': None,
+    }),
+    ('magic-8-ball', magic_8_ball.main, {**_MAGIC_8_BALL_DEFAULTS}),
+    ('magic-8-ball -e', magic_8_ball.main, {
+        **_MAGIC_8_BALL_DEFAULTS, 'endless': True,
+    }),
+    ('magic-8-ball -d x -b - -o jsonl -s 42 -j y', magic_8_ball.main, {
+        **_MAGIC_8_BALL_DEFAULTS, 'deck': 'x', 'batch': '-',
+        'output_format': 'jsonl', 'seed': 42, 'journal': 'y',
+    }),
+    ('tic-tac-toe', tic_tac_toe.main, {**_TIC_TAC_TOE_DEFAULTS}),
+    ('tic-tac-toe -e', tic_tac_toe.main, {
+        **_TIC_TAC_TOE_DEFAULTS, 'endless': True,
+    }),
+    ('tic-tac-toe -c -s 3 -p bob', tic_tac_toe.main, {
+        **_TIC_TAC_TOE_DEFAULTS, 'computer': True, 'seed': 3, 'player': 'bob',
+    }),
+    ('tic-tac-toe -c -S 15 -l 5 -t 200 -T 64 --threads 4', tic_tac_toe.main, {
+        **_TIC_TAC_TOE_DEFAULTS, 'computer': True, 'size': 15, 'length': 5,
+        'think_ms': 200, 'table_mb': 64, 'threads': 4,
+    }),
+    ('tic-tac-toe --spectate 0.0.0.0:8024', tic_tac_toe.main, {
+        **_TIC_TAC_TOE_DEFAULTS, 'spectate': '0.0.0.0:8024',
+    }),
+    ('tic-tac-toe --turn-timeout 2.5', tic_tac_toe.main, {
+        **_TIC_TAC_TOE_DEFAULTS, 'turn_timeout': 2.5,
+    }),
+    ('ultimate-tic-tac-toe -c -t 250', ultimate_tic_tac_toe.main, {
+        'endless': False, 'computer': True, 'think_ms': 250, 'seed': None,
+        'journal': '', 'player': '',
+    }),
+    ('replay x', replay.main, {'file': 'x'}),
+    ('stats', stats.main, {
+        'game': 'hangman', 'top': 10, 'by': 'wins', 'player': '',
+    }),
+    ('stats -g tic-tac-toe -t 3 -b streak', stats.main, {
+        'game': 'tic-tac-toe', 'top': 3, 'by': 'streak', 'player': '',
+    }),
+    ('bench -b x -t 0.5', bench.main, {
+        'output': '', 'baseline': 'x', 'threshold': 0.5, 'match': '',
+        'suite': '',
+    }),
+    ('stress -g hangman,tic-tac-toe -s 8 -T --seed 1', stress.main, {
+        'games': 'hangman,tic-tac-toe', 'sessions': 8, 'workers': 0,
+        'turns': 50, 'script': '', 'tty': True, 'seed': 1, 'output': '',
+        'shared_wordlist': False,
+    }),
+    ('tablebase -s 3 -S 10', tablebase.main, {
+        'size': 3, 'length': 3, 'processes': 0, 'samples': 10, 'seed': None,
+    }),
+    ('train x -e 1000 -p 2 -l 0.5 -E 0 -s 3', train.main, {
+        'checkpoint': 'x', 'episodes': 1000, 'processes': 2,
+        'learning_rate': 0.5, 'exploration': 0.0, 'seed': 3,
+    }),
+    ('build -a x.pyz', build.main, {
+        'archive': 'x.pyz', 'interpreter': '/usr/bin/env python3',
+    }),
 ))
 def test_application_parse_arguments_basic(
     fresh_app,
@@ -150,6 +271,86 @@ def test_application_parse_arguments_basic(
     assert kwargs == expected_kwargs
 
 
+def test_application_parse_arguments_profile(fresh_app):
+    """Tests if `Application._parse_arguments()` handles `--profile`.
+
+    Verifies that the `_parse_arguments()` method in the `pygames.Application`
+    class wraps the subcommand's action in a profiler when the `--profile`
+    option is specified, without passing the option on to the action.
+    """
+
+    argv = ('--profile', 'out.pstats', 'hangman', '-l', '3')
+    action, kwargs = fresh_app._parse_arguments(argv)
+
+    assert action.func == _application._profiling.profile_call
+    assert action.args == (hangman.main, 'out.pstats')
+    assert kwargs == {**_HANGMAN_DEFAULTS, 'lives': 3}
+
+
+def test_application_commands_summary():
+    """Tests if each built-in command is summarized by its `main()` function.
+
+    Verifies that the summary registered for each built-in command (without
+    importing its module) is the first line of its `main()` function's
+    docstring, and that the command's name matches its module's.
+    """
+
+    for name, summary in _application._COMMANDS.items():
+        module = _application._import_command(name)
+
+        assert module.__name__.endswith(f'.{name.replace("-", "_")}')
+        assert module.main.__doc__.split('\n')[0] == summary
+
+
+def test_application_lazy_commands():
+    """Tests if the built-in commands are only imported once they are run.
+
+    Verifies that creating an `Application` object, in a fresh interpreter,
+    does not import the module of any built-in command.
+    """
+
+    code = (
+        "import sys\n"
+        "from src.pygames import _application\n"
+        "_application.Application()\n"
+        "print(*sys.modules)\n"
+    )
+
+    modules = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=pathlib.Path(__file__).parents[1],
+        capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+    for name in _application._COMMANDS:
+        assert f'src.pygames.{name.replace("-", "_")}' not in modules
+
+
+def test_application_startup_imports():
+    """Tests if starting a game leaves the slow optional modules unimported.
+
+    Verifies that parsing the arguments of a hangman game, in a fresh
+    interpreter, imports none of the modules that only some commands (or
+    options) need, so that they cannot slow down every start.
+    """
+
+    code = (
+        "import sys\n"
+        "from src.pygames import _application\n"
+        "_application.Application()._parse_arguments(('hangman',))\n"
+        "print(*sys.modules)\n"
+    )
+
+    modules = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=pathlib.Path(__file__).parents[1],
+        capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+    for name in ('argcomplete', 'asyncio', 'http.client', 'sqlite3'):
+        assert name not in modules
+
+
 # def test_application_add_subcommand(fresh_app, subparsers, game_module):
 #     """TODO"""
 
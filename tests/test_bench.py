@@ -0,0 +1,59 @@
+import pytest
+from src.pygames import bench
+
+
+def test_load_benchmarks(tmp_path):
+    """Tests if `_load_benchmarks()` finds the benchmarks in a suite.
+
+    Verifies that the `_load_benchmarks()` function only loads the functions
+    prefixed with ``bench_`` from the modules prefixed with ``bench_``, names
+    them after both, and filters them by name.
+    """
+
+    (tmp_path / 'bench_foo.py').write_text(
+        "def bench_bar(): return lambda: None\n"
+        "def bench_baz(): return lambda: None\n"
+        "def helper(): pass\n"
+    )
+    (tmp_path / 'helpers.py').write_text("def bench_qux(): pass\n")
+
+    assert set(bench._load_benchmarks(tmp_path, '')) == {'foo.bar', 'foo.baz'}
+    assert set(bench._load_benchmarks(tmp_path, 'baz')) == {'foo.baz'}
+
+
+def test_run_benchmark(monkeypatch):
+    """Tests if `_run_benchmark()` times the function returned by a benchmark."""
+
+    import time
+
+    monkeypatch.setattr(bench, '_REPEAT', 1)
+    result = bench._run_benchmark(lambda: lambda: time.sleep(0.2))
+
+    assert result['loops'] == 1
+    assert 0.2 <= result['best'] == result['median'] < 0.4
+
+
+@pytest.mark.parametrize('best,expected', (
+    (1.0, []), (1.2, []), (1.3, ["foo: 1.30x slower than baseline"]),
+))
+def test_compare(best: float, expected: list):
+    """Tests if `_compare()` only reports slowdowns beyond the threshold.
+
+    Args:
+        best (float): The new best time of the benchmark.
+        expected (list): The regressions expected to be reported.
+    """
+
+    results = {'foo': {'best': best}, 'new': {'best': 1.0}}
+    baseline = {'foo': {'best': 1.0}, 'old': {'best': 1.0}}
+
+    assert bench._compare(results, baseline, 0.25) == expected
+
+
+@pytest.mark.parametrize('seconds,expected', (
+    (2.5, '2.50 s'), (0.0125, '12.50 ms'), (3e-6, '3.00 µs'), (4e-8, '40 ns'),
+))
+def test_format_time(seconds: float, expected: str):
+    """Tests if `_format_time()` picks a suitable unit."""
+
+    assert bench._format_time(seconds) == expected
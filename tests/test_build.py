@@ -0,0 +1,73 @@
+import pytest
+import subprocess
+import sys
+import zipfile
+from src.pygames import _application, _wordlist, build
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch, capsys) -> str:
+    """Builds a zipapp of PyGames, with a local wordlist.
+
+    The wordlist is deleted once the zipapp is built, so that the zipapp can
+    only use the wordlist bundled with it.
+
+    Returns:
+        str: The path to the zipapp.
+    """
+
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text("jazz\nbanana\norange\nplanet\n")
+
+    monkeypatch.setenv('PYGAMES_WORDLIST_URL', wordlist.as_uri())
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    path = str(tmp_path / 'pygames.pyz')
+    build.main(archive=path)
+
+    assert f"built '{path}'" in capsys.readouterr().out
+
+    wordlist.unlink()
+    (tmp_path / 'cache').rename(tmp_path / 'old-cache')
+
+    return path
+
+
+def test_build_contents(archive: str):
+    """Tests if the zipapp holds the compiled modules and bundled data."""
+
+    with zipfile.ZipFile(archive) as f:
+        names = set(f.namelist())
+
+    assert {'__main__.py', '__main__.pyc'} <= names
+    assert {'pygames/hangman.py', 'pygames/hangman.pyc'} <= names
+    assert 'argcomplete/__init__.pyc' in names
+    assert 'pygames/_data/VERSION' in names
+    assert 'pygames/_data/tic_tac_toe.tbl' in names
+    assert not any(name.startswith('argcomplete/scripts/') for name in names)
+    assert not any('__pycache__' in name for name in names)
+
+
+def test_build_run_offline(archive: str):
+    """Tests if the zipapp runs on its own, with its bundled data.
+
+    Verifies that the zipapp reports the version it was built from, and
+    plays hangman with the bundled wordlist, even though the wordlist it was
+    built from is gone.
+    """
+
+    version = subprocess.run(
+        [sys.executable, archive, '--version'],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert version.stdout.strip() == f'pygames {_application.__version__}'
+
+    game = subprocess.run(
+        [sys.executable, archive, 'hangman', '--seed', '1'],
+        input='a\ne\ni\no\nn\nb\nl\np\nt\nr\ng\n',
+        capture_output=True, text=True, check=True,
+    )
+
+    assert "You win!" in game.stdout
@@ -255,6 +255,18 @@ def test_game_state_try_guess_regular(
     assert game_state.try_guess(guess) == expected
     assert lowers_lives == (game_state.lives == 7)
 
+
+def test_game_state_forfeit_turn(game_state):
+    """Tests if `_GameState.forfeit_turn()` takes a life away.
+
+    Verifies that the `forfeit_turn()` method in the `hangman._GameState`
+    class lowers the number of lives by one, without guessing any letter.
+    """
+
+    assert game_state.forfeit_turn() == "Time's up! You lost a life"
+    assert game_state.lives == 7
+    assert game_state.summarize() == '___________ · 7 lives'
+
 @pytest.mark.parametrize('letter', ('a', 'b', 'x'))
 def test_game_state_generate_count_message(game_state, letter: str):
     """Tests if `_GameState._generate_count_message()` works correctly.
@@ -282,3 +294,102 @@ def test_game_state_generate_count_message(game_state, letter: str):
 
         assert actual_lower == actual_upper
         assert actual_upper == expected
+
+
+@pytest.mark.parametrize('ansi', (False, True))
+def test_prompt_guess_single_write(game_state, monkeypatch, ansi: bool):
+    """Tests if `_prompt_guess()` draws each turn with a single write.
+
+    Verifies that each call to the `_prompt_guess()` function makes exactly
+    one `write()` call on the output stream, whether or not the output stream
+    is a terminal, and returns the user's guess in lowercase.
+
+    Args:
+        ansi (bool): Whether or not the renderer should redraw frames with
+            ANSI escape sequences.
+    """
+
+    import io
+    from src.pygames._rendering import Renderer
+
+    guesses = iter('APX')
+    monkeypatch.setattr('builtins.input', lambda *args: next(guesses))
+
+    renderer = Renderer(io.StringIO(), ansi=ansi)
+    header = []
+
+    for turn, expected in enumerate('apx', start=1):
+        guess = hangman._prompt_guess(renderer, game_state, header)
+        header = [game_state.try_guess(guess), '']
+
+        assert guess == expected
+        assert renderer.writes == turn
+
+
+def test_get_random_word_local(tmp_path, monkeypatch):
+    """Tests if `_get_random_word()` can pick a word from a local wordlist.
+
+    Verifies that the `_get_random_word()` function reads the wordlist from
+    the URL in the ``PYGAMES_WORDLIST_URL`` environment variable, and only
+    picks words between 5 and 12 letters in length.
+    """
+
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text("a\nfoo\napplication\nabcdefghijklmnop\n")
+    monkeypatch.setenv('PYGAMES_WORDLIST_URL', wordlist.as_uri())
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+
+    assert hangman._get_random_word() == 'application'
+
+
+@pytest.mark.parametrize('guesses', (
+    (),
+    ('a', 'x', 'p', 'z'),
+    ('a', 'p', 'l', 'i', 'c', 't', 'o', 'n'),
+    ('d', 'e', 'q', 'r', 's', 'u', 'w', 'y'),
+    ('application',),
+))
+def test_game_state_snapshot(guesses: tuple):
+    """Tests if a game state is restored as it was from its snapshot.
+
+    Args:
+        guesses (tuple): The guesses to make before taking the snapshot.
+    """
+
+    game_state = hangman._GameState('application', 8)
+
+    for guess in guesses:
+        game_state.try_guess(guess)
+
+    data = game_state.to_bytes()
+    restored = hangman._GameState.from_bytes(data)
+
+    assert len(data) == 16
+    assert restored.summarize() == game_state.summarize()
+    assert restored.guesses == game_state.guesses - {'application'}
+    assert restored.guess_count == game_state.guess_count
+    assert restored.secret_word.hidden == game_state.secret_word.hidden
+
+
+@pytest.mark.parametrize('word', ('Apple', 'naïve', 'abcdefghijklm'))
+def test_pack_word_invalid(word: str):
+    """Tests if `_pack_word()` rejects the words that cannot be packed.
+
+    Args:
+        word (str): The word to pack.
+    """
+
+    with pytest.raises(ValueError):
+        hangman._pack_word(word)
+
+
+@pytest.mark.parametrize('data', (b'', b'\x00' * 16, b'\x1f' + b'\x00' * 15))
+def test_game_state_from_bytes_invalid(data: bytes):
+    """Tests if `_GameState.from_bytes()` rejects invalid snapshots.
+
+    Args:
+        data (bytes): The snapshot to restore.
+    """
+
+    with pytest.raises(ValueError):
+        hangman._GameState.from_bytes(data)
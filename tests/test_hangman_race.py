@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from src.pygames import hangman_race
+
+
+class _Writer:
+    """A stand-in for a player's connection, that keeps its messages."""
+
+    def __init__(self):
+        self.transport = self
+        self.messages = []
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+    def is_closing(self) -> bool:
+        return False
+
+    def write(self, data: bytes):
+        self.messages.append(data.decode())
+
+    def close(self):
+        pass
+
+
+async def _wait_for(condition, timeout: float = 5):
+    """Waits until a condition is met, letting the event loop run."""
+
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+def test_room_batches(monkeypatch):
+    """Tests if `_Room` applies guesses in order, and broadcasts in batches.
+
+    Verifies that the guesses submitted to a `hangman_race._Room` object while
+    it waits out its broadcast interval are applied in the order they were
+    submitted, then sent to every player as a single message.
+    """
+
+    monkeypatch.setattr(hangman_race, '_BROADCAST_INTERVAL', 0.05)
+
+    async def play() -> tuple:
+        room = hangman_race._Room(lambda: 'application', lives=8)
+        writers = [_Writer(), _Writer()]
+
+        for n, writer in enumerate(writers):
+            room.join(f'player{n}', writer)
+
+        task = asyncio.create_task(room.run())
+        await _wait_for(lambda: room.game_state is not None)
+
+        room.submit('player0', 'x')
+        await _wait_for(lambda: room.guesses_applied == 1)
+
+        # the next guesses arrive before the broadcast interval is over
+        for name, guess in (('player1', 'a'), ('player0', 'a'),
+                            ('player1', 'p')):
+            room.submit(name, guess)
+
+        await _wait_for(lambda: room.guesses_applied == 4)
+        task.cancel()
+
+        return (room, writers)
+
+    room, writers = asyncio.run(play())
+
+    assert writers[0].messages[-2:] == writers[1].messages[-2:] == [
+        "player0: x · There are no letter X's\n"
+        "___________ · 7 lives · X\n",
+        "player1: a · There are 2 letter A's\n"
+        "player0: a · You already made this guess!\n"
+        "player1: p · There are 2 letter P's\n"
+        "app___a____ · 7 lives · X\n",
+    ]
+
+
+def test_room_rounds():
+    """Tests if `_Room` starts a new round once the word is solved."""
+
+    async def play() -> list:
+        words = iter(('apple', 'peach'))
+        room = hangman_race._Room(lambda: next(words), lives=8)
+        writer = _Writer()
+        room.join('player', writer)
+
+        task = asyncio.create_task(room.run())
+        await _wait_for(lambda: room.game_state is not None)
+
+        # the guess left over after the word is solved is dropped
+        for guess in ('apple', 'peach'):
+            room.submit('player', guess)
+
+        await _wait_for(lambda: room.game_state.secret_word._word == 'peach')
+        task.cancel()
+
+        return ''.join(writer.messages)
+
+    messages = asyncio.run(play())
+
+    assert 'player solved it with "apple"!\nYou win!\n' in messages
+    assert messages.endswith('New word!\n_____ · 8 lives\n')
+
+
+def test_room_rounds_stale_guesses():
+    """Tests if `_Room` drops the guesses queued across the end of a round.
+
+    Verifies that guesses submitted after a round has ended, while the next
+    word is being fetched, are not applied to the next word.
+    """
+
+    fetching = threading.Event()
+    fetched = threading.Event()
+
+    def get_word() -> str:
+        if not fetching.is_set():
+            fetching.set()
+            return 'apple'
+
+        fetched.wait(5)
+        return 'peach'
+
+    async def play() -> hangman_race._Room:
+        room = hangman_race._Room(get_word, lives=8)
+        room.join('player', _Writer())
+
+        task = asyncio.create_task(room.run())
+        await _wait_for(lambda: room.game_state is not None)
+
+        room.submit('player', 'apple')
+        await _wait_for(lambda: not room.game_state.secret_word.hidden)
+
+        # submitted while the next word is being fetched
+        room.submit('player', 'z')
+        fetched.set()
+
+        await _wait_for(lambda: room.game_state.secret_word._word == 'peach')
+        room.submit('player', 'e')
+        await _wait_for(lambda: room.guesses_applied >= 2)
+        task.cancel()
+
+        return room
+
+    room = asyncio.run(play())
+
+    assert room.game_state.lives == 8
+    assert room.game_state.summarize() == '_e___ · 8 lives'
+
+
+def test_room_tcp():
+    """Tests if players can join a room, and play, over TCP."""
+
+    async def play() -> str:
+        room = hangman_race._Room(lambda: 'apple', lives=8)
+        server = await hangman_race._serve(room, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        task = asyncio.create_task(room.run())
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(b'alice\nP\napple\n')
+        output = await reader.readuntil(b'You win!\n')
+
+        writer.close()
+        await _wait_for(lambda: not room._players)
+
+        task.cancel()
+        server.close()
+
+        return output.decode()
+
+    output = asyncio.run(play())
+
+    assert output.startswith('Your name: ')
+    assert "alice: p · There are 2 letter P's\n" in output
+    assert 'alice solved it with "apple"!\n' in output
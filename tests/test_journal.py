@@ -0,0 +1,98 @@
+import io
+import pytest
+import sys
+from src.pygames import _journal
+
+
+def test_journal_record(tmp_path):
+    """Tests if `Journal.record()` appends events as compact JSON lines.
+
+    Verifies that the `record()` method in the `_journal.Journal` class writes
+    each event as a single line, without overwriting any events that were
+    already in the journal file.
+    """
+
+    path = tmp_path / 'journal.jsonl'
+
+    for guess in 'ab':
+        with _journal.Journal(str(path)) as journal:
+            journal.record('guess', guess=guess)
+
+    assert path.read_text() == (
+        '{"event":"guess","guess":"a"}\n{"event":"guess","guess":"b"}\n'
+    )
+
+
+def test_journal_record_disabled():
+    """Tests if a `Journal` without a path silently ignores all events."""
+
+    with _journal.Journal() as journal:
+        journal.record('start', game='hangman')
+
+
+def test_make_rng():
+    """Tests if `make_rng()` creates reproducible random number generators."""
+
+    seed, rng = _journal.make_rng(None)
+    _, same_rng = _journal.make_rng(seed)
+
+    assert [rng.random() for _ in range(3)] == [
+        same_rng.random() for _ in range(3)
+    ]
+
+
+@pytest.mark.parametrize('content', ('{"event": "start"\n', '[1, 2]\n'))
+def test_read_events_corrupted(tmp_path, content: str):
+    """Tests if `read_events()` rejects corrupted journal files.
+
+    Args:
+        content (str): The contents of the corrupted journal file.
+    """
+
+    path = tmp_path / 'journal.jsonl'
+    path.write_text('{"event": "start"}\n\n' + content)
+
+    with pytest.raises(_journal.CorruptedJournalError,
+                       match='corrupted journal on line 3'):
+        tuple(_journal.read_events(str(path)))
+
+
+def test_read_events_stdin(monkeypatch):
+    """Tests if `read_events()` reads the standard input, leaving it open."""
+
+    stdin = io.StringIO('{"event": "start"}\n{"event": "end"}\n')
+    monkeypatch.setattr(sys, 'stdin', stdin)
+
+    assert [event['event'] for event in _journal.read_events('-')] == [
+        'start', 'end',
+    ]
+    assert not stdin.closed
+
+
+def test_group_games():
+    """Tests if `group_games()` lazily groups events by their game.
+
+    Verifies that the `group_games()` function yields each game's 'start'
+    event alongside the rest of its events, skips any events that precede the
+    first game, and skips the events of games that are not consumed.
+    """
+
+    events = [
+        {'event': 'guess', 'n': 0},
+        {'event': 'start', 'n': 1}, {'event': 'guess', 'n': 2},
+        {'event': 'start', 'n': 3}, {'event': 'end', 'n': 4},
+        {'event': 'start', 'n': 5}, {'event': 'guess', 'n': 6},
+    ]
+
+    games = _journal.group_games(iter(events))
+
+    start, rest = next(games)
+    assert start['n'] == 1 and [event['n'] for event in rest] == [2]
+
+    start, rest = next(games) # rest is left unconsumed
+    assert start['n'] == 3
+
+    start, rest = next(games)
+    assert start['n'] == 5 and [event['n'] for event in rest] == [6]
+
+    assert next(games, None) is None
@@ -0,0 +1,119 @@
+import os
+import pytest
+import random
+from src.pygames import _learning, train
+
+
+def test_get_code():
+    """Tests if `get_code()` numbers every grid with its own code."""
+
+    assert _learning.get_code([0] * 9) == 0
+    assert _learning.get_code([2] * 9) == _learning._STATES - 1
+    assert _learning.get_code([1, 0, 0, 0, 0, 0, 0, 0, 2]) == 1 + 2 * 3**8
+
+
+def test_choose_move():
+    """Tests if `ValueTable.choose_move()` picks the most valuable move."""
+
+    table = _learning.ValueTable()
+    spaces = [2, 1, 0, 0, 2, 1, 0, 0, 0]
+    code = _learning.get_code(spaces)
+    table.values[code + 2 * 3**8] = 1.0
+
+    assert table.choose_move(spaces, 2) == (8, False)
+    assert table.choose_move(spaces, 2, exploration=1.0)[1]
+
+
+def test_train():
+    """Tests if self-play learns never to lose against random moves.
+
+    Verifies that a few thousand games of training, with a fixed seed, make
+    a player that wins most games against an opponent that moves at random,
+    and loses almost none, starting from a player that loses many.
+    """
+
+    rng = random.Random(0)
+
+    with _learning.Trainer(1, 0.2, 0.1) as trainer:
+        _, _, losses = trainer.evaluate(1000, random.Random(1))
+        assert losses > 100
+
+        trainer.train(20000, rng)
+        wins, _, losses = trainer.evaluate(1000, random.Random(1))
+
+        assert trainer.table.games == 20000
+        assert wins > 800 and losses < 10
+
+
+def test_train_shared():
+    """Tests if every process of a training learns into the same table."""
+
+    with _learning.Trainer(2, 0.2, 0.1) as trainer:
+        trainer.train(1000, random.Random(0))
+        table = _learning.ValueTable.attach(trainer.table.name)
+
+        try:
+            assert any(table.values)
+            assert list(table.values) == list(trainer.table.values)
+        finally:
+            table.close()
+
+    with pytest.raises(ValueError):
+        _learning.Trainer(0, 0.2, 0.1)
+
+
+def test_checkpoint(tmp_path):
+    """Tests if a checkpoint restores the values of a table, as 32-bit floats.
+    """
+
+    path = tmp_path / 'agent'
+    table = _learning.ValueTable()
+    table.values[100] = 0.5
+    table.values[200] = -1 / 3
+    table.games = 1234
+    table.save(path)
+
+    other = _learning.ValueTable()
+    other.load(path)
+
+    assert other.games == 1234
+    assert other.values[100] == 0.5
+    assert other.values[200] == pytest.approx(-1 / 3)
+    assert not any(other.values[:100])
+
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError):
+        other.load(path)
+
+    with pytest.raises(ValueError):
+        other.load(tmp_path / 'missing')
+
+
+def test_checkpoint_concurrent(tmp_path):
+    """Tests if saving a checkpoint leaves other processes' files alone."""
+
+    path = tmp_path / 'agent'
+    other = tmp_path / f'agent.{os.getpid() + 1}.tmp'
+    other.write_bytes(b'half-written')
+
+    _learning.ValueTable().save(path)
+
+    assert other.read_bytes() == b'half-written'
+    assert sorted(tmp_path.iterdir()) == [path, other]
+
+
+def test_main(tmp_path, capsys):
+    """Tests if `train.main()` reports each round, and resumes training.
+
+    Verifies that a second training with the same checkpoint picks up from
+    the number of games the first one saved.
+    """
+
+    path = str(tmp_path / 'agent')
+    train.main(path, 100, 1, seed=0)
+    train.main(path, 100, 1, seed=0)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(lines) == 2 * (1 + train._ROUNDS)
+    assert lines[-1].split()[0] == '200'
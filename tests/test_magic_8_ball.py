@@ -0,0 +1,198 @@
+import math
+import os
+import pytest
+import random
+from array import array
+from src.pygames import magic_8_ball
+
+
+def _table_probabilities(table: magic_8_ball._AliasTable) -> list:
+    """Computes the exact probability of drawing each index from a table.
+
+    Args:
+        table (magic_8_ball._AliasTable): The alias table to inspect.
+
+    Returns:
+        list: The probability of drawing each index, in order.
+    """
+
+    count = len(table)
+    result = [0.0] * count
+
+    for n in range(count):
+        result[n] += table._probabilities[n] / count
+        result[table._aliases[n]] += (1 - table._probabilities[n]) / count
+
+    return result
+
+
+@pytest.mark.parametrize('weights', (
+    (1, 1, 1, 1), (1, 2, 3, 4), (1000, 1, 0.5, 1), (0.5,), (7, 1, 1, 1, 1, 3),
+))
+def test_alias_table_from_weights(weights: tuple):
+    """Tests if `_AliasTable.from_weights()` preserves the given weights.
+
+    Verifies that the alias table built by the `from_weights()` method in the
+    `magic_8_ball._AliasTable` class draws each index with a probability
+    proportional to its weight.
+
+    Args:
+        weights (tuple): The weights to build the alias table from.
+    """
+
+    table = magic_8_ball._AliasTable.from_weights(weights)
+    expected = [weight / sum(weights) for weight in weights]
+
+    assert _table_probabilities(table) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('weights', (
+    (), (0, 0), (1, 0), (1, -1), (1, math.nan), (1, math.inf),
+))
+def test_alias_table_from_weights_invalid(weights: tuple):
+    """Tests if `_AliasTable.from_weights()` rejects invalid weights."""
+
+    with pytest.raises(ValueError):
+        magic_8_ball._AliasTable.from_weights(weights)
+
+
+def test_alias_table_sample():
+    """Tests if `_AliasTable.sample()` draws every index, and only those."""
+
+    table = magic_8_ball._AliasTable.from_weights((1, 300, 1, 100))
+    rng = random.Random(8)
+
+    assert {table.sample(rng) for _ in range(10000)} == {0, 1, 2, 3}
+
+
+def test_load_deck(tmp_path):
+    """Tests if `_load_deck()` reads a deck file and caches its alias table.
+
+    Verifies that the `_load_deck()` function reads weighted and unweighted
+    answers from a deck file, writes the alias table alongside it, reuses the
+    cached table while the deck file is unchanged, and rebuilds it otherwise.
+    """
+
+    deck = tmp_path / 'deck.txt'
+    deck.write_text("3\tYes\nNo\n\n1\tMaybe\tor not\n")
+
+    answers, table = magic_8_ball._load_deck(str(deck))
+    cache = tmp_path / 'deck.txt.alias'
+
+    assert answers == ("Yes", "No", "Maybe\tor not")
+    assert _table_probabilities(table) == pytest.approx([0.6, 0.2, 0.2])
+    assert cache.exists()
+
+    # the cache is used as long as the deck file is unchanged
+    cached_answers, cached_table = magic_8_ball._load_deck(str(deck))
+
+    assert cached_answers == answers
+    assert cached_table._probabilities == table._probabilities
+    assert cached_table._aliases == table._aliases
+
+    deck.write_text("Yes\nNo\n")
+    os.utime(deck, ns=(0, 0))
+    answers, table = magic_8_ball._load_deck(str(deck))
+
+    assert answers == ("Yes", "No")
+    assert _table_probabilities(table) == pytest.approx([0.5, 0.5])
+
+
+@pytest.mark.parametrize('content', (
+    "x\tYes\n", "\tYes\nNo\n", "Yes\nnan\tNo\n", "Yes\ninf\tNo\n",
+    "Yes\n-inf\tNo\n", "Yes\n0\tNo\n", "Yes\n-1\tNo\n",
+))
+def test_load_deck_invalid(tmp_path, content: str):
+    """Tests if `_load_deck()` rejects a deck file with invalid weights.
+
+    Verifies that the `_load_deck()` function rejects weights that are not
+    numbers, or not positive and finite, naming the line they are on, and
+    caches no alias table for the deck.
+    """
+
+    deck = tmp_path / 'deck.txt'
+    deck.write_text(content)
+    line = content.count('\n', 0, content.index('\t')) + 1
+
+    with pytest.raises(ValueError, match=f'invalid weight on line {line}'):
+        magic_8_ball._load_deck(str(deck))
+
+    assert not (tmp_path / 'deck.txt.alias').exists()
+
+
+def test_load_deck_corrupt_cache(tmp_path):
+    """Tests if `_load_deck()` rebuilds a cached table with invalid odds."""
+
+    deck = tmp_path / 'deck.txt'
+    deck.write_text("Yes\nNo\n")
+
+    magic_8_ball._AliasTable(
+        array('d', (math.nan, 1.0)), array('I', (0, 1)),
+    ).save(f'{deck}.alias', os.stat(deck))
+
+    _, table = magic_8_ball._load_deck(str(deck))
+
+    assert _table_probabilities(table) == pytest.approx([0.5, 0.5])
+
+
+@pytest.mark.parametrize('chunk_size', (1, 7, 1 << 20))
+@pytest.mark.parametrize('use_table', (False, True))
+def test_answer_batch_tsv(monkeypatch, chunk_size: int, use_table: bool):
+    """Tests if `_answer_batch()` answers every line, in order, as TSV.
+
+    Verifies that the `_answer_batch()` function writes exactly one line of
+    output per line of input, regardless of how the input is split into
+    chunks, escapes tabs and backslashes in the questions, and draws the same
+    answers for the same seed.
+
+    Args:
+        chunk_size (int): The size of the chunks to read the questions in.
+        use_table (bool): Whether or not to draw answers with an alias table.
+    """
+
+    import io
+
+    monkeypatch.setattr(magic_8_ball, '_BATCH_CHUNK_SIZE', chunk_size)
+
+    answers = ("Yes", "No")
+    table = None
+
+    if use_table:
+        table = magic_8_ball._AliasTable.from_weights((1, 1))
+
+    questions = b"why?\n\nfoo\tbar\\baz\nno newline"
+    outputs = []
+
+    for _ in range(2):
+        output = io.BytesIO()
+        magic_8_ball._answer_batch(io.BytesIO(questions), output, answers,
+                                   table, random.Random(8), 'tsv')
+        outputs.append(output.getvalue())
+
+    lines = outputs[0].decode().splitlines()
+
+    assert outputs[0] == outputs[1]
+    assert [line.rpartition('\t')[0] for line in lines] == [
+        "why?", "", "foo\\tbar\\\\baz", "no newline",
+    ]
+    assert {line.rpartition('\t')[2] for line in lines} <= set(answers)
+
+
+@pytest.mark.parametrize('question', ("why?", 'say "hi"\\', "¿qué?", "a\tb"))
+def test_answer_batch_jsonl(question: str):
+    """Tests if `_answer_batch()` writes valid JSONL.
+
+    Args:
+        question (str): A question to answer.
+    """
+
+    import io
+    import json
+
+    output = io.BytesIO()
+    magic_8_ball._answer_batch(io.BytesIO(f"{question}\n".encode()), output,
+                               ("Yes",), None, random.Random(), 'jsonl')
+
+    assert json.loads(output.getvalue()) == {
+        'question': question, 'answer': "Yes",
+    }
@@ -0,0 +1,122 @@
+import pytest
+from src.pygames import _metrics
+
+
+@pytest.mark.parametrize('value', (0, 1, 31, 32, 33, 1000, 123456789, 1 << 40))
+def test_histogram_record(value: int):
+    """Tests if `Histogram.record()` keeps each value within 6.25% of it.
+
+    Verifies that the bucket that a value is recorded in by the `record()`
+    method in the `_metrics.Histogram` class holds the value, and that the
+    bucket's upper bound is within 6.25% of the value.
+
+    Args:
+        value (int): The value to record.
+    """
+
+    histogram = _metrics.Histogram()
+    histogram.record(value)
+
+    [(upper_bound, total)] = histogram.get_buckets()
+
+    assert total == 1
+    assert value < upper_bound <= max(value + 1, value * 1.0625)
+
+
+def test_histogram_get_quantile():
+    """Tests if `Histogram.get_quantile()` estimates quantiles correctly."""
+
+    histogram = _metrics.Histogram()
+
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 1000
+    assert histogram.sum == 500500 * 1000
+    assert histogram.get_quantile(0.5) == pytest.approx(500000, rel=0.0625)
+    assert histogram.get_quantile(0.99) == pytest.approx(990000, rel=0.0625)
+    assert _metrics.Histogram().get_quantile(0.5) == 0
+
+
+def test_timed():
+    """Tests if `timed()` only records calls while metrics are enabled."""
+
+    @_metrics.timed('foo_seconds', game='bar')
+    def foobar(x: int) -> int:
+        return x * 2
+
+    assert foobar(2) == 4
+
+    registry = _metrics.enable()
+
+    try:
+        assert foobar(3) == 6
+        _metrics.count('foo_total', game='bar')
+    finally:
+        _metrics.disable()
+
+    assert foobar(4) == 8
+    assert registry.get_histogram('foo_seconds', game='bar').count == 1
+
+
+def test_registry_export():
+    """Tests if `Registry.export()` uses the Prometheus text format.
+
+    Verifies that the `export()` method in the `_metrics.Registry` class lists
+    each counter, and each histogram's cumulative buckets (in seconds), sum
+    and count, with their label values escaped.
+    """
+
+    registry = _metrics.Registry()
+    registry.increment(('pygames_games_total', (('game', 'a"b'),)))
+    registry.increment(('pygames_games_total', (('game', 'a"b'),)), 2)
+
+    for nanoseconds in (10, 10, 20):
+        registry.observe(('pygames_render_seconds', ()), nanoseconds)
+
+    assert registry.export() == (
+        '# HELP pygames_games_total Games finished, by outcome\n'
+        '# TYPE pygames_games_total counter\n'
+        'pygames_games_total{game="a\\"b"} 3\n'
+        '# HELP pygames_render_seconds Time taken to draw a frame\n'
+        '# TYPE pygames_render_seconds histogram\n'
+        'pygames_render_seconds_bucket{le="1.1e-08"} 2\n'
+        'pygames_render_seconds_bucket{le="2.1e-08"} 3\n'
+        'pygames_render_seconds_bucket{le="+Inf"} 3\n'
+        'pygames_render_seconds_sum 4e-08\n'
+        'pygames_render_seconds_count 3\n'
+    )
+
+
+def test_export_call(tmp_path):
+    """Tests if `export_call()` writes the metrics recorded during a call."""
+
+    path = tmp_path / 'metrics.prom'
+
+    def foobar():
+        _metrics.count('foo_total')
+        return 'bar'
+
+    assert _metrics.export_call(foobar, str(path)) == 'bar'
+    assert path.read_text() == '# TYPE foo_total counter\nfoo_total 1\n'
+    assert _metrics._registry is None
+
+
+def test_serve():
+    """Tests if `_serve()` serves the exported metrics over HTTP."""
+
+    import urllib.request
+
+    registry = _metrics.Registry()
+    registry.increment(('foo_total', ()))
+    server = _metrics._serve(registry, 'http://127.0.0.1:0')
+
+    try:
+        host, port = server.server_address[:2]
+
+        with urllib.request.urlopen(f'http://{host}:{port}/metrics') as r:
+            assert r.headers['Content-Type'].startswith('text/plain')
+            assert r.read().decode() == registry.export()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,144 @@
+import os
+import pytest
+import sys
+from src.pygames import _application, _plugins
+
+_SNAKE_MODULE = '''
+calls = []
+
+
+def main(length: int = 3, wrap: bool = False):
+    """Play snake.
+
+    Args:
+        length (int): The starting length of the snake.
+        wrap (bool): Whether or not the snake wraps around the edges.
+    """
+
+    calls.append({'length': length, 'wrap': wrap})
+'''
+
+
+def _install(site, name: str, module: str, summary: str):
+    """Installs a fake distribution with a plugin, by writing its metadata.
+
+    Args:
+        site (pathlib.Path): The directory to install the distribution in.
+        name (str): The name of the plugin.
+        module (str): The name of the plugin's module.
+        summary (str): The summary of the distribution.
+    """
+
+    metadata = site / f'{module}-1.0.dist-info'
+    metadata.mkdir()
+    (metadata / 'METADATA').write_text(
+        f"Metadata-Version: 2.1\nName: {module}\nVersion: 1.0\n"
+        f"Summary: {summary}\n"
+    )
+    (metadata / 'entry_points.txt').write_text(
+        f"[{_plugins.ENTRY_POINT_GROUP}]\n{name} = {module}\n"
+    )
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """Creates a directory on ``sys.path`` with a single plugin installed.
+
+    Yields:
+        pathlib.Path: The directory.
+    """
+
+    site = tmp_path / 'site'
+    site.mkdir()
+    (site / 'pygames_snake.py').write_text(_SNAKE_MODULE)
+    _install(site, 'snake', 'pygames_snake', "Play snake on the command-line")
+
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+
+    yield site
+
+    sys.modules.pop('pygames_snake', None)
+
+
+def test_discover(site, monkeypatch):
+    """Tests if `discover()` finds a plugin, then reads it from the index.
+
+    Verifies that the `discover()` function finds the plugins registered
+    under the entry-point group, and saves them to the index, which is read
+    instead of the installed metadata until the environment changes.
+    """
+
+    expected = _plugins.Plugin('snake', 'pygames_snake',
+                               "Play snake on the command-line")
+
+    assert _plugins.discover() == [expected]
+    assert _plugins.get_index_path().exists()
+
+    def scan():
+        raise AssertionError("the installed metadata was read again")
+
+    with monkeypatch.context() as m:
+        m.setattr(_plugins, '_scan', scan)
+        assert _plugins.discover() == [expected]
+
+    _install(site, 'tetris', 'pygames_tetris', "Play tetris")
+    os.utime(site, ns=(0, 0))
+
+    assert [plugin.name for plugin in _plugins.discover()] == \
+        ['snake', 'tetris']
+
+
+def test_discover_concurrent(site):
+    """Tests if `discover()` leaves other processes' index files alone.
+
+    Verifies that rebuilding the index while another process is still
+    writing its own copy of it neither writes over nor moves the other
+    process's temporary file.
+    """
+
+    path = _plugins.get_index_path()
+    path.parent.mkdir(parents=True)
+    other = path.with_name(f'{path.name}.{os.getpid() + 1}.tmp')
+    other.write_text('half-written')
+
+    assert [plugin.name for plugin in _plugins.discover()] == ['snake']
+    assert other.read_text() == 'half-written'
+    assert sorted(path.parent.iterdir()) == [path, other]
+
+
+def test_application_plugin(site):
+    """Tests if a plugin's command runs its module, only imported when run.
+
+    Verifies that the `Application` class registers a command for each
+    plugin without importing it, then parses the command's arguments from
+    the signature of the plugin's `main()` function once it is run.
+    """
+
+    app = _application.Application()
+
+    assert 'pygames_snake' not in sys.modules
+
+    app.run('snake', '-l', '5', '--wrap')
+
+    assert sys.modules['pygames_snake'].calls == [{'length': 5, 'wrap': True}]
+
+
+@pytest.mark.parametrize('argv,expected', (
+    ('snake -x', 'unrecognized arguments'),
+    ('tetris', 'cannot load plugin'),
+    ('hangman -z', 'unrecognized arguments'),
+))
+def test_application_plugin_error(site, argv: str, expected: str):
+    """Tests if bad plugins and arguments raise a `BadArgumentError`.
+
+    Args:
+        argv (str): The argument tokens, separated by whitespace.
+        expected (str): The start of the expected error message.
+    """
+
+    _install(site, 'tetris', 'pygames_tetris', "Play tetris")
+    app = _application.Application()
+
+    with pytest.raises(_application.BadArgumentError, match=expected):
+        app.run(*argv.split())
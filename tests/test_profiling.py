@@ -0,0 +1,61 @@
+from src.pygames import _profiling
+
+
+def test_profile_call(tmp_path, capsys):
+    """Tests if `profile_call()` saves a profile and a summary of a function.
+
+    Verifies that the `profile_call()` function returns the value returned
+    by the profiled function, and saves both a '.pstats' file (readable by
+    the `pstats` module) and a text summary listing the profiled function.
+    """
+
+    import pstats
+
+    def foobar(x: int) -> int:
+        return sum(range(x))
+
+    path = tmp_path / 'profile.pstats'
+
+    assert _profiling.profile_call(foobar, str(path), x=10) == 45
+    assert 'foobar' in (tmp_path / 'profile.pstats.txt').read_text()
+    assert any(
+        function == 'foobar' for _, _, function in pstats.Stats(str(path)).stats
+    )
+    assert str(path) in capsys.readouterr().err
+
+
+def test_profile_call_already_profiling(tmp_path, monkeypatch, capsys):
+    """Tests if `profile_call()` saves the profile of the whole process.
+
+    Verifies that the `profile_call()` function, when the whole process is
+    already being profiled, still saves a profile to its path (from the
+    process's profiler), and leaves the process's profiler running.
+    """
+
+    import cProfile
+    import pstats
+
+    def foobar() -> str:
+        return 'foo'
+
+    def after():
+        pass
+
+    profiler = cProfile.Profile()
+    monkeypatch.setattr(_profiling, '_active_profiler', profiler)
+    path = tmp_path / 'profile.pstats'
+
+    profiler.enable()
+    result = _profiling.profile_call(foobar, str(path))
+    after()
+    profiler.disable()
+
+    assert result == 'foo'
+    assert str(path) in capsys.readouterr().err
+
+    saved = {function for _, _, function in pstats.Stats(str(path)).stats}
+    profiled = {function for _, _, function in pstats.Stats(profiler).stats}
+
+    assert 'foobar' in saved
+    assert 'after' not in saved
+    assert {'foobar', 'after'} <= profiled
@@ -0,0 +1,137 @@
+import io
+import pytest
+from src.pygames import _rendering
+
+
+class _CountingStream(io.StringIO):
+    """An in-memory text stream that counts its `write()` calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.write_calls = 0
+
+    def write(self, text: str) -> int:
+        self.write_calls += 1
+        return super().write(text)
+
+
+@pytest.fixture
+def stream() -> _CountingStream:
+    """Creates a new `_CountingStream` object.
+
+    Returns:
+        _CountingStream: The aforementioned object.
+    """
+
+    return _CountingStream()
+
+
+def test_renderer_draw_single_write(stream):
+    """Tests if `Renderer.draw()` writes each frame in a single call.
+
+    Verifies that the `draw()` method in the `_rendering.Renderer` class makes
+    exactly one `write()` call per frame, and that the `writes` and
+    `bytes_written` counters match what was actually written.
+    """
+
+    renderer = _rendering.Renderer(stream, ansi=True)
+
+    for n in range(1, 4):
+        renderer.draw(['foo', 'bar', f'baz {n}'])
+
+    assert stream.write_calls == 3
+    assert renderer.writes == 3
+    assert renderer.bytes_written == len(stream.getvalue().encode())
+
+
+@pytest.mark.parametrize('frames,expected', (
+    ((['a', 'b'], ['a', 'b', 'c']), 'a\nb\nc'),
+    ((['a', 'b'], ['x', 'y']), 'a\nb\nx\ny'),
+    ((['a'], ['a']), 'a'),
+))
+def test_renderer_draw_plain(stream, frames: tuple, expected: str):
+    """Tests if `Renderer.draw()` appends frames without escape sequences.
+
+    Verifies that the `draw()` method in the `_rendering.Renderer` class only
+    writes the lines that extend the previous frame, or writes the new frame
+    in full on the next row, when the output stream is not a terminal.
+
+    Args:
+        frames (tuple): The frames to draw, in order.
+        expected (str): The text expected to be written to the stream.
+    """
+
+    renderer = _rendering.Renderer(stream, ansi=False)
+
+    for frame in frames:
+        renderer.draw(frame)
+
+    assert stream.getvalue() == expected
+
+
+def test_renderer_draw_ansi_diff(stream):
+    """Tests if `Renderer.draw()` only redraws the lines that changed.
+
+    Verifies that the `draw()` method in the `_rendering.Renderer` class moves
+    the cursor up to the first changed line of the previous frame, and skips
+    the unchanged lines that follow it.
+    """
+
+    renderer = _rendering.Renderer(stream, ansi=True)
+    renderer.draw(['title', 'x 1', 'same', 'x 2'])
+    stream.seek(0)
+    stream.truncate()
+
+    renderer.draw(['title', 'y 1', 'same', 'x 2'])
+
+    assert stream.getvalue() == '\x1b[2A\ry 1\x1b[K\n\nx 2\x1b[K'
+
+
+def test_renderer_draw_ansi_shrink(stream):
+    """Tests if `Renderer.draw()` clears rows left over from a taller frame."""
+
+    renderer = _rendering.Renderer(stream, ansi=True)
+    renderer.draw(['a', 'b', 'c'])
+    stream.seek(0)
+    stream.truncate()
+
+    renderer.draw(['a'])
+
+    assert stream.getvalue() == '\x1b[2A\ra\x1b[K\x1b[J'
+
+
+def test_renderer_input(stream, monkeypatch):
+    """Tests if `Renderer.input()` keeps track of the user's input.
+
+    Verifies that the `input()` method in the `_rendering.Renderer` class
+    returns the user's input, and records it as part of the current frame so
+    that the next frame can continue from it.
+    """
+
+    monkeypatch.setattr('builtins.input', lambda *args: 'why?')
+    renderer = _rendering.Renderer(stream, ansi=False)
+
+    assert renderer.input(['question: ']) == 'why?'
+    assert renderer.lines == ['question: why?']
+
+    renderer.draw([*renderer.lines, 'answer'], final=True)
+
+    assert stream.getvalue() == 'question: answer\n'
+    assert stream.write_calls == 2
+
+
+def test_renderer_input_empty(stream, monkeypatch):
+    """Tests if `Renderer.draw()` redraws a frame after an empty input.
+
+    Verifies that the `draw()` method in the `_rendering.Renderer` class
+    draws the same frame again after the user enters an empty line, so that
+    the prompt is shown again, even when the output stream is not a terminal.
+    """
+
+    monkeypatch.setattr('builtins.input', lambda *args: '')
+    renderer = _rendering.Renderer(stream, ansi=False)
+
+    renderer.input(['error', 'prompt: '])
+    renderer.input(['error', 'prompt: '])
+
+    assert stream.getvalue() == 'error\nprompt: error\nprompt: '
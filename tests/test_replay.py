@@ -0,0 +1,137 @@
+import json
+import pytest
+from src.pygames import replay
+
+
+def _write_journal(path, events: tuple):
+    """Writes the provided events to a journal file, one per line.
+
+    Args:
+        path: The path to the journal file.
+        events (tuple): The events to write.
+    """
+
+    path.write_text(''.join(json.dumps(event) + '\n' for event in events))
+
+
+@pytest.mark.parametrize('outcome,lives,expected', (
+    ('win', 7, []),
+    ('lose', 7, ["game 1 (hangman): expected a lose with 7 lives, got a win "
+                 "with 7 lives"]),
+    ('win', 8, ["game 1 (hangman): expected a win with 8 lives, got a win "
+                "with 7 lives"]),
+))
+def test_replay_journal_hangman(tmp_path, outcome, lives, expected: list):
+    """Tests if `_replay_journal()` verifies the outcome of a hangman game.
+
+    Args:
+        outcome (str): The outcome recorded in the journal.
+        lives (int): The number of lives recorded in the journal.
+        expected (list): The mismatches expected to be reported.
+    """
+
+    path = tmp_path / 'journal.jsonl'
+    _write_journal(path, (
+        {'event': 'start', 'game': 'hangman', 'seed': 1,
+         'config': {'lives': 8}, 'word': 'apple'},
+        *({'event': 'guess', 'guess': guess} for guess in 'axple'),
+        {'event': 'end', 'outcome': outcome, 'lives': lives},
+    ))
+
+    assert replay._replay_journal(str(path)) == (1, expected)
+
+
+def test_replay_journal_hangman_timeout(tmp_path):
+    """Tests if `_replay_journal()` takes a life for each timed out turn."""
+
+    path = tmp_path / 'journal.jsonl'
+    _write_journal(path, (
+        {'event': 'start', 'game': 'hangman', 'seed': 1,
+         'config': {'lives': 2}, 'word': 'apple'},
+        {'event': 'guess', 'guess': 'a'},
+        {'event': 'timeout'},
+        {'event': 'timeout'},
+        {'event': 'end', 'outcome': 'lose', 'lives': 0},
+    ))
+
+    assert replay._replay_journal(str(path)) == (1, [])
+
+
+def test_replay_journal_tic_tac_toe(tmp_path):
+    """Tests if `_replay_journal()` replays invalid moves like the game does.
+
+    Verifies that invalid and repeated moves recorded in a tic-tac-toe journal
+    do not pass the turn to the next player when replayed.
+    """
+
+    path = tmp_path / 'journal.jsonl'
+    _write_journal(path, (
+        {'event': 'start', 'game': 'tic-tac-toe', 'config': {}, 'first': 'O'},
+        *({'event': 'move', 'move': move}
+          for move in ('1', '1', 'x', '4', '2', '5', '3')),
+        {'event': 'end', 'outcome': 'O'},
+    ))
+
+    assert replay._replay_journal(str(path)) == (1, [])
+
+
+def test_replay_journal_ultimate_tic_tac_toe(tmp_path):
+    """Tests if `_replay_journal()` replays a game of ultimate tic-tac-toe.
+
+    Verifies that the moves recorded in an ultimate tic-tac-toe journal,
+    including invalid moves and moves without a board, are replayed like the
+    game does.
+    """
+
+    path = tmp_path / 'journal.jsonl'
+    _write_journal(path, (
+        {'event': 'start', 'game': 'ultimate-tic-tac-toe', 'config': {},
+         'first': 'X'},
+        *({'event': 'move', 'move': move}
+          for move in ('55', '55', '1', '5 9', 'x', '99')),
+        {'event': 'end', 'outcome': 'quit'},
+    ))
+
+    assert replay._replay_journal(str(path)) == (1, [])
+
+
+def test_replay_journal_corrupted_line(tmp_path):
+    """Tests if `_replay_journal()` reports a corrupted line in a game.
+
+    Verifies that a line that is not a valid event, in the middle of a game,
+    stops the replay with the line's number, instead of being reported as
+    a mismatch of that game.
+    """
+
+    path = tmp_path / 'journal.jsonl'
+    _write_journal(path, (
+        {'event': 'start', 'game': 'hangman', 'seed': 1,
+         'config': {'lives': 8}, 'word': 'apple'},
+        {'event': 'guess', 'guess': 'a'},
+    ))
+
+    with open(path, 'a') as f:
+        f.write('{"event": "guess", "guess": \n')
+
+    with pytest.raises(ValueError, match='corrupted journal on line 3'):
+        replay._replay_journal(str(path))
+
+
+def test_replay_main_mismatch(tmp_path, capsys):
+    """Tests if `replay.main()` exits with an error when outcomes differ."""
+
+    path = tmp_path / 'journal.jsonl'
+    _write_journal(path, (
+        {'event': 'start', 'game': 'chess', 'config': {}},
+        {'event': 'start', 'game': 'magic-8-ball', 'seed': 4,
+         'config': {'deck': ''}},
+        {'event': 'answer', 'answer': 'Probably not'},
+    ))
+
+    with pytest.raises(SystemExit, match='2 of 2 games'):
+        replay.main(str(path))
+
+    assert capsys.readouterr().out == (
+        "game 1: unknown game 'chess'\n"
+        "game 2 (magic-8-ball): answer #1 differs\n"
+    )
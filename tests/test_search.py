@@ -0,0 +1,201 @@
+import pytest
+import random
+from src.pygames import _search
+
+
+class _Nim:
+    """A game of Nim: players take 1 to 3 stones, and whoever takes the last
+    stone wins. Leaving a multiple of 4 stones is always a winning move."""
+
+    def __init__(self, stones: int):
+        self.stones = stones
+        self.winner = None
+        self._history = []
+
+    def get_moves(self) -> list:
+        if self.winner:
+            return []
+
+        return [n for n in (1, 2, 3) if n <= self.stones]
+
+    def play(self, move: int):
+        self._history.append(move)
+        self.stones -= move
+        self.winner = 'last' if not self.stones else None
+
+    def undo(self):
+        self.stones += self._history.pop()
+        self.winner = None
+
+    def evaluate(self) -> int:
+        return 0
+
+    @property
+    def key(self) -> int:
+        # the stones left are all that matter, whoever's turn it is
+        return self.stones
+
+
+@pytest.mark.parametrize('stones,expected', ((5, 1), (6, 2), (7, 3), (10, 2)))
+def test_search_forced_win(stones: int, expected: int):
+    """Tests if `Searcher.search()` finds the winning move of a decided game.
+
+    Args:
+        stones (int): The number of stones left.
+        expected (int): The winning move.
+    """
+
+    position = _Nim(stones)
+    result = _search.Searcher(position).search(1000, rng=random.Random(0))
+
+    assert result.move == expected
+    assert result.score > _search.WIN_SCORE - 1000
+    assert position.stones == stones
+
+
+def test_search_time_budget():
+    """Tests if `Searcher.search()` returns a legal move within its budget.
+
+    Verifies that the search of a game too deep to solve is cut off once its
+    time budget is spent, and still returns the best move found so far.
+    """
+
+    position = _Nim(10000)
+    result = _search.Searcher(position).search(20)
+
+    assert result.move in (1, 2, 3)
+    assert result.depth >= 1
+    assert result.seconds < 0.05
+    assert position.stones == 10000 and not position._history
+
+
+def test_search_game_over():
+    """Tests if `Searcher.search()` rejects a game that has already ended."""
+
+    with pytest.raises(ValueError):
+        _search.Searcher(_Nim(0)).search(10)
+
+
+@pytest.mark.parametrize('stones', (5, 10, 23))
+def test_search_transposition_table(stones: int):
+    """Tests if a transposition table leaves the result of a search unchanged.
+
+    Verifies that a search to a fixed depth with a transposition table finds
+    the same move and score as one without, while visiting fewer positions,
+    as the same numbers of stones are reached through many orders of moves.
+
+    Args:
+        stones (int): The number of stones left.
+    """
+
+    table = _search.TranspositionTable(1)
+    expected = _search.Searcher(_Nim(stones)).search(1000, max_depth=8)
+    result = _search.Searcher(_Nim(stones), table).search(1000, max_depth=8)
+
+    assert (result.move, result.score) == (expected.move, expected.score)
+    assert result.nodes < expected.nodes
+    assert 0 < result.hit_rate == table.hit_rate <= 1
+
+
+def test_transposition_table_replacement():
+    """Tests if each bucket keeps the deepest entry, and the latest one.
+
+    Verifies that a shallower entry does not replace a deeper one of the same
+    search in the first entry of a bucket, but replaces the second, and that
+    entries of an older search are always replaced.
+    """
+
+    table = _search.TranspositionTable(1)
+    buckets = 2**20 // _search._BUCKET.size
+    deep, shallow, latest = 7, 7 + buckets, 7 + 2 * buckets
+
+    table.store(deep, 10, 1, 5, _search._EXACT)
+    table.store(shallow, 20, 2, 2, _search._LOWER)
+    table.store(latest, 30, 3, 1, _search._UPPER)
+
+    assert table.lookup(deep) == (10, 1, 5, _search._EXACT)
+    assert table.lookup(shallow) is None
+    assert table.lookup(latest) == (30, 3, 1, _search._UPPER)
+    assert table.hit_rate == 2 / 3
+
+    table.new_search()
+    table.store(shallow, 20, 2, 2, _search._LOWER)
+
+    assert table.lookup(shallow) == (20, 2, 2, _search._LOWER)
+    assert table.lookup(deep) is None
+    assert len(table._buffer) == 2**20
+
+
+def test_transposition_table_size():
+    """Tests if a transposition table rejects sizes of less than 1 MB."""
+
+    with pytest.raises(ValueError):
+        _search.TranspositionTable(0)
+
+
+def test_transposition_table_torn_entry():
+    """Tests if an entry mixing the halves of two writes is never found.
+
+    Verifies that an entry whose data was overwritten by another position's
+    (as a write racing another process may leave it) no longer matches the
+    key of either position.
+    """
+
+    table = _search.TranspositionTable(1)
+    buckets = 2**20 // _search._BUCKET.size
+    first, second = 7, 7 + buckets
+    offset = 7 * _search._BUCKET.size
+
+    table.store(first, 10, 1, 5, _search._EXACT)
+    first_half, _ = _search._ENTRY.unpack_from(table._buffer, offset)
+    table.new_search()
+    table.store(second, 20, 2, 5, _search._EXACT)
+    _, second_half = _search._ENTRY.unpack_from(table._buffer, offset)
+    _search._ENTRY.pack_into(table._buffer, offset, first_half, second_half)
+
+    assert table.lookup(first) is None
+    assert table.lookup(second) is None
+
+
+def test_transposition_table_shared():
+    """Tests if a table in shared memory is found by the name of its block.
+
+    Verifies that entries stored through the allocated table are found
+    through an attached one and the other way round, and that closing the
+    attached table leaves the allocated one intact.
+    """
+
+    table = _search.TranspositionTable(1, shared=True)
+
+    try:
+        other = _search.TranspositionTable.attach(table.name)
+        table.store(7, 10, 1, 5, _search._EXACT)
+        other.store(8, 20, 2, 3, _search._LOWER)
+
+        assert other.lookup(7) == (10, 1, 5, _search._EXACT)
+        other.close()
+        assert table.lookup(8) == (20, 2, 3, _search._LOWER)
+    finally:
+        table.close()
+
+    assert table.name is None
+
+
+@pytest.mark.parametrize('processes', (1, 2))
+def test_parallel_search(processes: int):
+    """Tests if a parallel search finds the same move as a single search.
+
+    Args:
+        processes (int): The number of processes to search with.
+    """
+
+    with _search.ParallelSearcher(processes, 1) as searcher:
+        for stones in (5, 6, 7):
+            result = searcher.search(_Nim, (stones,), 2000, max_depth=12,
+                                     rng=random.Random(0))
+
+            assert result.move == stones % 4
+            assert result.score > _search.WIN_SCORE - 1000
+
+    with pytest.raises(ValueError):
+        _search.ParallelSearcher(0, 1)
@@ -0,0 +1,82 @@
+import pytest
+from src.pygames import _snapshot, hangman, tic_tac_toe
+
+
+def _create_game_states() -> list:
+    """Creates a mix of in-progress hangman and tic-tac-toe game states.
+
+    Returns:
+        list: The game states, with runs of each game of varying lengths.
+    """
+
+    game_states = []
+
+    for n, word in enumerate(('apple', 'banana', 'cherry', 'damson')):
+        game_state = hangman._GameState(word, 8)
+        game_state.try_guess('a')
+        game_states.append(game_state)
+
+        for _ in range(n):
+            game_state = tic_tac_toe._GameState()
+            game_state.add_mark(n + 1, tic_tac_toe._Mark.Cross)
+            game_states.append(game_state)
+
+    return game_states
+
+
+def _describe(game_state) -> tuple:
+    """Describes a game state, so that it can be compared to another one."""
+
+    if isinstance(game_state, hangman._GameState):
+        return (game_state.summarize(), game_state.guess_count)
+
+    return (game_state.get_grid(), game_state.winner)
+
+
+def test_dump_load():
+    """Tests if `load()` restores every game state encoded by `dump()`."""
+
+    game_states = _create_game_states()
+    restored = _snapshot.load(_snapshot.dump(game_states))
+
+    assert [type(state) for state in restored] == \
+        [type(state) for state in game_states]
+    assert [_describe(state) for state in restored] == \
+        [_describe(state) for state in game_states]
+
+
+def test_dump_load_empty():
+    """Tests if an empty set of snapshots is restored as an empty list."""
+
+    assert _snapshot.load(_snapshot.dump([])) == []
+
+
+def test_dump_unsupported():
+    """Tests if `dump()` rejects the states of games without snapshots."""
+
+    with pytest.raises(ValueError):
+        _snapshot.dump([object()])
+
+
+@pytest.mark.parametrize('cut', (0, 3, 10, -1))
+def test_load_corrupted(cut: int):
+    """Tests if `load()` rejects truncated snapshots.
+
+    Args:
+        cut (int): The position to truncate the snapshots at.
+    """
+
+    data = _snapshot.dump(_create_game_states())
+
+    with pytest.raises(ValueError, match="corrupted snapshot"):
+        _snapshot.load(data[:cut])
+
+
+def test_load_unknown_tag():
+    """Tests if `load()` rejects a run with an unknown tag."""
+
+    data = bytearray(_snapshot.dump(_create_game_states()))
+    data[8:10] = b'ZZ'
+
+    with pytest.raises(ValueError, match="corrupted snapshot"):
+        _snapshot.load(bytes(data))
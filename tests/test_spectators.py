@@ -0,0 +1,177 @@
+import asyncio
+import io
+import pytest
+import random
+import socket
+import time
+from src.pygames import _journal, _spectators, tic_tac_toe
+from src.pygames._rendering import Renderer
+
+
+class _Recorder:
+    """A stand-in for the spectators of a game, that keeps its frames."""
+
+    def __init__(self):
+        self.frames = []
+
+    def publish(self, lines: list):
+        self.frames.append(lines)
+
+
+def _connect(broadcaster: _spectators.Broadcaster) -> socket.socket:
+    """Connects a spectator, and waits until they are accepted."""
+
+    count = broadcaster.spectators
+    connection = socket.create_connection(broadcaster.address, timeout=5)
+    deadline = time.monotonic() + 5
+
+    while broadcaster.spectators == count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    return connection
+
+
+def _receive(connection: socket.socket, size: int) -> bytes:
+    """Receives an exact number of bytes from a connection."""
+
+    data = b''
+
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        assert chunk
+        data += chunk
+
+    return data
+
+
+@pytest.mark.parametrize(('address', 'expected'), [
+    ('8024', ('127.0.0.1', 8024)),
+    (':8024', ('127.0.0.1', 8024)),
+    ('0.0.0.0:0', ('0.0.0.0', 0)),
+    ('[::1]:8024', ('[::1]', 8024)),
+])
+def test_parse_address(address: str, expected: tuple):
+    """Tests if `parse_address()` splits an address into host and port."""
+
+    assert _spectators.parse_address(address) == expected
+
+
+@pytest.mark.parametrize('address', ['', 'localhost', 'localhost:http',
+                                     '127.0.0.1:65536', '127.0.0.1:-1'])
+def test_parse_address_invalid(address: str):
+    """Tests if `parse_address()` rejects addresses without a valid port."""
+
+    with pytest.raises(ValueError):
+        _spectators.parse_address(address)
+
+
+def test_broadcaster_fan_out():
+    """Tests if `Broadcaster` sends the same frames to every spectator.
+
+    Verifies that every spectator who keeps up is sent each frame published,
+    in order, and that spectators who connect late are sent the latest
+    frame first.
+    """
+
+    frames = [['1'], ['2', 'X wins!']]
+    expected = [
+        _spectators._CLEAR_SCREEN + b'1\n',
+        _spectators._CLEAR_SCREEN + b'2\nX wins!\n',
+    ]
+
+    with _spectators.Broadcaster() as broadcaster:
+        early = [_connect(broadcaster) for _ in range(3)]
+
+        for lines, data in zip(frames, expected):
+            broadcaster.publish(lines)
+
+            for connection in early:
+                assert _receive(connection, len(data)) == data
+
+        late = _connect(broadcaster)
+        assert _receive(late, len(expected[-1])) == expected[-1]
+
+    assert broadcaster.frames == 2
+    assert broadcaster.dropped == 0
+
+
+def test_broadcaster_put_latest():
+    """Tests if `Broadcaster` only keeps the latest frame waiting to be sent.
+
+    Verifies that each frame queued for a spectator who has yet to be sent
+    the previous one replaces it, and is counted as dropped.
+    """
+
+    broadcaster = _spectators.Broadcaster()
+    queue = asyncio.Queue(maxsize=1)
+
+    for data in (b'1', b'2', b'3'):
+        broadcaster._put_latest(queue, data)
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == b'3'
+    assert broadcaster.dropped == 2
+
+
+def test_broadcaster_slow_spectator():
+    """Tests if a slow spectator skips frames, without holding others back.
+
+    Verifies that a spectator who never reads their frames does not keep
+    the other spectators from receiving every frame, and that the frames
+    they could not be sent in time are dropped rather than queued forever.
+    """
+
+    # frames larger than a connection can buffer, so that they back up
+    frames = [[chr(65 + n % 26) * (1 << 18)] for n in range(64)]
+    size = len(_spectators._CLEAR_SCREEN) + (1 << 18) + 1
+
+    with _spectators.Broadcaster() as broadcaster:
+        slow = _connect(broadcaster)
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        fast = _connect(broadcaster)
+
+        for lines in frames:
+            broadcaster.publish(lines)
+            data = _receive(fast, size)
+            assert data.endswith(lines[0].encode() + b'\n')
+
+    assert broadcaster.dropped > 0
+    slow.close()
+    fast.close()
+
+
+def test_broadcaster_address_in_use():
+    """Tests if `Broadcaster` raises a `ValueError` if its port is taken."""
+
+    with _spectators.Broadcaster() as broadcaster:
+        with pytest.raises(ValueError, match='cannot listen'):
+            with _spectators.Broadcaster(*broadcaster.address):
+                pass
+
+
+def test_play_game_spectators(monkeypatch):
+    """Tests if `tic_tac_toe._play_game()` sends each move to spectators.
+
+    Verifies that the spectators are sent the empty grid when the game
+    starts, then the grid after each valid move until the game ends, but
+    nothing after invalid ones.
+    """
+
+    moves = iter(['1', '1', '5', '2', '9', '3'])
+    monkeypatch.setattr('builtins.input', lambda *args: next(moves))
+
+    spectators = _Recorder()
+    game_state = tic_tac_toe._GameState()
+    order = [tic_tac_toe._Mark.Cross, tic_tac_toe._Mark.Nought]
+
+    with _journal.Journal('') as log:
+        assert not tic_tac_toe._play_game(
+            Renderer(io.StringIO()), game_state, order, False,
+            random.Random(0), log, spectators=spectators,
+        )
+
+    assert game_state.winner == tic_tac_toe._Mark.Cross
+    assert len(spectators.frames) == 5
+    assert spectators.frames[0][-1] == "X's turn"
+    assert spectators.frames[1][-2:] == ["X marked space 1", "O's turn"]
+    assert spectators.frames[-1][-2:] == ["O marked space 9", "X's turn"]
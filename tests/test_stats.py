@@ -0,0 +1,122 @@
+import pytest
+from src.pygames import _stats
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Creates the path to a new, empty statistics database.
+
+    Returns:
+        pathlib.Path: The aforementioned path.
+    """
+
+    return tmp_path / 'stats' / 'stats.sqlite3'
+
+
+def test_connect_wal(database):
+    """Tests if `connect()` opens the statistics database in WAL mode."""
+
+    connection = _stats.connect(database)
+    mode, = connection.execute('PRAGMA journal_mode').fetchone()
+    connection.close()
+
+    assert mode == 'wal'
+
+
+def test_connect_invalid(database):
+    """Tests if `connect()` rejects a database that cannot be opened."""
+
+    database.parent.parent.joinpath('file').write_text('')
+
+    with pytest.raises(ValueError, match='cannot open statistics database'):
+        _stats.connect(database.parent.parent / 'file' / 'stats.sqlite3')
+
+    database.parent.mkdir()
+    database.write_bytes(b'not a database' * 100)
+
+    with pytest.raises(ValueError, match='cannot open statistics database'):
+        _stats.connect(database)
+
+
+def test_stats_recorder(database):
+    """Tests if `StatsRecorder` keeps each player's totals up to date.
+
+    Verifies that the outcomes recorded by the `_stats.StatsRecorder` class
+    are all written once it is closed, including the number of games played,
+    won, lost and drawn, the total number of guesses, and the current and
+    best winning streaks.
+    """
+
+    outcomes = ('win', 'win', 'lose', 'win', 'win', 'win', 'lose')
+
+    with _stats.StatsRecorder('alice', database) as recorder:
+        for outcome in outcomes:
+            recorder.record('hangman', outcome, 10)
+
+        recorder.record('tic-tac-toe', 'draw')
+
+    assert recorder.error is None
+
+    connection = _stats.connect(database)
+
+    assert _stats.get_player_stats(connection, 'alice') == [
+        ('hangman', 'alice', 7, 5, 2, 0, 70, 0, 3),
+        ('tic-tac-toe', 'alice', 1, 0, 0, 1, 0, 0, 0),
+    ]
+
+    count, = connection.execute('SELECT COUNT(*) FROM games').fetchone()
+    connection.close()
+
+    assert count == 8
+
+
+def test_stats_recorder_disabled(database):
+    """Tests if a `StatsRecorder` without a player records nothing."""
+
+    with _stats.StatsRecorder('', database) as recorder:
+        recorder.record('hangman', 'win', 3)
+
+    assert not database.exists()
+
+
+@pytest.mark.parametrize('by,expected', (
+    ('wins', ['carol', 'bob', 'alice']),
+    ('win-rate', ['alice', 'carol', 'bob']),
+    ('guesses', ['bob', 'alice', 'carol']),
+    ('streak', ['carol', 'bob', 'alice']),
+))
+def test_get_leaderboard(database, by: str, expected: list):
+    """Tests if `get_leaderboard()` ranks the players correctly.
+
+    Verifies that the `get_leaderboard()` function returns the top players of
+    a game in the right order, and reads them through an index rather than
+    sorting the whole table.
+
+    Args:
+        by (str): The leaderboard to read.
+        expected (list): The names of the players, in the expected order.
+    """
+
+    games = {
+        'alice': (('win', 5),),
+        'bob': (('win', 1), ('win', 1), ('lose', 1), ('lose', 1)),
+        'carol': (('win', 9), ('win', 9), ('win', 9), ('lose', 9)),
+    }
+
+    for player, outcomes in games.items():
+        with _stats.StatsRecorder(player, database) as recorder:
+            for outcome, guesses in outcomes:
+                recorder.record('hangman', outcome, guesses)
+
+    connection = _stats.connect(database)
+    rows = _stats.get_leaderboard(connection, 'hangman', by, 3)
+
+    plan = connection.execute(
+        f'EXPLAIN QUERY PLAN SELECT * FROM players WHERE game = ? '
+        f'ORDER BY {_stats.LEADERBOARDS[by]} LIMIT ?', ('hangman', 3),
+    ).fetchall()
+
+    connection.close()
+
+    assert [row[1] for row in rows] == expected
+    assert not any('TEMP B-TREE' in row[-1] for row in plan)
@@ -0,0 +1,112 @@
+import os
+import pytest
+import random
+from src.pygames import stress
+
+
+@pytest.mark.parametrize('game', ('hangman', 'magic-8-ball', 'tic-tac-toe'))
+@pytest.mark.parametrize('tty', (False, True))
+def test_run_session(tmp_path, game: str, tty: bool):
+    """Tests if `_run_session()` plays a whole session of a game.
+
+    Verifies that the `_run_session()` function enters every line of random
+    input (unless it ends the session early), times each turn, and ends the
+    session with an EOF that the game exits cleanly on, both through pipes
+    and through a pseudo-terminal.
+
+    Args:
+        game (str): The name of the game to play.
+        tty (bool): Whether or not to run the game in a pseudo-terminal.
+    """
+
+    server = stress._serve_wordlist(0)
+    host, port = server.server_address[:2]
+    env = {
+        **os.environ,
+        'PYGAMES_WORDLIST_URL': f'http://{host}:{port}/',
+        'XDG_CACHE_HOME': str(tmp_path),
+    }
+
+    try:
+        session = stress._run_session(game, 8, 5, (), tty, env)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert session.error == ''
+    assert session.startup > 0
+    assert 1 <= len(session.latencies) <= 5
+
+
+def test_run_session_shared_wordlist(tmp_path):
+    """Tests if hangman sessions use the wordlist shared by `_share_wordlist()`.
+
+    Verifies that a session of hangman started with the path of a shared
+    index in its environment picks its words from it, without fetching the
+    wordlist (whose server is already shut down) or caching its own index.
+    """
+
+    server = stress._serve_wordlist(0)
+    host, port = server.server_address[:2]
+    url = f'http://{host}:{port}/'
+
+    try:
+        shared = stress._share_wordlist(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    env = {
+        **os.environ,
+        'PYGAMES_WORDLIST_URL': url,
+        'PYGAMES_WORDLIST_SHARED': shared.path,
+        'XDG_CACHE_HOME': str(tmp_path),
+    }
+
+    with shared:
+        session = stress._run_session('hangman', 8, 5, (), False, env)
+
+    assert session.error == ''
+    assert session.rss > 0
+    assert not list(tmp_path.rglob('*.idx'))
+
+
+def test_run_session_script():
+    """Tests if `_run_session()` enters the lines of a script, in order."""
+
+    session = stress._run_session('tic-tac-toe', 8, 10, ('', 'x', '5', '5'),
+                                  False, dict(os.environ))
+
+    assert session.error == ''
+    assert len(session.latencies) == 4
+
+
+@pytest.mark.parametrize('game', ('hangman', 'magic-8-ball', 'tic-tac-toe'))
+def test_random_input(game: str):
+    """Tests if the random input of each game is a single line of text."""
+
+    _, generate = stress._GAMES[game]
+    rng = random.Random(8)
+
+    for _ in range(100):
+        assert '\n' not in generate(rng)
+
+
+def test_summarize():
+    """Tests if `_summarize()` counts the turns and failures of sessions."""
+
+    sessions = [stress._Session('hangman', n) for n in range(3)]
+    sessions[0].latencies = [1000, 2000, 3000]
+    sessions[1].latencies = [4000]
+    sessions[2].error = 'foo'
+    sessions[0].rss = 3000
+    sessions[1].rss = 1000
+
+    summary = stress._summarize(sessions, 2.0)
+
+    assert summary['sessions'] == 3
+    assert summary['failed'] == 1
+    assert summary['turns'] == 4
+    assert summary['turns_per_second'] == 2.0
+    assert summary['rss'] == 2000
+    assert summary['latency']['max'] == pytest.approx(4e-6, rel=0.0625)
@@ -0,0 +1,160 @@
+import pytest
+import random
+from src.pygames import _tablebase, tablebase, tic_tac_toe
+
+
+def _solve_classic(path) -> _tablebase.Tablebase:
+    """Generates the tablebase of the classic 3x3 grid, in a single process.
+    """
+
+    solved = _tablebase.Tablebase(path, 3, 3)
+    solved.generate()
+
+    return solved
+
+
+def test_generate(tmp_path):
+    """Tests if the tablebase of the classic grid matches its solution.
+
+    Verifies that every position reachable in a game that crosses start has
+    the value that `tic_tac_toe._evaluate()` scores it.
+    """
+
+    seen = set()
+    values = {1: _tablebase.WIN, 0: _tablebase.DRAW, -1: _tablebase.LOSS}
+
+    with _solve_classic(tmp_path / 'classic.tbl') as solved:
+        assert solved.complete
+
+        def visit(spaces: list, turn: int):
+            if tuple(spaces) in seen:
+                return None
+
+            seen.add(tuple(spaces))
+            score = tic_tac_toe._evaluate(tuple(spaces), turn)
+            sign = (score > 0) - (score < 0)
+
+            assert solved.lookup(spaces) == values[sign]
+
+            for a, b, c in tic_tac_toe._LINES:
+                if spaces[a] and spaces[a] == spaces[b] == spaces[c]:
+                    return None
+
+            for n in range(9):
+                if not spaces[n]:
+                    spaces[n] = turn
+                    visit(spaces, 3 - turn)
+                    spaces[n] = 0
+
+        visit([0] * 9, 2)
+
+    assert len(seen) == 5478
+
+
+def test_generate_resume(tmp_path):
+    """Tests if an interrupted generation resumes where it stopped.
+
+    Verifies that a generation stopped after a few layers, then resumed in
+    several processes, writes the same file as an uninterrupted one.
+    """
+
+    expected = tmp_path / 'expected.tbl'
+    _solve_classic(expected).close()
+
+    def interrupt(marks: int):
+        if marks == 6:
+            raise KeyboardInterrupt()
+
+    path = tmp_path / 'resumed.tbl'
+
+    with _tablebase.Tablebase(path, 3, 3) as solved:
+        with pytest.raises(KeyboardInterrupt):
+            solved.generate(1, interrupt)
+
+        assert not solved.complete
+
+    layers = []
+
+    with _tablebase.Tablebase(path, 3, 3) as solved:
+        solved.generate(2, layers.append)
+
+    assert layers == [5, 4, 3, 2, 1, 0]
+    assert path.read_bytes() == expected.read_bytes()
+
+
+def test_choose_move(tmp_path):
+    """Tests if `Tablebase.choose_move()` wins when it can, and blocks."""
+
+    with _solve_classic(tmp_path / 'classic.tbl') as solved:
+        # crosses on the first two spaces of the top row, noughts to move
+        spaces = [2, 2, 0, 0, 1, 0, 0, 0, 0]
+
+        assert solved.lookup(spaces) == _tablebase.DRAW
+        assert solved.choose_move(spaces, 1) == 2
+
+        # any move that keeps the win will do, not only the fastest
+        spaces[8] = 1
+        assert solved.lookup(spaces) == _tablebase.WIN
+
+        for seed in range(10):
+            move = solved.choose_move(spaces, 2, random.Random(seed))
+            spaces[move] = 2
+            assert solved.lookup(spaces) == _tablebase.LOSS
+            spaces[move] = 0
+
+
+def test_tablebase_invalid(tmp_path):
+    """Tests if tablebases of other games or sizes are rejected."""
+
+    path = tmp_path / 'classic.tbl'
+    _solve_classic(path).close()
+
+    with pytest.raises(ValueError):
+        _tablebase.Tablebase(path, 4, 3)
+
+    with pytest.raises(ValueError):
+        _tablebase.Tablebase(tmp_path / 'large.tbl', 5, 3)
+
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with pytest.raises(ValueError):
+        _tablebase.Tablebase(path, 3, 3)
+
+
+def test_load(tmp_path, monkeypatch):
+    """Tests if `Tablebase.load()` only opens complete tablebases."""
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    path = _tablebase.get_path(3, 3)
+
+    assert _tablebase.Tablebase.load(3, 3) is None
+
+    _tablebase.Tablebase(path, 3, 3).close()
+    assert _tablebase.Tablebase.load(3, 3) is None
+
+    _solve_classic(path).close()
+
+    with _tablebase.Tablebase.load(3, 3) as solved:
+        assert solved.lookup([0] * 9) == _tablebase.DRAW
+
+
+def test_verify(tmp_path):
+    """Tests if `_verify()` finds a tablebase that differs from search."""
+
+    with _solve_classic(tmp_path / 'classic.tbl') as solved:
+        assert tablebase._verify(solved, 50, random.Random(0)) == 0
+
+        solved._values[:] = bytes(len(solved._values))
+        assert tablebase._verify(solved, 50, random.Random(0)) == 50
+
+
+def test_main(tmp_path, monkeypatch, capsys):
+    """Tests if `tablebase.main()` generates and checks a tablebase."""
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    tablebase.main(3, 3, 1, 20, 0)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(lines) == 12
+    assert lines[-1] == "checked 20 random positions against search"
+    assert _tablebase.get_path(3, 3).is_file()
@@ -0,0 +1,247 @@
+import pytest
+import random
+from src.pygames import _threats, tic_tac_toe
+
+_X, _O = tic_tac_toe._Mark.Cross, tic_tac_toe._Mark.Nought
+
+
+def _space(row: int, column: int) -> int:
+    """Numbers a space of a 15x15 grid, from 1."""
+
+    return row * 15 + column + 1
+
+
+# Positions of gomoku (five in a row on a 15x15 grid) with crosses to move,
+# as the spaces of the crosses, the spaces of the noughts, and the length of
+# the shortest forced win
+_WINS = {
+    'open three': (
+        (_space(7, 6), _space(7, 7), _space(7, 8)),
+        (_space(0, 0), _space(0, 14), _space(14, 0)),
+        3,
+    ),
+    'four-three': (
+        (_space(7, 5), _space(7, 6), _space(7, 7), _space(5, 8),
+         _space(6, 8)),
+        (_space(7, 4), _space(0, 0), _space(0, 14), _space(14, 0),
+         _space(14, 14)),
+        5,
+    ),
+    'double three': (
+        (_space(7, 5), _space(7, 6), _space(5, 7), _space(6, 7)),
+        (_space(0, 0), _space(0, 14), _space(14, 0), _space(14, 14)),
+        5,
+    ),
+}
+
+
+def _create_game_state(crosses: tuple, noughts: tuple,
+                       size: int = 15,
+                       length: int = 5) -> tic_tac_toe._GameState:
+    """Creates a game with the given marks, crosses first.
+
+    Args:
+        crosses (tuple): The spaces of the crosses.
+        noughts (tuple): The spaces of the noughts.
+        size (int): The number of spaces on each side of the grid (default:
+            15).
+        length (int): The number of marks in a row it takes to win (default:
+            5).
+
+    Returns:
+        tic_tac_toe._GameState: The game.
+    """
+
+    game_state = tic_tac_toe._GameState(size, length)
+
+    for cross, nought in zip(crosses, noughts):
+        game_state.add_mark(cross, _X)
+        game_state.add_mark(nought, _O)
+
+    return game_state
+
+
+def _is_forced_win(game_state: tic_tac_toe._GameState, depth: int) -> bool:
+    """Checks a forced win found by the threat search against every answer.
+
+    Args:
+        game_state (tic_tac_toe._GameState): The game, with crosses to move.
+        depth (int): The most threats crosses may make before winning.
+
+    Returns:
+        bool: Whether or not crosses win against every answer of noughts,
+            playing the first move found by the threat search each turn.
+    """
+
+    searcher = _threats.ThreatSearcher(game_state, _X, _O)
+    line = searcher.find_win(10000, depth)
+
+    if line is None:
+        return False
+
+    game_state.add_mark(line[0], _X)
+
+    try:
+        if game_state.winner:
+            return True
+
+        for answer in range(1, game_state.size ** 2 + 1):
+            if game_state.add_mark(answer, _O):
+                continue
+
+            try:
+                if game_state.winner or game_state.is_full():
+                    return False
+
+                if not _is_forced_win(game_state, depth - 1):
+                    return False
+            finally:
+                game_state.undo()
+    finally:
+        game_state.undo()
+
+    return True
+
+
+@pytest.mark.parametrize('name', _WINS)
+def test_find_win(name: str):
+    """Tests if `ThreatSearcher.find_win()` finds the shortest forced win.
+
+    Args:
+        name (str): The name of the position; see `_WINS`.
+    """
+
+    crosses, noughts, expected = _WINS[name]
+    game_state = _create_game_state(crosses, noughts)
+    key = game_state.key
+    searcher = _threats.ThreatSearcher(game_state, _X, _O)
+    line = searcher.find_win(10000)
+
+    assert len(line) == expected
+    assert searcher.nodes > 0
+    assert game_state.key == key and not game_state.winner
+
+    for n, move in enumerate(line):
+        assert not game_state.add_mark(move, (_X, _O)[n % 2])
+
+    assert game_state.winner == _X
+
+
+def test_find_win_none():
+    """Tests if `ThreatSearcher.find_win()` finds no win without threats."""
+
+    game_state = _create_game_state(
+        (_space(7, 7), _space(9, 9)), (_space(7, 8), _space(8, 8)),
+    )
+
+    assert _threats.ThreatSearcher(game_state, _X, _O).find_win(10000) is None
+
+
+def test_find_win_block():
+    """Tests if a threat only wins once the opponent's four is blocked.
+
+    Verifies that the open three of crosses does not win while noughts have
+    a four to block (as blocking it makes no threat), but does once it is
+    blocked.
+    """
+
+    crosses = (_space(7, 6), _space(7, 7), _space(7, 8), _space(2, 1))
+    noughts = (_space(2, 2), _space(2, 3), _space(2, 4), _space(2, 5))
+    game_state = _create_game_state(crosses, noughts)
+
+    assert _threats.ThreatSearcher(game_state, _X, _O).find_win(10000) is None
+
+    game_state = _create_game_state((*crosses, _space(2, 6)),
+                                    (*noughts, _space(0, 0)))
+
+    assert _threats.ThreatSearcher(game_state, _X, _O).find_win(10000)
+
+
+def test_find_win_every_answer():
+    """Tests if short wins found in random positions hold against any answer.
+
+    Verifies, on a 6x6 grid with four in a row to win, that every win of up
+    to three threats found by the threat search still wins whatever noughts
+    answer, not only against the answers it searched.
+    """
+
+    rng = random.Random(0)
+    wins = 0
+
+    for _ in range(40):
+        spaces = rng.sample(range(1, 37), 8)
+        game_state = _create_game_state(spaces[::2], spaces[1::2], 6, 4)
+
+        if game_state.winner:
+            continue
+
+        searcher = _threats.ThreatSearcher(game_state, _X, _O)
+
+        if searcher.find_win(10000, 3) is not None:
+            wins += 1
+            assert _is_forced_win(game_state, 3)
+
+    assert wins > 0
+
+
+def test_search_move_threats():
+    """Tests if the computer player plays a forced win too deep to search.
+
+    Verifies that `tic_tac_toe._search_move()` plays the first move of a
+    forced win found by the threat search, even though it is too long to be
+    proven in time, without scoring it as a decided game.
+    """
+
+    crosses = (_space(6, 6), _space(6, 8), _space(8, 6), _space(8, 8))
+    noughts = (_space(7, 7), _space(5, 5), _space(0, 0), _space(0, 14))
+    line = _threats.ThreatSearcher(
+        _create_game_state(crosses, noughts), _X, _O,
+    ).find_win(10000)
+
+    searcher = tic_tac_toe.ParallelSearcher(1, 1)
+    result = tic_tac_toe._search_move(_create_game_state(crosses, noughts),
+                                      _X, 2000, searcher)
+
+    assert len(line) == 9
+    assert result.move == line[0]
+    assert result.score < tic_tac_toe.WIN_SCORE - 1000
+
+
+def test_search_move_threats_proven():
+    """Tests if the computer player proves a short forced win right away.
+
+    Verifies that `tic_tac_toe._search_move()` scores a forced win found by
+    the threat search as a decided game once a search of every answer
+    proves it, well within its time budget.
+    """
+
+    crosses, noughts, length = _WINS['open three']
+    searcher = tic_tac_toe.ParallelSearcher(1, 1)
+    result = tic_tac_toe._search_move(_create_game_state(crosses, noughts),
+                                      _X, 2000, searcher)
+
+    assert result.score == tic_tac_toe.WIN_SCORE - length
+    assert result.seconds < 0.5
+
+
+def test_search_move_threats_refuted(monkeypatch):
+    """Tests if the computer player gives up a forced win that is refuted.
+
+    Verifies that `tic_tac_toe._search_move()` searches every move instead
+    of playing a forced win found by the threat search that the opponent can
+    refute, here by completing a line of their own.
+    """
+
+    game_state = _create_game_state(
+        (_space(7, 4), _space(0, 0), _space(0, 14), _space(14, 0)),
+        (_space(7, 5), _space(7, 6), _space(7, 7), _space(7, 8)),
+    )
+
+    # a made-up win, that leaves noughts free to win right away
+    monkeypatch.setattr(_threats.ThreatSearcher, 'find_win',
+                        lambda self, think_ms: [_space(1, 1), 1, 2])
+
+    searcher = tic_tac_toe.ParallelSearcher(1, 1)
+    result = tic_tac_toe._search_move(game_state, _X, 300, searcher)
+
+    assert result.move == _space(7, 9)
@@ -0,0 +1,295 @@
+import pytest
+import io
+import random
+from src.pygames import _journal, tic_tac_toe
+from src.pygames._rendering import Renderer
+
+_X, _O = tic_tac_toe._Mark.Cross, tic_tac_toe._Mark.Nought
+
+
+def _create_game_state(marks: str,
+                       length: int = 3) -> tic_tac_toe._GameState:
+    """Creates a new `tic_tac_toe._GameState` object with the provided marks.
+
+    Args:
+        marks (str): The mark in each space of the grid ('X', 'O' or '-'),
+            left to right and top to bottom; the grid is as large as the
+            number of marks allows.
+        length (int): The number of marks in a row it takes to win (default:
+            3).
+
+    Returns:
+        tic_tac_toe._GameState: The aforementioned object.
+    """
+
+    game_state = tic_tac_toe._GameState(int(len(marks) ** 0.5), length)
+
+    for index, mark in enumerate(marks, start=1):
+        if mark != '-':
+            game_state.add_mark(index, _X if mark == 'X' else _O)
+
+    return game_state
+
+
+@pytest.mark.parametrize('move,expected', (
+    ('0', "Please input a number from 1 to 9!"),
+    ('10', "Please input a number from 1 to 9!"),
+    ('x', "Please input a number from 1 to 9!"),
+    ('²', "Please input a number from 1 to 9!"),
+    ('5', "That space is already taken!"),
+    ('1', ""),
+))
+def test_try_move(move: str, expected: str):
+    """Tests if `_try_move()` returns the right message for each move.
+
+    Args:
+        move (str): The move to try, as entered by the player.
+        expected (str): The message expected to be returned.
+    """
+
+    game_state = _create_game_state('----X----')
+
+    assert tic_tac_toe._try_move(game_state, move, _O) == expected
+
+
+@pytest.mark.parametrize('marks,length,expected', (
+    ('XXXX-' '-----' '-----' '-----' 'OOO--', 4, _X),
+    ('XXX--' '-----' '-----' '-----' 'OOO--', 4, None),
+    ('O----' '-O---' '--O--' '---O-' '-----', 4, _O),
+    ('-----' '---X-' '--X--' '-X---' '-----', 3, _X),
+    ('X------' '-------' '-------' '---X---' '-------' '-----X-' '------X',
+     4, None),
+))
+def test_game_state_winner(marks: str, length: int,
+                           expected: tic_tac_toe._Mark | None):
+    """Tests if lines of the right length win, in every direction.
+
+    Args:
+        marks (str): The marks on the grid; see `_create_game_state()`.
+        length (int): The number of marks in a row it takes to win.
+        expected (tic_tac_toe._Mark | None): The expected winner.
+    """
+
+    assert _create_game_state(marks, length).winner == expected
+
+
+def test_game_state_undo():
+    """Tests if `_GameState.undo()` takes back the last mark added.
+
+    Verifies that taking back every mark restores the winner, score and key
+    of each earlier position, and that the key only depends on the marks on
+    the grid, whatever order they were added in.
+    """
+
+    game_state = tic_tac_toe._GameState(7, 4)
+    spaces = random.Random(0).sample(range(1, 50), 30)
+    positions = []
+
+    for n, space in enumerate(spaces):
+        positions.append((game_state.key, game_state._score,
+                          game_state.winner))
+        game_state.add_mark(space, (_X, _O)[n % 2])
+
+    key = game_state.key
+
+    for _ in spaces:
+        game_state.undo()
+        assert positions.pop() == (game_state.key, game_state._score,
+                                   game_state.winner)
+
+    assert game_state.key == 0 and not any(game_state._counts[_X.value])
+
+    for n in range(30, 0, -2):
+        game_state.add_mark(spaces[n - 2], _X)
+        game_state.add_mark(spaces[n - 1], _O)
+
+    assert game_state.key == key
+
+
+@pytest.mark.parametrize('marks,expected', (
+    ('-----' '-XXX-' '-----' '-O-O-' '-----', (6, 10)),  # win right away
+    ('-----' '-OOO-' '---X-' '-----' '--X--', (6, 10)),  # block
+))
+def test_search_move(marks: str, expected: tuple):
+    """Tests if `_search_move()` finds the best move on a larger grid.
+
+    Args:
+        marks (str): The marks on the grid; see `_create_game_state()`.
+        expected (tuple): The moves expected to be picked.
+    """
+
+    game_state = _create_game_state(marks, 4)
+    searcher = tic_tac_toe.ParallelSearcher(1, 1)
+    result = tic_tac_toe._search_move(game_state, _X, 200, searcher,
+                                      random.Random(0))
+
+    assert result.move in expected
+    assert game_state._grid == _create_game_state(marks, 4)._grid
+
+
+def test_evaluate_empty_grid():
+    """Tests if `_evaluate()` scores the empty grid as a draw."""
+
+    assert tic_tac_toe._evaluate((0,) * 9, _X.value) == 0
+
+
+@pytest.mark.parametrize('marks,mark,expected', (
+    ('XX-OO----', _X, 3),  # win right away
+    ('XX-OO----', _O, 6),  # win right away
+    ('XX--O----', _O, 3),  # block
+))
+def test_choose_move(marks: str, mark: tic_tac_toe._Mark, expected: int):
+    """Tests if `_choose_move()` picks the best move.
+
+    Args:
+        marks (str): The marks on the grid; see `_create_game_state()`.
+        mark (tic_tac_toe._Mark): The computer player's mark.
+        expected (int): The move expected to be picked.
+    """
+
+    game_state = _create_game_state(marks)
+    rng = random.Random(0)
+
+    assert tic_tac_toe._choose_move(game_state, mark, rng) == expected
+
+
+def test_choose_move_avoid_fork():
+    """Tests if `_choose_move()` avoids a move that lets the opponent fork."""
+
+    game_state = _create_game_state('X---O---X')
+
+    for seed in range(10):
+        move = tic_tac_toe._choose_move(game_state, _O, random.Random(seed))
+        assert move in (2, 4, 6, 8)
+
+
+def test_choose_move_self_play():
+    """Tests if the computer player always draws against itself."""
+
+    rng = random.Random(0)
+
+    for _ in range(20):
+        game_state = tic_tac_toe._GameState()
+        mark = _X
+
+        while not (game_state.winner or game_state.is_full()):
+            game_state.add_mark(
+                tic_tac_toe._choose_move(game_state, mark, rng), mark,
+            )
+            mark = _O if mark == _X else _X
+
+        assert game_state.winner is None
+
+
+@pytest.mark.parametrize('crosses,noughts,player,expected', (
+    ((), (), _X, ([0] * 9, 2)),
+    ((), (), _O, ([0] * 9, 2)),
+    ((5,), (), _O, ([0, 0, 0, 0, 2, 0, 0, 0, 0], 1)),
+    ((), (1,), _X, ([2, 0, 0, 0, 0, 0, 0, 0, 0], 1)),
+    ((5,), (1,), _X, ([1, 0, 0, 0, 2, 0, 0, 0, 0], 2)),
+    ((5,), (1,), _O, ([2, 0, 0, 0, 1, 0, 0, 0, 0], 2)),
+))
+def test_get_first_player_spaces(crosses: tuple, noughts: tuple,
+                                 player: tic_tac_toe._Mark, expected: tuple):
+    """Tests if `_get_first_player_spaces()` swaps the marks of noughts first.
+
+    Args:
+        crosses (tuple): The spaces of the crosses.
+        noughts (tuple): The spaces of the noughts.
+        player (tic_tac_toe._Mark): The mark of the player to move.
+        expected (tuple): The expected spaces and turn.
+    """
+
+    game_state = tic_tac_toe._GameState()
+
+    for index in crosses:
+        game_state.add_mark(index, _X)
+
+    for index in noughts:
+        game_state.add_mark(index, _O)
+
+    assert tic_tac_toe._get_first_player_spaces(game_state, player) == expected
+
+
+@pytest.mark.parametrize('marks', (
+    '---------', 'X---O---X', 'XXXOO----', 'XOXXOOOXX',
+))
+def test_game_state_snapshot(marks: str):
+    """Tests if a game state is restored as it was from its snapshot.
+
+    Args:
+        marks (str): The marks on the grid; see `_create_game_state()`.
+    """
+
+    game_state = _create_game_state(marks)
+    data = game_state.to_bytes()
+    restored = tic_tac_toe._GameState.from_bytes(data)
+
+    assert len(data) == 4
+    assert restored.get_grid() == game_state.get_grid()
+    assert restored.winner == game_state.winner
+
+
+def test_game_state_snapshot_larger_grid():
+    """Tests if games on grids larger than 3x3 cannot be snapshotted."""
+
+    with pytest.raises(ValueError):
+        tic_tac_toe._GameState(4, 3).to_bytes()
+
+
+@pytest.mark.parametrize('data', (
+    b'', b'\x01\x02\x00\x00', b'\x00\x00\x04\x00',
+))
+def test_game_state_from_bytes_invalid(data: bytes):
+    """Tests if `_GameState.from_bytes()` rejects invalid snapshots.
+
+    Args:
+        data (bytes): The snapshot to restore.
+    """
+
+    with pytest.raises(ValueError):
+        tic_tac_toe._GameState.from_bytes(data)
+
+
+def test_solution_table(monkeypatch):
+    """Tests if the bundled solution table seeds the scores of positions.
+
+    Verifies that the `_choose_move()` function loads every score from the
+    solution table built by `build_solution_table()`, and scores positions
+    the same way with it.
+    """
+
+    table = tic_tac_toe.build_solution_table()
+    scores = dict(tic_tac_toe._scores)
+
+    monkeypatch.setattr(tic_tac_toe, '_scores', {})
+    monkeypatch.setattr(tic_tac_toe._bundle, 'read_data', lambda name: table)
+
+    game_state = _create_game_state('X---O----')
+    tic_tac_toe._choose_move(game_state, _X, random.Random(0))
+
+    assert tic_tac_toe._scores == scores
+    assert len(table) == len(scores) * tic_tac_toe._SOLUTION.size
+
+
+def test_play_game_turn_timeout(monkeypatch):
+    """Tests if `_play_game()` moves at random for players who run out of time.
+
+    Verifies that every turn a player does not move in time is played with a
+    random valid move instead, so that the game still ends.
+    """
+
+    def time_out(*args):
+        raise TimeoutError
+
+    monkeypatch.setattr(Renderer, 'input', time_out)
+    game_state = tic_tac_toe._GameState()
+    order = [_X, _O]
+
+    with _journal.Journal('') as log:
+        assert not tic_tac_toe._play_game(
+            Renderer(io.StringIO()), game_state, order, False,
+            random.Random(0), log, turn_timeout=1,
+        )
+
+    assert game_state.winner or game_state.is_full()
@@ -0,0 +1,186 @@
+import gzip
+import http.server
+import pytest
+import threading
+from src.pygames import _transport
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves a few test resources, over persistent connections."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        self.server.ports.add(self.client_address[1])
+        headers = {}
+
+        if self.path == '/words':
+            status, body = 200, b'foo\nbar\n'
+        elif self.path == '/gzip':
+            status, body = 200, gzip.compress(b'foo\nbar\n')
+            headers['Content-Encoding'] = 'gzip'
+        elif self.path == '/truncated':
+            status, body = 200, gzip.compress(b'foo\nbar\n')[:-4]
+            headers['Content-Encoding'] = 'gzip'
+        elif self.path == '/corrupted':
+            status, body = 200, b'x' + gzip.compress(b'foo\nbar\n')
+            headers['Content-Encoding'] = 'gzip'
+        elif self.path == '/redirect':
+            status, body = 302, b''
+            headers['Location'] = '/words'
+        elif self.path == '/flaky' and self.server.failures:
+            self.server.failures -= 1
+            status, body = 503, b''
+        elif self.path == '/flaky':
+            status, body = 200, b'ok'
+        else:
+            status, body = 404, b''
+
+        self.send_response(status)
+        headers['Content-Length'] = str(len(body))
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch) -> http.server.ThreadingHTTPServer:
+    """Starts a local HTTP server for the duration of a test.
+
+    Returns:
+        http.server.ThreadingHTTPServer: The server, with the paths it was
+            requested (``requests``), the client ports that connected to it
+            (``ports``), and the number of times '/flaky' fails before it
+            succeeds (``failures``).
+    """
+
+    monkeypatch.setattr(_transport, '_RETRY_DELAY', 0)
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.requests = []
+    server.ports = set()
+    server.failures = 0
+    threading.Thread(target=server.serve_forever, args=(0.05,),
+                     daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def _get_url(server: http.server.ThreadingHTTPServer, path: str) -> str:
+    """Creates the URL of a path on the local server."""
+
+    host, port = server.server_address[:2]
+    return f'http://{host}:{port}{path}'
+
+
+def test_http_transport_keep_alive(server):
+    """Tests if `HTTPTransport` reuses a single connection for each server."""
+
+    transport = _transport.HTTPTransport()
+
+    try:
+        for _ in range(3):
+            assert transport.fetch(_get_url(server, '/words')) == b'foo\nbar\n'
+    finally:
+        transport.close()
+
+    assert len(server.requests) == 3
+    assert len(server.ports) == 1
+
+
+@pytest.mark.parametrize('path', ('/gzip', '/redirect'))
+def test_http_transport_fetch(server, path: str):
+    """Tests if `HTTPTransport.fetch()` decompresses and follows redirects."""
+
+    transport = _transport.HTTPTransport()
+
+    try:
+        assert transport.fetch(_get_url(server, path)) == b'foo\nbar\n'
+    finally:
+        transport.close()
+
+
+@pytest.mark.parametrize('failures,succeeds', ((2, True), (3, False)))
+def test_http_transport_retries(server, failures: int, succeeds: bool):
+    """Tests if `HTTPTransport.fetch()` retries requests that failed.
+
+    Args:
+        failures (int): The number of times the server fails the request.
+        succeeds (bool): Whether or not the request is expected to succeed,
+            given the transport's two retries.
+    """
+
+    server.failures = failures
+    transport = _transport.HTTPTransport(retries=2)
+
+    try:
+        if succeeds:
+            assert transport.fetch(_get_url(server, '/flaky')) == b'ok'
+        else:
+            with pytest.raises(ValueError, match='HTTP 503'):
+                transport.fetch(_get_url(server, '/flaky'))
+    finally:
+        transport.close()
+
+    assert len(server.requests) == 3
+
+
+def test_http_transport_errors(server):
+    """Tests if `HTTPTransport.fetch()` raises a ValueError on failure."""
+
+    transport = _transport.HTTPTransport(retries=0)
+
+    with pytest.raises(ValueError, match='HTTP 404'):
+        transport.fetch(_get_url(server, '/missing'))
+
+    with pytest.raises(ValueError, match='cannot fetch'):
+        transport.fetch('http://127.0.0.1:1/')
+
+    for path in ('/truncated', '/corrupted'):
+        with pytest.raises(ValueError, match='corrupted response'):
+            transport.fetch(_get_url(server, path))
+
+
+def test_file_transport(tmp_path):
+    """Tests if `FileTransport.fetch()` reads both paths and 'file:' URLs."""
+
+    path = tmp_path / 'words.txt'
+    path.write_bytes(b'foo\n')
+    transport = _transport.FileTransport()
+
+    assert transport.fetch(str(path)) == b'foo\n'
+    assert transport.fetch(path.as_uri()) == b'foo\n'
+
+    with pytest.raises(ValueError, match='cannot fetch'):
+        transport.fetch(str(tmp_path / 'missing.txt'))
+
+
+@pytest.mark.parametrize('url,expected', (
+    ('https://example.com/', _transport.HTTPTransport),
+    ('HTTP://example.com/', _transport.HTTPTransport),
+    ('file:///tmp/words.txt', _transport.FileTransport),
+    ('/tmp/words.txt', _transport.FileTransport),
+    ('C:\\words.txt', _transport.FileTransport),
+))
+def test_get_transport(url: str, expected: type):
+    """Tests if `get_transport()` picks the right transport for a URL."""
+
+    assert isinstance(_transport.get_transport(url), expected)
+
+
+def test_get_transport_unsupported():
+    """Tests if `get_transport()` rejects unsupported URL schemes."""
+
+    with pytest.raises(ValueError, match='unsupported'):
+        _transport.get_transport('ftp://example.com/')
@@ -0,0 +1,140 @@
+import io
+import os
+import pytest
+import sys
+import time
+from src.pygames import _rendering, _turns
+
+
+@pytest.fixture
+def pipe():
+    """Creates a new pipe, closing both of its ends once done.
+
+    Returns:
+        tuple: The file descriptors of its read and write ends.
+    """
+
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+
+    for fd in (read_fd, write_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass # already closed by the test
+
+
+def test_turn_loop_read_line(pipe):
+    """Tests if `TurnLoop.read_line()` reads one line at a time.
+
+    Verifies that input read beyond the end of a line is kept for the next
+    turn, that the last line is returned even without a newline character,
+    and that an `EOFError` is raised once the input has reached its end.
+    """
+
+    read_fd, write_fd = pipe
+    os.write(write_fd, b'apple\nbanana\ncherry')
+    os.close(write_fd)
+    loop = _turns.TurnLoop()
+
+    assert loop.read_line(read_fd, 1) == 'apple'
+    assert loop.read_line(read_fd, 1) == 'banana'
+    assert loop.read_line(read_fd) == 'cherry'
+
+    with pytest.raises(EOFError):
+        loop.read_line(read_fd, 1)
+
+    loop.close()
+
+
+def test_turn_loop_timeout(pipe):
+    """Tests if `TurnLoop.read_line()` gives up once its deadline passes.
+
+    Verifies that a `TimeoutError` is raised shortly after the timeout, and
+    that a partial line entered in the meantime is kept for the next turn.
+    """
+
+    read_fd, write_fd = pipe
+    os.write(write_fd, b'app')
+    loop = _turns.TurnLoop()
+    start = time.monotonic()
+
+    with pytest.raises(TimeoutError):
+        loop.read_line(read_fd, 0.05)
+
+    assert 0.05 <= time.monotonic() - start < 1
+
+    os.write(write_fd, b'le\n')
+    assert loop.read_line(read_fd, 1) == 'apple'
+    loop.close()
+
+
+def test_turn_loop_wait_idle():
+    """Tests if `TurnLoop.wait()` refuses to wait with no turn in progress."""
+
+    loop = _turns.TurnLoop()
+
+    with pytest.raises(ValueError):
+        loop.wait()
+
+    loop.close()
+
+
+def test_turn_loop_many_sessions():
+    """Tests if many sessions share a loop, each ending on its own deadline.
+
+    Verifies that every session that answers in time gets its line, and
+    that every other session times out in the order of its deadline.
+    """
+
+    pipes = [os.pipe() for _ in range(100)]
+    loop = _turns.TurnLoop()
+
+    try:
+        for n, (read_fd, write_fd) in enumerate(pipes):
+            loop.start_turn(read_fd, 0.01 + 0.001 * n)
+
+            if n % 2:
+                os.write(write_fd, f'{n}\n'.encode())
+
+        ended = []
+
+        while len(ended) < len(pipes):
+            ended += loop.wait()
+    finally:
+        loop.close()
+
+        for fds in pipes:
+            for fd in fds:
+                os.close(fd)
+
+    lines = {fd: result for fd, result in ended if isinstance(result, str)}
+    timeouts = [fd for fd, result in ended
+                if isinstance(result, TimeoutError)]
+
+    assert lines == {pipes[n][0]: str(n) for n in range(1, 100, 2)}
+    assert timeouts == [pipes[n][0] for n in range(0, 100, 2)]
+
+
+def test_renderer_input_timeout(pipe, monkeypatch):
+    """Tests if `Renderer.input()` raises a `TimeoutError` when timed out.
+
+    Verifies that the `input()` method in the `_rendering.Renderer` class
+    reads from the standard input's file descriptor once given a timeout,
+    keeps doing so afterwards (so that no input is lost to a buffer), and
+    records the user's input as part of the current frame.
+    """
+
+    read_fd, write_fd = pipe
+    stdin = io.TextIOWrapper(io.FileIO(read_fd, closefd=False))
+    monkeypatch.setattr(sys, 'stdin', stdin)
+    stream = io.StringIO()
+    renderer = _rendering.Renderer(stream, ansi=False)
+
+    with pytest.raises(TimeoutError):
+        renderer.input(['prompt: '], 0.01)
+
+    os.write(write_fd, b'5\n')
+
+    assert renderer.input(['prompt: ']) == '5'
+    assert renderer.lines == ['prompt: 5']
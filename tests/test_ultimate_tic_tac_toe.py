@@ -0,0 +1,126 @@
+import pytest
+import random
+from src.pygames import _search, ultimate_tic_tac_toe
+
+_X, _O = ultimate_tic_tac_toe._Mark.Cross, ultimate_tic_tac_toe._Mark.Nought
+
+# A game where crosses claim boards 1 and 5 (numbered from 1), and two spaces
+# of board 9, where noughts just sent them; crosses can win with space 3
+_NEAR_WIN = (0, 9, 1, 10, 2, 14, 36, 15, 37, 16, 38, 20, 72, 21, 73, 26)
+
+
+def _create_game_state(moves: tuple) -> ultimate_tic_tac_toe._GameState:
+    """Creates a new game state, with the provided moves made in order.
+
+    Args:
+        moves (tuple): The moves to make, numbered from 0 to 80.
+
+    Returns:
+        ultimate_tic_tac_toe._GameState: The aforementioned object.
+    """
+
+    game_state = ultimate_tic_tac_toe._GameState()
+
+    for move in moves:
+        game_state.play(move)
+
+    return game_state
+
+
+def test_game_state_play_undo():
+    """Tests if taking back every move of a game restores its first state."""
+
+    rng = random.Random(0)
+    game_state = ultimate_tic_tac_toe._GameState()
+    initial = vars(game_state).copy()
+    initial = {key: value.copy() if isinstance(value, list) else value
+               for key, value in initial.items()}
+    count = 0
+
+    while game_state.get_moves():
+        game_state.play(rng.choice(game_state.get_moves()))
+        count += 1
+
+    for _ in range(count):
+        game_state.undo()
+
+    assert vars(game_state) == initial
+
+
+def test_game_state_win():
+    """Tests if claiming three boards in a row wins the game."""
+
+    game_state = _create_game_state(_NEAR_WIN)
+
+    assert game_state.next_board == 8
+    assert game_state.winner is None
+
+    game_state.play(74)
+
+    assert game_state.winner == _X
+    assert game_state.get_moves() == []
+
+    game_state.undo()
+
+    assert game_state.winner is None
+    assert game_state.get_moves() == [74, 75, 76, 77, 78, 79, 80]
+
+
+def test_game_state_get_grid():
+    """Tests if `get_grid()` draws claimed boards and the playable spaces."""
+
+    lines = _create_game_state(_NEAR_WIN[:5]).get_grid().split('\n')
+
+    assert len(lines) == 11
+    assert lines[0] == 'X X X | O O . | - - -'
+    assert lines[3] == '------+-------+------'
+    assert lines[4] == '. . . | . . . | . . .'
+
+
+@pytest.mark.parametrize('moves,move,expected', (
+    ((), '0', "Please input a board and a space, from 1 to 9 each!"),
+    ((), '123', "Please input a board and a space, from 1 to 9 each!"),
+    ((), '5', "Please input a board as well as a space (e.g. 53)!"),
+    ((40,), '13', "You must play on board 5!"),
+    ((40,), '55', "That space is already taken!"),
+    ((*_NEAR_WIN[:5], 18), '12', "That board is already finished!"),
+    ((40,), '1', ""),
+    ((), '5 3', ""),
+))
+def test_try_move(moves: tuple, move: str, expected: str):
+    """Tests if `_try_move()` returns the right message for each move.
+
+    Args:
+        moves (tuple): The moves made before trying the move.
+        move (str): The move to try, as entered by the player.
+        expected (str): The expected message.
+    """
+
+    game_state = _create_game_state(moves)
+    assert ultimate_tic_tac_toe._try_move(game_state, move) == expected
+
+
+def test_choose_move_win():
+    """Tests if `_choose_move()` takes a move that wins the game."""
+
+    game_state = _create_game_state(_NEAR_WIN)
+    result = ultimate_tic_tac_toe._choose_move(game_state, 100,
+                                               random.Random(0))
+
+    assert result.move == 74
+    assert result.score > _search.WIN_SCORE - 1000
+
+
+@pytest.mark.parametrize('think_ms', (1, 30))
+def test_choose_move_budget(think_ms: int):
+    """Tests if `_choose_move()` always moves within its time budget.
+
+    Args:
+        think_ms (int): The time budget, in milliseconds.
+    """
+
+    game_state = _create_game_state((40, 36))
+    result = ultimate_tic_tac_toe._choose_move(game_state, think_ms)
+
+    assert result.move in game_state.get_moves()
+    assert result.seconds < think_ms / 1000 + 0.01
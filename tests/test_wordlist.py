@@ -0,0 +1,344 @@
+import multiprocessing
+import os
+import pathlib
+import pytest
+import random
+import time
+from src.pygames import _wordlist
+
+_WORDS = (
+    'jazz', 'fizzy', 'puzzle', 'rhythm', 'banana', 'string', 'planet',
+    'quartz', 'letter', 'stones', 'orange', 'jukebox', 'sizzle', 'python',
+    'garden', 'mellow', 'ghost', 'Token', 'naïve', 'abcdefghijklmnop',
+    'stones',
+)
+
+
+def test_count_solver_misses():
+    """Tests if `_count_solver_misses()` plays the solver's strategy.
+
+    Verifies that the `_count_solver_misses()` function counts no misses for a
+    word that is the only one of its length, and counts the misses of the
+    solver's most common letter first strategy otherwise.
+    """
+
+    misses = _wordlist._count_solver_misses(['abcde', 'xy', 'ab', 'cd'])
+
+    # the 2-letter words share no letters, so the solver guesses 'a' first
+    # (ties are broken alphabetically), then 'c', then knows the last word
+    assert misses == {'abcde': 0, 'ab': 0, 'cd': 1, 'xy': 2}
+
+
+def test_word_index_build():
+    """Tests if `WordIndex.build()` keeps and sorts the suitable words.
+
+    Verifies that the `build()` method in the `_wordlist.WordIndex` class only
+    keeps the unique words of 5 to 12 ASCII letters (in lowercase), sorted
+    by their score, from easiest to hardest.
+    """
+
+    index = _wordlist.WordIndex.build(_WORDS)
+
+    assert sorted(index._words) == sorted({
+        word.lower() for word in _WORDS
+        if 5 <= len(word) <= 12 and word.isascii()
+    })
+    assert list(index._scores) == sorted(index._scores)
+    assert 0 <= index._scores[0] <= index._scores[-1] <= 1
+
+
+def test_word_index_build_invalid():
+    """Tests if `WordIndex.build()` rejects a wordlist with no usable words."""
+
+    with pytest.raises(ValueError):
+        _wordlist.WordIndex.build(('a', 'foo', 'naïve'))
+
+
+@pytest.mark.parametrize('difficulty', _wordlist.DIFFICULTIES)
+def test_word_index_pick(difficulty: str):
+    """Tests if `WordIndex.pick()` only picks words of the right difficulty.
+
+    Args:
+        difficulty (str): The difficulty to pick words of.
+    """
+
+    index = _wordlist.WordIndex.build(_WORDS)
+    start, stop = index.get_band(difficulty)
+    rng = random.Random(8)
+    picked = {index.pick(rng, difficulty) for _ in range(200)}
+
+    assert picked == set(index._words[start:stop])
+
+
+def test_word_index_pick_invalid():
+    """Tests if `WordIndex.pick()` rejects an unknown difficulty."""
+
+    with pytest.raises(ValueError, match='unknown difficulty'):
+        _wordlist.WordIndex.build(_WORDS).pick(random, 'impossible')
+
+
+def test_word_index_save(tmp_path):
+    """Tests if `WordIndex.load()` reads back what `save()` wrote."""
+
+    path = tmp_path / 'words.idx'
+    index = _wordlist.WordIndex.build(_WORDS)
+    index.save(path)
+    loaded = _wordlist.WordIndex.load(path)
+
+    assert loaded._words == index._words
+    assert loaded._scores == index._scores
+    assert loaded.created == index.created
+
+    path.write_bytes(path.read_bytes()[:_wordlist._INDEX_HEADER.size + 4])
+
+    assert _wordlist.WordIndex.load(path) is None
+
+
+def test_word_index_save_concurrent(tmp_path):
+    """Tests if `WordIndex.save()` leaves other processes' files alone.
+
+    Verifies that saving an index while another process is still writing
+    its own copy of the same index neither writes over nor moves the other
+    process's temporary file.
+    """
+
+    path = tmp_path / 'words.idx'
+    other = tmp_path / f'words.idx.{os.getpid() + 1}.tmp'
+    other.write_bytes(b'half-written')
+
+    index = _wordlist.WordIndex.build(_WORDS)
+    index.save(path)
+
+    assert other.read_bytes() == b'half-written'
+    assert _wordlist.WordIndex.load(path)._words == index._words
+    assert sorted(tmp_path.iterdir()) == [path, other]
+
+
+def test_load_index(tmp_path, monkeypatch):
+    """Tests if `load_index()` caches the index, until it is out of date.
+
+    Verifies that the `load_index()` function builds the index of a wordlist
+    once, then reuses the index cached on disk (or in memory) instead of
+    fetching the wordlist again, until the cached index is too old.
+    """
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text('\n'.join(_WORDS))
+    url = wordlist.as_uri()
+
+    index = _wordlist.load_index(url)
+
+    assert _wordlist.load_index(url) is index
+    assert _wordlist.get_cache_path(url).exists()
+
+    # the cached index is used while it is recent enough, even if the
+    # wordlist has changed since
+    wordlist.write_text('orange\nbanana\n')
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    assert _wordlist.load_index(url)._words == index._words
+
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+    monkeypatch.setattr(time, 'time', lambda: index.created + 2 * 86400)
+
+    assert sorted(_wordlist.load_index(url)._words) == ['banana', 'orange']
+
+
+def test_load_index_bundled(tmp_path, monkeypatch):
+    """Tests if `load_index()` prefers the index bundled with a zipapp.
+
+    Verifies that the `load_index()` function uses the bundled index of a
+    wordlist as is, without fetching the wordlist or caching the index.
+    """
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    url = (tmp_path / 'missing.txt').as_uri()
+    data = _wordlist.WordIndex.build(_WORDS).to_bytes()
+    names = []
+
+    def read_data(name: str) -> bytes:
+        names.append(name)
+        return data
+
+    monkeypatch.setattr(_wordlist._bundle, 'read_data', read_data)
+
+    assert _wordlist.load_index(url).to_bytes() == data
+    assert names == [_wordlist.get_index_name(url)]
+    assert not _wordlist.get_cache_path(url).exists()
+
+
+def _pick_in_worker(url: str) -> tuple:
+    """Picks a word in a pool worker, from the index it loads on its own."""
+
+    index = _wordlist.load_index(url)
+    return (type(index).__name__, index.pick(random.Random(0)))
+
+
+def test_shared_word_index(tmp_path):
+    """Tests if `SharedWordIndex` holds the same words as the published index.
+
+    Verifies that an index attached to by `SharedWordIndex.attach()` encodes
+    to the same bytes and picks the same words as the index published with
+    `SharedWordIndex.publish()`, even once the publisher has closed it (which
+    removes its file).
+    """
+
+    url = (tmp_path / 'words.txt').as_uri()
+    index = _wordlist.WordIndex.build(_WORDS)
+
+    with _wordlist.SharedWordIndex.publish(index, url) as shared:
+        attached = _wordlist.SharedWordIndex.attach(shared.path, url)
+
+        assert shared.to_bytes() == index.to_bytes()
+        assert _wordlist.SharedWordIndex.attach(shared.path, 'x') is None
+
+    assert not os.path.exists(shared.path)
+    assert attached.to_bytes() == index.to_bytes()
+
+    for difficulty in ('', *_wordlist.DIFFICULTIES):
+        assert (attached.pick(random.Random(1), difficulty)
+                == index.pick(random.Random(1), difficulty))
+
+    with pytest.raises(IndexError):
+        attached._words[len(index)]
+
+    attached.close()
+
+
+def test_shared_word_index_invalid(tmp_path):
+    """Tests if `SharedWordIndex.attach()` rejects files it cannot use."""
+
+    url = (tmp_path / 'words.txt').as_uri()
+    path = tmp_path / 'shared.idx'
+
+    with _wordlist.SharedWordIndex.publish(
+        _wordlist.WordIndex.build(_WORDS), url,
+    ) as shared:
+        data = pathlib.Path(shared.path).read_bytes()
+
+    for invalid in (b'', data[:_wordlist._SHARED_HEADER.size],
+                    data[:-1], b'PGWI' + data[4:]):
+        path.write_bytes(invalid)
+        assert _wordlist.SharedWordIndex.attach(str(path), url) is None
+
+    assert _wordlist.SharedWordIndex.attach(str(tmp_path / 'x'), url) is None
+
+
+def test_load_index_shared(tmp_path, monkeypatch):
+    """Tests if `load_index()` attaches to an index shared by another process.
+
+    Verifies that the `load_index()` function, in every worker of a pool,
+    uses the index found at the path in the ``PYGAMES_WORDLIST_SHARED``
+    environment variable instead of fetching the wordlist (which does not
+    exist), as long as it is an index of the same wordlist.
+    """
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    url = (tmp_path / 'missing.txt').as_uri()
+    index = _wordlist.WordIndex.build(_WORDS)
+
+    with _wordlist.SharedWordIndex.publish(index, url) as shared:
+        monkeypatch.setenv('PYGAMES_WORDLIST_SHARED', shared.path)
+        context = multiprocessing.get_context('fork')
+
+        with context.Pool(2) as pool:
+            results = pool.map(_pick_in_worker, [url] * 4)
+
+        assert results == [
+            ('SharedWordIndex', index.pick(random.Random(0))),
+        ] * 4
+
+        with pytest.raises(ValueError):
+            _wordlist.load_index((tmp_path / 'other.txt').as_uri())
+
+    assert not _wordlist.get_cache_path(url).exists()
+
+
+@pytest.mark.parametrize('compression', _wordlist.COMPRESSIONS)
+def test_compressed_word_index(tmp_path, monkeypatch, compression: str):
+    """Tests if `CompressedWordIndex` only reads the blocks it needs.
+
+    Verifies that an index saved compressed by `WordIndex.save()` is loaded
+    by `CompressedWordIndex.load()` with the same words (in the same order),
+    and that picking a word only reads the block holding it.
+
+    Args:
+        compression (str): The compression of the index.
+    """
+
+    monkeypatch.setattr(_wordlist, '_BLOCK_SIZE', 4)
+
+    path = tmp_path / 'words.idx.gz'
+    index = _wordlist.WordIndex.build(_WORDS)
+    index.save(path, compression)
+    loaded = _wordlist.CompressedWordIndex.load(path)
+
+    for difficulty in ('', *_wordlist.DIFFICULTIES):
+        assert (loaded.pick(random.Random(1), difficulty)
+                == index.pick(random.Random(1), difficulty))
+
+    assert loaded.bytes_read < path.stat().st_size
+    assert loaded.to_bytes() == index.to_bytes()
+    assert loaded.created == index.created
+
+    loaded.close()
+
+    with pytest.raises(ValueError):
+        index.save(path, 'zip')
+
+
+def test_compressed_word_index_invalid(tmp_path):
+    """Tests if `CompressedWordIndex.load()` rejects invalid files."""
+
+    path = tmp_path / 'words.idx.gz'
+    _wordlist.WordIndex.build(_WORDS).save(path, 'gzip')
+    data = path.read_bytes()
+    header = _wordlist._COMPRESSED_HEADER.size
+
+    for invalid in (b'', data[:header], data[:-1], b'PGWI' + data[4:],
+                    data[:header - 4] + b'zip\0' + data[header:]):
+        path.write_bytes(invalid)
+        assert _wordlist.CompressedWordIndex.load(path) is None
+
+    assert _wordlist.CompressedWordIndex.load(tmp_path / 'x') is None
+
+
+def test_load_index_compressed(tmp_path, monkeypatch):
+    """Tests if `load_index()` caches the index compressed, if asked to.
+
+    Verifies that the `load_index()` function caches the index with the
+    compression in the ``PYGAMES_WORDLIST_COMPRESSION`` environment variable,
+    then loads it from there, and rejects unknown compressions.
+    """
+
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setenv('PYGAMES_WORDLIST_COMPRESSION', 'lzma')
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text('\n'.join(_WORDS))
+    url = wordlist.as_uri()
+    index = _wordlist.load_index(url)
+
+    assert _wordlist.get_cache_path(url, 'lzma').exists()
+    assert not _wordlist.get_cache_path(url).exists()
+
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+    loaded = _wordlist.load_index(url)
+
+    assert isinstance(loaded, _wordlist.CompressedWordIndex)
+    assert loaded.to_bytes() == index.to_bytes()
+
+    loaded.close()
+    monkeypatch.setenv('PYGAMES_WORDLIST_COMPRESSION', 'zip')
+    monkeypatch.setattr(_wordlist, '_indexes', {})
+
+    with pytest.raises(ValueError):
+        _wordlist.load_index(url)